@@ -0,0 +1,123 @@
+"""
+ANN Index Tests
+
+Covers the pluggable vector index backends:
+- IVF-flat recall against the exact matrix, plus insert/update/delete after training
+- FAISS backend parity with the exact matrix (skipped when faiss is missing)
+- SemanticAnchorGraph consolidation through an ANN-backed index
+"""
+
+import numpy as np
+import pytest
+
+from seed.engine.embeddings import (
+    EmbeddingMatrix, IVFFlatIndex, FaissIndex, create_ann_index, FAISS_AVAILABLE
+)
+from seed.engine.semantic_anchors import SemanticAnchorGraph
+
+from test_embedding_matrix import BagOfWordsProvider
+
+
+def _clustered_vectors(count, dimension=16, clusters=8, seed=3):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dimension))
+    labels = rng.integers(0, clusters, size=count)
+    return centers[labels] + 0.3 * rng.standard_normal((count, dimension))
+
+
+class TestIVFFlatIndex:
+    """Inverted-file index behaviour before and after training."""
+
+    def test_exact_until_trained(self):
+        vectors = _clustered_vectors(50)
+        index = IVFFlatIndex(train_threshold=100)
+        exact = EmbeddingMatrix()
+        for i, vector in enumerate(vectors):
+            index.add(f"id_{i}", vector)
+            exact.add(f"id_{i}", vector)
+
+        assert not index.is_trained
+        assert index.top_k(vectors[0], 5) == exact.top_k(vectors[0], 5)
+
+    def test_recall_after_training(self):
+        vectors = _clustered_vectors(2000)
+        index = IVFFlatIndex(train_threshold=500, n_probe=4)
+        exact = EmbeddingMatrix()
+        for i, vector in enumerate(vectors):
+            index.add(f"id_{i}", vector)
+            exact.add(f"id_{i}", vector)
+
+        assert index.is_trained
+        hits = 0
+        for query in vectors[:50]:
+            expected = {item_id for item_id, _ in exact.top_k(query, 10)}
+            hits += len(expected & {item_id for item_id, _ in index.top_k(query, 10)})
+        assert hits / 500 >= 0.9
+
+    def test_update_and_remove_after_training(self):
+        vectors = _clustered_vectors(300)
+        index = IVFFlatIndex(train_threshold=200, n_probe=1)
+        for i, vector in enumerate(vectors):
+            index.add(f"id_{i}", vector)
+
+        index.update("id_0", vectors[150])
+        assert index.top_k(vectors[150], 2)[0][1] == pytest.approx(1.0, abs=1e-5)
+        assert "id_0" in {item_id for item_id, _ in index.top_k(vectors[150], 2)}
+
+        assert index.remove("id_0")
+        assert not index.remove("id_0")
+        assert len(index) == 299
+        assert "id_0" not in {item_id for item_id, _ in index.top_k(vectors[150], 10)}
+
+        with pytest.raises(KeyError):
+            index.update("id_0", vectors[0])
+
+
+@pytest.mark.skipif(not FAISS_AVAILABLE, reason="faiss not installed")
+class TestFaissIndex:
+    """FAISS flat inner-product index mirrors the exact matrix."""
+
+    def test_matches_exact_with_updates(self):
+        vectors = _clustered_vectors(200)
+        index = FaissIndex()
+        exact = EmbeddingMatrix()
+        for i, vector in enumerate(vectors):
+            index.add(f"id_{i}", vector)
+            exact.add(f"id_{i}", vector)
+
+        index.update("id_1", vectors[5])
+        exact.update("id_1", vectors[5])
+        index.remove("id_2")
+        exact.remove("id_2")
+
+        query = vectors[5]
+        assert {i for i, _ in index.top_k(query, 10)} == {i for i, _ in exact.top_k(query, 10)}
+        assert [i for i, _ in index.top_k(query, 10, threshold=0.99)] == \
+            [i for i, _ in exact.top_k(query, 10, threshold=0.99)]
+
+
+class TestBackendSelection:
+    """create_ann_index and SemanticAnchorGraph wiring."""
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            create_ann_index("hnswlib")
+
+    def test_auto_prefers_faiss(self):
+        expected = FaissIndex if FAISS_AVAILABLE else EmbeddingMatrix
+        assert isinstance(create_ann_index("auto"), expected)
+
+    def test_graph_consolidates_through_ann_index(self):
+        graph = SemanticAnchorGraph(
+            embedding_provider=BagOfWordsProvider(),
+            config={"enable_privacy_hooks": False, "enable_memory_pooling": False,
+                    "ann_backend": "ivf", "ann_config": {"train_threshold": 2}}
+        )
+        first = graph.create_or_update_anchor("castle memory architecture", "u1", {})
+        graph.create_or_update_anchor("evaporation distills raw mist", "u2", {})
+        graph.create_or_update_anchor("giant compressor strata", "u3", {})
+
+        assert isinstance(graph.embedding_index, IVFFlatIndex)
+        assert graph.embedding_index.is_trained
+        assert graph.create_or_update_anchor("castle memory architecture", "u4", {}) == first
+        assert len(graph.embedding_index) == len(graph.anchors) == 3
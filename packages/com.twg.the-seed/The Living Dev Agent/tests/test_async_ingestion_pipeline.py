@@ -0,0 +1,222 @@
+"""
+Async Ingestion Pipeline Tests
+
+Covers AsyncStreamingIngestionPipeline:
+- await ingest suspending under backpressure instead of rejecting
+- Priority order and bulk batches from the asyncio.PriorityQueue
+- Concurrent async batch workers, timeouts and retries with original ids
+- Adaptive batch sizing and PipelineMetrics shared with the threaded pipeline
+"""
+
+import asyncio
+import time
+
+from seed.engine.streaming_ingestion_pipeline import (
+    AsyncStreamingIngestionPipeline, Fragment, PipelineState, BackpressureLevel
+)
+
+
+def _fragment(i, priority=1):
+    return Fragment(fragment_id=f"f{i}", content=f"content {i}", metadata={}, priority=priority, timestamp=1000.0 + i)
+
+
+class TestBackpressure:
+    """A full queue suspends producers."""
+
+    def test_ingest_suspends_until_space(self):
+        async def scenario():
+            gate = asyncio.Event()
+            processed = []
+
+            async def processor(fragments):
+                await gate.wait()
+                processed.extend(f.fragment_id for f in fragments)
+                return True
+
+            pipeline = AsyncStreamingIngestionPipeline(processor, initial_batch_size=1, max_queue_size=2)
+            await pipeline.start()
+            producer = asyncio.create_task(pipeline.ingest_batch([_fragment(i) for i in range(6)]))
+            await asyncio.sleep(0.05)
+            assert not producer.done()  # one batch in flight, two queued, the rest waiting
+            assert pipeline.ingestion_queue.qsize() == 2
+
+            gate.set()
+            assert await producer == 6
+            await pipeline.join()
+            await pipeline.stop()
+            return pipeline, processed
+
+        pipeline, processed = asyncio.run(scenario())
+        assert processed == [f"f{i}" for i in range(6)]
+        assert pipeline.metrics.backpressure_events == 0
+        assert pipeline.metrics.queue_depth_max == 2
+
+    def test_ingest_timeout_rejects(self):
+        async def scenario():
+            levels = []
+            pipeline = AsyncStreamingIngestionPipeline(lambda fragments: True, max_queue_size=1)
+            pipeline.set_backpressure_callback(levels.append)
+            pipeline.state = PipelineState.RUNNING  # accept ingests without draining workers
+            assert await pipeline.ingest(_fragment(0))
+            assert not await pipeline.ingest(_fragment(1), timeout=0.01)
+            assert not pipeline.ingest_nowait(_fragment(2))
+            return pipeline, levels
+
+        pipeline, levels = asyncio.run(scenario())
+        assert pipeline.metrics.backpressure_events == 2
+        assert pipeline.state == PipelineState.BACKPRESSURE
+        assert levels[0] == BackpressureLevel.CRITICAL
+
+    def test_stopped_pipeline_rejects(self):
+        pipeline = AsyncStreamingIngestionPipeline(lambda fragments: True)
+        assert not asyncio.run(pipeline.ingest(_fragment(0)))
+
+
+class TestBatches:
+    """Batches follow (-priority, timestamp) order."""
+
+    def test_priority_order_in_one_batch(self):
+        async def scenario():
+            batches = []
+
+            async def processor(fragments):
+                batches.append([f.fragment_id for f in fragments])
+                return True
+
+            pipeline = AsyncStreamingIngestionPipeline(processor, initial_batch_size=10)
+            await pipeline.start()
+            for i, priority in enumerate([1, 5, 3, 5, 1, 3]):
+                pipeline.ingest_nowait(_fragment(i, priority))  # no await: all queued before the worker runs
+            await pipeline.join()
+            await pipeline.stop()
+            return pipeline, batches
+
+        pipeline, batches = asyncio.run(scenario())
+        assert batches == [["f1", "f3", "f2", "f5", "f0", "f4"]]
+        assert pipeline.metrics.total_batches_processed == 1
+        assert pipeline.metrics.average_batch_size == 6
+
+    def test_sync_processor_accepted(self):
+        async def scenario():
+            pipeline = AsyncStreamingIngestionPipeline(lambda fragments: len(fragments) > 0)
+            await pipeline.start()
+            await pipeline.ingest_batch([_fragment(i) for i in range(25)])
+            await pipeline.join()
+            await pipeline.stop()
+            return pipeline
+
+        assert asyncio.run(scenario()).metrics.total_fragments_processed == 25
+
+    def test_batch_size_adapts(self):
+        async def scenario():
+            pipeline = AsyncStreamingIngestionPipeline(lambda fragments: True, initial_batch_size=2,
+                                                       max_batch_size=20, max_queue_size=5000)
+            await pipeline.start()
+            for i in range(2000):
+                await pipeline.ingest(_fragment(i))
+                if i % 50 == 0:
+                    await asyncio.sleep(0)  # let the worker take small batches as fragments arrive
+            await pipeline.join()
+            await pipeline.stop()
+            return pipeline
+
+        pipeline = asyncio.run(scenario())
+        assert pipeline.current_batch_size > 2
+        assert pipeline.get_status()["workers"]["worker_mode"] == "asyncio"
+
+
+class TestWorkers:
+    """N worker tasks, timeouts and retries."""
+
+    def test_workers_run_concurrently(self):
+        async def scenario():
+            in_flight, peak = [0], [0]
+
+            async def processor(fragments):
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+                await asyncio.sleep(0.02)
+                in_flight[0] -= 1
+                return True
+
+            pipeline = AsyncStreamingIngestionPipeline(processor, initial_batch_size=1, num_workers=4)
+            await pipeline.start()
+            await pipeline.ingest_batch([_fragment(i) for i in range(8)])
+            await pipeline.join()
+            await pipeline.stop()
+            return pipeline, peak[0]
+
+        pipeline, peak = asyncio.run(scenario())
+        assert peak == 4
+        assert pipeline.metrics.total_fragments_processed == 8
+
+    def test_timeout_cancels_and_retries_with_same_id(self):
+        async def scenario():
+            calls = []
+
+            async def processor(fragments):
+                calls.append([f.fragment_id for f in fragments])
+                if len(calls) == 1:
+                    await asyncio.sleep(5)  # first attempt hangs past the timeout
+                return True
+
+            pipeline = AsyncStreamingIngestionPipeline(processor, processing_timeout_sec=0.05)
+            await pipeline.start()
+            await pipeline.ingest(_fragment(0, priority=3))
+            await pipeline.join()
+            await pipeline.stop()
+            return pipeline, calls
+
+        started = time.perf_counter()
+        pipeline, calls = asyncio.run(scenario())
+        assert time.perf_counter() - started < 2
+        assert calls == [["f0"], ["f0"]]
+        assert pipeline.metrics.timed_out_batches == 1
+        assert pipeline.metrics.total_fragments_processed == 1
+
+    def test_dead_letter_after_max_retries(self):
+        async def scenario():
+            attempts = []
+
+            async def failing(fragments):
+                attempts.extend(f.fragment_id for f in fragments)
+                return False
+
+            pipeline = AsyncStreamingIngestionPipeline(failing, max_retries=3)
+            await pipeline.start()
+            await pipeline.ingest(_fragment(0, priority=5))
+            await pipeline.join()
+            await pipeline.stop()
+            return pipeline, attempts
+
+        pipeline, attempts = asyncio.run(scenario())
+        assert attempts == ["f0", "f0", "f0"]
+        assert pipeline.metrics.failed_fragments == 3
+        assert pipeline.metrics.dead_lettered_fragments == 1
+
+    def test_retry_into_full_queue_counted(self):
+        async def scenario():
+            pipeline = AsyncStreamingIngestionPipeline(lambda fragments: True, max_queue_size=1)
+            pipeline.state = PipelineState.RUNNING  # drive batches by hand
+            await pipeline.ingest(_fragment(0, priority=3))
+            failed = pipeline._collect_batch(pipeline.ingestion_queue.get_nowait()[-1])
+            await pipeline.ingest(_fragment(1))
+            return pipeline, pipeline._retry_failed(failed, pipeline._requeue)
+
+        pipeline, unretried = asyncio.run(scenario())
+        assert [f.fragment_id for f in unretried] == ["f0"]
+        assert pipeline.metrics.dropped_retries == 1
+        assert pipeline.metrics.backpressure_events == 1
+
+    def test_stop_is_prompt_when_idle(self):
+        async def scenario():
+            pipeline = AsyncStreamingIngestionPipeline(lambda fragments: True, num_workers=3)
+            await pipeline.start()
+            await asyncio.sleep(0.01)
+            started = time.perf_counter()
+            await pipeline.stop()
+            return pipeline, time.perf_counter() - started
+
+        pipeline, elapsed = asyncio.run(scenario())
+        assert elapsed < 0.5
+        assert pipeline.state == PipelineState.STOPPED
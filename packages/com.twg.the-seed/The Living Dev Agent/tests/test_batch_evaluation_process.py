@@ -0,0 +1,145 @@
+"""
+Batch Evaluation Process Mode Tests
+
+Covers ReplayMode.PROCESS in BatchEvaluationEngine:
+- Process-pool results matching sequential replay
+- Batch failures, progress and completion callbacks handled in the parent
+- Periodic checkpoints during the run, and resume after one or more worker crashes
+- Original corpus indices kept when resuming from a checkpoint
+"""
+
+import json
+import os
+
+from seed.engine.batch_evaluation import BatchEvaluationEngine, BatchStatus, ReplayMode
+
+CRASH_ENV = "BATCH_EVAL_TEST_CRASH"
+
+
+def square(items):
+    """Module-level so the process pool can pickle it."""
+    return [(item, item * item) for item in items]
+
+
+def fail_on_seven(items):
+    if 7 in items:
+        raise ValueError("seven")
+    return [(item, item * item) for item in items]
+
+
+def crash_on_poison(items):
+    if os.environ.get(CRASH_ENV) and int(os.environ[CRASH_ENV]) in items:
+        os._exit(1)  # simulated worker crash
+    return [(item, item * item) for item in items]
+
+
+class TestProcessReplay:
+    """Batches run in worker processes over the mapped corpus."""
+
+    def test_matches_sequential(self, tmp_path):
+        corpus = list(range(500))
+        sequential = BatchEvaluationEngine(checkpoint_dir=str(tmp_path)).process_corpus(
+            corpus, square, operation_id="seq", mode=ReplayMode.SEQUENTIAL, batch_size=25)
+        pooled = BatchEvaluationEngine(max_workers=3, checkpoint_dir=str(tmp_path)).process_corpus(
+            corpus, square, operation_id="proc", mode=ReplayMode.PROCESS, batch_size=25)
+
+        assert pooled["status"] == "completed"
+        assert sorted(pooled["results"]) == sequential["results"]
+        assert pooled["progress"]["processed_items"] == 500
+        assert pooled["progress"]["completed_batches"] == 20
+
+    def test_failed_batch_and_callbacks(self, tmp_path):
+        engine = BatchEvaluationEngine(max_workers=2, checkpoint_dir=str(tmp_path))
+        completed, updates = [], []
+        engine.set_batch_completion_callback(completed.append)
+        engine.set_progress_callback(lambda progress: updates.append(progress.processed_items))
+
+        result = engine.process_corpus(list(range(40)), fail_on_seven, operation_id="op",
+                                       mode=ReplayMode.PROCESS, batch_size=10)
+
+        assert result["status"] == "completed"
+        assert len(result["results"]) == 30
+        assert result["progress"]["failed_items"] == 10
+        failed = [r for r in engine.batch_results.values() if r.status == BatchStatus.FAILED]
+        assert [r.error_details for r in failed] == [{"error": "seven"}]
+        assert len(completed) == 3
+        assert len(updates) == 4 and updates == sorted(updates) and updates[-1] == 30
+
+    def test_empty_corpus(self, tmp_path):
+        result = BatchEvaluationEngine(checkpoint_dir=str(tmp_path)).process_corpus(
+            [], square, operation_id="empty", mode=ReplayMode.PROCESS)
+        assert result["status"] == "completed"
+        assert result["results"] == []
+
+
+class TestCheckpoints:
+    """Checkpoints are written by the parent and resume skips processed items."""
+
+    def test_periodic_checkpoint_during_run(self, tmp_path):
+        engine = BatchEvaluationEngine(max_workers=2, checkpoint_interval=20, checkpoint_dir=str(tmp_path))
+        seen = []
+
+        def on_progress(progress):
+            with open(tmp_path / "op.json") as f:
+                seen.append(len(json.load(f)["processed_items"]))
+
+        engine.set_progress_callback(on_progress)
+        engine.process_corpus(list(range(100)), square, operation_id="op", mode=ReplayMode.PROCESS, batch_size=20)
+
+        assert seen == [20, 40, 60, 80, 100]
+        assert not (tmp_path / "op.json").exists()  # removed on completion
+
+    def test_resume_after_worker_crash(self, tmp_path, monkeypatch):
+        corpus = list(range(200))
+        monkeypatch.setenv(CRASH_ENV, "50")
+        engine = BatchEvaluationEngine(max_workers=2, checkpoint_dir=str(tmp_path))
+        crashed = engine.process_corpus(corpus, crash_on_poison, operation_id="op",
+                                        mode=ReplayMode.PROCESS, batch_size=10)
+        assert crashed["status"] == "failed"
+        with open(tmp_path / "op.json") as f:
+            done = set(json.load(f)["processed_items"])
+        assert 50 not in done
+
+        monkeypatch.delenv(CRASH_ENV)
+        resumed = BatchEvaluationEngine(max_workers=2, checkpoint_dir=str(tmp_path)).process_corpus(
+            corpus, crash_on_poison, operation_id="op", mode=ReplayMode.PROCESS, batch_size=10)
+
+        assert resumed["status"] == "completed"
+        assert sorted(item for item, _ in resumed["results"]) == sorted(set(corpus) - done)
+        assert resumed["progress"]["processed_items"] == 200
+
+    def test_resume_after_two_crashes(self, tmp_path, monkeypatch):
+        corpus = list(range(100))
+        engine = BatchEvaluationEngine(max_workers=2, checkpoint_dir=str(tmp_path))
+
+        def run(target):
+            return target.process_corpus(corpus, crash_on_poison, operation_id="op",
+                                         mode=ReplayMode.PROCESS, batch_size=10)
+
+        def checkpointed():
+            with open(tmp_path / "op.json") as f:
+                return set(json.load(f)["processed_items"])
+
+        monkeypatch.setenv(CRASH_ENV, "55")
+        assert run(engine)["status"] == "failed"
+        first = checkpointed()
+        assert 55 not in first
+        # Crash again in the still-pending batch (the other batches may all have finished)
+        second_run = run(engine)  # same engine: stale batch state must not leak in
+        assert second_run["status"] == "failed"
+        second = checkpointed()
+        assert first <= second
+        assert 55 not in second
+
+        monkeypatch.delenv(CRASH_ENV)
+        final = run(BatchEvaluationEngine(max_workers=2, checkpoint_dir=str(tmp_path)))
+        assert final["status"] == "completed"
+        assert sorted(item for item, _ in final["results"]) == sorted(set(corpus) - second)
+        assert final["progress"]["processed_items"] == 100
+
+    def test_resumed_items_keep_corpus_index(self, tmp_path):
+        engine = BatchEvaluationEngine(checkpoint_dir=str(tmp_path))
+        batches = engine._create_batches(["c", "e"], 10, "op", corpus_indices=[2, 4])
+        assert [item.metadata["corpus_index"] for item in batches[0].items] == [2, 4]
+        assert batches[0].items[1].item_id == "op_item_4"
+        assert batches[0].batch_id == "op_batch_2"
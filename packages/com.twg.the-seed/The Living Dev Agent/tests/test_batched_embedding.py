@@ -0,0 +1,145 @@
+"""
+Batched Embedding Tests
+
+Covers the batch-first ingestion path:
+- EmbeddingProvider.embed_in_batches request sizing
+- SemanticAnchorGraph.create_or_update_anchors_bulk parity with per-item calls
+- ConflictDetector.process_statements embedding a batch in one request
+- RetrievalAPI.add_documents bulk insertion
+"""
+
+from seed.engine.semantic_anchors import SemanticAnchorGraph
+from seed.engine.conflict_detector import ConflictDetector
+from seed.engine.retrieval_api import RetrievalAPI
+
+from test_embedding_matrix import BagOfWordsProvider
+
+
+class CountingProvider(BagOfWordsProvider):
+    """BagOfWordsProvider that records the size of every embed_batch request."""
+
+    def __init__(self, dimension=32, max_batch_size=None, max_batch_tokens=None):
+        super().__init__(dimension)
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.batch_sizes = []
+        self.single_calls = 0
+
+    def embed_text(self, text):
+        self.single_calls += 1
+        return super().embed_text(text)
+
+    def embed_batch(self, texts):
+        self.batch_sizes.append(len(texts))
+        return [super(CountingProvider, self).embed_text(text) for text in texts]
+
+
+GRAPH_CONFIG = {"enable_privacy_hooks": False, "enable_memory_pooling": False}
+
+
+class TestEmbedInBatches:
+    """Provider-sized request splitting."""
+
+    def test_respects_max_batch_size(self):
+        provider = CountingProvider(max_batch_size=4)
+        embeddings = provider.embed_in_batches([f"text {i}" for i in range(10)])
+        assert len(embeddings) == 10
+        assert provider.batch_sizes == [4, 4, 2]
+
+    def test_respects_token_budget(self):
+        provider = CountingProvider(max_batch_tokens=10)
+        provider.embed_in_batches(["x" * 20, "y" * 20, "z" * 20])  # ~6 tokens each
+        assert provider.batch_sizes == [1, 1, 1]
+
+    def test_unlimited_by_default(self):
+        provider = CountingProvider()
+        provider.embed_in_batches([f"text {i}" for i in range(100)])
+        assert provider.batch_sizes == [100]
+
+
+class TestAnchorBulkIngest:
+    """Bulk anchor creation matches the per-item path."""
+
+    ITEMS = [
+        ("castle memory architecture", "u1", {}),
+        ("evaporation distills raw mist", "u2", {}),
+        ("castle memory architecture", "u3", {}),
+        ("giant compressor strata", "u4", {}),
+    ]
+
+    def test_matches_sequential_path(self):
+        sequential = SemanticAnchorGraph(embedding_provider=CountingProvider(), config=GRAPH_CONFIG)
+        expected = [sequential.create_or_update_anchor(*item) for item in self.ITEMS]
+
+        provider = CountingProvider()
+        bulk = SemanticAnchorGraph(embedding_provider=provider, config=GRAPH_CONFIG)
+        actual = bulk.create_or_update_anchors_bulk(self.ITEMS)
+
+        # Duplicate text consolidates into the anchor created earlier in the batch
+        assert actual[0] == actual[2]
+        assert len(set(actual)) == len(set(expected)) == 3
+        assert bulk.metrics == sequential.metrics
+        assert provider.single_calls == 0
+        assert provider.batch_sizes == [3]  # Distinct texts embedded once
+
+
+class TestConflictBatching:
+    """ConflictDetector embeds a statement batch in one request."""
+
+    STATEMENTS = [
+        {"id": "s1", "text": "The memory system is always stable"},
+        {"id": "s2", "text": "The memory system is not stable"},
+        {"id": "s3", "text": "   "},
+        {"id": "s4", "text": "Semantic anchors decay over time"},
+    ]
+    CONFIG = {"semantic_similarity_threshold": 0.5, "opposition_threshold": 0.3,
+              "min_confidence_score": 0.3}
+
+    def test_single_batch_and_same_conflicts(self):
+        provider = CountingProvider()
+        detector = ConflictDetector(embedding_provider=provider, config=self.CONFIG)
+        report = detector.process_statements(self.STATEMENTS)
+
+        assert provider.batch_sizes == [3]
+        assert provider.single_calls == 0
+        assert report["statements_processed"] == 4
+        assert report["fingerprints_created"] == 3
+
+        reference = ConflictDetector(embedding_provider=BagOfWordsProvider(), config=self.CONFIG)
+        for statement in self.STATEMENTS:
+            reference.process_statements([statement])
+
+        pairs = {(c.statement_a_id, c.statement_b_id) for c in detector.detected_conflicts}
+        assert pairs == {(c.statement_a_id, c.statement_b_id) for c in reference.detected_conflicts}
+        assert ("s2", "s1") in pairs
+
+
+class TestAddDocuments:
+    """Bulk context store insertion."""
+
+    def test_flags_duplicates_in_order(self):
+        api = RetrievalAPI()
+        assert api.add_document("d1", "existing document")
+
+        added = api.add_documents([
+            {"doc_id": "d1", "content": "duplicate"},
+            {"doc_id": "d2", "content": "second document", "metadata": {"realm": "lore"}},
+            {"doc_id": "d2", "content": "duplicate within batch"},
+        ])
+
+        assert added == [False, True, False]
+        assert api.get_context_store_size() == 2
+        assert api._context_store["d2"]["metadata"] == {"realm": "lore"}
+
+    def test_duplicate_id_indexed_with_stored_content(self):
+        provider = BagOfWordsProvider()
+        api = RetrievalAPI(embedding_provider=provider, config={"document_index_backend": "exact"})
+
+        assert api.add_documents([
+            {"doc_id": "d", "content": "castle castle castle"},
+            {"doc_id": "d", "content": "dragon dragon"},
+        ]) == [True, False]
+
+        assert api._context_store["d"]["content"] == "castle castle castle"
+        (doc_id, score), = api.document_index.top_k(provider.embed_text("castle castle castle"), 1)
+        assert doc_id == "d" and score > 0.99
@@ -0,0 +1,142 @@
+"""
+BitChain Binary Record Tests
+
+Covers the fixed-layout record format in bitchain_binary:
+- Round trip BitChain -> record -> BitChain for generated and edge-case chains
+- Record-side canonical bytes / addresses matching the JSON canonical form
+- Memory-mapped file iteration and rejection of values the layout cannot hold
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add seed/engine to path
+engine_dir = Path(__file__).resolve().parents[2] / 'seed' / 'engine'
+sys.path.insert(0, str(engine_dir))
+
+from stat7_experiments import (
+    BitChain, Coordinates, DataClass, canonical_serialize, generate_random_bitchain
+)
+from bitchain_binary import (
+    BitChainFileReader, encode_bitchain, encode_bitchains, decode_bitchains,
+    iter_records, write_bitchains
+)
+
+
+def _edge_bitchain(**overrides):
+    fields = dict(
+        id='ñandú-✓',
+        entity_type='custom-type',
+        realm='off-map',
+        coordinates=Coordinates(realm='void', lineage=-300, adjacency=['z', 'a', 'é'],
+                                horizon='afterglow', resonance=0.125000005,
+                                velocity=-0.0, density=1),
+        created_at='2025-03-04T05:06:07.089Z',
+        state={'nested': {'b': [1, 2.5, None], 'a': 'x'}, 'flag': True},
+        data_classification=DataClass.PII,
+        access_control_list=['owner', 'auditor'],
+        owner_id='user-1',
+        encryption_key_id='key-9',
+    )
+    fields.update(overrides)
+    return BitChain(**fields)
+
+
+def _canonical(bitchain):
+    return canonical_serialize(bitchain.to_canonical_dict()).encode('utf-8')
+
+
+class TestRoundTrip:
+    """Encoding and decoding preserve every field."""
+
+    def test_generated_chains_round_trip(self):
+        random.seed(21)
+        bitchains = [generate_random_bitchain() for _ in range(300)]
+        assert decode_bitchains(encode_bitchains(bitchains)) == bitchains
+
+    def test_edge_case_chain_round_trips(self):
+        bitchain = _edge_bitchain()
+        decoded, = decode_bitchains(encode_bitchain(bitchain))
+
+        assert decoded == bitchain
+        assert decoded.coordinates.density == 1.0
+
+    def test_record_is_smaller_than_canonical_json(self):
+        random.seed(4)
+        bitchains = [generate_random_bitchain() for _ in range(100)]
+        binary_size = len(encode_bitchains(bitchains))
+        json_size = sum(len(_canonical(bc)) for bc in bitchains)
+        assert binary_size < json_size * 0.6
+
+
+class TestCanonicalEquivalence:
+    """Record-side hashing matches the JSON canonical form."""
+
+    def test_generated_chain_addresses(self):
+        random.seed(8)
+        bitchains = [generate_random_bitchain() for _ in range(1000)]
+        records = list(iter_records(encode_bitchains(bitchains)))
+
+        for bitchain, record in zip(bitchains, records):
+            assert record.canonical_bytes() == _canonical(bitchain)
+            assert record.compute_address() == bitchain.compute_address()
+
+    def test_edge_case_canonical_bytes(self):
+        bitchain = _edge_bitchain()
+        record, = iter_records(encode_bitchain(bitchain))
+
+        assert record.canonical_bytes() == _canonical(bitchain)
+        assert record.realm == 'off-map'
+        assert record.horizon == 'afterglow'
+        assert record.lineage == -300
+        assert record.adjacency == ['z', 'a', 'é']
+
+
+class TestFileReader:
+    """Memory-mapped iteration over a written file."""
+
+    def test_reader_iterates_without_decoding(self, tmp_path):
+        random.seed(13)
+        bitchains = [generate_random_bitchain() for _ in range(200)]
+        path = str(tmp_path / 'chains.bin')
+        written = write_bitchains(path, bitchains)
+
+        with BitChainFileReader(path) as reader:
+            records = list(reader)
+            assert [record.id for record in records] == [bc.id for bc in bitchains]
+            assert sum(record.size for record in records) == written
+            assert records[7].to_bitchain() == bitchains[7]
+
+    def test_empty_file(self, tmp_path):
+        path = str(tmp_path / 'empty.bin')
+        write_bitchains(path, [])
+        with BitChainFileReader(path) as reader:
+            assert list(reader) == []
+
+    def test_truncated_buffer_raises(self):
+        data = encode_bitchain(_edge_bitchain())
+        with pytest.raises(ValueError):
+            list(iter_records(data[:-3]))
+
+
+class TestLayoutLimits:
+    """Values outside the fixed layout are rejected at encode time."""
+
+    @pytest.mark.parametrize("coordinates", [
+        Coordinates('data', 1.5, [], 'peak', 0.1, 0.1, 0.1),
+        Coordinates('data', 1, [7], 'peak', 0.1, 0.1, 0.1),
+        Coordinates('data', 1, [], 'peak', float('inf'), 0.1, 0.1),
+        Coordinates('data', 1, [], 'peak', True, 0.1, 0.1),
+    ])
+    def test_unencodable_coordinates(self, coordinates):
+        with pytest.raises(ValueError):
+            encode_bitchain(_edge_bitchain(coordinates=coordinates))
+
+    def test_unnormalized_timestamp(self):
+        bitchain = _edge_bitchain()
+        bitchain.created_at = '2025-03-04T05:06:07.089123Z'
+        with pytest.raises(ValueError):
+            encode_bitchain(bitchain)
@@ -0,0 +1,167 @@
+"""
+Castle Graph Extraction Tests
+
+Covers CastleGraph concept extraction during infuse:
+- One text analysis per proto-thought shared by every method
+- Memoized extraction keyed by proto-thought and mist context
+- Bounded extraction_history
+- Process-pool infusion matching a serial infusion, opt-in, with a serial fallback
+"""
+
+import random
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from seed.engine import castle_graph
+from seed.engine.castle_graph import CastleGraph
+
+WORDS = ("system algorithm Memory_castle design the of pattern builder creating analyzed framework "
+         "optimization mist glyph Thought structure a to Ancient wisdom data model node_graph").split()
+
+
+def _mist_lines(count, seed=0):
+    rng = random.Random(seed)
+    mist_lines = []
+    for i in range(count):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randrange(2, 14)))
+        if i % 5 == 0 and mist_lines:
+            text = rng.choice(mist_lines)["proto_thought"]
+        mist_lines.append({
+            "id": f"mist_{i}",
+            "proto_thought": text,
+            "style": rng.choice(["technical", "poetic", "narrative"]),
+            "affect_signature": {"curiosity": rng.random(), "awe": rng.random()},
+            "mythic_weight": rng.random(),
+        })
+    return mist_lines
+
+
+def _signature(result):
+    return (result.concept_id, result.confidence, result.extraction_method, result.supporting_terms,
+            result.semantic_density, result.novelty_score, result.statistical_significance)
+
+
+class TestSharedAnalysis:
+    """The proto-thought is cleaned and tokenized once for all methods."""
+
+    def test_text_cleaned_once_per_extraction(self, monkeypatch):
+        graph = CastleGraph()
+        calls = []
+        clean_text = graph._clean_text
+        monkeypatch.setattr(graph, "_clean_text", lambda text: calls.append(text) or clean_text(text))
+
+        result = graph._extract_concept_scientific(
+            {"id": "m", "proto_thought": "The system design of the Memory_castle framework", "style": "technical"})
+        assert result is not None
+        assert len(calls) == 1
+
+    def test_hybrid_alone_matches_reused_results(self):
+        graph = CastleGraph()
+        mist = {"proto_thought": "creating a pattern builder for the system pattern", "style": "technical"}
+        analysis = graph._analyze_text(mist["proto_thought"])
+        results = {name: graph.extraction_methods[name](mist["proto_thought"], mist, analysis)
+                   for name in ("linguistic", "semantic", "statistical")}
+        results = {name: result for name, result in results.items() if result}
+
+        assert graph._extract_hybrid_concept(mist["proto_thought"], mist) == \
+            graph._extract_hybrid_concept(mist["proto_thought"], mist, analysis, results)
+
+
+class TestMemoization:
+    """Repeated proto-thoughts reuse their extraction; graph state is still applied."""
+
+    def test_repeat_served_from_cache(self, monkeypatch):
+        graph = CastleGraph()
+        mist = {"id": "m", "proto_thought": "system design of the Memory_castle framework", "style": "technical"}
+        first = graph._extract_concept_scientific(mist)
+        monkeypatch.setattr(graph, "_analyze_text", lambda text: (_ for _ in ()).throw(AssertionError("re-analyzed")))
+
+        graph._track_concept_statistics(first, mist)
+        second = graph._extract_concept_scientific(mist)
+        assert second.concept_id == first.concept_id
+        assert first.novelty_score == 1.0
+        assert second.novelty_score == 0.7
+
+    def test_context_is_part_of_the_key(self):
+        graph = CastleGraph()
+        text = "the system design of the framework"
+        technical = graph._extraction_key(text, {"style": "technical"})
+        assert technical == graph._extraction_key(text, {"style": "technical", "affect_signature": {"awe": 0.2}})
+        assert technical != graph._extraction_key(text, {"style": "poetic"})
+        assert technical != graph._extraction_key(text, {"style": "technical", "affect_signature": {"awe": 0.9}})
+
+    def test_cache_bounded(self):
+        graph = CastleGraph({"extraction_cache_size": 10})
+        graph.infuse(_mist_lines(100))
+        assert len(graph._extraction_cache) == 10
+
+
+class TestBoundedHistory:
+    """extraction_history keeps only the most recent results."""
+
+    def test_history_capped(self):
+        graph = CastleGraph({"max_extraction_history": 25})
+        metrics = graph.infuse(_mist_lines(200))
+
+        assert metrics["successful_extractions"] > 25
+        assert len(graph.extraction_history) == 25
+        rooms = graph.get_top_rooms(50)
+        assert sum(room["extraction_count"] for room in rooms) <= 25
+
+
+class TestParallelInfusion:
+    """Pool extraction with the serial merge order."""
+
+    def test_matches_serial(self):
+        mist_lines = _mist_lines(300, seed=1)
+        serial = CastleGraph({"infusion_workers": 1})
+        serial.infuse(mist_lines)
+        pooled = CastleGraph({"infusion_workers": 2, "infusion_chunk_size": 40})
+        pooled.infuse(mist_lines)
+
+        assert [_signature(r) for r in pooled.extraction_history] == [_signature(r) for r in serial.extraction_history]
+        assert list(pooled.nodes) == list(serial.nodes)
+        assert [node["visit_count"] for node in pooled.nodes.values()] == \
+            [node["visit_count"] for node in serial.nodes.values()]
+        # Heat decays by whole seconds, so allow for a clock tick between the two runs
+        assert [node["heat"] for node in pooled.nodes.values()] == \
+            pytest.approx([node["heat"] for node in serial.nodes.values()], rel=1e-3)
+
+    def test_pool_is_opt_in(self, monkeypatch):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("default infusion must not start a process pool")
+
+        monkeypatch.setattr(castle_graph, "ProcessPoolExecutor", no_pool)
+        graph = CastleGraph({"infusion_chunk_size": 40})
+        assert graph.infusion_workers == 1
+        assert graph.infuse(_mist_lines(300, seed=1))["successful_extractions"] > 0
+
+    def test_falls_back_to_serial_when_pool_fails(self, monkeypatch):
+        mist_lines = _mist_lines(300, seed=1)
+        serial = CastleGraph()
+        serial.infuse(mist_lines)
+
+        unpicklable = CastleGraph({"infusion_workers": 2, "infusion_chunk_size": 40, "hook": lambda: None})
+        unpicklable.infuse(mist_lines)
+
+        class BrokenPool:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def map(self, *args):
+                raise BrokenProcessPool("worker died")
+
+        monkeypatch.setattr(castle_graph, "ProcessPoolExecutor", BrokenPool)
+        broken = CastleGraph({"infusion_workers": 2, "infusion_chunk_size": 40})
+        broken.infuse(mist_lines)
+
+        for graph in (unpicklable, broken):
+            assert [_signature(r) for r in graph.extraction_history] == \
+                [_signature(r) for r in serial.extraction_history]
@@ -0,0 +1,117 @@
+"""
+Cloud Store Tests
+
+Covers the expiring, top-k indexed CloudStore:
+- get_active_mist in the order of the original full rescoring
+- Expiry of mist past the one-hour recency horizon
+- Bounded retention under continuous evaporation cycles
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add seed/engine to path
+engine_dir = Path(__file__).resolve().parents[2] / 'seed' / 'engine'
+sys.path.insert(0, str(engine_dir))
+
+import evaporation
+import melt_layer
+from evaporation import CloudStore, EvaporationEngine
+from melt_layer import MagmaStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(evaporation.time, "time", clock.time)
+    return clock
+
+
+def _mist(rng, created):
+    return {
+        "id": f"mist_{rng.random()}",
+        "created_epoch": created,
+        "distillation_quality": rng.random(),
+        "mythic_weight": rng.random(),
+        "style_confidence": rng.random(),
+    }
+
+
+def _rescored(mist_lines, now, limit):
+    """The original get_active_mist, restricted to mist inside the horizon."""
+    def score(mist):
+        age = now - mist["created_epoch"]
+        return (max(0, 1.0 - age / 3600) * 0.4 + mist["distillation_quality"] * 0.3
+                + mist["mythic_weight"] * 0.2 + mist["style_confidence"] * 0.1)
+    active = [m for m in mist_lines if now - m["created_epoch"] <= 3600]
+    return sorted(active, key=score, reverse=True)[:limit]
+
+
+class TestActiveMist:
+    """Top-k served from the rank heap."""
+
+    def test_matches_rescoring_as_time_passes(self, clock):
+        rng = random.Random(0)
+        store = CloudStore()
+        added = []
+        for _ in range(40):
+            clock.now += 97
+            batch = [_mist(rng, clock.now - rng.randrange(300)) for _ in range(5)]
+            store.add_mist_lines(batch)
+            added.extend(batch)
+            for limit in (1, 10):
+                assert store.get_active_mist(limit) == _rescored(added, clock.now, limit)
+
+    def test_empty_and_missing_fields(self, clock):
+        store = CloudStore()
+        assert store.get_active_mist() == []
+        store.add_mist_lines([{"id": "bare"}])
+        assert store.get_active_mist() == [{"id": "bare"}]
+
+
+class TestExpiry:
+    """Mist past the recency horizon is dropped."""
+
+    def test_expired_mist_is_dropped(self, clock):
+        rng = random.Random(1)
+        store = CloudStore()
+        store.add_mist_lines([_mist(rng, clock.now) for _ in range(10)])
+        store.add_mist_lines([_mist(rng, clock.now - 4000)])  # already past the horizon
+        assert len(store.mist_lines) == 10
+
+        clock.now += 3601
+        assert store.get_active_mist() == []
+        clock.now += 60
+        store.get_active_mist()
+        assert store.mist_lines == []
+        assert store._buckets == {}
+
+    def test_retention_bounded_under_evaporation(self, clock, monkeypatch):
+        monkeypatch.setattr(melt_layer.time, "time", clock.time)
+        rng = random.Random(2)
+        magma = MagmaStore()
+        for i in range(200):
+            magma.add_glyph({"id": f"g{i}", "heat_seed": rng.random(), "created_epoch": clock.now,
+                             "affect": {"awe": 0.2}, "compressed_summary": f"summary {i}"})
+        cloud = CloudStore()
+        engine = EvaporationEngine(magma, cloud)
+
+        sizes = []
+        for _ in range(6 * 60):  # six simulated hours, one cycle a minute
+            clock.now += 60
+            engine.evaporate(limit=3)
+            assert len(cloud.get_active_mist(5)) == min(5, len(cloud.mist_lines))
+            sizes.append(len(cloud.mist_lines))
+        assert max(sizes) <= 3 * 62
+        assert len(cloud._ranked) <= 2 * len(cloud.mist_lines) + 1024
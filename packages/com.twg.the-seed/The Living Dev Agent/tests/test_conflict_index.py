@@ -0,0 +1,143 @@
+"""
+Conflict Index Tests
+
+Covers ConflictDetector's statement similarity index:
+- Conflicts identical to scoring every retained pair
+- Index kept in sync with re-processed statements, cleanup and resolve_conflict
+- Pairwise fallback for embeddings of another dimension
+"""
+
+import random
+
+import pytest
+
+from seed.engine import conflict_detector
+from seed.engine.conflict_detector import ConflictDetector
+from seed.engine.embeddings.base_provider import EmbeddingProvider
+
+from test_embedding_matrix import BagOfWordsProvider
+
+# Bag-of-words cosines land exactly on 0.5; keep the threshold off that tie
+CONFIG = {"semantic_similarity_threshold": 0.55, "opposition_threshold": 0.3,
+          "min_confidence_score": 0.3}
+
+SUBJECTS = ["memory system", "castle graph", "semantic anchor", "giant compressor", "mist layer"]
+CLAIMS = ["is stable", "is not stable", "always persists", "never persists", "runs before sync",
+          "runs after sync", "is definitely proven fact", "is wrong"]
+
+
+def _statements(count, seed=0, prefix="s"):
+    rng = random.Random(seed)
+    return [{"id": f"{prefix}{i}", "text": f"The {rng.choice(SUBJECTS)} {rng.choice(CLAIMS)}"}
+            for i in range(count)]
+
+
+def _all_pairs(detector, statements):
+    """(new, existing) conflicts from scoring every earlier statement pairwise."""
+    fingerprints, pairs = [], []
+    provider = detector.embedding_provider
+    for statement in statements:
+        new = detector._create_statement_fingerprint(
+            statement["id"], statement["text"], statement, provider.embed_text(statement["text"]))
+        for existing in fingerprints:
+            similarity = provider.calculate_similarity(new.embedding, existing.embedding)
+            if similarity <= detector.semantic_similarity_threshold:
+                continue
+            opposition = detector._calculate_opposition_score(new, existing)
+            if opposition <= detector.opposition_threshold:
+                continue
+            overlap = len(new.domain_tags & existing.domain_tags) / max(len(new.domain_tags | existing.domain_tags), 1)
+            indicators = (new.negation_indicators if new.negation_indicators and not existing.negation_indicators
+                          else existing.negation_indicators if existing.negation_indicators and not new.negation_indicators
+                          else [])
+            if detector._calculate_confidence_score(similarity, opposition, overlap, indicators) >= detector.min_confidence_score:
+                pairs.append((new.statement_id, existing.statement_id))
+        fingerprints.append(new)
+    return pairs
+
+
+class TestIndexedDetection:
+    """Neighbour search returns the same conflicts as the all-pairs scan."""
+
+    @pytest.mark.parametrize("backend", ["exact", "ivf"])
+    def test_matches_all_pairs(self, backend):
+        statements = _statements(150)
+        config = dict(CONFIG, ann_backend=backend,
+                      ann_config={"n_lists": 4, "n_probe": 4, "train_threshold": 32} if backend == "ivf" else None)
+        detector = ConflictDetector(embedding_provider=BagOfWordsProvider(), config=config)
+        for start in range(0, 150, 25):
+            detector.process_statements(statements[start:start + 25])
+
+        detected = [(c.statement_a_id, c.statement_b_id) for c in detector.detected_conflicts]
+        expected = _all_pairs(detector, statements)
+        assert expected
+        assert detected == expected
+        assert len(detector.statement_index) == 150
+
+    def test_reprocessed_statement_replaces_its_entry(self):
+        detector = ConflictDetector(embedding_provider=BagOfWordsProvider(), config=CONFIG)
+        detector.process_statements([{"id": "a", "text": "The memory system is stable"}])
+        detector.process_statements([{"id": "a", "text": "The memory system is not stable"}])
+
+        assert detector.detected_conflicts == []  # never compared with itself
+        assert len(detector.statement_index) == 1
+        report = detector.process_statements([{"id": "b", "text": "The memory system is stable"}])
+        assert [(c["statement_a"], c["statement_b"]) for c in report["new_conflicts"]] == [("b", "a")]
+
+
+class TestIndexConsistency:
+    """Cleanup and resolution keep the index in step with the fingerprints."""
+
+    def test_cleanup_unindexes_expired_statements(self, monkeypatch):
+        now = [1_000_000.0]
+        monkeypatch.setattr(conflict_detector.time, "time", lambda: now[0])
+        detector = ConflictDetector(embedding_provider=BagOfWordsProvider(),
+                                    config=dict(CONFIG, max_statement_age_hours=1))
+
+        detector.process_statements(_statements(20, prefix="old"))
+        now[0] += 1800
+        detector.process_statements(_statements(10, seed=1, prefix="mid"))
+        now[0] += 1801
+        detector.process_statements([{"id": "new", "text": "The memory system is stable"}])
+
+        # Cleanup runs after detection, so the next batch no longer sees old statements
+        assert set(detector.statement_fingerprints) == {f"mid{i}" for i in range(10)} | {"new"}
+        assert len(detector.statement_index) == 11
+        assert "old0" not in detector.statement_index
+        report = detector.process_statements(_statements(20, seed=2, prefix="next"))
+        assert report["new_conflicts"]
+        assert not any(c["statement_b"].startswith("old") for c in report["new_conflicts"])
+
+    def test_resolved_conflicts_keep_statements_indexed(self):
+        detector = ConflictDetector(embedding_provider=BagOfWordsProvider(), config=CONFIG)
+        report = detector.process_statements([
+            {"id": "s1", "text": "The memory system is always stable"},
+            {"id": "s2", "text": "The memory system is not stable"},
+        ])
+        assert detector.resolve_conflict(report["new_conflicts"][0]["conflict_id"], "scoped differently")
+        assert detector.detected_conflicts == []
+        assert len(detector.statement_index) == 2
+
+        report = detector.process_statements([{"id": "s3", "text": "The memory system is never stable"}])
+        assert ("s3", "s1") in [(c["statement_a"], c["statement_b"]) for c in report["new_conflicts"]]
+
+
+class TestDimensionFallback:
+    """Embeddings that do not fit the index are compared pairwise."""
+
+    def test_mismatched_dimensions(self):
+        class TwoDimensionProvider(BagOfWordsProvider):
+            def embed_batch(self, texts):
+                return [self.embed_text(t)[:16] if "short" in t else self.embed_text(t) for t in texts]
+
+        detector = ConflictDetector(embedding_provider=TwoDimensionProvider(), config=CONFIG)
+        detector.process_statements([{"id": "long", "text": "The memory system is stable"}])
+        detector.process_statements([{"id": "short", "text": "short memory system is not stable"}])
+
+        assert "short" in detector._unindexed_fingerprints
+        assert len(detector.statement_index) == 1
+        similarity = EmbeddingProvider.calculate_similarity(
+            None, detector.statement_fingerprints["short"].embedding,
+            detector.statement_fingerprints["long"].embedding)
+        assert detector._calculate_similarities(detector.statement_fingerprints["long"]) == (
+            {"short": similarity} if similarity > 0.55 else {})
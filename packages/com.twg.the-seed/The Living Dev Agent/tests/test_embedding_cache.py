@@ -0,0 +1,171 @@
+"""
+Embedding Cache Tests
+
+Covers CachedEmbeddingProvider:
+- LRU hits, misses and evictions reported through get_provider_info()
+- Batch requests embedding only distinct misses
+- Keys following the provider's full config and IDF state
+- Non-cacheable providers (vocabulary mode) passed straight through
+- Concurrent lookups, evictions and disk writes from several threads
+- Memory-mapped disk tier surviving a restart and a torn index append
+- Factory wiring through the 'cache' config section
+"""
+
+import threading
+
+import pytest
+
+from seed.engine.embeddings import CachedEmbeddingProvider, EmbeddingProviderFactory, LocalEmbeddingProvider
+
+from test_batched_embedding import CountingProvider
+
+
+class TestMemoryTier:
+    """Bounded in-memory LRU."""
+
+    def test_hits_misses_and_evictions(self):
+        inner = CountingProvider()
+        provider = CachedEmbeddingProvider(inner, {"max_entries": 2})
+
+        first = provider.embed_text("castle memory")
+        assert provider.embed_text("castle memory") == first
+        provider.embed_text("raw mist")
+        provider.embed_text("giant strata")  # Evicts "castle memory"
+        provider.embed_text("castle memory")
+
+        cache = provider.get_provider_info()["cache"]
+        assert cache["hits"] == 1
+        assert cache["misses"] == 4
+        assert cache["evictions"] == 2
+        assert cache["memory_entries"] == 2
+        assert provider.get_provider_info()["provider_id"] == inner.provider_id
+
+    def test_batch_embeds_distinct_misses_once(self):
+        inner = CountingProvider()
+        provider = CachedEmbeddingProvider(inner)
+        provider.embed_text("castle memory")
+
+        embeddings = provider.embed_batch(["castle memory", "raw mist", "raw mist", "giant strata"])
+
+        assert inner.batch_sizes == [1, 2]
+        assert embeddings[1] == embeddings[2]
+        assert embeddings[0] == inner.embed_text("castle memory")
+
+    def test_key_depends_on_provider_identity(self):
+        small = CachedEmbeddingProvider(CountingProvider(dimension=16))
+        large = CachedEmbeddingProvider(CountingProvider(dimension=32))
+        assert small.cache_key("castle") != large.cache_key("castle")
+
+    def test_key_follows_local_mode_and_idf(self):
+        hashing = LocalEmbeddingProvider({"mode": "hashing", "dimension": 16})
+        vocabulary = CachedEmbeddingProvider(LocalEmbeddingProvider({"mode": "vocabulary", "dimension": 16}))
+        cached = CachedEmbeddingProvider(hashing)
+        assert cached.cache_key("castle") != vocabulary.cache_key("castle")
+
+        plain = cached.embed_text("castle memory anchors")
+        hashing.embed_batch(["castle keep", "memory garden", "castle walls"])
+        key = cached.cache_key("castle memory anchors")
+        hashing.freeze_idf()
+        assert cached.cache_key("castle memory anchors") != key
+        weighted = cached.embed_text("castle memory anchors")
+        assert weighted == hashing.embed_text("castle memory anchors")
+        assert weighted != plain
+
+    def test_non_cacheable_provider_passes_through(self, tmp_path):
+        inner = LocalEmbeddingProvider({"mode": "vocabulary", "dimension": 16})
+        reference = LocalEmbeddingProvider({"mode": "vocabulary", "dimension": 16})
+        provider = CachedEmbeddingProvider(inner, {"cache_dir": str(tmp_path)})
+        assert not provider.is_cacheable()
+
+        for texts in (["castle memory", "raw mist"], ["castle memory"]):
+            assert provider.embed_batch(texts) == reference.embed_batch(texts)
+
+        cache = provider.get_cache_stats()
+        assert cache["bypassed"] == 3
+        assert cache["misses"] == cache["memory_entries"] == cache["disk_entries"] == 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_concurrent_threads(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedEmbeddingProvider(inner, {"max_entries": 8, "cache_dir": str(tmp_path)})
+        texts = [f"statement {i}" for i in range(60)]
+        errors = []
+
+        def worker(offset):
+            try:
+                for round_ in range(20):
+                    batch = texts[(offset + round_) % 40:][:20]
+                    assert provider.embed_batch(batch) == [inner.embed_text(text) for text in batch]
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i * 7,)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        restarted = CachedEmbeddingProvider(CountingProvider(), {"cache_dir": str(tmp_path)})
+        for got, text in zip(restarted.embed_batch(texts), texts):
+            assert got == pytest.approx(inner.embed_text(text), abs=1e-6)
+
+
+class TestDiskTier:
+    """Memory-mapped persistence across provider instances."""
+
+    def test_survives_restart(self, tmp_path):
+        config = {"cache_dir": str(tmp_path), "max_entries": 10}
+        first = CachedEmbeddingProvider(CountingProvider(), config)
+        texts = [f"statement {i}" for i in range(40)]
+        expected = first.embed_batch(texts)
+
+        inner = CountingProvider()
+        restarted = CachedEmbeddingProvider(inner, config)
+        reloaded = restarted.embed_batch(texts)
+
+        assert inner.batch_sizes == []
+        assert restarted.get_cache_stats()["disk_hits"] == 40
+        assert restarted.get_cache_stats()["disk_entries"] == 40
+        for got, want in zip(reloaded, expected):
+            assert got == pytest.approx(want, abs=1e-6)
+
+    def test_torn_index_record_truncated(self, tmp_path):
+        config = {"cache_dir": str(tmp_path)}
+        CachedEmbeddingProvider(CountingProvider(), config).embed_batch(["castle", "mist"])
+        index_path = next(tmp_path.glob("*.idx"))
+        with open(index_path, "ab") as index_file:
+            index_file.write(b"0000000002 3f9a")  # crash mid-append
+
+        recovered = CachedEmbeddingProvider(CountingProvider(), config)
+        assert recovered.get_cache_stats()["disk_entries"] == 2
+        recovered.embed_batch(["garden", "river"])
+
+        inner = CountingProvider()
+        restarted = CachedEmbeddingProvider(inner, config)
+        texts = ["castle", "mist", "garden", "river"]
+        for got, text in zip(restarted.embed_batch(texts), texts):
+            assert got == pytest.approx(inner.embed_text(text), abs=1e-6)
+        assert inner.batch_sizes == []
+        assert index_path.stat().st_size % 76 == 0
+
+
+class TestFactoryWiring:
+    """create_from_config wraps providers when a cache section is present."""
+
+    def test_cache_section_wraps_provider(self):
+        provider = EmbeddingProviderFactory.create_from_config(
+            {"provider": "openai", "config": {"dimension": 8}, "cache": {"max_entries": 5}}
+        )
+        assert isinstance(provider, CachedEmbeddingProvider)
+        assert provider.get_dimension() == 8
+        assert not isinstance(EmbeddingProviderFactory.create_from_config({"provider": "local"}),
+                              CachedEmbeddingProvider)
+
+    def test_non_cacheable_provider_left_unwrapped(self):
+        vocabulary = EmbeddingProviderFactory.create_from_config({"provider": "local", "cache": {}})
+        hashing = EmbeddingProviderFactory.create_from_config(
+            {"provider": "local", "config": {"mode": "hashing"}, "cache": {}}
+        )
+        assert isinstance(vocabulary, LocalEmbeddingProvider)
+        assert isinstance(hashing, CachedEmbeddingProvider)
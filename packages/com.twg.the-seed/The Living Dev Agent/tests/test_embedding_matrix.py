@@ -0,0 +1,155 @@
+"""
+Embedding Matrix Tests
+
+Covers the vectorized anchor search path:
+- EmbeddingMatrix insert/update/delete and top-k
+- SemanticAnchorGraph keeping its matrix in sync with anchors
+- RetrievalAPI vectorized results matching the pairwise similarity loop
+"""
+
+import random
+
+import pytest
+
+from seed.engine.embeddings import EmbeddingMatrix
+from seed.engine.embeddings.base_provider import EmbeddingProvider
+from seed.engine.semantic_anchors import SemanticAnchorGraph
+from seed.engine.retrieval_api import RetrievalAPI, RetrievalQuery, RetrievalMode
+
+
+class BagOfWordsProvider(EmbeddingProvider):
+    """Deterministic provider: each token hashes into a fixed bucket."""
+
+    def __init__(self, dimension=32):
+        super().__init__({"dimension": dimension})
+        self.dimension = dimension
+
+    def embed_text(self, text):
+        vector = [0.0] * self.dimension
+        for token in text.lower().split():
+            vector[sum(map(ord, token)) % self.dimension] += 1.0
+        return vector
+
+    def embed_batch(self, texts):
+        return [self.embed_text(text) for text in texts]
+
+    def get_dimension(self):
+        return self.dimension
+
+
+def _random_vectors(count, dimension, seed=7):
+    rng = random.Random(seed)
+    return [[rng.gauss(0.0, 1.0) for _ in range(dimension)] for _ in range(count)]
+
+
+class TestEmbeddingMatrix:
+    """Core matrix operations."""
+
+    def test_top_k_matches_pairwise_cosine(self):
+        vectors = _random_vectors(200, 16)
+        matrix = EmbeddingMatrix()
+        matrix.extend((f"id_{i}", v) for i, v in enumerate(vectors))
+
+        query = _random_vectors(1, 16, seed=99)[0]
+        expected = sorted(
+            ((f"id_{i}", EmbeddingProvider.calculate_similarity(None, query, v))
+             for i, v in enumerate(vectors)),
+            key=lambda item: item[1], reverse=True
+        )[:10]
+
+        actual = matrix.top_k(query, 10)
+        assert [item_id for item_id, _ in actual] == [item_id for item_id, _ in expected]
+        for (_, got), (_, want) in zip(actual, expected):
+            assert got == pytest.approx(want, abs=1e-5)
+
+    def test_threshold_filters_candidates(self):
+        matrix = EmbeddingMatrix()
+        matrix.add("a", [1.0, 0.0])
+        matrix.add("b", [0.0, 1.0])
+        matrix.add("c", [1.0, 1.0])
+
+        matches = matrix.top_k([1.0, 0.0], k=5, threshold=0.5)
+        assert [item_id for item_id, _ in matches] == ["a", "c"]
+
+    def test_update_and_remove_keep_rows_dense(self):
+        matrix = EmbeddingMatrix(dimension=2, initial_capacity=1)
+        matrix.add("a", [1.0, 0.0])
+        matrix.add("b", [0.0, 1.0])
+        matrix.add("c", [-1.0, 0.0])
+
+        assert matrix.remove("a")
+        assert not matrix.remove("a")
+        assert len(matrix) == 2
+        assert set(matrix.ids) == {"b", "c"}
+
+        matrix.update("c", [0.0, 1.0])
+        assert matrix.top_k([0.0, 1.0], k=2)[1][1] == pytest.approx(1.0)
+
+        with pytest.raises(KeyError):
+            matrix.update("missing", [1.0, 0.0])
+
+    def test_dimension_mismatch_rejected(self):
+        matrix = EmbeddingMatrix(dimension=3)
+        with pytest.raises(ValueError):
+            matrix.add("a", [1.0, 0.0])
+
+
+class TestAnchorGraphSync:
+    """SemanticAnchorGraph keeps embedding_index aligned with anchors."""
+
+    @pytest.fixture
+    def graph(self):
+        return SemanticAnchorGraph(
+            embedding_provider=BagOfWordsProvider(),
+            config={"enable_privacy_hooks": False, "enable_memory_pooling": False}
+        )
+
+    def test_create_update_and_evict(self, graph):
+        first = graph.create_or_update_anchor("castle memory architecture", "u1", {})
+        graph.create_or_update_anchor("evaporation distills raw mist", "u2", {})
+        assert set(graph.embedding_index.ids) == set(graph.anchors)
+
+        # Same text consolidates into the existing anchor and refreshes its row
+        updated = graph.create_or_update_anchor("castle memory architecture", "u3", {})
+        assert updated == first
+        stored = graph.embedding_index.top_k(graph.anchors[first].embedding, k=1)
+        assert stored[0][0] == first
+        assert stored[0][1] == pytest.approx(1.0, abs=1e-5)
+
+        graph.eviction_heat_threshold = 10.0  # Evict everything
+        graph.apply_lifecycle_policies()
+        assert len(graph.embedding_index) == 0
+
+
+class TestRetrievalVectorizedPath:
+    """RetrievalAPI scores anchors through the matrix when it is in sync."""
+
+    def test_matches_pairwise_loop(self):
+        provider = BagOfWordsProvider()
+        graph = SemanticAnchorGraph(
+            embedding_provider=provider,
+            config={"enable_privacy_hooks": False, "enable_memory_pooling": False,
+                    "consolidation_threshold": 0.99}
+        )
+        texts = [
+            "semantic anchors ground memory", "memory castle rooms", "castle graph infusion",
+            "evaporation of mist lines", "giant compressor strata", "anchor heat decays",
+        ]
+        for i, text in enumerate(texts):
+            graph.create_or_update_anchor(text, f"u{i}", {})
+
+        api = RetrievalAPI(embedding_provider=provider, semantic_anchors=graph)
+        query = RetrievalQuery(
+            query_id="q", mode=RetrievalMode.SEMANTIC_SIMILARITY,
+            semantic_query="memory castle anchors", confidence_threshold=0.0
+        )
+        query_embedding = provider.embed_text(query.semantic_query)
+
+        vectorized = dict(api._score_anchors(query_embedding, query))
+
+        graph.embedding_index = None  # Force the pairwise fallback
+        pairwise = dict(api._score_anchors(query_embedding, query))
+
+        assert vectorized.keys() == pairwise.keys()
+        for anchor_id, score in pairwise.items():
+            assert vectorized[anchor_id] == pytest.approx(score, abs=1e-5)
@@ -0,0 +1,139 @@
+"""
+EXP-06 Candidate Generation Tests
+
+Covers pair pruning ahead of entanglement scoring:
+- Recall against the exhaustive detector on exp06_test_data at the default threshold
+- Exactness of realm blocking / adjacency index / bound pruning across thresholds
+- LSH over polarity vectors only ever dropping pairs, never inventing them
+- Optional and reservoir-sampled score retention, distributions labelled with their scope
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add seed/engine to path
+engine_dir = Path(__file__).resolve().parents[2] / 'seed' / 'engine'
+sys.path.insert(0, str(engine_dir))
+
+from exp06_entanglement_detection import (
+    EntanglementDetector, compute_entanglement_score, generate_candidate_pairs
+)
+from exp06_test_data import generate_test_dataset
+
+
+REALMS = ['data', 'narrative', 'system', 'faculty', 'event', 'pattern', 'void']
+
+
+def _random_bitchains(count, seed=17, neighbors=40):
+    """Bit-chains with a small shared neighbor pool and some isolated ones."""
+    rng = random.Random(seed)
+    bitchains = []
+    for i in range(count):
+        bitchains.append({
+            'id': f'bc-{i}',
+            'coordinates': {
+                'realm': rng.choice(REALMS),
+                'lineage': rng.randint(1, 10),
+                'adjacency': [f'n-{rng.randrange(neighbors)}' for _ in range(rng.randint(0, 3))],
+                'horizon': rng.choice(['genesis', 'emergence', 'peak', 'decay', 'crystallization']),
+                'resonance': rng.uniform(-1.0, 1.0),
+                'velocity': rng.uniform(-1.0, 1.0),
+                'density': rng.random(),
+            },
+        })
+    return bitchains
+
+
+@pytest.fixture(scope="module")
+def test_dataset():
+    random.seed(6)
+    bitchains, true_pairs, _ = generate_test_dataset()
+    return bitchains, true_pairs
+
+
+class TestRecall:
+    """Pruned detection finds exactly what the exhaustive detector finds."""
+
+    def test_no_entangled_pairs_lost_at_default_threshold(self, test_dataset):
+        bitchains, true_pairs = test_dataset
+        exhaustive = EntanglementDetector(use_candidates=False).detect(bitchains)
+        detector = EntanglementDetector()
+        pruned = detector.detect(bitchains)
+
+        assert pruned == exhaustive
+        ids = {(bitchains[i]['id'], bitchains[j]['id']) for i, j in true_pairs}
+        assert ids <= {(a, b) for a, b, _ in pruned}
+        assert detector.candidate_stats['scored_pairs'] < detector.candidate_stats['total_pairs'] / 100
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.8, 0.85, 0.9, 0.95])
+    def test_exact_pruning_across_thresholds(self, threshold):
+        bitchains = _random_bitchains(150)
+        exhaustive = EntanglementDetector(threshold, use_candidates=False).detect(bitchains)
+        assert EntanglementDetector(threshold).detect(bitchains) == exhaustive
+
+    def test_pruned_pairs_cannot_reach_threshold(self):
+        bitchains = _random_bitchains(120, seed=3)
+        stats = {}
+        candidates = set(generate_candidate_pairs(bitchains, 0.85, stats=stats))
+
+        assert stats['candidate_pairs'] == len(candidates) < stats['total_pairs']
+        for i in range(len(bitchains)):
+            for j in range(i + 1, len(bitchains)):
+                if (i, j) not in candidates:
+                    assert compute_entanglement_score(bitchains[i], bitchains[j]).total_score < 0.85
+
+    def test_lsh_is_a_subset_of_exact_candidates(self, test_dataset):
+        bitchains = _random_bitchains(150, seed=9)
+        exact = set(generate_candidate_pairs(bitchains, 0.6))
+        hashed = set(generate_candidate_pairs(bitchains, 0.6, lsh_tables=4, lsh_bits=8))
+        assert hashed < exact
+
+        dataset, _ = test_dataset
+        exhaustive = EntanglementDetector(use_candidates=False).detect(dataset)
+        assert EntanglementDetector(lsh_tables=8).detect(dataset) == exhaustive
+
+
+class TestScoreRetention:
+    """Scores kept in full, dropped, or reservoir-sampled."""
+
+    def test_retention_modes(self):
+        bitchains = _random_bitchains(80)
+        full = EntanglementDetector(0.7)
+        full.detect(bitchains)
+        none = EntanglementDetector(0.7, retain_scores=False)
+        none.detect(bitchains)
+        sampled = EntanglementDetector(0.7, retain_scores=25, seed=1)
+        sampled.detect(bitchains)
+
+        expected = full.get_score_distribution()
+        assert none.scores == []
+        assert len(sampled.scores) == 25
+        assert {s.to_dict()['bitchain1_id'] for s in sampled.scores} <= {
+            s['bitchain1_id'] for s in full.get_all_scores()}
+        for distribution in (none.get_score_distribution(), sampled.get_score_distribution()):
+            assert distribution['count'] == expected['count']
+            for key in ('min', 'max', 'mean', 'std_dev'):
+                assert distribution[key] == pytest.approx(expected[key], abs=1e-7)
+        assert 'median' not in none.get_score_distribution()
+        assert sampled.get_score_distribution()['sample_size'] == 25
+
+    def test_distribution_labels_scope(self):
+        bitchains = _random_bitchains(80)
+        pruned = EntanglementDetector(0.7)
+        pruned.detect(bitchains)
+        exhaustive = EntanglementDetector(0.7, use_candidates=False)
+        exhaustive.detect(bitchains)
+
+        candidates = pruned.get_score_distribution()
+        everything = exhaustive.get_score_distribution()
+        assert candidates['scope'] == 'candidate_pairs'
+        assert everything['scope'] == 'all_pairs'
+        assert everything['count'] == everything['total_pairs'] == candidates['total_pairs'] == 80 * 79 // 2
+        assert candidates['count'] < everything['count']
+
+    def test_invalid_retention_rejected(self):
+        with pytest.raises(ValueError):
+            EntanglementDetector(retain_scores=-1)
@@ -0,0 +1,128 @@
+"""
+EXP-06 Vectorized Scoring Tests
+
+Covers the array kernel behind EntanglementDetector:
+- extract_features() arrays: polarity matrix, realm codes and adjacency CSR
+- score_pair_block() components matching the scalar functions to 1e-9
+- Missing coordinates, unknown realms, duplicate neighbors and zero polarity vectors
+- Vectorized detection matching scalar detection across block sizes
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add seed/engine to path
+engine_dir = Path(__file__).resolve().parents[2] / 'seed' / 'engine'
+sys.path.insert(0, str(engine_dir))
+
+from exp06_entanglement_detection import (
+    EntanglementDetector, compute_entanglement_score, compute_polarity_vector,
+    extract_features, score_pair_block
+)
+
+from test_exp06_candidates import _random_bitchains
+
+
+COMPONENTS = {
+    'total': 'total_score',
+    'polarity_resonance': 'polarity_resonance',
+    'realm_affinity': 'realm_affinity',
+    'adjacency_overlap': 'adjacency_overlap',
+    'luminosity_proximity': 'luminosity_proximity',
+    'lineage_affinity': 'lineage_affinity',
+}
+
+
+def _edge_bitchains():
+    zero = {'realm': 'data', 'lineage': 0, 'resonance': 0.0, 'velocity': 0.0, 'density': 0.0}
+    return [
+        {'id': 'bare', 'coordinates': {}},
+        {'id': 'missing'},
+        {'id': 'zero-a', 'coordinates': dict(zero)},
+        {'id': 'zero-b', 'coordinates': dict(zero)},
+        {'id': 'off-map', 'coordinates': {'realm': 'off-map', 'adjacency': ['n-1', 'n-1', 'n-2']}},
+        {'id': 'off-map-2', 'coordinates': {'realm': 'off-map', 'adjacency': ['n-2']}},
+        {'id': 'deep', 'coordinates': {'realm': 'void', 'lineage': 250, 'density': 1,
+                                       'adjacency': ['n-2', 'n-3']}},
+    ]
+
+
+def _assert_block_matches_scalar(bitchains):
+    features = extract_features(bitchains)
+    left, right = np.triu_indices(len(bitchains), 1)
+    block = score_pair_block(features, left, right)
+
+    for k in range(len(left)):
+        expected = compute_entanglement_score(bitchains[left[k]], bitchains[right[k]])
+        for attribute, field in COMPONENTS.items():
+            assert getattr(block, attribute)[k] == pytest.approx(
+                getattr(expected, field), abs=1e-9), (left[k], right[k], field)
+        materialized = block.entanglement_score(k, features.ids)
+        assert (materialized.bitchain1_id, materialized.bitchain2_id) == (
+            expected.bitchain1_id, expected.bitchain2_id)
+
+
+class TestFeatureExtraction:
+    """Arrays built once per bit-chain list."""
+
+    def test_arrays_align_with_input(self):
+        bitchains = _edge_bitchains()
+        features = extract_features(bitchains)
+
+        assert len(features) == len(bitchains)
+        assert features.polarity.shape == (len(bitchains), 7)
+        assert features.polarity[6].tolist() == compute_polarity_vector(bitchains[6])
+        assert features.adjacency_sizes.tolist() == [0, 0, 0, 0, 2, 1, 2]
+        assert features.realm_codes[4] == features.realm_codes[5]
+        assert features.ids == [bc['id'] for bc in bitchains]
+
+    def test_empty_input(self):
+        features = extract_features([])
+        block = score_pair_block(features, [], [])
+        assert len(features) == 0
+        assert len(block) == 0
+
+
+class TestScoreParity:
+    """Block scores against compute_entanglement_score."""
+
+    def test_random_bitchains(self):
+        _assert_block_matches_scalar(_random_bitchains(120, seed=23, neighbors=15))
+
+    def test_edge_cases(self):
+        _assert_block_matches_scalar(_edge_bitchains())
+
+
+class TestVectorizedDetection:
+    """Detector output through the array kernel."""
+
+    @pytest.mark.parametrize("use_candidates", [True, False])
+    @pytest.mark.parametrize("block_size", [1, 97, 65_536])
+    def test_matches_scalar_detection(self, use_candidates, block_size):
+        bitchains = _random_bitchains(90, seed=31, neighbors=20)
+        scalar = EntanglementDetector(0.7, use_candidates=use_candidates, vectorized=False)
+        vectorized = EntanglementDetector(0.7, use_candidates=use_candidates,
+                                          block_size=block_size)
+
+        expected = scalar.detect(bitchains)
+        detected = vectorized.detect(bitchains)
+        assert [pair[:2] for pair in detected] == [pair[:2] for pair in expected]
+        for (_, _, score), (_, _, reference) in zip(detected, expected):
+            assert score == pytest.approx(reference, abs=1e-9)
+
+        distribution = vectorized.get_score_distribution()
+        for key, value in scalar.get_score_distribution().items():
+            assert distribution[key] == pytest.approx(value, abs=1e-7)
+
+    def test_reservoir_through_blocks(self):
+        bitchains = _random_bitchains(60, seed=2)
+        detector = EntanglementDetector(0.6, use_candidates=False, retain_scores=10,
+                                        block_size=50)
+        detector.detect(bitchains)
+
+        assert detector.pairs_scored == 60 * 59 // 2
+        assert len(detector.scores) == 10
+        assert len({(s.bitchain1_id, s.bitchain2_id) for s in detector.scores}) == 10
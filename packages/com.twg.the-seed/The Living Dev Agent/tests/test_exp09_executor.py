@@ -0,0 +1,107 @@
+"""
+EXP-09 Executor Offload Tests
+
+Covers the exp09 API service worker pools:
+- /query retrieval running off the event loop (health checks stay responsive)
+- /bulk_query concurrency actually overlapping slow queries
+- Process-pool narrative analysis matching the in-process result
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+ENGINE_DIR = Path(__file__).resolve().parents[2] / "seed" / "engine"
+sys.path.insert(0, str(ENGINE_DIR))
+
+import exp09_api_service as service
+
+
+QUERY_DELAY_S = 0.3
+
+
+@pytest.fixture
+def slow_service():
+    """Fresh service API whose retrieve_context takes QUERY_DELAY_S."""
+    service._api_instance = None
+    api = service._init_api()
+    api.add_documents([{"doc_id": f"d{i}", "content": f"castle memory room {i}"} for i in range(5)])
+    retrieve_context = api.retrieve_context
+
+    def slow_retrieve(query):
+        time.sleep(QUERY_DELAY_S)
+        return retrieve_context(query)
+
+    api.retrieve_context = slow_retrieve
+    yield api
+    service._api_instance = None
+    service.configure_executor("thread", 20)
+
+
+async def _query_and_probe_health():
+    """Return (query_finished_at, health_finished_at) for one slow query plus a health check."""
+    transport = httpx.ASGITransport(app=service.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        finished = {}
+
+        async def query():
+            response = await client.post("/query", json={"query_id": "q", "semantic_query": "castle memory",
+                                                          "confidence_threshold": 0.0})
+            assert response.status_code == 200
+            finished["query"] = time.perf_counter()
+
+        async def health():
+            await asyncio.sleep(0.05)
+            assert (await client.get("/health")).status_code == 200
+            finished["health"] = time.perf_counter()
+
+        await asyncio.gather(query(), health())
+        return finished["query"], finished["health"]
+
+
+class TestQueryOffload:
+    """Blocking retrieval no longer stalls other requests."""
+
+    def test_health_answers_during_thread_offloaded_query(self, slow_service):
+        service.configure_executor("thread", 4)
+        query_done, health_done = asyncio.run(_query_and_probe_health())
+        assert health_done < query_done
+
+    def test_inline_mode_blocks_the_loop(self, slow_service):
+        service.configure_executor("inline")
+        query_done, health_done = asyncio.run(_query_and_probe_health())
+        assert health_done > query_done
+
+    def test_bulk_queries_overlap(self, slow_service):
+        service.configure_executor("thread", 8)
+        request = service.BulkQueryRequest(
+            queries=[service.QueryRequest(query_id=f"q{i}", semantic_query="castle memory",
+                                          confidence_threshold=0.0) for i in range(6)],
+            concurrency_level=6
+        )
+
+        start = time.perf_counter()
+        response = asyncio.run(service.bulk_concurrent_queries(request))
+        elapsed = time.perf_counter() - start
+
+        assert response["successful"] == 6
+        assert elapsed < 3 * QUERY_DELAY_S  # Serial execution would take 6x
+
+
+class TestExecutorModes:
+    """Configuration and the process-pool analysis path."""
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            service.configure_executor("fibers")
+
+    def test_process_pool_analysis_matches(self, slow_service):
+        results = [{"id": f"d{i}", "relevance_score": 0.5 + i / 10, "semantic_similarity": 0.6,
+                    "stat7_resonance": 0.4, "metadata": {"pack": f"p{i % 2}"}} for i in range(4)]
+        service.configure_executor("process", 2)
+        assert asyncio.run(service._run_analysis(results)) == service._analyze_narrative_coherence(results)
+        assert service._executor_config == {"mode": "process", "workers": 2}
@@ -0,0 +1,147 @@
+"""
+Giant Clustering Backend Tests
+
+Covers the vectorized GiantCompressor clustering backend:
+- Density-based and hierarchical clusters identical to the reference methods
+- Mini-batch k-means partitions, k-means++ seeding and seeded reproducibility
+- Blocked similarity never exceeding its element budget
+- stomp() through the default backend into the SedimentStore
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add seed/engine to path
+engine_dir = Path(__file__).resolve().parents[2] / 'seed' / 'engine'
+sys.path.insert(0, str(engine_dir))
+
+from embeddings.base_provider import EmbeddingProvider
+from giant_compressor import GiantCompressor, SedimentStore
+from vector_clustering import (
+    average_linkage_clusters, kmeans_plus_plus, mean_pairwise_similarity, minibatch_kmeans,
+    unit_rows, within_distance_blocks
+)
+
+
+class LookupProvider(EmbeddingProvider):
+    """Returns fixed embeddings for fragment texts."""
+
+    def __init__(self, table):
+        super().__init__({})
+        self.table = table
+
+    def embed_text(self, text):
+        return self.table[text]
+
+    def embed_batch(self, texts):
+        return [self.table[text] for text in texts]
+
+    def get_dimension(self):
+        return len(next(iter(self.table.values())))
+
+
+def _corpus(n, seed=0, dimension=16, topics=6, noise=0.6):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((topics, dimension))
+    embeddings = centers[rng.integers(topics, size=n)] + noise * rng.standard_normal((n, dimension))
+    embeddings[n // 2] = 0.0  # zero vector: cosine 0 with everything
+    fragments = [{"text": f"fragment {i}"} for i in range(n)]
+    provider = LookupProvider({f["text"]: e for f, e in zip(fragments, embeddings.tolist())})
+    return fragments, embeddings.tolist(), provider
+
+
+def _cluster(backend, method, fragments, embeddings, provider, **config):
+    config.update({"clustering_method": method, "clustering_backend": backend})
+    return GiantCompressor(SedimentStore(), provider, config)._semantic_cluster(fragments, embeddings)
+
+
+def _summary(clusters):
+    return [(c["id"], c["indices"], c["size"], round(c["avg_similarity"], 9)) for c in clusters]
+
+
+class TestReferenceParity:
+    """Vectorized density-based and hierarchical clustering match the reference."""
+
+    @pytest.mark.parametrize("method,n", [("density_based", 150), ("hierarchical", 70)])
+    @pytest.mark.parametrize("max_distance", [0.3, 0.7, 0.95])
+    def test_identical_clusters(self, method, n, max_distance):
+        fragments, embeddings, provider = _corpus(n, seed=int(max_distance * 10))
+        config = {"max_cluster_distance": max_distance, "cluster_block_elements": 500}
+
+        reference = _cluster("reference", method, fragments, embeddings, provider, **config)
+        vectorized = _cluster("vectorized", method, fragments, embeddings, provider, **config)
+        assert _summary(vectorized) == _summary(reference)
+
+    def test_too_few_fragments_is_single_cluster(self):
+        fragments, embeddings, provider = _corpus(2)
+        clusters = _cluster("vectorized", "hierarchical", fragments, embeddings, provider)
+        assert [c["indices"] for c in clusters] == [[0, 1]]
+
+
+class TestVectorKernels:
+    """Building blocks of the backend."""
+
+    def test_blocks_respect_budget(self):
+        _, embeddings, _ = _corpus(101)
+        unit = unit_rows(embeddings)
+        rows_seen = []
+        for block, mask in within_distance_blocks(unit, 0.5, block_elements=1_000):
+            assert mask.size <= 1_000
+            assert not mask[np.arange(len(block)), block].any()
+            rows_seen.extend(block.tolist())
+        assert rows_seen == list(range(101))
+
+    def test_mean_pairwise_similarity(self):
+        _, embeddings, _ = _corpus(12)
+        unit = unit_rows(embeddings)
+        pairs = [unit[i] @ unit[j] for i in range(12) for j in range(i + 1, 12)]
+        assert mean_pairwise_similarity(unit) == pytest.approx(np.mean(pairs), abs=1e-12)
+        assert mean_pairwise_similarity(unit[:1]) == 1.0
+
+    def test_average_linkage_merges_nothing_past_threshold(self):
+        unit = np.eye(5)
+        assert average_linkage_clusters(unit, 0.5) == [[0], [1], [2], [3], [4]]
+        assert average_linkage_clusters(unit, 1.0) == [[0, 1, 2, 3, 4]]
+
+    def test_kmeans_plus_plus_picks_distinct_seeds(self):
+        unit = unit_rows(np.repeat(np.eye(4), 10, axis=0))
+        seeds = kmeans_plus_plus(unit, 4, np.random.default_rng(3))
+        assert sorted(seeds // 10) == [0, 1, 2, 3]
+
+    def test_minibatch_kmeans_recovers_separated_topics(self):
+        rng = np.random.default_rng(1)
+        labels = rng.integers(4, size=400)
+        unit = unit_rows(np.eye(8)[labels * 2] + 0.05 * rng.standard_normal((400, 8)))
+        assignments = minibatch_kmeans(unit, 4, np.random.default_rng(2), batch_size=64)
+
+        for topic in range(4):
+            assert len(set(assignments[labels == topic].tolist())) == 1
+        assert len(set(assignments.tolist())) == 4
+
+
+class TestStomp:
+    """End-to-end compression through the default backend."""
+
+    @pytest.mark.parametrize("method", ["density_based", "kmeans", "hierarchical"])
+    def test_every_fragment_stored_once(self, method):
+        fragments, embeddings, provider = _corpus(300, seed=4)
+        store = SedimentStore()
+        giant = GiantCompressor(store, provider, {"clustering_method": method, "random_seed": 7})
+        result = giant.stomp(fragments)
+
+        assert result["clustering_backend"] == "vectorized"
+        indices = [i for c in store.get_stratum(result["stratum_id"])["clusters"] for i in c["indices"]]
+        if method == "density_based":
+            # Rejected core claims drop their members, as in the reference
+            assert len(indices) == len(set(indices)) <= 300
+        else:
+            assert sorted(indices) == list(range(300))
+
+    def test_kmeans_is_reproducible_with_seed(self):
+        fragments, embeddings, provider = _corpus(200, seed=5)
+        first = _cluster("vectorized", "kmeans", fragments, embeddings, provider, random_seed=11)
+        second = _cluster("vectorized", "kmeans", fragments, embeddings, provider, random_seed=11)
+        assert _summary(first) == _summary(second)
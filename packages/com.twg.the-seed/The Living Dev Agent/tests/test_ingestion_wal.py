@@ -0,0 +1,253 @@
+"""
+Ingestion WAL Tests
+
+Covers the write-ahead log in front of StreamingIngestionPipeline:
+- Group commit, segment rotation and torn-tail recovery
+- Committed offset advancing over out-of-order acks, and consumed segments deleted
+- Replay of unacknowledged fragments after a restart, with original ids
+- Replay bounded to records logged before it began, so live ingests are not queued twice
+- Retries and dead letters keeping original fragment ids
+- Retries that no longer fit in the queue dead-lettered and counted
+"""
+
+import threading
+import time
+
+from seed.engine.ingestion_wal import WriteAheadLog
+from seed.engine.streaming_ingestion_pipeline import StreamingIngestionPipeline, Fragment, PipelineState
+
+
+def _fragment(i, priority=1):
+    return Fragment(fragment_id=f"f{i}", content=f"content {i}", metadata={"n": i}, priority=priority,
+                    timestamp=1000.0 + i)
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestWriteAheadLog:
+    """Segments, offsets and recovery."""
+
+    def test_replay_from_committed_offset(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path))
+        lsns = [wal.append({"n": i}) for i in range(10)]
+        wal.commit(lsns[-1])
+        assert lsns == list(range(10))
+        assert wal.stats["fsyncs"] == 1
+
+        wal.ack([0, 1, 3])  # 2 is still pending, so the offset stops there
+        assert wal.committed_offset == 2
+        assert wal.pending_count() == 7
+        wal.close()
+
+        reopened = WriteAheadLog(str(tmp_path))
+        assert [lsn for lsn, _ in reopened.replay()] == list(range(2, 10))
+        assert reopened.append({"n": 10}) == 10
+        reopened.close()
+
+    def test_commit_covers_earlier_appends(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path))
+        first = wal.append({"n": 0})
+        second = wal.append({"n": 1})
+        wal.commit(second)
+        wal.commit(first)
+        assert wal.stats["fsyncs"] == 1
+        wal.close()
+
+    def test_consumed_segments_deleted(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path), segment_max_bytes=200)
+        lsns = [wal.append({"payload": "x" * 40}) for _ in range(40)]
+        wal.commit(lsns[-1])
+        segments = wal.segment_count()
+        assert segments > 3
+
+        wal.ack(lsns[:20])
+        assert 1 <= wal.segment_count() < segments
+        assert [lsn for lsn, _ in wal.replay()] == lsns[20:]
+        wal.close()
+
+    def test_replay_stops_at_records_logged_before_it(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path), segment_max_bytes=200)
+        wal.commit(max(wal.append({"n": i}) for i in range(10)))
+        replayed = []
+        for lsn, _ in wal.replay():
+            replayed.append(lsn)
+            wal.commit(wal.append({"n": 100 + lsn}))  # a live ingest mid-replay
+        assert replayed == list(range(10))
+        assert wal.pending_count() == 20
+        wal.close()
+
+    def test_torn_tail_truncated(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path))
+        wal.commit(max(wal.append({"n": i}) for i in range(5)))
+        wal.close()
+        segment = next(p for p in tmp_path.iterdir() if p.name.startswith("wal-"))
+        with open(segment, "ab") as f:
+            f.write(b"\x40\x00\x00\x00partial")  # crash mid-append
+
+        recovered = WriteAheadLog(str(tmp_path))
+        assert [payload["n"] for _, payload in recovered.replay()] == [0, 1, 2, 3, 4]
+        assert recovered.append({"n": 5}) == 5
+        recovered.commit(5)
+        assert [lsn for lsn, _ in recovered.replay()] == [0, 1, 2, 3, 4, 5]
+        recovered.close()
+
+
+class TestPipelineRecovery:
+    """Unacknowledged fragments survive a restart."""
+
+    def test_unprocessed_fragments_replayed(self, tmp_path):
+        gate = threading.Event()
+        first_run = []
+
+        def stalled(fragments):
+            first_run.extend(f.fragment_id for f in fragments)
+            gate.wait(timeout=5)
+            return True
+
+        wal = WriteAheadLog(str(tmp_path / "wal"))
+        pipeline = StreamingIngestionPipeline(stalled, initial_batch_size=5, wal=wal)
+        pipeline.start()
+        assert pipeline.ingest_batch([_fragment(i) for i in range(20)]) == 20
+        assert _wait_for(lambda: len(first_run) == 5)
+        # Simulated crash mid-batch: the first pipeline is abandoned with its log still open
+        pipeline.stop(timeout_sec=0.1)
+
+        processed = []
+        restarted = StreamingIngestionPipeline(lambda fs: processed.extend(fs) or True,
+                                               wal=WriteAheadLog(str(tmp_path / "wal")))
+        restarted.start()
+        assert _wait_for(lambda: len(processed) >= 20)
+        restarted.stop()
+        gate.set()
+
+        ids = [f.fragment_id for f in processed]
+        assert sorted(ids, key=lambda i: int(i[1:])) == [f"f{i}" for i in range(20)]
+        assert processed[3].metadata == {"n": int(processed[3].fragment_id[1:])}
+        assert restarted.metrics.replayed_fragments == 20
+        assert restarted.wal.pending_count() == 0
+        restarted.wal.close()
+
+    def test_ingest_during_replay_processed_once(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path))
+        wal.commit(max(wal.append(_fragment(i).to_record()) for i in range(20)))
+        wal.close()
+
+        processed = []
+        live = threading.Thread(target=lambda: [pipeline.ingest_fragment(_fragment(i)) for i in range(100, 105)])
+
+        def process(fragments):
+            if not processed:
+                live.start()  # replay is still blocked on the two-slot queue
+            processed.extend(f.fragment_id for f in fragments)
+            return True
+
+        pipeline = StreamingIngestionPipeline(process, initial_batch_size=2, max_queue_size=2,
+                                              wal=WriteAheadLog(str(tmp_path)))
+        pipeline.start()
+        live.join(timeout=10)
+        assert _wait_for(lambda: len(processed) >= 25)
+        time.sleep(0.2)
+        pipeline.stop()
+
+        assert sorted(processed) == sorted([f"f{i}" for i in range(20)] + [f"f{i}" for i in range(100, 105)])
+        assert pipeline.metrics.replayed_fragments == 20
+        assert pipeline.wal.pending_count() == 0
+        pipeline.wal.close()
+
+    def test_acknowledged_fragments_not_replayed(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path))
+        pipeline = StreamingIngestionPipeline(lambda fs: True, wal=wal)
+        pipeline.start()
+        for i in range(30):
+            assert pipeline.ingest_fragment(_fragment(i))
+        assert _wait_for(lambda: pipeline.metrics.total_fragments_processed == 30)
+        pipeline.stop()
+        wal.close()
+
+        assert list(WriteAheadLog(str(tmp_path)).replay()) == []
+
+    def test_rejected_fragment_not_replayed(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path))
+        pipeline = StreamingIngestionPipeline(lambda fs: True, max_queue_size=3, wal=wal)
+        pipeline.state = PipelineState.RUNNING  # accept ingests without draining workers
+        assert pipeline.ingest_batch([_fragment(i) for i in range(5)]) == 3
+        assert not pipeline.ingest_fragment(_fragment(9), block=False)
+        assert [lsn for lsn, _ in wal.replay()] == [0, 1, 2]
+        wal.close()
+
+
+class TestRetries:
+    """Failed fragments keep their ids through retries and dead-lettering."""
+
+    def test_dead_letter_keeps_original_ids(self, tmp_path):
+        attempts = []
+
+        def failing(fragments):
+            attempts.extend(f.fragment_id for f in fragments)
+            return not any(f.fragment_id == "f1" for f in fragments)
+
+        wal = WriteAheadLog(str(tmp_path))
+        pipeline = StreamingIngestionPipeline(failing, initial_batch_size=1, wal=wal, max_retries=3)
+        pipeline.start()
+        pipeline.ingest_batch([_fragment(i, priority=3) for i in range(3)])
+        assert _wait_for(lambda: pipeline.metrics.dead_lettered_fragments == 1)
+        assert _wait_for(lambda: wal.pending_count() == 0)
+        pipeline.stop()
+
+        assert attempts.count("f1") == 3
+        assert all(a in {"f0", "f1", "f2"} for a in attempts)
+        dead = list(wal.read_dead_letters())
+        assert [(lsn, payload["fragment_id"], payload["retry_count"]) for lsn, payload in dead] == [(1, "f1", 3)]
+        assert wal.committed_offset == 3
+        wal.close()
+        assert list(WriteAheadLog(str(tmp_path)).replay()) == []
+
+    def test_retry_into_full_queue_dead_lettered(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path), segment_max_bytes=200)
+        pipeline = StreamingIngestionPipeline(lambda fs: True, max_queue_size=3, wal=wal)
+        pipeline.state = PipelineState.RUNNING  # drive batches by hand
+        pipeline.ingest_batch([_fragment(i, priority=3) for i in range(3)])
+        failed = pipeline._collect_batch()
+        pipeline.ingest_batch([_fragment(i) for i in range(3, 6)])  # the queue is full again
+
+        pipeline._handle_processing_failure(failed)
+        assert pipeline.metrics.dropped_retries == 3
+        assert pipeline.metrics.backpressure_events == 1
+        assert [payload["fragment_id"] for _, payload in wal.read_dead_letters()] == ["f0", "f1", "f2"]
+
+        pipeline._acknowledge(pipeline._collect_batch().fragments)
+        assert wal.committed_offset == 6
+        assert wal.pending_count() == 0
+        assert wal.segment_count() == 1
+        wal.close()
+
+    def test_retry_into_full_queue_counted_without_wal(self):
+        pipeline = StreamingIngestionPipeline(lambda fs: True, max_queue_size=1)
+        pipeline.state = PipelineState.RUNNING
+        pipeline.ingest_fragment(_fragment(0))
+        failed = pipeline._collect_batch()
+        pipeline.ingest_fragment(_fragment(1))
+
+        pipeline._handle_processing_failure(failed)
+        assert pipeline.metrics.dropped_retries == 1
+        assert pipeline.metrics.backpressure_events == 1
+        assert pipeline.get_status()["metrics"]["dropped_retries"] == 1
+
+    def test_retry_without_wal_keeps_id(self):
+        attempts = []
+
+        def flaky(fragments):
+            attempts.extend(f.fragment_id for f in fragments)
+            return len(attempts) > 1
+
+        pipeline = StreamingIngestionPipeline(flaky)
+        pipeline.start()
+        pipeline.ingest_fragment(_fragment(0, priority=4))
+        assert _wait_for(lambda: pipeline.metrics.total_fragments_processed == 1)
+        pipeline.stop()
+        assert attempts == ["f0", "f0"]
@@ -0,0 +1,92 @@
+"""
+Keyword Index Tests
+
+Covers the BM25 context-store search:
+- BM25Index ranking, coverage-first ordering and heap top-k
+- Snapshot round-trips (to_dict/from_dict, save/load)
+- RetrievalAPI keyword fallback and context store persistence
+"""
+
+import pytest
+
+from seed.engine.keyword_index import BM25Index, tokenize
+from seed.engine.retrieval_api import RetrievalAPI, RetrievalQuery, RetrievalMode
+
+
+DOCS = {
+    "d1": "The castle memory holds every anchor in the castle",
+    "d2": "Memory strata compress slowly under the giant",
+    "d3": "Evaporation distills raw mist into glyphs",
+    "d4": "Castle gates open at dawn",
+}
+
+
+@pytest.fixture
+def index():
+    built = BM25Index()
+    for doc_id, content in DOCS.items():
+        built.add(doc_id, content)
+    return built
+
+
+class TestBM25Index:
+    """Scoring and ranking."""
+
+    def test_tokenize_strips_punctuation(self):
+        assert tokenize("Castle, memory? anchor!") == ["castle", "memory", "anchor"]
+
+    def test_coverage_then_bm25(self, index):
+        ranked = index.search("castle memory", k=10)
+        assert [doc_id for doc_id, _, _ in ranked] == ["d1", "d4", "d2"]
+        assert [matches for _, matches, _ in ranked] == [2, 1, 1]
+        # Repeated "castle" outweighs a single "memory" in a longer doc
+        assert ranked[1][2] > ranked[2][2]
+
+    def test_top_k_and_misses(self, index):
+        assert len(index.search("castle memory", k=1)) == 1
+        assert index.search("nonexistent", k=5) == []
+        assert index.search("", k=5) == []
+
+    def test_duplicate_doc_rejected(self, index):
+        with pytest.raises(KeyError):
+            index.add("d1", "again")
+
+    def test_snapshot_round_trip(self, index, tmp_path):
+        path = tmp_path / "index.json"
+        index.save(str(path))
+        restored = BM25Index.load(str(path))
+        assert len(restored) == len(index)
+        assert restored.search("castle memory", 10) == index.search("castle memory", 10)
+
+
+class TestRetrievalKeywordFallback:
+    """RetrievalAPI without an embedding provider."""
+
+    def _query(self, text, threshold=0.5):
+        return RetrievalQuery(query_id="q", mode=RetrievalMode.SEMANTIC_SIMILARITY,
+                              semantic_query=text, confidence_threshold=threshold)
+
+    def test_relevance_is_term_coverage(self):
+        api = RetrievalAPI()
+        api.add_documents([{"doc_id": doc_id, "content": content} for doc_id, content in DOCS.items()])
+
+        results = api._search_context_store(self._query("castle memory"))
+        scores = {result.content_id: result.relevance_score for result in results}
+        assert scores == {"d1": 1.0, "d4": 0.5, "d2": 0.5}
+
+        strict = api._search_context_store(self._query("castle memory", threshold=0.9))
+        assert [result.content_id for result in strict] == ["d1"]
+
+    def test_persisted_store_skips_reindex(self, tmp_path):
+        api = RetrievalAPI()
+        for doc_id, content in DOCS.items():
+            api.add_document(doc_id, content, {"realm": "lore"})
+        path = tmp_path / "store.json"
+        api.save_context_store(str(path))
+
+        restarted = RetrievalAPI()
+        restarted.load_context_store(str(path))
+        assert restarted.get_context_store_size() == 4
+        results = restarted._search_context_store(self._query("evaporation mist"))
+        assert [result.content_id for result in results] == ["d3"]
+        assert results[0].metadata == {"realm": "lore"}
@@ -0,0 +1,111 @@
+"""
+Local Embedding Hashing Mode Tests
+
+Covers LocalEmbeddingProvider:
+- Hashing mode stability across calls, vocabulary growth and processes
+- Frozen IDF snapshots (freeze, save, load)
+- Vocabulary mode still matching a full re-sort of the vocabulary
+- Per-instance tokenizer memo bounded in entries and text length
+"""
+
+import subprocess
+import sys
+import random
+from pathlib import Path
+
+import pytest
+
+from seed.engine.embeddings import LocalEmbeddingProvider
+
+
+ENGINE_DIR = Path(__file__).resolve().parents[2] / "seed" / "engine"
+
+
+class TestHashingMode:
+    """Signed feature hashing into a fixed dimension."""
+
+    def test_stable_as_corpus_grows(self):
+        provider = LocalEmbeddingProvider({"mode": "hashing", "dimension": 64})
+        probe = provider.embed_text("castle memory architecture holds anchors")
+        for i in range(50):
+            provider.embed_text(f"unrelated document number{i} about strata{i}")
+        assert provider.embed_text("castle memory architecture holds anchors") == probe
+
+    def test_stable_across_processes(self):
+        provider = LocalEmbeddingProvider({"mode": "hashing", "dimension": 32})
+        expected = provider.embed_text("semantic anchors ground memory")
+
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "from embeddings.local_provider import LocalEmbeddingProvider as P;"
+            "print(repr(P({'mode': 'hashing', 'dimension': 32}).embed_text('semantic anchors ground memory')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script, str(ENGINE_DIR)],
+            capture_output=True, text=True, check=True, env={"PYTHONHASHSEED": "12345"}
+        ).stdout
+        assert eval(output) == expected
+
+    def test_similar_texts_score_higher(self):
+        provider = LocalEmbeddingProvider({"mode": "hashing"})
+        base = provider.embed_text("castle memory architecture")
+        close = provider.embed_text("castle memory rooms")
+        far = provider.embed_text("evaporation distills mist")
+        assert provider.calculate_similarity(base, close) > provider.calculate_similarity(base, far)
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            LocalEmbeddingProvider({"mode": "sparse"})
+
+
+class TestIdfSnapshot:
+    """Frozen IDF weights."""
+
+    def test_freeze_save_and_load(self, tmp_path):
+        trained = LocalEmbeddingProvider({"mode": "hashing"})
+        trained.embed_batch(["memory castle", "memory strata", "memory mist", "rare glyph"])
+        trained.freeze_idf()
+        assert trained.idf_snapshot["memory"] < trained.idf_snapshot["glyph"]
+
+        path = tmp_path / "idf.json"
+        trained.save_idf_snapshot(str(path))
+        expected = trained.embed_text("memory glyph")
+        trained.embed_text("glyph glyph glyph")  # Stats move on, frozen weights do not
+        assert trained.embed_text("memory glyph") == expected
+
+        loaded = LocalEmbeddingProvider({"mode": "hashing", "idf_snapshot_path": str(path)})
+        assert loaded.embed_text("memory glyph") == pytest.approx(expected)
+        assert loaded.get_provider_info()["idf_frozen"]
+
+
+class TestVocabularyMode:
+    """Incremental sorted-vocabulary prefix."""
+
+    def test_prefix_matches_full_sort(self):
+        provider = LocalEmbeddingProvider({"dimension": 16})
+        rng = random.Random(5)
+        words = ["".join(rng.choice("abcdefgh") for _ in range(rng.randint(3, 6))) for _ in range(300)]
+        for _ in range(60):
+            provider.embed_text(" ".join(rng.choices(words, k=8)))
+            assert provider._vocab_list == sorted(provider.vocabulary)[:16]
+
+
+class TestTokenizeCache:
+    """Bounded per-instance memo of short texts."""
+
+    def test_bounded_and_skips_long_texts(self):
+        provider = LocalEmbeddingProvider({"mode": "hashing", "tokenize_cache_size": 2,
+                                           "tokenize_cache_max_chars": 40})
+        for text in ["castle memory", "raw mist", "castle memory", "giant strata"]:
+            provider.embed_text(text)
+        assert list(provider._token_cache) == ["castle memory", "giant strata"]
+
+        document = "memory castle anchors " * 20
+        assert provider._tokenize(document) == ["memory", "castle", "anchors"] * 20
+        assert document not in provider._token_cache
+        assert LocalEmbeddingProvider()._token_cache == {}
+
+    def test_settings_left_out_of_cache_identity(self):
+        plain = LocalEmbeddingProvider({"mode": "hashing"})
+        tuned = LocalEmbeddingProvider({"mode": "hashing", "tokenize_cache_size": 10})
+        assert plain.get_cache_identity() == tuned.get_cache_identity()
@@ -0,0 +1,133 @@
+"""
+Magma Store Tests
+
+Covers the heap-ordered, bounded MagmaStore:
+- select_hot in decayed-heat order with the decayed "heat" on returned copies
+- reheat through the id index
+- Spilling the coldest glyphs past max_in_memory and reading them back
+- Evaporation over a spilling store
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add seed/engine to path
+engine_dir = Path(__file__).resolve().parents[2] / 'seed' / 'engine'
+sys.path.insert(0, str(engine_dir))
+
+import melt_layer
+from melt_layer import MagmaStore
+from evaporation import EvaporationEngine, CloudStore
+
+NOW = 1_000_000.0
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    monkeypatch.setattr(melt_layer.time, "time", lambda: NOW)
+
+
+def _glyphs(count, seed=0):
+    rng = random.Random(seed)
+    return [{
+        "id": f"g{i}",
+        "heat_seed": rng.uniform(0.0, 1.0),
+        "created_epoch": NOW - rng.randrange(5 * 86400),
+        "affect": {"awe": 0.1},
+        "compressed_summary": f"summary {i}",
+    } for i in range(count)]
+
+
+def _expected_hot(glyphs, limit, half_life_s=86400.0):
+    heat = lambda g: g["heat_seed"] * 2.0 ** ((g["created_epoch"] - NOW) / half_life_s)
+    return [g["id"] for g in sorted(glyphs, key=heat, reverse=True)[:limit]]
+
+
+class TestHotSelection:
+    """Ordering by lazily decayed heat."""
+
+    def test_matches_full_sort(self):
+        glyphs = _glyphs(500)
+        store = MagmaStore()
+        for glyph in glyphs:
+            store.add_glyph(glyph)
+
+        assert [g["id"] for g in store.select_hot(40)] == _expected_hot(glyphs, 40)
+        assert len(store.select_hot(10_000)) == 500
+        assert store.select_hot(0) == []
+
+    def test_decay_favours_recent_glyphs(self):
+        store = MagmaStore(half_life_s=3600.0)
+        store.add_glyph({"id": "old", "heat_seed": 0.9, "created_epoch": NOW - 7200})
+        store.add_glyph({"id": "new", "heat_seed": 0.5, "created_epoch": NOW})
+
+        new, old = store.select_hot(2)
+        assert new["heat"] == pytest.approx(0.5)
+        assert old["heat"] == pytest.approx(0.225)
+        assert "heat" not in store.glyphs[0]  # stored glyphs are never mutated
+
+    def test_reheat(self):
+        store = MagmaStore()
+        for glyph in _glyphs(50):
+            store.add_glyph(glyph)
+        coldest = store.select_hot(50)[-1]["id"]
+
+        assert store.reheat(coldest, 5.0) > 5.0
+        assert store.select_hot(1)[0]["id"] == coldest
+        assert store.get_glyph(coldest)["heat"] > 5.0
+        assert store.reheat("missing", 1.0) is None
+
+    def test_glyphs_keeps_insertion_order(self):
+        store = MagmaStore()
+        store.add_glyph({"id": "test_glyph", "data": "test"})
+        store.add_glyph({"id": "test_glyph", "data": "again"})
+        assert [g["data"] for g in store.glyphs] == ["test", "again"]
+        assert store.get_glyph("test_glyph")["data"] == "again"
+
+
+class TestSpill:
+    """Bounded memory with an on-disk cold tier."""
+
+    def test_coldest_glyphs_spill(self, tmp_path):
+        glyphs = _glyphs(300, seed=1)
+        store = MagmaStore(max_in_memory=100, spill_path=str(tmp_path / "magma.seg"))
+        for glyph in glyphs:
+            store.add_glyph(glyph)
+
+        assert store.resident_count() <= 100
+        assert store.resident_count() + store.spilled_count() == len(store) == 300
+        assert [g["id"] for g in store.select_hot(300)] == _expected_hot(glyphs, 300)
+        assert store.glyphs == glyphs
+
+        # A spilled glyph stays addressable and can be reheated back to the top
+        coldest = _expected_hot(glyphs, 300)[-1]
+        assert store.reheat(coldest, 10.0) is not None
+        assert store.select_hot(1)[0]["id"] == coldest
+        store.close()
+
+    def test_temporary_spill_file_removed_on_close(self):
+        store = MagmaStore(max_in_memory=5)
+        for glyph in _glyphs(20):
+            store.add_glyph(glyph)
+        path = Path(store.spill_path)
+        assert path.exists()
+        store.close()
+        assert not path.exists()
+
+    def test_invalid_cap_rejected(self):
+        with pytest.raises(ValueError):
+            MagmaStore(max_in_memory=0)
+
+    def test_evaporation_over_spilled_store(self, tmp_path):
+        store = MagmaStore(max_in_memory=20, spill_path=str(tmp_path / "magma.seg"))
+        for glyph in _glyphs(200, seed=2):
+            store.add_glyph(glyph)
+        cloud = CloudStore()
+
+        mist = EvaporationEngine(store, cloud).evaporate(limit=5)
+        assert len(mist) == 5
+        assert len(cloud.mist_lines) == 5
+        store.close()
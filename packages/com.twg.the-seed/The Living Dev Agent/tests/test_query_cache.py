@@ -0,0 +1,112 @@
+"""
+Query Result Cache Tests
+
+Covers RetrievalAPI result caching:
+- QueryResultCache LRU bound, TTL expiry and generation invalidation
+- Cache keys separating hybrid/semantic queries and STAT7 parameters
+- Invalidation when documents or anchors change, reported in metrics
+"""
+
+import time
+
+from seed.engine.retrieval_api import (
+    RetrievalAPI, RetrievalQuery, RetrievalMode, QueryResultCache, ContextAssembly
+)
+from seed.engine.semantic_anchors import SemanticAnchorGraph
+
+from test_embedding_matrix import BagOfWordsProvider
+
+
+def _assembly(assembly_id):
+    query = RetrievalQuery(query_id=assembly_id, mode=RetrievalMode.SEMANTIC_SIMILARITY)
+    return ContextAssembly(
+        assembly_id=assembly_id, query=query, results=[], total_relevance=0.0,
+        temporal_span_hours=0.0, anchor_coverage=[], assembly_quality=0.0,
+        conflict_summary={}, retrieval_timestamp=time.time()
+    )
+
+
+def _query(**overrides):
+    fields = {"query_id": "q", "mode": RetrievalMode.SEMANTIC_SIMILARITY,
+              "semantic_query": "castle memory", "confidence_threshold": 0.0}
+    fields.update(overrides)
+    return RetrievalQuery(**fields)
+
+
+class TestQueryResultCache:
+    """Standalone LRU + TTL + generation behaviour."""
+
+    def test_lru_bound(self):
+        cache = QueryResultCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", _assembly("a"), 0)
+        cache.put("b", _assembly("b"), 0)
+        assert cache.get("a", 0) is not None  # "b" becomes least recently used
+        cache.put("c", _assembly("c"), 0)
+
+        assert cache.get("b", 0) is None
+        assert cache.get("a", 0) is not None
+        assert cache.get_stats()["evictions"] == 1
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self):
+        cache = QueryResultCache(max_entries=10, ttl_seconds=0.01)
+        cache.put("a", _assembly("a"), 0)
+        time.sleep(0.02)
+        assert cache.get("a", 0) is None
+        assert cache.get_stats()["expirations"] == 1
+        assert cache.memory_bytes == 0
+
+    def test_generation_mismatch_invalidates(self):
+        cache = QueryResultCache()
+        cache.put("a", _assembly("a"), (1, None))
+        assert cache.get("a", (2, None)) is None
+        assert cache.get_stats()["invalidations"] == 1
+        assert len(cache) == 0
+
+
+class TestCacheKey:
+    """Every result-affecting field is part of the key."""
+
+    def test_hybrid_and_stat7_fields_distinguish_queries(self):
+        api = RetrievalAPI()
+        semantic = api._generate_cache_key(_query())
+        hybrid = api._generate_cache_key(_query(stat7_hybrid=True))
+        reweighted = api._generate_cache_key(_query(stat7_hybrid=True, weight_semantic=0.9, weight_stat7=0.1))
+        readdressed = api._generate_cache_key(_query(
+            stat7_hybrid=True, stat7_address={"realm": {"type": "faculty"}, "lineage": 3}
+        ))
+
+        assert len({semantic, hybrid, reweighted, readdressed}) == 4
+        assert api._generate_cache_key(_query(query_id="other")) == semantic
+
+
+class TestCorpusInvalidation:
+    """Ingest and anchor updates invalidate cached results."""
+
+    def test_add_document_invalidates(self):
+        api = RetrievalAPI()
+        api.add_document("d1", "castle memory rooms")
+        first = api.retrieve_context(_query())
+        assert api.retrieve_context(_query()) is first
+
+        api.add_document("d2", "castle memory strata")
+        refreshed = api.retrieve_context(_query())
+
+        assert refreshed is not first
+        assert {r.content_id for r in refreshed.results} == {"d1", "d2"}
+        metrics = api.get_retrieval_metrics()["cache_performance"]
+        assert metrics["invalidations"] == 1
+        assert metrics["memory_bytes"] > 0
+
+    def test_anchor_update_invalidates(self):
+        provider = BagOfWordsProvider()
+        graph = SemanticAnchorGraph(
+            embedding_provider=provider,
+            config={"enable_privacy_hooks": False, "enable_memory_pooling": False}
+        )
+        api = RetrievalAPI(embedding_provider=provider, semantic_anchors=graph)
+        graph.create_or_update_anchor("castle memory architecture", "u1", {})
+        first = api.retrieve_context(_query())
+
+        graph.create_or_update_anchor("castle memory rooms", "u2", {})
+        assert api.retrieve_context(_query()) is not first
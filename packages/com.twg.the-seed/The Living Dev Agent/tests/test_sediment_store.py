@@ -0,0 +1,120 @@
+"""
+Sediment Store Tests
+
+Covers the indexed, persistent SedimentStore:
+- Stratum / fragment lookup and maintained cluster and fragment counters
+- Time-range queries over created_at
+- Reload from the append-only segment file with lazily loaded cluster bodies
+- Recovery from a record torn by a crash mid-append
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add seed/engine to path
+engine_dir = Path(__file__).resolve().parents[2] / 'seed' / 'engine'
+sys.path.insert(0, str(engine_dir))
+
+import giant_compressor
+from giant_compressor import SedimentStore
+
+
+def _clusters(stratum, count=3, size=2):
+    return [{
+        "id": f"cluster_{stratum}_{c}",
+        "size": size,
+        "fragments": [{"id": f"frag_{stratum}_{c}_{f}", "text": f"text {stratum} {c} {f}"}
+                      for f in range(size)],
+        "avg_similarity": 0.5,
+    } for c in range(count)]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Deterministic created_at values: 100.0, 200.0, ..."""
+    ticks = iter(range(100, 100_000, 100))
+    monkeypatch.setattr(giant_compressor.time, "time", lambda: float(next(ticks)))
+
+
+class TestIndexes:
+    """In-memory lookups and counters."""
+
+    def test_lookups_and_counters(self):
+        store = SedimentStore()
+        for s in range(4):
+            store.append_clusters(_clusters(s))
+
+        assert store.get_stratum("stratum_3")["clusters"][0]["id"] == "cluster_2_0"
+        assert store.get_stratum("stratum_9") is None
+        assert store.get_cluster_count() == 12
+        assert store.get_fragment_count() == 24
+        assert store.locate_fragment("frag_1_2_1") == {"stratum_id": "stratum_2", "cluster_id": "cluster_1_2"}
+        assert store.get_fragment("frag_3_0_0")["text"] == "text 3 0 0"
+        assert store.get_fragment("missing") is None
+        assert [s["stratum_id"] for s in store.strata] == [f"stratum_{i}" for i in range(1, 5)]
+
+    def test_fragments_without_ids_are_counted_not_indexed(self):
+        store = SedimentStore()
+        store.append_cluster({"id": "test_cluster", "fragments": [{"text": "anonymous"}], "size": 1})
+        assert store.get_fragment_count() == 1
+        assert store._fragments == {}
+
+    def test_empty_append_rejected(self):
+        with pytest.raises(ValueError):
+            SedimentStore().append_clusters([])
+
+    def test_time_range(self, clock):
+        store = SedimentStore()
+        for s in range(5):
+            store.append_clusters(_clusters(s))
+
+        ids = [s["stratum_id"] for s in store.get_strata_between(200.0, 400.0)]
+        assert ids == ["stratum_2", "stratum_3", "stratum_4"]
+        assert store.get_strata_between(601.0, 900.0) == []
+
+
+class TestPersistence:
+    """Segment file round trips."""
+
+    def test_reload_is_lazy(self, tmp_path, clock):
+        path = str(tmp_path / "sediment.seg")
+        store = SedimentStore(path)
+        for s in range(3):
+            store.append_clusters(_clusters(s))
+        store.close()
+
+        reopened = SedimentStore(path)
+        assert reopened.get_cluster_count() == 9
+        assert reopened.get_fragment_count() == 18
+        assert reopened.locate_fragment("frag_2_1_0") == {"stratum_id": "stratum_3", "cluster_id": "cluster_2_1"}
+        assert len(reopened._bodies) == 3  # nothing loaded yet
+
+        assert reopened.get_fragment("frag_0_0_1")["text"] == "text 0 0 1"
+        assert len(reopened._bodies) == 2
+        assert [s["stratum_id"] for s in reopened.get_strata_between(300.0, 300.0)] == ["stratum_3"]
+
+        reopened.append_clusters(_clusters(3))
+        reopened.close()
+        again = SedimentStore(path)
+        assert [s["stratum_id"] for s in again.strata] == [f"stratum_{i}" for i in range(1, 5)]
+        assert again.get_stratum("stratum_2")["clusters"] == _clusters(1)
+        again.close()
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        path = tmp_path / "sediment.seg"
+        store = SedimentStore(str(path))
+        store.append_clusters(_clusters(0))
+        store.close()
+        intact = path.stat().st_size
+        with open(path, "ab") as f:
+            f.write(b"\x40\x00\x00\x00\x10\x00")
+
+        recovered = SedimentStore(str(path))
+        assert recovered.get_fragment_count() == 6
+        assert path.stat().st_size == intact
+        recovered.append_clusters(_clusters(1))
+        recovered.close()
+
+        assert SedimentStore(str(path)).get_stratum("stratum_2")["clusters"] == _clusters(1)
@@ -0,0 +1,168 @@
+"""
+Sharded Index Tests
+
+Covers the multi-process scatter/gather vector index:
+- Parity with the exact matrix through worker processes and inline scoring
+- Overwrite, removal with rebalancing and shared-memory growth under running workers
+- Worker errors drained before raising, dead workers scored inline and restarted
+- RetrievalAPI semantic search over a sharded document index
+"""
+
+import numpy as np
+import pytest
+
+from seed.engine.embeddings import EmbeddingMatrix, ShardedIndex, create_ann_index
+from seed.engine.retrieval_api import RetrievalAPI
+
+from test_embedding_matrix import BagOfWordsProvider
+
+
+def _vectors(count, dimension=16, seed=5):
+    return np.random.default_rng(seed).standard_normal((count, dimension))
+
+
+def _ids(matches):
+    return [item_id for item_id, _ in matches]
+
+
+@pytest.fixture
+def sharded():
+    index = ShardedIndex(n_shards=3, initial_capacity=8, inline_threshold=0)
+    yield index
+    index.close()
+
+
+class TestShardedIndex:
+    """Scatter/gather search and shard maintenance."""
+
+    def test_workers_match_exact_matrix(self, sharded):
+        vectors = _vectors(400)
+        exact = EmbeddingMatrix()
+        for i, vector in enumerate(vectors):
+            sharded.add(f"id_{i}", vector)
+            exact.add(f"id_{i}", vector)
+
+        for query in vectors[:5]:
+            assert _ids(sharded.top_k(query, 10)) == _ids(exact.top_k(query, 10))
+        assert sharded.get_index_info()["workers_running"] == 3
+        assert sorted(sharded.get_shard_sizes()) == [133, 133, 134]
+
+    def test_inline_scoring_matches_workers(self, sharded):
+        vectors = _vectors(100)
+        for i, vector in enumerate(vectors):
+            sharded.add(f"id_{i}", vector)
+        parallel = sharded.top_k(vectors[3], 5, threshold=0.1)
+
+        sharded.inline_threshold = 10_000
+        assert _ids(sharded.top_k(vectors[3], 5, threshold=0.1)) == _ids(parallel)
+
+    def test_overwrite_and_growth_with_running_workers(self, sharded):
+        vectors = _vectors(30)
+        for i, vector in enumerate(vectors[:10]):
+            sharded.add(f"id_{i}", vector)
+        sharded.top_k(vectors[0], 3)  # Workers attach to the initial blocks
+
+        for i, vector in enumerate(vectors[10:], start=10):
+            sharded.add(f"id_{i}", vector)
+        sharded.add("id_0", vectors[29])
+
+        assert len(sharded) == 30
+        assert set(_ids(sharded.top_k(vectors[29], 2))) == {"id_0", "id_29"}
+        assert _ids(sharded.top_k(vectors[15], 1)) == ["id_15"]
+
+    def test_remove_rebalances_shards(self, sharded):
+        vectors = _vectors(90)
+        for i, vector in enumerate(vectors):
+            sharded.add(f"id_{i}", vector)
+
+        # Empty whichever shard holds id_0 so the others have to give rows up
+        shard_of_first = sharded._locations["id_0"][0]
+        victims = list(sharded._shards[shard_of_first].ids)
+        for item_id in victims:
+            assert sharded.remove(item_id)
+
+        sizes = sharded.get_shard_sizes()
+        assert sum(sizes) == 60
+        assert max(sizes) <= sharded.rebalance_ratio * min(sizes)
+        assert sharded.rebalanced_rows > 0
+        assert not sharded.remove(victims[0])
+
+        remaining = [i for i in range(90) if f"id_{i}" not in victims]
+        for i in remaining[:5]:
+            assert _ids(sharded.top_k(vectors[i], 1)) == [f"id_{i}"]
+
+    def test_worker_error_does_not_leak_into_next_query(self, sharded):
+        vectors = _vectors(30)
+        for i, vector in enumerate(vectors):
+            sharded.add(f"id_{i}", vector)
+
+        with pytest.raises(Exception):
+            sharded.top_k(vectors[0], 3, threshold="not a number")  # every shard replies with an error
+        assert _ids(sharded.top_k(vectors[7], 1)) == ["id_7"]
+        assert _ids(sharded.top_k(vectors[8], 1)) == ["id_8"]
+
+    def test_dead_worker_scored_inline_then_restarted(self, sharded):
+        vectors = _vectors(30)
+        for i, vector in enumerate(vectors):
+            sharded.add(f"id_{i}", vector)
+        sharded.top_k(vectors[0], 1)
+
+        shard_index = sharded._locations["id_4"][0]
+        process = sharded._shards[shard_index].process
+        process.kill()
+        process.join()
+
+        assert _ids(sharded.top_k(vectors[4], 1)) == ["id_4"]
+        info = sharded.get_index_info()
+        assert info["worker_restarts"] == 1
+        assert info["workers_running"] == 2
+
+        assert _ids(sharded.top_k(vectors[4], 1)) == ["id_4"]
+        assert sharded.get_index_info()["workers_running"] == 3
+
+    def test_close_releases_shards(self):
+        index = create_ann_index("sharded", config={"n_shards": 2, "inline_threshold": 0})
+        assert isinstance(index, ShardedIndex)
+        index.add("a", [1.0, 0.0])
+        index.top_k([1.0, 0.0], 1)
+        index.close()
+
+        assert len(index) == 0
+        with pytest.raises(RuntimeError):
+            index.add("b", [0.0, 1.0])
+
+    def test_dimension_mismatch_raises(self, sharded):
+        sharded.add("a", [1.0, 0.0, 0.0])
+        with pytest.raises(ValueError):
+            sharded.add("b", [1.0, 0.0])
+        with pytest.raises(ValueError):
+            sharded.top_k([1.0, 0.0], 1)
+
+
+class TestShardedRetrieval:
+    """RetrievalAPI document search through a sharded index."""
+
+    def test_semantic_query_returns_sharded_documents(self):
+        api = RetrievalAPI(
+            embedding_provider=BagOfWordsProvider(),
+            config={
+                "document_index_backend": "sharded",
+                "document_index_config": {"n_shards": 2, "inline_threshold": 0},
+            }
+        )
+        try:
+            api.add_documents([
+                {"doc_id": "castle", "content": "memory castle anchors"},
+                {"doc_id": "garden", "content": "walnut garden soil"},
+                {"doc_id": "river", "content": "river delta sediment"},
+            ])
+            query = {"mode": "semantic_similarity", "semantic_query": "memory castle anchors",
+                     "confidence_threshold": 0.9, "stat7_hybrid": False}
+            assert [r.content_id for r in api.retrieve_context(query).results] == ["castle"]
+
+            api.add_document("castle_2", "memory castle anchors")
+            results = api.retrieve_context(query).results
+            assert sorted(r.content_id for r in results) == ["castle", "castle_2"]
+            assert api.get_retrieval_metrics()["document_index"]["size"] == 4
+        finally:
+            api.close()
@@ -0,0 +1,114 @@
+"""
+STAT7 Batch Addressing Tests
+
+Differential tests for the fast canonical path used by compute_addresses():
+- canonical_bitchain_bytes() and canonical_json() byte-identical to canonical_serialize()
+- float normalization near 8-place rounding ties, exponents, ints and -0.0
+- non-ASCII text, nested state and non-string adjacency taking the generic encoder
+- process-pool batches returning the same addresses in input order
+"""
+
+import random
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+# Add seed/engine to path
+engine_dir = Path(__file__).resolve().parents[2] / 'seed' / 'engine'
+sys.path.insert(0, str(engine_dir))
+
+from stat7_experiments import (
+    BitChain, Coordinates, canonical_serialize, canonical_bitchain_bytes, canonical_json,
+    compute_addresses, generate_random_bitchain, normalize_float, _normalized_float_repr
+)
+
+
+def _reference_bytes(bitchain):
+    return canonical_serialize(bitchain.to_canonical_dict()).encode('utf-8')
+
+
+def _bitchain(**overrides):
+    coordinates = dict(realm='data', lineage=7, adjacency=['b', 'a'], horizon='peak',
+                       resonance=0.5, velocity=-0.25, density=0.75)
+    coordinates.update(overrides.pop('coordinates', {}))
+    fields = dict(id='bc-1', entity_type='concept', realm='data',
+                  created_at='2025-01-01T00:00:00.000Z', state={'value': 1})
+    fields.update(overrides)
+    return BitChain(coordinates=Coordinates(**coordinates), **fields)
+
+
+def _float_samples(count, seed=11):
+    rng = random.Random(seed)
+    samples = [0.0, -0.0, 1e-05, 1e-09, 0.125000005, 0.124999995, -0.000000015,
+               2.5e-09, 123456789.123456789, 1.0, 3, 0, -1, True]
+    for _ in range(count):
+        samples.append(rng.uniform(-1.0, 1.0))
+        samples.append(rng.randint(-10**9, 10**9) / 10**9 + rng.choice([5e-9, -5e-9, 5e-10]))
+        samples.append(round(rng.uniform(-1.0, 1.0), rng.randint(1, 12)))
+        samples.append(struct.unpack('d', struct.pack('Q', rng.getrandbits(64)))[0])
+    return samples
+
+
+class TestCanonicalBytes:
+    """Fast path against the canonical_serialize reference."""
+
+    def test_random_bitchains_identical(self):
+        random.seed(3)
+        for _ in range(2000):
+            bitchain = generate_random_bitchain()
+            assert canonical_bitchain_bytes(bitchain) == _reference_bytes(bitchain)
+
+    def test_float_normalization_matches_decimal_path(self):
+        for value in _float_samples(20_000):
+            try:
+                expected = repr(float(normalize_float(value)))
+            except Exception:
+                with pytest.raises(Exception):
+                    _normalized_float_repr(value)
+                continue
+            assert _normalized_float_repr(value) == expected, value
+
+    @pytest.mark.parametrize("overrides", [
+        {'id': 'ñandú-✓', 'entity_type': 'agent\n"quoted"', 'realm': 'void'},
+        {'state': {}},
+        {'state': {'z': 'é', 'a': [1, {'y': 2, 'b': None}], 'm': True, 'f': 0.1}},
+        {'state': {'flag': False, 'count': 3}},
+        {'coordinates': {'adjacency': []}},
+        {'coordinates': {'adjacency': [3, 1, 2]}},
+        {'coordinates': {'lineage': True}},
+        {'coordinates': {'density': 0, 'resonance': 1e-05, 'velocity': -0.0}},
+        {'coordinates': {'resonance': 0.125000005, 'velocity': 0.124999995}},
+    ])
+    def test_edge_cases_identical(self, overrides):
+        bitchain = _bitchain(**overrides)
+        assert canonical_bitchain_bytes(bitchain) == _reference_bytes(bitchain)
+
+    def test_canonical_json_matches_serialize(self):
+        state = {'b': [3, {'z': 1, 'a': 'é'}], 'a': None, 'c': 1.5}
+        assert canonical_json(state) == canonical_serialize(state)
+
+    def test_nan_rejected_like_reference(self):
+        bitchain = _bitchain(coordinates={'density': float('nan')})
+        with pytest.raises(ValueError):
+            canonical_bitchain_bytes(bitchain)
+
+
+class TestComputeAddresses:
+    """Batch addressing in-process and on a process pool."""
+
+    def test_serial_matches_compute_address(self):
+        random.seed(5)
+        bitchains = [generate_random_bitchain() for _ in range(500)]
+        assert compute_addresses(bitchains, workers=1) == [bc.compute_address() for bc in bitchains]
+
+    def test_pool_preserves_order(self):
+        random.seed(9)
+        bitchains = [generate_random_bitchain() for _ in range(250)]
+        expected = [bc.compute_address() for bc in bitchains]
+
+        assert compute_addresses(bitchains, workers=2, chunk_size=40) == expected
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            assert compute_addresses(bitchains, chunk_size=64, executor=pool) == expected
@@ -0,0 +1,156 @@
+"""
+STAT7 Columnar Scoring Tests
+
+Covers the vectorized STAT7 hybrid path:
+- STAT7ColumnarStore resonance and hybrid scores equal to the scalar functions
+- retrieve() and STAT7RAGBridge.retrieve() matching the per-document reference, ties included
+- STAT7RAGBridge.search() over an explicitly indexed corpus, never stale after in-place edits
+- RetrievalAPI hybrid scoring through the batch resonance call
+"""
+
+import random
+
+import pytest
+
+from seed.engine.stat7_rag_bridge import (
+    Realm, STAT7Address, RAGDocument, STAT7ColumnarStore, STAT7RAGBridge,
+    stat7_resonance, hybrid_score, retrieve, _retrieve_scalar, generate_random_stat7_address,
+)
+from seed.engine.retrieval_api import RetrievalAPI, RetrievalResult, RetrievalQuery, RetrievalMode
+
+
+REALMS = [Realm("game", "arena"), Realm("game", "lobby"), Realm("faculty", "arena"), Realm("data", "logs")]
+
+
+def _documents(count, dimension=16, seed=3):
+    rng = random.Random(seed)
+    random.seed(seed)
+    documents = []
+    for i in range(count):
+        stat7 = generate_random_stat7_address(
+            rng.choice(REALMS), horizon_choices=["logline", "outline", "scene", "panel", "epilogue"]
+        )
+        embedding = [rng.uniform(-1, 1) for _ in range(dimension)]
+        documents.append(RAGDocument(id=f"doc-{i}", text="", embedding=embedding, stat7=stat7))
+    return documents
+
+
+QUERY_STAT7 = STAT7Address(realm=Realm("game", "arena"), lineage=4, adjacency=0.5, horizon="scene",
+                           luminosity=0.3, polarity=0.8, dimensionality=4)
+
+
+class TestColumnarStore:
+    """Vectorized scores are bit-identical to the scalar ones."""
+
+    def test_resonance_matches_scalar(self):
+        documents = _documents(500)
+        store = STAT7ColumnarStore.from_documents(documents)
+        for query_stat7 in [QUERY_STAT7] + [doc.stat7 for doc in documents[:20]]:
+            expected = [stat7_resonance(query_stat7, doc.stat7) for doc in documents]
+            assert store.resonance(query_stat7).tolist() == expected
+
+    def test_hybrid_matches_scalar(self):
+        documents = _documents(500)
+        store = STAT7ColumnarStore.from_documents(documents)
+        query_embedding = documents[7].embedding
+        for weights in [(0.6, 0.4), (1.0, 0.0), (0.25, 0.75)]:
+            expected = [hybrid_score(query_embedding, doc, QUERY_STAT7, *weights) for doc in documents]
+            assert store.hybrid_scores(query_embedding, QUERY_STAT7, *weights).tolist() == expected
+
+    def test_unknown_query_realm_and_short_query(self):
+        documents = _documents(50)
+        store = STAT7ColumnarStore.from_documents(documents)
+        query_stat7 = STAT7Address(realm=Realm("business", "ledger"), lineage=0, adjacency=0.0,
+                                   horizon="unknown", luminosity=1.0, polarity=0.0, dimensionality=7)
+        short_query = documents[0].embedding[:5]
+        expected = [hybrid_score(short_query, doc, query_stat7) for doc in documents]
+        assert store.hybrid_scores(short_query, query_stat7).tolist() == expected
+
+    def test_bulk_build_matches_add(self):
+        documents = _documents(300)
+        added = STAT7ColumnarStore()
+        for doc in documents:
+            added.add(doc.id, doc.stat7, doc.embedding)
+        bulk = STAT7ColumnarStore.from_documents(documents)
+        query_embedding = documents[3].embedding
+        assert bulk.hybrid_scores(query_embedding, QUERY_STAT7).tolist() == \
+            added.hybrid_scores(query_embedding, QUERY_STAT7).tolist()
+
+        bulk.add("late", QUERY_STAT7, query_embedding)
+        assert bulk.top_k(query_embedding, QUERY_STAT7, k=1)[0][0] == "late"
+
+    def test_mixed_dimensions_rejected(self):
+        store = STAT7ColumnarStore()
+        store.add("a", QUERY_STAT7, [1.0, 0.0])
+        with pytest.raises(ValueError):
+            store.add("b", QUERY_STAT7, [1.0, 0.0, 0.0])
+
+
+class TestRetrieve:
+    """Top-k selection keeps the reference ordering."""
+
+    def test_retrieve_matches_reference(self):
+        documents = _documents(2000)
+        query_embedding = documents[11].embedding
+        for k in (1, 10, 2000, 5000):
+            assert retrieve(documents, query_embedding, QUERY_STAT7, k) == \
+                _retrieve_scalar(documents, query_embedding, QUERY_STAT7, k, 0.6, 0.4)
+
+    def test_ties_keep_document_order(self):
+        documents = [RAGDocument(id=f"doc-{i}", text="", embedding=[1.0, 0.0], stat7=QUERY_STAT7)
+                     for i in range(6)]
+        assert [doc_id for doc_id, _ in retrieve(documents, [1.0, 0.0], QUERY_STAT7, k=3)] == \
+            ["doc-0", "doc-1", "doc-2"]
+
+    def test_bridge_sees_in_place_replacement(self):
+        documents = _documents(100)
+        bridge = STAT7RAGBridge()
+        query_embedding = [1.0] * 16
+        bridge.retrieve(documents, query_embedding, QUERY_STAT7, k=5)
+
+        documents[40] = RAGDocument(id="new", text="", embedding=query_embedding, stat7=QUERY_STAT7)
+        assert bridge.retrieve(documents, query_embedding, QUERY_STAT7, k=1)[0][0] == "new"
+        documents[40].embedding[0] = -1.0
+        assert bridge.retrieve(documents, query_embedding, QUERY_STAT7, k=5) == \
+            _retrieve_scalar(documents, query_embedding, QUERY_STAT7, 5, 0.6, 0.4)
+
+    def test_bridge_index_and_search(self):
+        documents = _documents(100)
+        bridge = STAT7RAGBridge()
+        assert bridge.search(documents[0].embedding, QUERY_STAT7) == []
+
+        bridge.index_documents(documents)
+        assert bridge.search(documents[0].embedding, QUERY_STAT7, k=5) == \
+            retrieve(documents, documents[0].embedding, QUERY_STAT7, k=5)
+
+        bridge.add_documents([RAGDocument(id="new", text="", embedding=documents[0].embedding, stat7=QUERY_STAT7)])
+        assert bridge.search(documents[0].embedding, QUERY_STAT7, k=1)[0][0] == "new"
+        assert bridge.index_version == 2
+
+    def test_mixed_dimensions_fall_back(self):
+        documents = _documents(10) + _documents(10, dimension=8, seed=4)
+        query_embedding = documents[0].embedding
+        assert retrieve(documents, query_embedding, QUERY_STAT7, 5) == \
+            _retrieve_scalar(documents, query_embedding, QUERY_STAT7, 5, 0.6, 0.4)
+
+
+class TestRetrievalAPIHybrid:
+    """RetrievalAPI scores a whole result list with one bridge call."""
+
+    def test_batch_resonance_matches_scalar(self):
+        api = RetrievalAPI(stat7_bridge=STAT7RAGBridge())
+        query = RetrievalQuery(query_id="q", mode=RetrievalMode.SEMANTIC_SIMILARITY, stat7_hybrid=True,
+                               stat7_address=QUERY_STAT7.to_dict())
+        documents = _documents(30)
+        results = [
+            RetrievalResult(result_id=doc.id, content_type="document", content_id=doc.id, content="",
+                            relevance_score=0.5, temporal_distance=0.0, anchor_connections=[],
+                            provenance_depth=0, conflict_flags=[], metadata={"stat7": doc.stat7.to_dict()})
+            for doc in documents
+        ]
+
+        api._apply_hybrid_scoring(results, query)
+
+        for result, doc in zip(results, documents):
+            assert result.stat7_resonance == stat7_resonance(QUERY_STAT7, doc.stat7)
+        assert len(api._stat7_address_objects) == 30
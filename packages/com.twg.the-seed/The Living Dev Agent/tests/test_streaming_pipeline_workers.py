@@ -0,0 +1,270 @@
+"""
+Streaming Pipeline Worker Tests
+
+Covers the multi-worker StreamingIngestionPipeline:
+- PriorityBatchQueue bulk dequeue order, bounds and ordered-class claims
+- Batches processed concurrently by N thread workers or a process pool
+- Per-batch processing timeouts, settled only once the timed-out call returns
+- Strict in-order processing for ORDERED priority classes, retries included
+"""
+
+import queue
+import threading
+import time
+
+import pytest
+
+from seed.engine.streaming_ingestion_pipeline import (
+    StreamingIngestionPipeline, PriorityBatchQueue, OrderingMode, Fragment, BackpressureLevel, PipelineState
+)
+
+
+def _fragment(i, priority=1):
+    return Fragment(fragment_id=f"f{i}", content=f"content {i}", metadata={}, priority=priority, timestamp=1000.0 + i)
+
+
+def _wait_for(condition, timeout=10.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def count_fragments(fragments):
+    """Module-level so the process pool can pickle it."""
+    return len(fragments) > 0
+
+
+class TestPriorityBatchQueue:
+    """Bulk dequeue in (-priority, timestamp) order."""
+
+    def test_batch_follows_priority_then_timestamp(self):
+        q = PriorityBatchQueue()
+        for i, priority in enumerate([1, 5, 3, 5, 1, 3]):
+            q.put(_fragment(i, priority))
+
+        fragments, claimed = q.get_batch(4)
+        assert [f.fragment_id for f in fragments] == ["f1", "f3", "f2", "f5"]
+        assert claimed == ()
+        assert q.qsize() == 2
+
+    def test_bounded_put(self):
+        q = PriorityBatchQueue(maxsize=2)
+        q.put(_fragment(0))
+        q.put(_fragment(1))
+        with pytest.raises(queue.Full):
+            q.put(_fragment(2), block=False)
+        with pytest.raises(queue.Full):
+            q.put(_fragment(2), timeout=0.01)
+        q.get_batch(1)
+        q.put(_fragment(2), block=False)
+
+    def test_empty_get_times_out(self):
+        assert PriorityBatchQueue().get_batch(5, timeout=0.01) == ([], ())
+
+    def test_ordered_class_claimed_until_release(self):
+        q = PriorityBatchQueue(ordering={5: OrderingMode.ORDERED})
+        for i in range(4):
+            q.put(_fragment(i, priority=5))
+        q.put(_fragment(9, priority=1))
+
+        first, claimed = q.get_batch(2)
+        assert [f.fragment_id for f in first] == ["f0", "f1"] and claimed == (5,)
+        # Class 5 is busy, so another consumer only sees class 1
+        other, _ = q.get_batch(5, timeout=0.01)
+        assert [f.fragment_id for f in other] == ["f9"]
+        assert q.get_batch(5, timeout=0.01) == ([], ())
+
+        q.release(claimed)
+        rest, _ = q.get_batch(5)
+        assert [f.fragment_id for f in rest] == ["f2", "f3"]
+
+    def test_requeue_goes_to_head_of_class(self):
+        q = PriorityBatchQueue(maxsize=3, ordering={5: OrderingMode.ORDERED})
+        for i in range(3):
+            q.put(Fragment(fragment_id=f"f{i}", content="", metadata={}, priority=5, timestamp=1000.0))
+        first, claimed = q.get_batch(2)
+        q.put(Fragment(fragment_id="late", content="", metadata={}, priority=5, timestamp=1000.0))
+
+        for fragment in first:
+            q.requeue(fragment)  # allowed past maxsize
+        q.release(claimed)
+        assert q.qsize() == 4
+        assert [f.fragment_id for f in q.get_batch(10)[0]] == ["f0", "f1", "f2", "late"]
+
+
+class TestWorkers:
+    """N workers process batches concurrently."""
+
+    def test_thread_workers_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def processor(fragments):
+            barrier.wait()  # only passes with three batches in flight at once
+            return True
+
+        pipeline = StreamingIngestionPipeline(processor, initial_batch_size=1, num_workers=3)
+        pipeline.start()
+        for i in range(3):
+            pipeline.ingest_fragment(_fragment(i))
+        assert _wait_for(lambda: pipeline.metrics.total_fragments_processed == 3)
+        pipeline.stop()
+        assert pipeline.metrics.failed_fragments == 0
+
+    def test_process_workers(self):
+        pipeline = StreamingIngestionPipeline(count_fragments, max_queue_size=500, num_workers=2,
+                                              worker_mode="process")
+        pipeline.start()
+        assert pipeline.ingest_batch([_fragment(i) for i in range(200)]) == 200
+        assert _wait_for(lambda: pipeline.metrics.total_fragments_processed == 200, timeout=30)
+        pipeline.stop()
+        assert pipeline.state == PipelineState.STOPPED
+
+    def test_idle_worker_wakes_on_ingest(self):
+        done = threading.Event()
+        pipeline = StreamingIngestionPipeline(lambda fragments: done.set() or True)
+        pipeline.start()
+        time.sleep(0.2)  # let the worker go idle
+        pipeline.ingest_fragment(_fragment(0))
+        assert done.wait(timeout=5)
+        pipeline.stop()
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            StreamingIngestionPipeline(count_fragments, num_workers=0)
+        with pytest.raises(ValueError):
+            StreamingIngestionPipeline(count_fragments, worker_mode="fiber")
+
+
+class TestTimeouts:
+    """A batch exceeding processing_timeout_sec is settled once its call returns."""
+
+    def test_timed_out_failure_retried_after_call_returns(self):
+        release = threading.Event()
+        calls, returned = [], []
+
+        def processor(fragments):
+            calls.append(([f.fragment_id for f in fragments], bool(returned)))
+            if len(calls) == 1:
+                release.wait(timeout=5)  # first attempt hangs past the timeout, then fails
+                returned.append(True)
+                return False
+            return True
+
+        pipeline = StreamingIngestionPipeline(processor, processing_timeout_sec=0.1, num_workers=2)
+        pipeline.start()
+        pipeline.ingest_fragment(_fragment(0))
+        assert _wait_for(lambda: pipeline.metrics.timed_out_batches == 1)
+        time.sleep(0.2)
+        assert len(calls) == 1  # not retried while the first call is still running
+        assert pipeline.get_status()["workers"]["timed_out_running"] == 1
+        release.set()
+        assert _wait_for(lambda: pipeline.metrics.total_fragments_processed == 1)
+        pipeline.stop()
+
+        assert pipeline.metrics.failed_fragments == 1
+        assert calls == [(["f0"], False), (["f0"], True)]
+        assert pipeline.get_status()["workers"]["timed_out_running"] == 0
+
+    def test_hung_ordered_batch_keeps_class_and_frees_worker(self):
+        release = threading.Event()
+        seen = []
+
+        def processor(fragments):
+            ids = [f.fragment_id for f in fragments]
+            if ids == ["f0"]:
+                release.wait(timeout=5)  # hangs past the timeout, then succeeds
+            seen.extend(ids)
+            return True
+
+        pipeline = StreamingIngestionPipeline(processor, initial_batch_size=1, processing_timeout_sec=0.1,
+                                              ordering={5: OrderingMode.ORDERED})
+        pipeline.start()
+        pipeline.ingest_fragment(_fragment(0, priority=5))
+        assert _wait_for(lambda: pipeline.metrics.timed_out_batches == 1)
+        pipeline.ingest_batch([_fragment(1, priority=5), _fragment(2), _fragment(3)])
+        # The single executor slot is not lost to the hung call
+        assert _wait_for(lambda: seen == ["f2", "f3"])
+        time.sleep(0.2)
+        assert seen == ["f2", "f3"]  # the ORDERED class waits for the hung call
+        release.set()
+        assert _wait_for(lambda: pipeline.metrics.total_fragments_processed == 4)
+        pipeline.stop()
+
+        assert seen == ["f2", "f3", "f0", "f1"]
+        assert pipeline.metrics.failed_fragments == 0
+
+
+class TestOrdering:
+    """ORDERED classes are processed one batch at a time, in queue order."""
+
+    def test_ordered_class_keeps_order_across_workers(self):
+        seen, in_flight, overlaps = [], set(), []
+        lock = threading.Lock()
+
+        def processor(fragments):
+            classes = {f.priority for f in fragments}
+            with lock:
+                if 5 in classes and 5 in in_flight:
+                    overlaps.append(fragments[0].fragment_id)
+                in_flight.update(classes)
+            time.sleep(0.002)
+            with lock:
+                seen.extend(f.fragment_id for f in fragments)
+                in_flight.difference_update(classes)
+            return True
+
+        pipeline = StreamingIngestionPipeline(processor, initial_batch_size=3, max_queue_size=1000,
+                                              num_workers=4, ordering={5: OrderingMode.ORDERED})
+        pipeline.start()
+        for i in range(400):
+            pipeline.ingest_fragment(_fragment(i, priority=5 if i % 2 else 1))
+        assert _wait_for(lambda: pipeline.metrics.total_fragments_processed == 400)
+        pipeline.stop()
+
+        assert overlaps == []
+        assert [s for s in seen if int(s[1:]) % 2] == [f"f{i}" for i in range(1, 400, 2)]
+
+
+    def test_failed_ordered_batch_retried_in_place(self):
+        seen, attempts = [], []
+        lock = threading.Lock()
+
+        def processor(fragments):
+            ids = [f.fragment_id for f in fragments]
+            with lock:
+                attempts.append(ids)
+                if "f21" in ids and sum("f21" in a for a in attempts) == 1:
+                    return False  # first attempt at the batch holding f21 fails
+                seen.extend(f.fragment_id for f in fragments if f.priority == 5)
+            time.sleep(0.002)
+            return True
+
+        pipeline = StreamingIngestionPipeline(processor, initial_batch_size=3, max_queue_size=1000,
+                                              num_workers=4, ordering={5: OrderingMode.ORDERED})
+        pipeline.start()
+        for i in range(120):
+            pipeline.ingest_fragment(_fragment(i, priority=5 if i % 2 else 1))
+        assert _wait_for(lambda: pipeline.metrics.total_fragments_processed == 120)
+        pipeline.stop()
+
+        assert pipeline.metrics.failed_fragments >= 1
+        assert seen == [f"f{i}" for i in range(1, 120, 2)]
+
+
+class TestBackpressure:
+    """Leaving HIGH backpressure returns the pipeline to RUNNING."""
+
+    def test_backpressure_clears(self):
+        levels = []
+        pipeline = StreamingIngestionPipeline(count_fragments, max_queue_size=10)
+        pipeline.set_backpressure_callback(levels.append)
+        pipeline.state = PipelineState.RUNNING
+
+        pipeline.metrics.queue_depth_current = 9
+        pipeline._check_backpressure()
+        assert pipeline.state == PipelineState.BACKPRESSURE
+        pipeline.metrics.queue_depth_current = 1
+        pipeline._check_backpressure()
+        assert pipeline.state == PipelineState.RUNNING
+        assert levels == [BackpressureLevel.HIGH, BackpressureLevel.NONE]
@@ -0,0 +1,106 @@
+"""
+Summarization Stream Tests
+
+Covers the streaming SummarizationLadder:
+- stream_fragments yielding the same rungs as process_fragments
+- One batched embedding request per chunk, with unchanged centroids
+- Bounded retention with eviction to a SegmentRungStore
+- process_stream callbacks over a lazily consumed iterator
+"""
+
+from seed.engine.summarization_ladder import (
+    SummarizationLadder, MicroSummary, MacroDistillation, SegmentRungStore
+)
+
+from test_batched_embedding import CountingProvider
+
+
+def _fragments(count, start=0):
+    return [{"id": f"frag_{i}", "text": f"fragment {i} about topic {i % 4}", "heat": (i % 5) / 5}
+            for i in range(start, start + count)]
+
+
+def _shape(rung):
+    if isinstance(rung, MicroSummary):
+        return ("micro", rung.compressed_text, rung.window_fragments, rung.heat_aggregate)
+    return ("macro", rung.distilled_essence, rung.consolidation_ratio)
+
+
+class TestStreaming:
+    """Streaming produces the rungs of the batch path."""
+
+    def test_matches_process_fragments(self):
+        fragments = _fragments(200)
+        batch = SummarizationLadder()
+        for start in range(0, 200, 30):
+            batch.process_fragments(fragments[start:start + 30])
+
+        streamed = SummarizationLadder()
+        rungs = list(streamed.stream_fragments(iter(fragments), chunk_size=17))
+
+        assert [_shape(r) for r in rungs if isinstance(r, MacroDistillation)] == \
+            [_shape(m) for m in batch.macro_distillations]
+        assert streamed.metrics["total_fragments"] == batch.metrics["total_fragments"] == 200
+        assert streamed.metrics["compression_ratio"] == batch.metrics["compression_ratio"]
+        assert streamed.micro_summaries_created == batch.micro_summaries_created
+
+    def test_one_embedding_request_per_chunk(self):
+        provider = CountingProvider(dimension=8)
+        ladder = SummarizationLadder(embedding_provider=provider)
+        micros = [r for r in ladder.stream_fragments(_fragments(100), chunk_size=25)
+                  if isinstance(r, MicroSummary)]
+
+        assert provider.batch_sizes == [25, 25, 25, 25]
+        assert provider.single_calls == 0
+        window = _fragments(5)
+        vectors = [provider.embed_text(f["text"]) for f in window]
+        assert micros[0].semantic_centroid == [sum(column) / 5 for column in zip(*vectors)]
+
+    def test_iterator_consumed_lazily(self):
+        pulled = []
+
+        def source():
+            for fragment in _fragments(1000):
+                pulled.append(fragment["id"])
+                yield fragment
+
+        ladder = SummarizationLadder()
+        first = next(iter(ladder.stream_fragments(source(), chunk_size=10)))
+        assert isinstance(first, MicroSummary)
+        assert len(pulled) == 10
+
+
+class TestRetention:
+    """Only the retention window stays in memory."""
+
+    def test_macros_evicted_to_store(self, tmp_path):
+        path = str(tmp_path / "rungs.seg")
+        ladder = SummarizationLadder({"max_macro_distillations": 3}, rung_store=SegmentRungStore(path))
+        seen = []
+        counts = ladder.process_stream(_fragments(500), on_macro=seen.append)
+
+        assert counts["macro_distillations_created"] == len(seen) == ladder.macro_distillations_created
+        assert len(ladder.macro_distillations) == 3
+        assert counts["rungs_evicted"] == len(seen) - 3
+        assert [m.distillation_id for m in ladder.macro_distillations] == [m.distillation_id for m in seen[-3:]]
+        archived = list(ladder.rung_store.scan("macro"))
+        assert [a["distilled_essence"] for a in archived] == [m.distilled_essence for m in seen[:-3]]
+        ladder.close()
+
+        assert len(SegmentRungStore(path)) == len(seen) - 3
+
+    def test_overflowing_micro_summaries_evicted(self, tmp_path):
+        store = SegmentRungStore(str(tmp_path / "rungs.seg"))
+        ladder = SummarizationLadder({"max_micro_summaries": 2, "macro_trigger_count": 4}, rung_store=store)
+        micros = []
+        ladder.process_stream(_fragments(40), on_micro=micros.append)
+
+        assert len(ladder.micro_summaries) == 2
+        assert ladder.macro_distillations_created == 0
+        assert [m["summary_id"] for m in store.scan("micro")] == [m.summary_id for m in micros[:-2]]
+
+    def test_eviction_without_store_drops(self):
+        ladder = SummarizationLadder({"max_macro_distillations": 1})
+        ladder.process_stream(_fragments(200))
+        assert len(ladder.macro_distillations) == 1
+        assert ladder.rungs_evicted == ladder.macro_distillations_created - 1
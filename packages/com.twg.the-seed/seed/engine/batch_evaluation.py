@@ -9,15 +9,19 @@
     but never forget to document the battle plan." - Bootstrap Sentinel
 """
 
-from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
+from typing import List, Dict, Any, Optional, Callable, Iterator, Set, Tuple
 import time
 import json
 import hashlib
+import mmap
+import os
+import pickle
+import tempfile
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from enum import Enum
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 
 
 class BatchStatus(Enum):
@@ -35,6 +39,7 @@ class ReplayMode(Enum):
     PARALLEL = "parallel"
     ADAPTIVE = "adaptive"
     PRIORITY_BASED = "priority_based"
+    PROCESS = "process"  # process pool over a memory-mapped corpus, for CPU-bound processors
 
 
 @dataclass
@@ -116,12 +121,36 @@ def update_throughput(self):
             self.current_throughput = self.processed_items / elapsed
 
 
+# Process-pool replay: each worker maps the serialized corpus once and
+# receives only (batch_id, byte range) per task
+_replay_corpus: Optional[mmap.mmap] = None
+_replay_processor: Optional[Callable[[List[Any]], List[Any]]] = None
+
+
+def _attach_replay_corpus(corpus_path: str, processor_func: Callable[[List[Any]], List[Any]]):
+    """Pool initializer: map the corpus file read-only and keep the processor."""
+    global _replay_corpus, _replay_processor
+    with open(corpus_path, 'rb') as f:
+        _replay_corpus = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _replay_processor = processor_func
+
+
+def _replay_batch(batch_id: str, start: int, end: int) -> Tuple[str, Optional[List[Any]], Optional[str], float]:
+    """Process one batch from the mapped corpus; returns (batch_id, results, error, processing_time)."""
+    start_time = time.time()
+    try:
+        contents = pickle.loads(_replay_corpus[start:end])
+        return batch_id, _replay_processor(contents), None, time.time() - start_time
+    except Exception as e:
+        return batch_id, None, str(e), time.time() - start_time
+
+
 class BatchEvaluationEngine:
     """
     High-performance batch evaluation engine for large corpus replay.
     
     Features:
-    - Configurable batch sizing and parallelism
+    - Configurable batch sizing and parallelism (threads, or processes for CPU-bound work)
     - Progress tracking and resumption capabilities
     - Error handling and retry logic
     - Performance optimization based on system resources
@@ -138,7 +167,7 @@ def __init__(self,
         Initialize batch evaluation engine.
         
         Args:
-            max_workers: Maximum number of worker threads
+            max_workers: Maximum number of worker threads (worker processes in PROCESS mode)
             default_batch_size: Default size for batches
             max_batch_size: Maximum allowed batch size
             checkpoint_interval: Items between checkpoints
@@ -155,6 +184,8 @@ def __init__(self,
         self.current_operation_id: Optional[str] = None
         self.progress: Optional[CorpusReplayProgress] = None
         self.batch_results: Dict[str, BatchResult] = {}
+        self.batch_definitions: Dict[str, BatchDefinition] = {}
+        self._checkpointed_items: Set[int] = set()  # corpus indices completed by earlier runs
         
         # Thread safety
         self._lock = threading.Lock()
@@ -175,7 +206,8 @@ def process_corpus(self,
         
         Args:
             corpus: List of items to process
-            processor_func: Function to process batches
+            processor_func: Function to process batches; in PROCESS mode it
+                must be picklable (e.g. a module-level function)
             operation_id: Unique identifier for this operation
             mode: Processing mode (sequential, parallel, etc.)
             batch_size: Override default batch size
@@ -194,13 +226,19 @@ def process_corpus(self,
         if resume_from_checkpoint:
             checkpoint_data = self._load_checkpoint(operation_id)
             
+        # Results of earlier runs are carried by the checkpoint, not by this engine
+        self.batch_results = {}
+        self.batch_definitions = {}
+        
         # Initialize or restore progress
         if checkpoint_data:
             self.progress = CorpusReplayProgress(**checkpoint_data['progress'])
-            processed_items = checkpoint_data.get('processed_items', [])
-            remaining_corpus = [item for i, item in enumerate(corpus) 
-                              if i not in processed_items]
+            self._checkpointed_items = set(checkpoint_data.get('processed_items', []))
+            remaining_indices = [i for i in range(len(corpus)) if i not in self._checkpointed_items]
+            remaining_corpus = [corpus[i] for i in remaining_indices]
         else:
+            self._checkpointed_items = set()
+            remaining_indices = None
             remaining_corpus = corpus
             self.progress = CorpusReplayProgress(
                 total_items=len(corpus),
@@ -217,7 +255,8 @@ def process_corpus(self,
             batch_size = self._calculate_optimal_batch_size(len(remaining_corpus), mode)
             
         # Create batches
-        batches = self._create_batches(remaining_corpus, batch_size, operation_id)
+        batches = self._create_batches(remaining_corpus, batch_size, operation_id, remaining_indices)
+        self.batch_definitions = {batch.batch_id: batch for batch in batches}
         self.progress.total_batches = len(batches)
         
         # Process batches based on mode
@@ -228,6 +267,8 @@ def process_corpus(self,
                 results = self._process_parallel(batches, processor_func)
             elif mode == ReplayMode.ADAPTIVE:
                 results = self._process_adaptive(batches, processor_func)
+            elif mode == ReplayMode.PROCESS:
+                results = self._process_multiprocess(batches, processor_func)
             else:
                 results = self._process_priority_based(batches, processor_func)
                 
@@ -261,15 +302,16 @@ def _calculate_optimal_batch_size(self, corpus_size: int, mode: ReplayMode) -> i
         if mode == ReplayMode.SEQUENTIAL:
             # Larger batches for sequential processing
             return min(self.max_batch_size, max(self.default_batch_size * 2, corpus_size // 20))
-        elif mode == ReplayMode.PARALLEL:
+        elif mode in (ReplayMode.PARALLEL, ReplayMode.PROCESS):
             # Smaller batches for better parallelization
             return min(self.default_batch_size, max(10, corpus_size // (self.max_workers * 4)))
         else:  # ADAPTIVE or PRIORITY_BASED
             # Balanced approach
             return min(self.max_batch_size, max(self.default_batch_size, corpus_size // 50))
             
-    def _create_batches(self, corpus: List[Any], batch_size: int, operation_id: str) -> List[BatchDefinition]:
-        """Create batch definitions from corpus."""
+    def _create_batches(self, corpus: List[Any], batch_size: int, operation_id: str,
+                        corpus_indices: Optional[List[int]] = None) -> List[BatchDefinition]:
+        """Create batch definitions from corpus (corpus_indices: original index of each item when resuming)."""
         batches = []
         
         for i in range(0, len(corpus), batch_size):
@@ -277,15 +319,17 @@ def _create_batches(self, corpus: List[Any], batch_size: int, operation_id: str)
             batch_corpus = corpus[i:i + batch_size]
             
             for j, item in enumerate(batch_corpus):
+                corpus_index = corpus_indices[i + j] if corpus_indices is not None else i + j
                 batch_item = BatchItem(
-                    item_id=f"{operation_id}_item_{i + j}",
+                    item_id=f"{operation_id}_item_{corpus_index}",
                     content=item,
-                    metadata={"corpus_index": i + j, "batch_index": j}
+                    metadata={"corpus_index": corpus_index, "batch_index": j}
                 )
                 batch_items.append(batch_item)
                 
+            # Named by the first corpus index, so ids stay unique across resumed runs
             batch_def = BatchDefinition(
-                batch_id=f"{operation_id}_batch_{len(batches)}",
+                batch_id=f"{operation_id}_batch_{batch_items[0].metadata['corpus_index']}",
                 items=batch_items,
                 batch_size=len(batch_items),
                 metadata={"start_index": i, "end_index": i + len(batch_items)}
@@ -430,6 +474,76 @@ def _process_priority_based(self, batches: List[BatchDefinition],
         
         return self._process_parallel(sorted_batches, processor_func)
         
+    def _process_multiprocess(self, batches: List[BatchDefinition],
+                              processor_func: Callable) -> List[Any]:
+        """
+        Process batches on a process pool over a memory-mapped corpus.
+        
+        Each batch's contents are pickled once into a temporary corpus file
+        that every worker maps in its initializer, so a task carries only the
+        batch id and byte range instead of the pickled BatchDefinition. At
+        most 2 * max_workers batches are in flight; results stream back as
+        they complete while progress, callbacks and checkpoints update here
+        in the parent.
+        """
+        if not batches:
+            return []
+            
+        all_results = []
+        spans: Dict[str, Tuple[int, int]] = {}
+        fd, corpus_path = tempfile.mkstemp(prefix="batch_corpus_", suffix=".pkl")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for batch in batches:
+                    start = f.tell()
+                    pickle.dump([item.content for item in batch.items], f, protocol=pickle.HIGHEST_PROTOCOL)
+                    spans[batch.batch_id] = (start, f.tell())
+                    
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_attach_replay_corpus,
+                                     initargs=(corpus_path, processor_func)) as executor:
+                pending = iter(batches)
+                in_flight = set()
+                since_checkpoint = 0
+                
+                while True:
+                    # Keep the result channel bounded: refill only as results are consumed
+                    while len(in_flight) < self.max_workers * 2:
+                        batch = next(pending, None)
+                        if batch is None:
+                            break
+                        in_flight.add(executor.submit(_replay_batch, batch.batch_id, *spans[batch.batch_id]))
+                    if not in_flight:
+                        break
+                        
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        batch_id, results, error, processing_time = future.result()
+                        batch_result = self._record_batch_result(
+                            self.batch_definitions[batch_id], results, error, processing_time
+                        )
+                        all_results.extend(batch_result.results)
+                        
+                        # Update progress
+                        with self._lock:
+                            self.progress.completed_batches += 1
+                            self.progress.processed_items += batch_result.items_processed
+                            self.progress.failed_items += batch_result.items_failed
+                            self.progress.update_throughput()
+                            
+                        # Checkpoint every checkpoint_interval processed items
+                        since_checkpoint += batch_result.items_processed
+                        if since_checkpoint >= self.checkpoint_interval:
+                            self._save_checkpoint(self.current_operation_id)
+                            since_checkpoint = 0
+                            
+                        # Progress callback
+                        if self.progress_callback:
+                            self.progress_callback(self.progress)
+        finally:
+            os.remove(corpus_path)
+            
+        return all_results
+        
     def _process_single_batch(self, batch: BatchDefinition, 
                             processor_func: Callable) -> BatchResult:
         """Process a single batch and return results."""
@@ -441,9 +555,15 @@ def _process_single_batch(self, batch: BatchDefinition,
             
             # Process the batch
             results = processor_func(batch_content)
+            return self._record_batch_result(batch, results, None, time.time() - start_time)
             
-            processing_time = time.time() - start_time
+        except Exception as e:
+            return self._record_batch_result(batch, None, str(e), time.time() - start_time)
             
+    def _record_batch_result(self, batch: BatchDefinition, results: Optional[List[Any]],
+                             error: Optional[str], processing_time: float) -> BatchResult:
+        """Build and store the BatchResult of a processed batch (error set when it raised)."""
+        if error is None:
             batch_result = BatchResult(
                 batch_id=batch.batch_id,
                 status=BatchStatus.COMPLETED,
@@ -452,19 +572,7 @@ def _process_single_batch(self, batch: BatchDefinition,
                 processing_time=processing_time,
                 results=results
             )
-            
-            # Store result
-            self.batch_results[batch.batch_id] = batch_result
-            
-            # Batch completion callback
-            if self.batch_completion_callback:
-                self.batch_completion_callback(batch_result)
-                
-            return batch_result
-            
-        except Exception as e:
-            processing_time = time.time() - start_time
-            
+        else:
             batch_result = BatchResult(
                 batch_id=batch.batch_id,
                 status=BatchStatus.FAILED,
@@ -472,12 +580,18 @@ def _process_single_batch(self, batch: BatchDefinition,
                 items_failed=len(batch.items),
                 processing_time=processing_time,
                 results=[],
-                error_details={"error": str(e)}
+                error_details={"error": error}
             )
             
-            self.batch_results[batch.batch_id] = batch_result
-            return batch_result
+        # Store result
+        self.batch_results[batch.batch_id] = batch_result
+        
+        # Batch completion callback
+        if error is None and self.batch_completion_callback:
+            self.batch_completion_callback(batch_result)
             
+        return batch_result
+        
     def _save_checkpoint(self, operation_id: str):
         """Save progress checkpoint."""
         if not self.progress:
@@ -485,29 +599,26 @@ def _save_checkpoint(self, operation_id: str):
             
         checkpoint_file = self.checkpoint_dir / f"{operation_id}.json"
         
-        # Get processed item indices
-        processed_items = []
+        # Get processed item indices: earlier runs' plus this run's completed batches
+        processed_items = set(self._checkpointed_items)
         for batch_result in self.batch_results.values():
             if batch_result.status == BatchStatus.COMPLETED:
-                batch_def = next(
-                    (b for b in [] if b.batch_id == batch_result.batch_id), 
-                    None
-                )
+                batch_def = self.batch_definitions.get(batch_result.batch_id)
                 if batch_def:
                     for item in batch_def.items:
-                        processed_items.append(item.metadata.get('corpus_index', 0))
+                        processed_items.add(item.metadata.get('corpus_index', 0))
                         
         checkpoint_data = {
             "operation_id": operation_id,
             "timestamp": time.time(),
             "progress": asdict(self.progress),
-            "processed_items": processed_items,
+            "processed_items": sorted(processed_items),
             "batch_results": {k: asdict(v) for k, v in self.batch_results.items()}
         }
         
         try:
             with open(checkpoint_file, 'w') as f:
-                json.dump(checkpoint_data, f, indent=2)
+                json.dump(checkpoint_data, f, indent=2, default=str)  # enums and non-JSON results
         except Exception as e:
             print(f"Failed to save checkpoint: {e}")
             
@@ -0,0 +1,433 @@
+"""
+BitChain Binary Records - Compact Fixed-Layout Encoding
+
+A length-prefixed binary record per bit-chain, replacing JSON text for bulk
+storage. Enumerated fields (realms, horizon, entity type, data class) are
+single-byte codes, lineage is a zigzag varint, strings and the adjacency list
+are length-prefixed, and resonance/velocity/density are packed doubles.
+
+Record layout (little-endian):
+    u32 body length (bytes after this field)
+    u8  format version
+    u8  realm, u8 coordinate realm, u8 horizon, u8 entity type
+        (index into REALMS / HORIZONS / ENTITY_TYPES; 255 = string in tail)
+    u8  data classification (index into DataClass)
+    u8  flags (1 = owner_id present, 2 = encryption_key_id present)
+    f64 resonance, f64 velocity, f64 density
+    i64 created_at (milliseconds since the Unix epoch, UTC)
+    tail: id, varint lineage, custom enum strings, adjacency (count + ids),
+          canonical state JSON, access control list, owner_id, encryption_key_id
+
+BitChainRecord reads fields straight out of a memoryview, and its
+canonical_bytes() is byte-identical to canonical_serialize(to_canonical_dict())
+of the chain it was encoded from, so records hash to the same STAT7 address.
+"""
+
+from typing import Dict, List, Any, Optional, Iterator, Iterable, Tuple, Union
+from datetime import datetime, timedelta, timezone
+from json.encoder import encode_basestring_ascii
+import hashlib
+import json
+import math
+import mmap
+import struct
+
+from stat7_experiments import (
+    BitChain,
+    Coordinates,
+    DataClass,
+    REALMS,
+    HORIZONS,
+    ENTITY_TYPES,
+    canonical_json,
+    format_canonical_bitchain,
+)
+
+
+FORMAT_VERSION = 1
+CUSTOM_CODE = 255
+
+_LENGTH = struct.Struct('<I')
+_HEADER = struct.Struct('<IBBBBBBBdddq')
+_DATA_CLASSES = list(DataClass)
+_OWNER_FLAG = 1
+_ENCRYPTION_KEY_FLAG = 2
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_REALM_CODES = {name: code for code, name in enumerate(REALMS)}
+_HORIZON_CODES = {name: code for code, name in enumerate(HORIZONS)}
+_ENTITY_TYPE_CODES = {name: code for code, name in enumerate(ENTITY_TYPES)}
+
+
+# ============================================================================
+# PRIMITIVES
+# ============================================================================
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buffer, offset: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+def _write_text(out: bytearray, text: str):
+    if type(text) is not str:
+        raise ValueError(f"Expected str, got {type(text).__name__}: {text!r}")
+    data = text.encode('utf-8')
+    _write_varint(out, len(data))
+    out += data
+
+
+def _read_text(buffer, offset: int) -> Tuple[str, int]:
+    length, offset = _read_varint(buffer, offset)
+    end = offset + length
+    return str(buffer[offset:end], 'utf-8'), end
+
+
+def _skip_text(buffer, offset: int) -> int:
+    length, offset = _read_varint(buffer, offset)
+    return offset + length
+
+
+def _packed_float(value: Any, name: str) -> float:
+    if type(value) not in (float, int) or not math.isfinite(value) or float(value) != value:
+        raise ValueError(f"{name} must be a finite real number, got {value!r}")
+    return float(value)
+
+
+def _timestamp_millis(created_at: str) -> int:
+    """Milliseconds for a normalized timestamp; rejects strings that would not round-trip."""
+    millis = (datetime.fromisoformat(created_at[:-1] + '+00:00') - _EPOCH) // timedelta(milliseconds=1)
+    if _format_millis(millis) != created_at:
+        raise ValueError(f"created_at is not a normalized millisecond timestamp: {created_at!r}")
+    return millis
+
+
+def _format_millis(millis: int) -> str:
+    return (_EPOCH + timedelta(milliseconds=millis)).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+# ============================================================================
+# ENCODING
+# ============================================================================
+
+def encode_bitchain(bc: BitChain, out: Optional[bytearray] = None) -> bytearray:
+    """
+    Append one length-prefixed record for bc to out (a new bytearray if None).
+
+    Raises:
+        ValueError: if a field does not fit the layout (non-str ids, non-int
+            lineage, non-finite floats, un-normalized created_at)
+    """
+    out = bytearray() if out is None else out
+    start = len(out)
+    coords = bc.coordinates
+
+    codes = [
+        _REALM_CODES.get(bc.realm, CUSTOM_CODE),
+        _REALM_CODES.get(coords.realm, CUSTOM_CODE),
+        _HORIZON_CODES.get(coords.horizon, CUSTOM_CODE),
+        _ENTITY_TYPE_CODES.get(bc.entity_type, CUSTOM_CODE),
+    ]
+    flags = (_OWNER_FLAG if bc.owner_id is not None else 0) | \
+        (_ENCRYPTION_KEY_FLAG if bc.encryption_key_id is not None else 0)
+
+    out += _HEADER.pack(
+        0, FORMAT_VERSION, *codes,
+        _DATA_CLASSES.index(bc.data_classification), flags,
+        _packed_float(coords.resonance, 'resonance'),
+        _packed_float(coords.velocity, 'velocity'),
+        _packed_float(coords.density, 'density'),
+        _timestamp_millis(bc.created_at),
+    )
+
+    _write_text(out, bc.id)
+
+    lineage = coords.lineage
+    if type(lineage) is not int:
+        raise ValueError(f"lineage must be an int, got {lineage!r}")
+    _write_varint(out, lineage << 1 if lineage >= 0 else (~lineage << 1) | 1)  # Zigzag
+
+    for code, value in zip(codes, (bc.realm, coords.realm, coords.horizon, bc.entity_type)):
+        if code == CUSTOM_CODE:
+            _write_text(out, value)
+
+    _write_varint(out, len(coords.adjacency))
+    for neighbor in coords.adjacency:
+        _write_text(out, neighbor)
+    _write_text(out, canonical_json(bc.state))
+    _write_varint(out, len(bc.access_control_list))
+    for role in bc.access_control_list:
+        _write_text(out, role)
+    if bc.owner_id is not None:
+        _write_text(out, bc.owner_id)
+    if bc.encryption_key_id is not None:
+        _write_text(out, bc.encryption_key_id)
+
+    _LENGTH.pack_into(out, start, len(out) - start - _LENGTH.size)
+    return out
+
+
+def encode_bitchains(bitchains: Iterable[BitChain]) -> bytearray:
+    """Concatenated records for many bit-chains."""
+    out = bytearray()
+    for bc in bitchains:
+        encode_bitchain(bc, out)
+    return out
+
+
+def write_bitchains(path: str, bitchains: Iterable[BitChain]) -> int:
+    """Write records to path; returns the number of bytes written."""
+    data = encode_bitchains(bitchains)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+# ============================================================================
+# ZERO-COPY READING
+# ============================================================================
+
+class BitChainRecord:
+    """
+    Read-only view of one record inside a larger buffer.
+
+    Header fields are unpacked on access and the id sits at a fixed offset;
+    the rest of the variable-length tail is located once, on first use.
+    Nothing is copied out of the buffer until a field is read.
+    """
+
+    __slots__ = ('_buffer', '_offset', '_end', '_tail')
+
+    def __init__(self, buffer: memoryview, offset: int = 0):
+        self._buffer = buffer
+        self._offset = offset
+        self._end = offset + _LENGTH.size + _LENGTH.unpack_from(buffer, offset)[0]
+        self._tail = None
+        if buffer[offset + _LENGTH.size] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported BitChain record version {buffer[offset + _LENGTH.size]}")
+
+    @property
+    def size(self) -> int:
+        """Encoded size of this record in bytes, including the length prefix."""
+        return self._end - self._offset
+
+    @property
+    def id(self) -> str:
+        return _read_text(self._buffer, self._offset + _HEADER.size)[0]
+
+    @property
+    def resonance(self) -> float:
+        return self._header()[8]
+
+    @property
+    def velocity(self) -> float:
+        return self._header()[9]
+
+    @property
+    def density(self) -> float:
+        return self._header()[10]
+
+    @property
+    def created_at(self) -> str:
+        return _format_millis(self._header()[11])
+
+    @property
+    def data_classification(self) -> DataClass:
+        return _DATA_CLASSES[self._header()[6]]
+
+    @property
+    def lineage(self) -> int:
+        return self._parse()[0]
+
+    @property
+    def realm(self) -> str:
+        return self._parse()[1]
+
+    @property
+    def coordinate_realm(self) -> str:
+        return self._parse()[2]
+
+    @property
+    def horizon(self) -> str:
+        return self._parse()[3]
+
+    @property
+    def entity_type(self) -> str:
+        return self._parse()[4]
+
+    @property
+    def adjacency(self) -> List[str]:
+        return self._read_list(self._parse()[5])
+
+    @property
+    def state_json(self) -> str:
+        """Canonical JSON text of the state, as stored."""
+        return _read_text(self._buffer, self._parse()[6])[0]
+
+    def canonical_bytes(self) -> bytes:
+        """Canonical serialization of the encoded bit-chain, built from the record."""
+        header = self._header()
+        lineage, realm, coordinate_realm, horizon, entity_type, adjacency_offset, state_offset, _ = self._parse()
+        text = encode_basestring_ascii
+
+        return format_canonical_bitchain(
+            text(_format_millis(header[11])),
+            text(entity_type),
+            text(self.id),
+            text(realm),
+            ','.join(map(text, sorted(self._read_list(adjacency_offset)))),
+            header[10],
+            text(horizon),
+            lineage,
+            text(coordinate_realm),
+            header[8],
+            header[9],
+            _read_text(self._buffer, state_offset)[0],
+        )
+
+    def compute_address(self) -> str:
+        """STAT7 address; equal to BitChain.compute_address() of the source chain."""
+        return hashlib.sha256(self.canonical_bytes()).hexdigest()
+
+    def to_bitchain(self) -> BitChain:
+        """Materialize the full BitChain (state comes back from its canonical JSON)."""
+        header = self._header()
+        lineage, realm, coordinate_realm, horizon, entity_type, adjacency_offset, state_offset, offset = self._parse()
+        buffer = self._buffer
+
+        count, offset = _read_varint(buffer, offset)
+        acl = []
+        for _ in range(count):
+            role, offset = _read_text(buffer, offset)
+            acl.append(role)
+        owner_id = encryption_key_id = None
+        if header[7] & _OWNER_FLAG:
+            owner_id, offset = _read_text(buffer, offset)
+        if header[7] & _ENCRYPTION_KEY_FLAG:
+            encryption_key_id, offset = _read_text(buffer, offset)
+
+        return BitChain(
+            id=self.id,
+            entity_type=entity_type,
+            realm=realm,
+            coordinates=Coordinates(
+                realm=coordinate_realm,
+                lineage=lineage,
+                adjacency=self._read_list(adjacency_offset),
+                horizon=horizon,
+                resonance=header[8],
+                velocity=header[9],
+                density=header[10],
+            ),
+            created_at=_format_millis(header[11]),
+            state=json.loads(_read_text(buffer, state_offset)[0]),
+            data_classification=_DATA_CLASSES[header[6]],
+            access_control_list=acl,
+            owner_id=owner_id,
+            encryption_key_id=encryption_key_id,
+        )
+
+    def _header(self) -> tuple:
+        return _HEADER.unpack_from(self._buffer, self._offset)
+
+    def _read_list(self, offset: int) -> List[str]:
+        count, offset = _read_varint(self._buffer, offset)
+        items = []
+        for _ in range(count):
+            item, offset = _read_text(self._buffer, offset)
+            items.append(item)
+        return items
+
+    def _parse(self) -> tuple:
+        """(lineage, realm, coordinate realm, horizon, entity type, adjacency/state/ACL offsets)."""
+        if self._tail is not None:
+            return self._tail
+
+        buffer = self._buffer
+        header = self._header()
+        offset = _skip_text(buffer, self._offset + _HEADER.size)  # id
+        zigzag, offset = _read_varint(buffer, offset)
+
+        names = []
+        for code, table in ((header[2], REALMS), (header[3], REALMS),
+                            (header[4], HORIZONS), (header[5], ENTITY_TYPES)):
+            if code == CUSTOM_CODE:
+                name, offset = _read_text(buffer, offset)
+            else:
+                name = table[code]
+            names.append(name)
+
+        adjacency_offset = offset
+        count, offset = _read_varint(buffer, offset)
+        for _ in range(count):
+            offset = _skip_text(buffer, offset)
+        state_offset = offset
+
+        self._tail = ((zigzag >> 1) ^ -(zigzag & 1), *names,
+                      adjacency_offset, state_offset, _skip_text(buffer, state_offset))
+        return self._tail
+
+
+def iter_records(buffer: Union[bytes, bytearray, memoryview, mmap.mmap]) -> Iterator[BitChainRecord]:
+    """Yield a BitChainRecord view for every record in a buffer of concatenated records."""
+    view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+    offset = 0
+    total = len(view)
+    while offset < total:
+        record = BitChainRecord(view, offset)
+        if record._end > total:
+            raise ValueError(f"Truncated BitChain record at offset {offset}")
+        yield record
+        offset = record._end
+
+
+def decode_bitchains(buffer: Union[bytes, bytearray, memoryview]) -> List[BitChain]:
+    """Materialize every record in a buffer."""
+    return [record.to_bitchain() for record in iter_records(buffer)]
+
+
+class BitChainFileReader:
+    """
+    Memory-mapped reader over a file written by write_bitchains().
+
+    Records are views into the mapping and must not be used after close():
+
+        with BitChainFileReader(path) as reader:
+            addresses = [record.compute_address() for record in reader]
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._map = None  # Empty file: mmap cannot map zero bytes
+        self._view = memoryview(self._map) if self._map is not None else memoryview(b'')
+
+    def __iter__(self) -> Iterator[BitChainRecord]:
+        return iter_records(self._view)
+
+    def __enter__(self) -> "BitChainFileReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
@@ -1,14 +1,18 @@
 
 from __future__ import annotations
 from typing import List, Dict, Any, Tuple, Optional, Set
+import os
 import time
 import re
 import math
 import hashlib
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 import json
 import logging
+import pickle
 
 # Configure secure logging
 logger = logging.getLogger(__name__)
@@ -41,6 +45,44 @@ class ConceptValidationMetrics:
     effect_size: float
 
 
+class _TextAnalysis:
+    """
+    One proto-thought cleaned, tokenized and pattern-matched once.
+
+    Shared by every extraction method so the text is not re-cleaned,
+    re-tokenized and re-scanned per method.
+    """
+    __slots__ = ("cleaned_text", "words", "tokens", "term_freq", "term_positions", "pattern_matches")
+
+    def __init__(self, cleaned_text: str, tokens: List[str], concept_patterns: Dict[str, Dict[str, Any]]):
+        self.cleaned_text = cleaned_text
+        self.words = cleaned_text.split()
+        self.tokens = tokens
+        self.term_freq = Counter(tokens)
+        self.term_positions: Dict[str, List[int]] = {}
+        for position, token in enumerate(tokens):
+            self.term_positions.setdefault(token, []).append(position)
+        self.pattern_matches = [
+            (pattern_name, pattern_config, pattern_config["regex"].findall(cleaned_text))
+            for pattern_name, pattern_config in concept_patterns.items()
+        ]
+
+
+_MISSING = object()
+
+
+def _extract_candidates_chunk(config: Dict[str, Any], items: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+    """Pool task: text-only extraction for (proto_thought, mist) pairs; failures come back as _MISSING."""
+    graph = CastleGraph(dict(config, extraction_cache_size=0))
+    results = []
+    for proto_thought, mist in items:
+        try:
+            results.append(graph._extract_candidates(proto_thought, mist))
+        except Exception:
+            results.append(_MISSING)  # re-run (and logged) by infuse on the main process
+    return results
+
+
 class CastleGraph:
     """
     Castle Graph: Scientific concept extraction and cognitive structure mapping.
@@ -51,6 +93,12 @@ class CastleGraph:
     - Semantic coherence metrics
     - Reproducible results with deterministic hashing
     - Comprehensive logging for empirical studies
+
+    Config (beyond the extraction settings):
+        extraction_cache_size: Memoized text extractions, LRU (default 10000, 0 disables)
+        max_extraction_history: ConceptExtractionResults kept in extraction_history (default 10000, None keeps all)
+        infusion_workers: Process pool size for large infusions (default 1 stays in process; 0 uses os.cpu_count())
+        infusion_chunk_size: Distinct proto-thoughts per pool task (default 2000)
     """
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
@@ -59,7 +107,7 @@ def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.updated_epoch = 0
 
         # Scientific validation tracking
-        self.extraction_history = []
+        self.extraction_history = deque(maxlen=self.config.get("max_extraction_history", 10000))
         self.validation_metrics = []
         self.concept_statistics = defaultdict(lambda: {"frequency": 0, "contexts": [], "confidence_sum": 0.0})
 
@@ -79,11 +127,20 @@ def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.concept_patterns = self._initialize_concept_patterns()
         self.semantic_weights = self._initialize_semantic_weights()
 
+        # Memoized text-only extraction results, keyed by proto-thought and context
+        self.extraction_cache_size = self.config.get("extraction_cache_size", 10000)
+        self._extraction_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self.infusion_workers = self.config.get("infusion_workers", 1) or os.cpu_count() or 1
+        self.infusion_chunk_size = self.config.get("infusion_chunk_size", 2000)
+
     def infuse(self, mist_lines: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Scientific infusion of mist lines with comprehensive concept extraction and validation.
 
         Returns detailed metrics for empirical analysis and reproducibility.
+        Batches with more distinct proto-thoughts than infusion_chunk_size have
+        their text extraction split across a process pool; nodes are still
+        heated here, in input order, so the result matches a serial infusion.
         """
         start_time = time.time()
         extraction_results = []
@@ -98,10 +155,12 @@ def infuse(self, mist_lines: List[Dict[str, Any]]) -> Dict[str, Any]:
             "validation_metrics": None
         }
 
+        prefetched = self._prefetch_candidates(mist_lines)
+
         for mist in mist_lines:
             try:
                 # Advanced concept extraction with full validation
-                extraction_result = self._extract_concept_scientific(mist)
+                extraction_result = self._extract_concept_scientific(mist, prefetched)
 
                 if extraction_result and extraction_result.confidence >= self.confidence_threshold:
                     # Update node with scientific heat calculation
@@ -150,6 +209,13 @@ def get_top_rooms(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
         current_time = time.time()
 
+        # Extraction count and confidence per concept, in one pass over the history
+        concept_confidence = defaultdict(lambda: [0, 0.0])
+        for extraction in self.extraction_history:
+            totals = concept_confidence[extraction.concept_id]
+            totals[0] += 1
+            totals[1] += extraction.confidence
+
         # Calculate comprehensive heat scores
         scored_nodes = []
         for concept_id, node_data in self.nodes.items():
@@ -165,8 +231,8 @@ def get_top_rooms(self, limit: int = 5) -> List[Dict[str, Any]]:
             frequency_bonus = math.log(1 + visit_count) * 0.1
 
             # Confidence weighting from extraction history
-            concept_extractions = [e for e in self.extraction_history if e.concept_id == concept_id]
-            avg_confidence = sum(e.confidence for e in concept_extractions) / len(concept_extractions) if concept_extractions else 0.5
+            extraction_count, confidence_sum = concept_confidence.get(concept_id, (0, 0.0))
+            avg_confidence = confidence_sum / extraction_count if extraction_count else 0.5
             confidence_weight = avg_confidence * 0.2
 
             # Semantic diversity bonus
@@ -184,6 +250,7 @@ def get_top_rooms(self, limit: int = 5) -> List[Dict[str, Any]]:
         # Return top rooms with full metadata
         top_rooms = []
         for concept_id, heat_score, node_data in scored_nodes[:limit]:
+            extraction_count, confidence_sum = concept_confidence.get(concept_id, (0, 0.0))
             room_data = {
                 "concept_id": concept_id,
                 "heat": heat_score,
@@ -193,8 +260,8 @@ def get_top_rooms(self, limit: int = 5) -> List[Dict[str, Any]]:
                 "visit_count": node_data.get("visit_count", 0),
                 "age_hours": (current_time - node_data.get("last_visit", current_time)) / 3600,
                 "temporal_decay": math.exp(-((current_time - node_data.get("last_visit", current_time)) / 3600) / 24),
-                "extraction_count": len([e for e in self.extraction_history if e.concept_id == concept_id]),
-                "avg_confidence": sum(e.confidence for e in self.extraction_history if e.concept_id == concept_id) / max(1, len([e for e in self.extraction_history if e.concept_id == concept_id])),
+                "extraction_count": extraction_count,
+                "avg_confidence": confidence_sum / max(1, extraction_count),
                 "semantic_diversity": self._calculate_semantic_diversity(concept_id),
                 "creation_epoch": node_data.get("creation_epoch", current_time),
             }
@@ -202,7 +269,101 @@ def get_top_rooms(self, limit: int = 5) -> List[Dict[str, Any]]:
 
         return top_rooms
 
-    def _extract_concept_scientific(self, mist: Dict[str, Any]) -> Optional[ConceptExtractionResult]:
+    def _prefetch_candidates(self, mist_lines: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Text extraction for the uncached proto-thoughts of a large batch, on a process pool.
+
+        Returns {extraction key: candidates} for _extract_concept_scientific;
+        empty when the batch is small enough to extract in process, or when the
+        pool fails (unpicklable config, dead worker), leaving it all to the serial pass.
+        """
+        if self.infusion_workers <= 1 or len(mist_lines) <= self.infusion_chunk_size:
+            return {}
+
+        pending: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for mist in mist_lines:
+            try:
+                proto_thought = mist.get("proto_thought", "")
+                if not proto_thought or len(proto_thought.strip()) < 3:
+                    continue
+                key = self._extraction_key(proto_thought, mist)
+            except Exception:
+                continue  # fails again, and is counted, in the serial pass
+            if key not in self._extraction_cache:
+                pending.setdefault(key, (proto_thought, mist))
+        if len(pending) <= self.infusion_chunk_size:
+            return {}
+
+        keys, items = list(pending), list(pending.values())
+        chunks = [items[start:start + self.infusion_chunk_size] for start in range(0, len(items), self.infusion_chunk_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=min(self.infusion_workers, len(chunks))) as pool:
+                results = [result for chunk in pool.map(_extract_candidates_chunk, [self.config] * len(chunks), chunks)
+                           for result in chunk]
+        except (BrokenProcessPool, pickle.PicklingError, TypeError, AttributeError, OSError) as e:
+            logger.warning("Infusion pool failed (%s: %s); extracting serially", type(e).__name__, e)
+            return {}
+        return {key: result for key, result in zip(keys, results) if result is not _MISSING}
+
+    def _extraction_key(self, proto_thought: str, mist: Dict[str, Any]) -> str:
+        """Memo key: the proto-thought plus the mist context that _calculate_context_weight reads."""
+        affect = mist.get("affect_signature", {})
+        try:
+            context = (mist.get("style", ""), affect.get("curiosity", 0) > 0.5, affect.get("awe", 0) > 0.5)
+        except (AttributeError, TypeError):
+            context = (mist.get("style", ""), affect)
+        return hashlib.sha256(f"{context!r}\x00{proto_thought}".encode()).hexdigest()
+
+    def _extract_candidates(self, proto_thought: str, mist: Dict[str, Any],
+                            prefetched: Optional[Dict[str, Any]] = None) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Text-dependent half of extraction: (best method result, validation metrics) or None.
+
+        Every method reads one shared _TextAnalysis, and the outcome is memoized
+        by _extraction_key since it does not depend on graph state.
+        """
+        key = self._extraction_key(proto_thought, mist)
+        candidates = self._extraction_cache.get(key, _MISSING)
+        if candidates is not _MISSING:
+            self._extraction_cache.move_to_end(key)
+            return candidates
+        candidates = prefetched.get(key, _MISSING) if prefetched else _MISSING
+
+        if candidates is _MISSING:
+            analysis = self._analyze_text(proto_thought)
+
+            # Run multiple extraction methods; hybrid reuses the results of the others
+            method_results = {}
+            for method_name, method_func in self.extraction_methods.items():
+                try:
+                    if method_name == "hybrid":
+                        result = method_func(proto_thought, mist, analysis, method_results)
+                    else:
+                        result = method_func(proto_thought, mist, analysis)
+                    if result:
+                        method_results[method_name] = result
+                except Exception as e:
+                    self._log_method_error(method_name, proto_thought, str(e))
+
+            candidates = None
+            if method_results:
+                # Select best result using consensus and confidence weighting
+                best_result = self._select_best_extraction(method_results, mist)
+                candidates = (best_result, self._calculate_extraction_validation(best_result, method_results, proto_thought))
+
+        if self.extraction_cache_size > 0:
+            self._extraction_cache[key] = candidates
+            if len(self._extraction_cache) > self.extraction_cache_size:
+                self._extraction_cache.popitem(last=False)
+        return candidates
+
+    def _analyze_text(self, proto_thought: str) -> _TextAnalysis:
+        """Clean, tokenize and pattern-match a proto-thought once for all methods."""
+        cleaned_text = self._clean_text(proto_thought)
+        return _TextAnalysis(cleaned_text, self._tokenize(cleaned_text), self.concept_patterns)
+
+    def _extract_concept_scientific(self, mist: Dict[str, Any],
+                                    prefetched: Optional[Dict[str, Any]] = None) -> Optional[ConceptExtractionResult]:
         """
         Scientific concept extraction with multiple algorithms and validation.
 
@@ -219,45 +380,32 @@ def _extract_concept_scientific(self, mist: Dict[str, Any]) -> Optional[ConceptE
         if not proto_thought or len(proto_thought.strip()) < 3:
             return None
 
-        # Run multiple extraction methods
-        method_results = {}
-        for method_name, method_func in self.extraction_methods.items():
-            try:
-                result = method_func(proto_thought, mist)
-                if result:
-                    method_results[method_name] = result
-            except Exception as e:
-                self._log_method_error(method_name, proto_thought, str(e))
-
-        if not method_results:
+        candidates = self._extract_candidates(proto_thought, mist, prefetched)
+        if candidates is None:
             return None
-
-        # Select best result using consensus and confidence weighting
-        best_result = self._select_best_extraction(method_results, mist)
-
-        # Calculate comprehensive validation metrics
-        validation_metrics = self._calculate_extraction_validation(best_result, method_results, proto_thought)
+        best_result, validation_metrics = candidates
 
         # Create reproducible hash for verification
         validation_hash = self._create_validation_hash(best_result, proto_thought, mist)
 
         extraction_time = (time.time() - start_time) * 1000
 
-        # Return comprehensive result
+        # Return comprehensive result; novelty depends on the graph so far and is never memoized
         return ConceptExtractionResult(
             concept_id=best_result["concept_id"],
             confidence=best_result["confidence"],
             extraction_method=best_result["method"],
-            supporting_terms=best_result["supporting_terms"],
+            supporting_terms=list(best_result["supporting_terms"]),
             semantic_density=validation_metrics["semantic_density"],
-            novelty_score=validation_metrics["novelty_score"],
+            novelty_score=self._calculate_concept_novelty(best_result.get("raw_concept", "")),
             validation_hash=validation_hash,
             extraction_time_ms=extraction_time,
-            linguistic_features=validation_metrics["linguistic_features"],
+            linguistic_features=dict(validation_metrics["linguistic_features"]),
             statistical_significance=validation_metrics["statistical_significance"]
         )
 
-    def _extract_linguistic_concept(self, proto_thought: str, mist: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _extract_linguistic_concept(self, proto_thought: str, mist: Dict[str, Any],
+                                    analysis: Optional[_TextAnalysis] = None) -> Optional[Dict[str, Any]]:
         """
         Linguistic concept extraction using pattern matching and grammatical analysis.
 
@@ -268,17 +416,17 @@ def _extract_linguistic_concept(self, proto_thought: str, mist: Dict[str, Any])
         4. Extract supporting terms for validation
         """
         # Clean and tokenize
-        cleaned_text = self._clean_text(proto_thought)
-        tokens = self._tokenize(cleaned_text)
+        analysis = analysis or self._analyze_text(proto_thought)
+        cleaned_text = analysis.cleaned_text
 
-        if not tokens:
+        if not analysis.tokens:
             return None
 
-        # Apply concept patterns
+        # Apply concept patterns (supporting terms depend only on the concept, not the pattern)
         concept_candidates = []
+        supporting_by_concept: Dict[str, List[str]] = {}
 
-        for pattern_name, pattern_config in self.concept_patterns.items():
-            matches = pattern_config["regex"].findall(cleaned_text)
+        for pattern_name, pattern_config, matches in analysis.pattern_matches:
             for match in matches:
                 if isinstance(match, tuple):
                     match = match[0]  # Take first group if tuple
@@ -286,7 +434,10 @@ def _extract_linguistic_concept(self, proto_thought: str, mist: Dict[str, Any])
                 concept = match.lower().strip()
                 if self._is_valid_concept(concept):
                     confidence = self._calculate_linguistic_confidence(concept, pattern_config, cleaned_text)
-                    supporting_terms = self._extract_supporting_terms(concept, cleaned_text)
+                    supporting_terms = supporting_by_concept.get(concept)
+                    if supporting_terms is None:
+                        supporting_terms = self._extract_supporting_terms(concept, cleaned_text, analysis.words)
+                        supporting_by_concept[concept] = supporting_terms
 
                     concept_candidates.append({
                         "concept": concept,
@@ -311,7 +462,8 @@ def _extract_linguistic_concept(self, proto_thought: str, mist: Dict[str, Any])
 
         return None
 
-    def _extract_semantic_concept(self, proto_thought: str, mist: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _extract_semantic_concept(self, proto_thought: str, mist: Dict[str, Any],
+                                  analysis: Optional[_TextAnalysis] = None) -> Optional[Dict[str, Any]]:
         """
         Semantic concept extraction using density and relevance analysis.
 
@@ -321,14 +473,14 @@ def _extract_semantic_concept(self, proto_thought: str, mist: Dict[str, Any]) ->
         3. Apply semantic weighting based on context
         4. Validate using semantic coherence metrics
         """
-        cleaned_text = self._clean_text(proto_thought)
-        tokens = self._tokenize(cleaned_text)
+        analysis = analysis or self._analyze_text(proto_thought)
+        cleaned_text, tokens = analysis.cleaned_text, analysis.tokens
 
         if not tokens:
             return None
 
         # Calculate term frequencies and semantic weights
-        term_freq = Counter(tokens)
+        term_freq = analysis.term_freq
         semantic_scores = {}
 
         for term, freq in term_freq.items():
@@ -338,7 +490,7 @@ def _extract_semantic_concept(self, proto_thought: str, mist: Dict[str, Any]) ->
                 base_weight = 0.5  # Default weight for unknown terms
 
             # Position-based weighting (earlier terms often more important)
-            term_positions = [i for i, token in enumerate(tokens) if token == term]
+            term_positions = analysis.term_positions[term]
             avg_position = sum(term_positions) / len(term_positions)
             position_weight = 1.0 - (avg_position / len(tokens))  # Earlier = higher weight
 
@@ -384,7 +536,8 @@ def _extract_semantic_concept(self, proto_thought: str, mist: Dict[str, Any]) ->
             "raw_concept": concept
         }
 
-    def _extract_statistical_concept(self, proto_thought: str, mist: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _extract_statistical_concept(self, proto_thought: str, mist: Dict[str, Any],
+                                     analysis: Optional[_TextAnalysis] = None) -> Optional[Dict[str, Any]]:
         """
         Statistical concept extraction using frequency analysis and significance testing.
 
@@ -394,14 +547,14 @@ def _extract_statistical_concept(self, proto_thought: str, mist: Dict[str, Any])
         3. Apply chi-square tests for term independence
         4. Select statistically significant concepts
         """
-        cleaned_text = self._clean_text(proto_thought)
-        tokens = self._tokenize(cleaned_text)
+        analysis = analysis or self._analyze_text(proto_thought)
+        cleaned_text, tokens = analysis.cleaned_text, analysis.tokens
 
         if len(tokens) < 3:
             return None
 
         # Calculate term statistics
-        term_freq = Counter(tokens)
+        term_freq = analysis.term_freq
         total_terms = len(tokens)
 
         # Calculate expected frequencies (uniform distribution assumption)
@@ -449,39 +602,46 @@ def _extract_statistical_concept(self, proto_thought: str, mist: Dict[str, Any])
             "raw_concept": concept
         }
 
-    def _extract_hybrid_concept(self, proto_thought: str, mist: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _extract_hybrid_concept(self, proto_thought: str, mist: Dict[str, Any],
+                                analysis: Optional[_TextAnalysis] = None,
+                                method_results: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
         """
         Hybrid concept extraction combining multiple methods with consensus validation.
 
         Algorithm:
-        1. Run all extraction methods
+        1. Run all extraction methods (or reuse their results when given)
         2. Calculate consensus scores
         3. Apply weighted voting
         4. Validate cross-method agreement
         """
-        # Run all methods
-        method_results = {}
-        for method_name in ["linguistic", "semantic", "statistical"]:
-            try:
-                method_func = self.extraction_methods[method_name]
-                result = method_func(proto_thought, mist)
-                if result:
-                    method_results[method_name] = result
-            except Exception:
-                continue
+        if method_results is not None:
+            method_results = {name: method_results[name] for name in ["linguistic", "semantic", "statistical"]
+                              if name in method_results}
+        else:
+            # Run all methods
+            analysis = analysis or self._analyze_text(proto_thought)
+            method_results = {}
+            for method_name in ["linguistic", "semantic", "statistical"]:
+                try:
+                    method_func = self.extraction_methods[method_name]
+                    result = method_func(proto_thought, mist, analysis)
+                    if result:
+                        method_results[method_name] = result
+                except Exception:
+                    continue
 
         if not method_results:
             return None
 
         # Calculate consensus for each concept
-        concept_consensus = defaultdict(lambda: {"methods": [], "confidences": [], "supporting_terms": set()})
+        concept_consensus = defaultdict(lambda: {"methods": [], "confidences": [], "supporting_terms": {}})
 
         for method, result in method_results.items():
             concept = result.get("raw_concept", result.get("concept_id", "").replace("concept_", ""))
             if concept:
                 concept_consensus[concept]["methods"].append(method)
                 concept_consensus[concept]["confidences"].append(result["confidence"])
-                concept_consensus[concept]["supporting_terms"].update(result.get("supporting_terms", []))
+                concept_consensus[concept]["supporting_terms"].update(dict.fromkeys(result.get("supporting_terms", [])))
 
         # Calculate consensus scores
         consensus_scores = {}
@@ -620,7 +780,7 @@ def _determine_room_type(self, extraction_result: ConceptExtractionResult) -> st
 
     def _update_semantic_profile(self, concept_id: str, extraction_result: ConceptExtractionResult):
         """Update semantic profile for a concept."""
-        if "semantic_profile" not in self.nodes[concept_id]:
+        if not self.nodes[concept_id].get("semantic_profile"):
             self.nodes[concept_id]["semantic_profile"] = {
                 "avg_confidence": extraction_result.confidence,
                 "method_distribution": Counter(),
@@ -745,13 +905,14 @@ def _calculate_linguistic_confidence(self, concept: str, pattern_config: Dict[st
 
         return min(base_confidence * position_weight * length_weight * capitalization_bonus, 1.0)
 
-    def _extract_supporting_terms(self, concept: str, text: str) -> List[str]:
-        """Extract supporting terms around a concept."""
-        words = text.split()
+    def _extract_supporting_terms(self, concept: str, text: str, words: Optional[List[str]] = None) -> List[str]:
+        """Extract supporting terms around a concept (words: text.split(), when already at hand)."""
+        words = text.split() if words is None else words
+        concept = concept.lower()
         supporting = []
 
         for i, word in enumerate(words):
-            if concept.lower() in word.lower():
+            if concept in word.lower():
                 # Extract context window
                 start = max(0, i - 3)
                 end = min(len(words), i + 4)
@@ -759,7 +920,7 @@ def _extract_supporting_terms(self, concept: str, text: str) -> List[str]:
 
                 # Add related terms (excluding the concept itself)
                 for context_word in context_words:
-                    if (context_word.lower() != concept.lower() and
+                    if (context_word.lower() != concept and
                         context_word not in self.stop_words and
                         len(context_word) > 2 and
                         context_word not in supporting):
@@ -869,10 +1030,9 @@ def _select_best_extraction(self, method_results: Dict[str, Dict[str, Any]], mis
         return scored_results[0][0]
 
     def _calculate_extraction_validation(self, best_result: Dict[str, Any], all_results: Dict[str, Any], proto_thought: str) -> Dict[str, Any]:
-        """Calculate comprehensive validation metrics for extraction."""
+        """Calculate the text-only validation metrics for extraction (novelty is scored per infusion)."""
         return {
             "semantic_density": self._calculate_semantic_density_of_text(proto_thought),
-            "novelty_score": self._calculate_concept_novelty(best_result.get("raw_concept", "")),
             "linguistic_features": self._extract_linguistic_features(proto_thought),
             "statistical_significance": best_result.get("statistical_significance", 0.5)
         }
@@ -915,7 +1075,7 @@ def _extract_linguistic_features(self, text: str) -> Dict[str, Any]:
             "sentence_count": len([s for s in sentences if s.strip()]),
             "avg_word_length": sum(len(w) for w in words) / len(words) if words else 0,
             "punctuation_ratio": len(re.findall(r'[^\w\s]', text)) / len(text) if text else 0,
-            "capitalization_ratio": sum(1 for c in text if c.isupper()) / len(text) if text else 0
+            "capitalization_ratio": sum(map(str.isupper, text)) / len(text) if text else 0
         }
 
     def _create_validation_hash(self, result: Dict[str, Any], proto_thought: str, mist: Dict[str, Any]) -> str:
@@ -6,11 +6,18 @@
 """
 
 from typing import List, Dict, Any, Optional, Tuple, Set
+import heapq
 import time
 import hashlib
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    from .embeddings.ann_index import create_ann_index
+except ImportError:
+    # Loaded as a top-level module (seed/engine on sys.path)
+    from embeddings.ann_index import create_ann_index
+
 
 class ConflictType(Enum):
     """Types of conflicts that can be detected."""
@@ -77,6 +84,19 @@ def __init__(self, config: Optional[Dict[str, Any]] = None, embedding_provider=N
         self.detected_conflicts: List[ConflictEvidence] = []
         self.conflict_history: List[ConflictEvidence] = []
         
+        # Vector index kept in sync with self.statement_fingerprints, queried for
+        # neighbours above semantic_similarity_threshold ("exact" by default;
+        # "ivf"/"faiss"/"auto" for ANN). Embeddings of another dimension than the
+        # index stay in _unindexed_fingerprints and are compared pairwise.
+        self.statement_index = create_ann_index(
+            self.config.get("ann_backend", "exact"),
+            config=self.config.get("ann_config")
+        )
+        self._unindexed_fingerprints: Dict[str, StatementFingerprint] = {}
+        self._statement_order: Dict[str, int] = {}
+        self._next_statement_order = 0
+        self._expiry_queue: List[Tuple[float, str]] = []  # (creation_timestamp, statement_id)
+        
         # Conflict detection patterns
         self.negation_patterns = [
             "not", "no", "never", "none", "nothing", "nowhere",
@@ -127,21 +147,27 @@ def process_statements(self, statements: List[Dict[str, Any]]) -> Dict[str, Any]
             }
         }
         
+        # Embed every non-empty statement in one batched provider pass
+        valid_statements = [s for s in statements if s.get("text", "").strip()]
+        embeddings = self._embed_statements([s["text"] for s in valid_statements])
+        
         # Process each statement
-        for statement in statements:
+        for statement, embedding in zip(valid_statements, embeddings):
             statement_id = statement.get("id", f"stmt_{int(time.time())}")
-            content = statement.get("text", "")
-            
-            if not content.strip():
-                continue
+            content = statement["text"]
                 
             # Create fingerprint for new statement
-            fingerprint = self._create_statement_fingerprint(statement_id, content, statement)
+            fingerprint = self._create_statement_fingerprint(statement_id, content, statement, embedding)
+            if statement_id not in self.statement_fingerprints:
+                self._statement_order[statement_id] = self._next_statement_order
+                self._next_statement_order += 1
             self.statement_fingerprints[statement_id] = fingerprint
+            heapq.heappush(self._expiry_queue, (fingerprint.creation_timestamp, statement_id))
             processing_report["fingerprints_created"] += 1
             
-            # Detect conflicts with existing statements
+            # Detect conflicts with existing statements, then index the new one
             conflicts = self._detect_conflicts_for_statement(fingerprint)
+            self._index_fingerprint(fingerprint)
             
             for conflict in conflicts:
                 if conflict.confidence_score >= self.min_confidence_score:
@@ -326,16 +352,22 @@ def resolve_conflict(self, conflict_id: str, resolution: str) -> bool:
                 return True
         return False
     
-    def _create_statement_fingerprint(self, statement_id: str, content: str, metadata: Dict[str, Any]) -> StatementFingerprint:
-        """Create semantic and structural fingerprint for a statement."""
-        # Generate embedding if provider available
-        embedding = []
-        if self.embedding_provider:
+    def _embed_statements(self, contents: List[str]) -> List[List[float]]:
+        """Embed statement texts in provider-sized batches (empty embeddings without a provider)."""
+        if self.embedding_provider and contents:
             try:
-                embedding = self.embedding_provider.embed_text(content)
+                return self.embedding_provider.embed_in_batches(contents)
             except Exception:
-                # Fallback to empty embedding
+                # Fallback to empty embeddings
                 pass
+        return [[] for _ in contents]
+    
+    def _create_statement_fingerprint(self, statement_id: str, content: str, metadata: Dict[str, Any],
+                                      embedding: Optional[List[float]] = None) -> StatementFingerprint:
+        """Create semantic and structural fingerprint for a statement."""
+        # Generate embedding if provider available and none was precomputed
+        if embedding is None:
+            embedding = self._embed_statements([content])[0]
         
         # Detect negation indicators
         content_lower = content.lower()
@@ -382,56 +414,96 @@ def _create_statement_fingerprint(self, statement_id: str, content: str, metadat
     def _detect_conflicts_for_statement(self, new_fingerprint: StatementFingerprint) -> List[ConflictEvidence]:
         """Detect conflicts between new statement and existing statements."""
         conflicts = []
+        similarities = self._calculate_similarities(new_fingerprint)
         
-        for existing_id, existing_fingerprint in self.statement_fingerprints.items():
-            if existing_id == new_fingerprint.statement_id:
-                continue  # Don't compare with self
+        # Only neighbours above the similarity threshold, in statement insertion order
+        for existing_id in sorted(similarities, key=self._statement_order.__getitem__):
+            existing_fingerprint = self.statement_fingerprints[existing_id]
+            similarity = similarities[existing_id]
+            
+            # High semantic similarity with negation indicators suggests opposition
+            opposition_score = self._calculate_opposition_score(new_fingerprint, existing_fingerprint)
+            
+            if opposition_score > self.opposition_threshold:
+                # Calculate context overlap
+                context_overlap = len(new_fingerprint.domain_tags & existing_fingerprint.domain_tags) / \
+                                max(len(new_fingerprint.domain_tags | existing_fingerprint.domain_tags), 1)
+                
+                # Collect opposition evidence
+                opposition_indicators = []
+                if new_fingerprint.negation_indicators and not existing_fingerprint.negation_indicators:
+                    opposition_indicators.extend(new_fingerprint.negation_indicators)
+                elif existing_fingerprint.negation_indicators and not new_fingerprint.negation_indicators:
+                    opposition_indicators.extend(existing_fingerprint.negation_indicators)
                 
-            # Check for semantic opposition
-            if self.embedding_provider and new_fingerprint.embedding and existing_fingerprint.embedding:
-                similarity = self.embedding_provider.calculate_similarity(
-                    new_fingerprint.embedding, existing_fingerprint.embedding
+                # Determine conflict type
+                conflict_type = self._determine_conflict_type(new_fingerprint, existing_fingerprint)
+                
+                # Calculate confidence score
+                confidence = self._calculate_confidence_score(
+                    similarity, opposition_score, context_overlap, opposition_indicators
                 )
                 
-                # High semantic similarity with negation indicators suggests opposition
-                if similarity > self.semantic_similarity_threshold:
-                    opposition_score = self._calculate_opposition_score(new_fingerprint, existing_fingerprint)
-                    
-                    if opposition_score > self.opposition_threshold:
-                        # Calculate context overlap
-                        context_overlap = len(new_fingerprint.domain_tags & existing_fingerprint.domain_tags) / \
-                                        max(len(new_fingerprint.domain_tags | existing_fingerprint.domain_tags), 1)
-                        
-                        # Collect opposition evidence
-                        opposition_indicators = []
-                        if new_fingerprint.negation_indicators and not existing_fingerprint.negation_indicators:
-                            opposition_indicators.extend(new_fingerprint.negation_indicators)
-                        elif existing_fingerprint.negation_indicators and not new_fingerprint.negation_indicators:
-                            opposition_indicators.extend(existing_fingerprint.negation_indicators)
-                        
-                        # Determine conflict type
-                        conflict_type = self._determine_conflict_type(new_fingerprint, existing_fingerprint)
-                        
-                        # Calculate confidence score
-                        confidence = self._calculate_confidence_score(
-                            similarity, opposition_score, context_overlap, opposition_indicators
-                        )
-                        
-                        if confidence >= self.min_confidence_score:
-                            conflict = ConflictEvidence(
-                                statement_a_id=new_fingerprint.statement_id,
-                                statement_b_id=existing_fingerprint.statement_id,
-                                conflict_type=conflict_type,
-                                confidence_score=confidence,
-                                semantic_distance=1.0 - similarity,
-                                opposition_indicators=opposition_indicators,
-                                context_overlap=context_overlap,
-                                detection_timestamp=time.time()
-                            )
-                            conflicts.append(conflict)
+                if confidence >= self.min_confidence_score:
+                    conflict = ConflictEvidence(
+                        statement_a_id=new_fingerprint.statement_id,
+                        statement_b_id=existing_fingerprint.statement_id,
+                        conflict_type=conflict_type,
+                        confidence_score=confidence,
+                        semantic_distance=1.0 - similarity,
+                        opposition_indicators=opposition_indicators,
+                        context_overlap=context_overlap,
+                        detection_timestamp=time.time()
+                    )
+                    conflicts.append(conflict)
         
         return conflicts
     
+    def _calculate_similarities(self, new_fingerprint: StatementFingerprint) -> Dict[str, float]:
+        """Cosine similarity of a statement to every other statement above semantic_similarity_threshold."""
+        if not self.embedding_provider or not new_fingerprint.embedding:
+            return {}
+        
+        threshold = self.semantic_similarity_threshold
+        similarities = {}
+        if self.statement_index.dimension in (None, len(new_fingerprint.embedding)):
+            neighbours = self.statement_index.top_k(
+                new_fingerprint.embedding, len(self.statement_index), threshold
+            )
+            similarities.update(
+                (statement_id, score) for statement_id, score in neighbours
+                if score > threshold and statement_id != new_fingerprint.statement_id
+            )
+            others = list(self._unindexed_fingerprints.values())
+        else:
+            others = [fp for fp in self.statement_fingerprints.values() if fp.embedding]
+        
+        # Mismatched dimensions keep the provider's pairwise semantics
+        for fingerprint in others:
+            if fingerprint.statement_id == new_fingerprint.statement_id:
+                continue
+            score = self.embedding_provider.calculate_similarity(
+                new_fingerprint.embedding, fingerprint.embedding
+            )
+            if score > threshold:
+                similarities[fingerprint.statement_id] = score
+        
+        return similarities
+    
+    def _index_fingerprint(self, fingerprint: StatementFingerprint):
+        """Replace a statement's entry in the similarity index."""
+        self._unindex_statement(fingerprint.statement_id)
+        if not fingerprint.embedding:
+            return
+        if self.statement_index.dimension in (None, len(fingerprint.embedding)):
+            self.statement_index.add(fingerprint.statement_id, fingerprint.embedding)
+        else:
+            self._unindexed_fingerprints[fingerprint.statement_id] = fingerprint
+    
+    def _unindex_statement(self, statement_id: str):
+        self.statement_index.remove(statement_id)
+        self._unindexed_fingerprints.pop(statement_id, None)
+    
     def _calculate_opposition_score(self, fp1: StatementFingerprint, fp2: StatementFingerprint) -> float:
         """Calculate how much two statements oppose each other."""
         score = 0.0
@@ -488,13 +560,14 @@ def _cleanup_old_statements(self):
         current_time = time.time()
         max_age_seconds = self.max_statement_age_hours * 3600
         
-        old_statement_ids = [
-            stmt_id for stmt_id, fingerprint in self.statement_fingerprints.items()
-            if current_time - fingerprint.creation_timestamp > max_age_seconds
-        ]
-        
-        for stmt_id in old_statement_ids:
-            del self.statement_fingerprints[stmt_id]
+        # Oldest first; entries for statements re-processed since are stale
+        while self._expiry_queue and current_time - self._expiry_queue[0][0] > max_age_seconds:
+            timestamp, stmt_id = heapq.heappop(self._expiry_queue)
+            fingerprint = self.statement_fingerprints.get(stmt_id)
+            if fingerprint is not None and fingerprint.creation_timestamp == timestamp:
+                del self.statement_fingerprints[stmt_id]
+                del self._statement_order[stmt_id]
+                self._unindex_statement(stmt_id)
         
         # Also cleanup old conflicts
         self.detected_conflicts = [
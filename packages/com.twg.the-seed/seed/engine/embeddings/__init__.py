@@ -5,11 +5,23 @@
 from .base_provider import EmbeddingProvider
 from .openai_provider import OpenAIEmbeddingProvider
 from .local_provider import LocalEmbeddingProvider
+from .cached_provider import CachedEmbeddingProvider
 from .factory import EmbeddingProviderFactory
+from .embedding_matrix import EmbeddingMatrix
+from .ann_index import AnnIndex, IVFFlatIndex, FaissIndex, create_ann_index, FAISS_AVAILABLE
+from .sharded_index import ShardedIndex
 
 __all__ = [
     "EmbeddingProvider",
     "OpenAIEmbeddingProvider", 
     "LocalEmbeddingProvider",
+    "CachedEmbeddingProvider",
     "EmbeddingProviderFactory",
+    "EmbeddingMatrix",
+    "AnnIndex",
+    "IVFFlatIndex",
+    "FaissIndex",
+    "ShardedIndex",
+    "create_ann_index",
+    "FAISS_AVAILABLE",
 ]
\ No newline at end of file
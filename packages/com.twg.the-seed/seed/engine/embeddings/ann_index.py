@@ -0,0 +1,292 @@
+"""
+Approximate Nearest-Neighbour Indexes - Pluggable Vector Search Backends
+
+All backends share the EmbeddingMatrix search interface (add / update /
+remove / top_k) so SemanticAnchorGraph and RetrievalAPI can swap them freely:
+
+- "exact": EmbeddingMatrix brute-force scan (vectorized, exact)
+- "ivf":   pure NumPy IVF-flat (spherical k-means coarse quantizer)
+- "faiss": FAISS inner-product index, used when faiss is installed
+- "sharded": exact scan split across worker processes (see sharded_index)
+- "auto":  FAISS when available, otherwise exact
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, Optional, Tuple, Sequence
+import numpy as np
+
+from .embedding_matrix import EmbeddingMatrix, normalize_vector, select_top_k
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+
+class AnnIndex(ABC):
+    """Abstract base class for incremental vector indexes keyed by string id."""
+
+    dimension: Optional[int] = None
+    # True when the index serializes its own calls, so callers need no lock around top_k
+    thread_safe: bool = False
+
+    @abstractmethod
+    def add(self, item_id: str, embedding: Sequence[float]):
+        """Insert an embedding, or overwrite it if the id is already present."""
+        pass
+
+    @abstractmethod
+    def remove(self, item_id: str) -> bool:
+        """Remove an id; returns False if it was not present."""
+        pass
+
+    @abstractmethod
+    def top_k(self, query_embedding: Sequence[float], k: int,
+              threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Return up to k (id, cosine similarity) pairs, best first."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __contains__(self, item_id: str) -> bool:
+        pass
+
+    def update(self, item_id: str, embedding: Sequence[float]):
+        """Replace the stored embedding for an existing id."""
+        if item_id not in self:
+            raise KeyError(item_id)
+        self.add(item_id, embedding)
+
+    def get_index_info(self) -> Dict[str, Any]:
+        """Backend metadata for metrics endpoints."""
+        return {"backend": self.__class__.__name__, "size": len(self), "dimension": self.dimension}
+
+
+class IVFFlatIndex(AnnIndex):
+    """
+    Inverted-file index over normalized vectors.
+
+    Vectors are exact-scanned until train_threshold items exist; then a
+    spherical k-means quantizer partitions them into n_lists inverted lists
+    and queries scan only the n_probe closest lists. The quantizer is
+    retrained whenever the index grows by retrain_growth since last training.
+    """
+
+    def __init__(self, dimension: Optional[int] = None, n_lists: Optional[int] = None,
+                 n_probe: int = 8, train_threshold: int = 1024,
+                 retrain_growth: float = 4.0, kmeans_iterations: int = 10, seed: int = 0):
+        self.dimension = dimension
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.train_threshold = train_threshold
+        self.retrain_growth = retrain_growth
+        self.kmeans_iterations = kmeans_iterations
+        self._rng = np.random.default_rng(seed)
+
+        self._vectors = EmbeddingMatrix(dimension)
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[EmbeddingMatrix] = []
+        self._list_of: Dict[str, int] = {}
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._vectors
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, item_id: str, embedding: Sequence[float]):
+        self._vectors.add(item_id, embedding)
+        self.dimension = self._vectors.dimension
+
+        if self.is_trained:
+            self._assign(item_id, self._vectors.get_vector(item_id))
+            if len(self) > self._trained_size * self.retrain_growth:
+                self.train()
+        elif len(self) >= self.train_threshold:
+            self.train()
+
+    def remove(self, item_id: str) -> bool:
+        if not self._vectors.remove(item_id):
+            return False
+        list_id = self._list_of.pop(item_id, None)
+        if list_id is not None:
+            self._lists[list_id].remove(item_id)
+        return True
+
+    def top_k(self, query_embedding: Sequence[float], k: int,
+              threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        if not self.is_trained:
+            return self._vectors.top_k(query_embedding, k, threshold)
+
+        query = normalize_vector(query_embedding)
+        probes = select_top_k(self._centroids @ query, self.n_probe)
+
+        merged: List[Tuple[str, float]] = []
+        for list_id in probes:
+            merged.extend(self._lists[list_id].top_k(query, k, threshold))
+        merged.sort(key=lambda item: item[1], reverse=True)
+        return merged[:k]
+
+    def train(self):
+        """(Re)build the coarse quantizer and redistribute every vector."""
+        vectors = self._vectors.vectors
+        ids = self._vectors.ids
+        count = len(ids)
+        if count == 0:
+            return
+
+        n_lists = self.n_lists or max(1, int(np.sqrt(count)))
+        n_lists = min(n_lists, count)
+
+        sample_size = min(count, n_lists * 64)
+        sample = vectors[self._rng.choice(count, size=sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, size=n_lists, replace=False)].copy()
+
+        for _ in range(self.kmeans_iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            for list_id in range(n_lists):
+                members = sample[assignments == list_id]
+                if len(members):
+                    centroids[list_id] = normalize_vector(members.sum(axis=0))
+
+        self._centroids = centroids
+        self._lists = [EmbeddingMatrix(self.dimension, initial_capacity=16) for _ in range(n_lists)]
+        self._list_of = {}
+
+        block_size = 8192
+        for start in range(0, count, block_size):
+            block = vectors[start:start + block_size]
+            assignments = np.argmax(block @ centroids.T, axis=1)
+            for offset, list_id in enumerate(assignments):
+                item_id = ids[start + offset]
+                self._lists[list_id].add(item_id, block[offset])
+                self._list_of[item_id] = int(list_id)
+
+        self._trained_size = count
+
+    def get_index_info(self) -> Dict[str, Any]:
+        info = super().get_index_info()
+        info.update({
+            "trained": self.is_trained,
+            "n_lists": len(self._lists),
+            "n_probe": self.n_probe,
+        })
+        return info
+
+    def _assign(self, item_id: str, vector: np.ndarray):
+        list_id = int(np.argmax(self._centroids @ vector))
+        previous = self._list_of.get(item_id)
+        if previous is not None and previous != list_id:
+            self._lists[previous].remove(item_id)
+        self._lists[list_id].add(item_id, vector)
+        self._list_of[item_id] = list_id
+
+
+class FaissIndex(AnnIndex):
+    """FAISS inner-product index over normalized vectors with id remapping."""
+
+    def __init__(self, dimension: Optional[int] = None):
+        if not FAISS_AVAILABLE:
+            raise ImportError("faiss not installed. Run: pip install faiss-cpu")
+        self.dimension = dimension
+        self._index = None
+        self._int_ids: Dict[str, int] = {}
+        self._str_ids: Dict[int, str] = {}
+        self._next_id = 0
+
+        if dimension is not None:
+            self._create_index(dimension)
+
+    def __len__(self) -> int:
+        return len(self._int_ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._int_ids
+
+    def add(self, item_id: str, embedding: Sequence[float]):
+        vector = normalize_vector(embedding)
+        if self._index is None:
+            self._create_index(int(vector.shape[0]))
+        elif vector.shape[0] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {vector.shape[0]} does not match index dimension {self.dimension}"
+            )
+
+        if item_id in self._int_ids:
+            self.remove(item_id)
+
+        int_id = self._next_id
+        self._next_id += 1
+        self._int_ids[item_id] = int_id
+        self._str_ids[int_id] = item_id
+        self._index.add_with_ids(vector.reshape(1, -1), np.array([int_id], dtype=np.int64))
+
+    def remove(self, item_id: str) -> bool:
+        int_id = self._int_ids.pop(item_id, None)
+        if int_id is None:
+            return False
+        del self._str_ids[int_id]
+        self._index.remove_ids(np.array([int_id], dtype=np.int64))
+        return True
+
+    def top_k(self, query_embedding: Sequence[float], k: int,
+              threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        if not self._int_ids or k <= 0:
+            return []
+
+        query = normalize_vector(query_embedding).reshape(1, -1)
+        scores, int_ids = self._index.search(query, min(k, len(self._int_ids)))
+
+        matches = []
+        for score, int_id in zip(scores[0], int_ids[0]):
+            if int_id < 0:
+                continue
+            if threshold is not None and score < threshold:
+                break
+            matches.append((self._str_ids[int(int_id)], float(score)))
+        return matches
+
+    def _create_index(self, dimension: int):
+        self.dimension = dimension
+        self._index = faiss.IndexIDMap2(faiss.IndexFlatIP(dimension))
+
+
+ANN_BACKENDS = ["auto", "exact", "ivf", "faiss", "sharded"]
+
+
+def create_ann_index(backend: str = "auto", dimension: Optional[int] = None,
+                     config: Optional[Dict[str, Any]] = None):
+    """
+    Create a vector index for the requested backend.
+
+    Args:
+        backend: One of ANN_BACKENDS
+        dimension: Vector dimension (inferred from the first insert if None)
+        config: Backend options (IVF: n_lists, n_probe, train_threshold, retrain_growth;
+                sharded: n_shards, inline_threshold, rebalance_ratio, start_method)
+    """
+    config = config or {}
+
+    if backend == "auto":
+        backend = "faiss" if FAISS_AVAILABLE else "exact"
+
+    if backend == "exact":
+        return EmbeddingMatrix(dimension)
+    if backend == "ivf":
+        return IVFFlatIndex(dimension, **config)
+    if backend == "faiss":
+        return FaissIndex(dimension)
+    if backend == "sharded":
+        from .sharded_index import ShardedIndex
+        return ShardedIndex(dimension, **config)
+
+    raise ValueError(f"Unknown ANN backend '{backend}'. Available: {ANN_BACKENDS}")
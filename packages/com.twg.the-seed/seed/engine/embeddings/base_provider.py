@@ -10,6 +10,13 @@
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
     
+    # Per-request limits for embed_batch (None = unlimited); remote providers override
+    max_batch_size: Optional[int] = None
+    max_batch_tokens: Optional[int] = None
+    
+    # Config keys that do not change the vectors, left out of get_cache_identity()
+    cache_identity_ignored_keys = frozenset({"api_key"})
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.provider_id = self.__class__.__name__
@@ -25,6 +32,32 @@ def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """Generate embedding vectors for multiple texts."""
         pass
         
+    def embed_in_batches(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed any number of texts via embed_batch, split into provider-sized requests.
+        
+        Requests are capped at max_batch_size texts and roughly max_batch_tokens
+        tokens (estimated at 4 characters per token).
+        """
+        embeddings: List[List[float]] = []
+        batch: List[str] = []
+        batch_tokens = 0
+        
+        for text in texts:
+            text_tokens = len(text) // 4 + 1
+            if batch and (
+                (self.max_batch_size and len(batch) >= self.max_batch_size) or
+                (self.max_batch_tokens and batch_tokens + text_tokens > self.max_batch_tokens)
+            ):
+                embeddings.extend(self.embed_batch(batch))
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += text_tokens
+            
+        if batch:
+            embeddings.extend(self.embed_batch(batch))
+        return embeddings
+        
     @abstractmethod
     def get_dimension(self) -> int:
         """Get the dimension of embedding vectors."""
@@ -54,4 +87,24 @@ def get_provider_info(self) -> Dict[str, Any]:
             "dimension": self.get_dimension(),
             "created_at": self.created_at,
             "config_keys": list(self.config.keys()),
-        }
\ No newline at end of file
+        }
+        
+    def get_cache_identity(self) -> Dict[str, Any]:
+        """
+        Everything that decides the vector produced for a text, for embedding caches.
+        
+        Providers whose vectors depend on mutable state extend this with that state.
+        """
+        return {
+            "provider_id": self.provider_id,
+            "model": getattr(self, "model", None),
+            "dimension": self.get_dimension(),
+            "config": {
+                key: value for key, value in self.config.items()
+                if key not in self.cache_identity_ignored_keys
+            },
+        }
+        
+    def is_cacheable(self) -> bool:
+        """Whether a cached vector can ever be served again; False makes caches pass through."""
+        return True
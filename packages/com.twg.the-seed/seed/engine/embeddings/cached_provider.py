@@ -0,0 +1,257 @@
+"""
+Cached Embedding Provider - Content-Addressed Embedding Reuse
+
+Wraps any EmbeddingProvider so identical texts are embedded once. Entries are
+keyed by sha256(provider cache identity, text) and held in a bounded
+in-memory LRU, optionally backed by a memory-mapped on-disk tier that survives
+restarts. The identity (EmbeddingProvider.get_cache_identity) covers the full
+provider config plus any state the vectors depend on, such as frozen IDF
+weights, and is re-read on every batch.
+
+Providers whose vectors never repeat (EmbeddingProvider.is_cacheable() is
+False, e.g. LocalEmbeddingProvider in vocabulary mode) are passed straight
+through without touching either tier.
+"""
+
+from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import json
+import os
+import re
+import threading
+import numpy as np
+
+from .base_provider import EmbeddingProvider
+
+# One fixed-width .idx record per row: "<row:010d> <sha256 hex key>\n"
+_INDEX_RECORD = re.compile(rb"(\d{10}) ([0-9a-f]{64})\n")
+_INDEX_RECORD_BYTES = 76
+
+
+class _DiskEmbeddingStore:
+    """
+    Append-only memory-mapped float32 rows with a parallel key index file.
+
+    Row i of <name>.f32 holds the vector for record i of <name>.idx, which
+    carries its row number. Vectors are written before their key, and load
+    stops at the first torn or malformed record and truncates the index
+    there, so a crash mid-append never shifts later keys onto other rows.
+    One writer process per directory; threads of that process may share it.
+    """
+
+    def __init__(self, directory: str, name: str, dimension: int, initial_capacity: int = 1024):
+        self.dimension = dimension
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.vectors_path = self.directory / f"{name}.f32"
+        self.index_path = self.directory / f"{name}.idx"
+        self.row_bytes = dimension * 4
+
+        self._rows: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._load_index()
+
+        capacity = max(initial_capacity, len(self._rows))
+        self._ensure_file_rows(capacity)
+        self._open_memmap()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                return None
+            return np.array(self._memmap[row])
+
+    def put(self, key: str, vector: List[float]):
+        with self._lock:
+            if key in self._rows:
+                return
+            row = len(self._rows)
+            if row >= self._memmap.shape[0]:
+                self._memmap.flush()
+                self._ensure_file_rows(self._memmap.shape[0] * 2)
+                self._open_memmap()
+
+            self._memmap[row] = np.asarray(vector, dtype=np.float32)
+            self._memmap.flush()
+            with open(self.index_path, "ab") as index_file:
+                index_file.write(f"{row:010d} {key}\n".encode("ascii"))
+            self._rows[key] = row
+
+    def get_disk_bytes(self) -> int:
+        return self.vectors_path.stat().st_size + self.index_path.stat().st_size
+
+    def _load_index(self):
+        if not self.index_path.exists():
+            self.index_path.touch()
+            return
+
+        data = self.index_path.read_bytes()
+        stored_rows = self.vectors_path.stat().st_size // self.row_bytes if self.vectors_path.exists() else 0
+        valid_bytes = 0
+        for row in range(min(len(data) // _INDEX_RECORD_BYTES, stored_rows)):
+            match = _INDEX_RECORD.fullmatch(data, valid_bytes, valid_bytes + _INDEX_RECORD_BYTES)
+            if match is None or int(match.group(1)) != row:
+                break
+            self._rows[match.group(2).decode("ascii")] = row
+            valid_bytes += _INDEX_RECORD_BYTES
+
+        if valid_bytes < len(data):
+            # Cut a torn tail so the next put starts a fresh record
+            with open(self.index_path, "r+b") as index_file:
+                index_file.truncate(valid_bytes)
+
+    def _ensure_file_rows(self, rows: int):
+        with open(self.vectors_path, "ab") as vectors_file:
+            if vectors_file.tell() < rows * self.row_bytes:
+                vectors_file.truncate(rows * self.row_bytes)
+
+    def _open_memmap(self):
+        rows = os.path.getsize(self.vectors_path) // self.row_bytes
+        self._memmap = np.memmap(self.vectors_path, dtype=np.float32, mode="r+",
+                                 shape=(rows, self.dimension))
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """
+    Caching decorator around an EmbeddingProvider. Safe to share between threads.
+
+    Config:
+        max_entries: In-memory LRU capacity (default 10000)
+        cache_dir: Directory for the persistent memory-mapped tier (disabled if None)
+    """
+
+    def __init__(self, provider: EmbeddingProvider, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self.provider = provider
+        self.provider_id = f"Cached{provider.provider_id}"
+        self.max_entries = self.config.get("max_entries", 10000)
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: Optional[_DiskEmbeddingStore] = None
+        if self.config.get("cache_dir") and provider.is_cacheable():
+            namespace = hashlib.sha256(self._identity().encode()).hexdigest()[:16]
+            self._disk = _DiskEmbeddingStore(self.config["cache_dir"], namespace, provider.get_dimension())
+
+        self.stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "bypassed": 0,  # texts embedded uncached for a non-cacheable provider
+        }
+
+    def cache_key(self, text: str) -> str:
+        """Content address of a text for the provider's current cache identity."""
+        return self._key(self._identity(), text)
+
+    def embed_text(self, text: str) -> List[float]:
+        """Return the cached embedding for text, embedding it on a miss."""
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Serve cached texts and embed the distinct misses in provider-sized batches."""
+        if not self.provider.is_cacheable():
+            with self._lock:
+                self.stats["bypassed"] += len(texts)
+            return self.provider.embed_in_batches(texts)
+
+        identity = self._identity()
+        keys = [self._key(identity, text) for text in texts]
+        results: List[Optional[List[float]]] = [self._lookup(key) for key in keys]
+
+        missing: Dict[str, str] = {}
+        for key, text, result in zip(keys, texts, results):
+            if result is None:
+                missing.setdefault(key, text)
+
+        if missing:
+            with self._lock:
+                self.stats["misses"] += len(missing)
+            embedded = self.provider.embed_in_batches(list(missing.values()))
+            fresh = dict(zip(missing.keys(), embedded))
+            for key, embedding in fresh.items():
+                self._store(key, embedding)
+            results = [
+                result if result is not None else list(fresh[key])
+                for key, result in zip(keys, results)
+            ]
+
+        return results
+
+    def get_dimension(self) -> int:
+        return self.provider.get_dimension()
+
+    def is_cacheable(self) -> bool:
+        return self.provider.is_cacheable()
+
+    def calculate_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
+        return self.provider.calculate_similarity(embedding1, embedding2)
+
+    def clear_cache(self):
+        """Drop the in-memory tier (the disk tier is kept)."""
+        with self._lock:
+            self._memory.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and tier sizes."""
+        lookups = self.stats["hits"] + self.stats["disk_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": (self.stats["hits"] + self.stats["disk_hits"]) / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "disk_entries": len(self._disk) if self._disk is not None else 0,
+            "disk_bytes": self._disk.get_disk_bytes() if self._disk is not None else 0,
+        }
+
+    def get_provider_info(self) -> Dict[str, Any]:
+        info = self.provider.get_provider_info()
+        info["cache"] = self.get_cache_stats()
+        return info
+
+    def _identity(self) -> str:
+        return json.dumps(self.provider.get_cache_identity(), sort_keys=True, default=str)
+
+    @staticmethod
+    def _key(identity: str, text: str) -> str:
+        return hashlib.sha256(f"{identity}\x00{text}".encode()).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+                self.stats["hits"] += 1
+                return list(embedding)
+
+        if self._disk is not None:
+            vector = self._disk.get(key)
+            if vector is not None:
+                embedding = vector.tolist()
+                with self._lock:
+                    self.stats["disk_hits"] += 1
+                    self._remember(key, embedding)
+                return list(embedding)
+
+        return None
+
+    def _store(self, key: str, embedding: List[float]):
+        with self._lock:
+            self._remember(key, list(embedding))
+        if self._disk is not None:
+            self._disk.put(key, embedding)
+
+    def _remember(self, key: str, embedding: List[float]):
+        """Insert into the LRU; caller holds _lock."""
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
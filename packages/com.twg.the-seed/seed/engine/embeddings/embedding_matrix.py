@@ -0,0 +1,178 @@
+"""
+Embedding Matrix - Contiguous Vector Store for Vectorized Similarity Search
+
+Keeps embeddings in a pre-normalized float32 matrix so that scoring a query
+against every stored vector is a single matrix-vector product.
+"""
+
+from typing import List, Dict, Optional, Tuple, Sequence, Iterable
+import numpy as np
+
+
+def normalize_vector(embedding: Sequence[float]) -> np.ndarray:
+    """Return an L2-normalized float32 copy of an embedding (zero vectors stay zero)."""
+    vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector = vector / norm
+    return vector
+
+
+def batch_cosine_similarity(query_embedding: Sequence[float],
+                            embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+    """Cosine similarity between one query and a list of embeddings in one pass."""
+    if len(embeddings) == 0:
+        return np.zeros(0, dtype=np.float32)
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1)
+    norms[norms == 0] = 1.0
+    return (matrix @ normalize_vector(query_embedding)) / norms
+
+
+def select_top_k(scores: np.ndarray, k: int, threshold: Optional[float] = None) -> np.ndarray:
+    """Return indices of the k best scores (descending), optionally above a threshold."""
+    if threshold is not None:
+        candidates = np.flatnonzero(scores >= threshold)
+    else:
+        candidates = np.arange(scores.shape[0])
+
+    if k <= 0 or candidates.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    if candidates.size > k:
+        partitioned = np.argpartition(-scores[candidates], k - 1)[:k]
+        candidates = candidates[partitioned]
+
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class EmbeddingMatrix:
+    """
+    Growable row-major float32 matrix of L2-normalized embeddings keyed by id.
+
+    Rows are kept dense: removing an item moves the last row into the freed
+    slot, so insert, update and delete are all O(dimension).
+    """
+
+    def __init__(self, dimension: Optional[int] = None, initial_capacity: int = 64):
+        self.dimension = dimension
+        self._capacity = max(1, initial_capacity)
+        self._matrix: Optional[np.ndarray] = None
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+        if dimension is not None:
+            self._matrix = np.zeros((self._capacity, dimension), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._rows
+
+    @property
+    def ids(self) -> List[str]:
+        """Ids in row order."""
+        return list(self._ids)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """View of the populated, normalized rows."""
+        if self._matrix is None:
+            return np.zeros((0, self.dimension or 0), dtype=np.float32)
+        return self._matrix[:len(self._ids)]
+
+    def add(self, item_id: str, embedding: Sequence[float]):
+        """Insert an embedding, or overwrite it if the id is already present."""
+        vector = self._prepare(embedding)
+
+        row = self._rows.get(item_id)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(item_id)
+            self._rows[item_id] = row
+
+        self._matrix[row] = vector
+
+    def update(self, item_id: str, embedding: Sequence[float]):
+        """Replace the stored embedding for an existing id."""
+        if item_id not in self._rows:
+            raise KeyError(item_id)
+        self.add(item_id, embedding)
+
+    def remove(self, item_id: str) -> bool:
+        """Remove an id; returns False if it was not present."""
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+
+        last_row = len(self._ids) - 1
+        if row != last_row:
+            moved_id = self._ids[last_row]
+            self._matrix[row] = self._matrix[last_row]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+
+        self._ids.pop()
+        return True
+
+    def clear(self):
+        """Drop every stored embedding (capacity is kept)."""
+        self._ids.clear()
+        self._rows.clear()
+
+    def extend(self, items: Iterable[Tuple[str, Sequence[float]]]):
+        """Insert or overwrite many (id, embedding) pairs."""
+        for item_id, embedding in items:
+            self.add(item_id, embedding)
+
+    def get_vector(self, item_id: str) -> np.ndarray:
+        """Return the normalized row stored for an id."""
+        return self._matrix[self._rows[item_id]]
+
+    def similarities(self, query_embedding: Sequence[float]) -> np.ndarray:
+        """Cosine similarity of the query against every row, in row order."""
+        if not self._ids:
+            return np.zeros(0, dtype=np.float32)
+        return self.vectors @ normalize_vector(query_embedding)
+
+    def top_k(self, query_embedding: Sequence[float], k: int,
+              threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        """
+        Return up to k (id, similarity) pairs sorted by similarity descending.
+
+        Args:
+            query_embedding: Query vector (normalized internally)
+            k: Maximum number of matches
+            threshold: Optional minimum similarity
+        """
+        scores = self.similarities(query_embedding)
+        if scores.size == 0:
+            return []
+
+        return [(self._ids[i], float(scores[i])) for i in select_top_k(scores, k, threshold)]
+
+    def get_memory_bytes(self) -> int:
+        """Bytes held by the backing matrix (including spare capacity)."""
+        return int(self._matrix.nbytes) if self._matrix is not None else 0
+
+    def _prepare(self, embedding: Sequence[float]) -> np.ndarray:
+        vector = normalize_vector(embedding)
+        if self.dimension is None:
+            self.dimension = int(vector.shape[0])
+            self._matrix = np.zeros((self._capacity, self.dimension), dtype=np.float32)
+        elif vector.shape[0] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension {vector.shape[0]} does not match matrix dimension {self.dimension}"
+            )
+        return vector
+
+    def _ensure_capacity(self, required_rows: int):
+        if required_rows <= self._matrix.shape[0]:
+            return
+        new_capacity = max(required_rows, self._matrix.shape[0] * 2)
+        grown = np.zeros((new_capacity, self.dimension), dtype=np.float32)
+        grown[:len(self._ids)] = self._matrix[:len(self._ids)]
+        self._matrix = grown
+        self._capacity = new_capacity
@@ -6,6 +6,7 @@
 from .base_provider import EmbeddingProvider
 from .local_provider import LocalEmbeddingProvider
 from .openai_provider import OpenAIEmbeddingProvider
+from .cached_provider import CachedEmbeddingProvider
 
 
 class EmbeddingProviderFactory:
@@ -38,8 +39,11 @@ def list_available_providers(cls) -> list[str]:
         
     @classmethod
     def create_from_config(cls, full_config: Dict[str, Any]) -> EmbeddingProvider:
-        """Create provider from configuration dict."""
+        """Create provider from configuration dict (wrapped in a cache if 'cache' is set and it is cacheable)."""
         provider_type = full_config.get("provider", "local")
         provider_config = full_config.get("config", {})
         
-        return cls.create_provider(provider_type, provider_config)
\ No newline at end of file
+        provider = cls.create_provider(provider_type, provider_config)
+        if full_config.get("cache") is not None and provider.is_cacheable():
+            provider = CachedEmbeddingProvider(provider, full_config["cache"])
+        return provider
\ No newline at end of file
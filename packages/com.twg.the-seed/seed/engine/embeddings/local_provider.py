@@ -1,24 +1,73 @@
 """
 Local Embedding Provider - Fallback Semantic Grounding
 Simple TF-IDF based embeddings for offline operation
+
+Modes:
+- "vocabulary" (default): one dimension per token of the first N sorted
+  vocabulary entries; embeddings shift as the vocabulary grows
+- "hashing": signed feature hashing into a fixed dimension with optional
+  frozen IDF weights; embeddings are stable across calls and processes
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+import bisect
+import hashlib
+import json
 import re
 import math
-from collections import Counter
+from collections import Counter, OrderedDict
 from .base_provider import EmbeddingProvider
 
 
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'})
+
+
+def _tokenize_text(text: str) -> Tuple[str, ...]:
+    """Lowercase word tokens minus stop words and short tokens."""
+    tokens = re.findall(r'\b\w+\b', text.lower())
+    return tuple(token for token in tokens if token not in STOP_WORDS and len(token) > 2)
+
+
+@lru_cache(maxsize=262144)
+def _hash_token(token: str, dimension: int) -> Tuple[int, float]:
+    """Stable (bucket, sign) for a token; independent of PYTHONHASHSEED."""
+    value = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+    return value % dimension, (1.0 if (value >> 63) == 0 else -1.0)
+
+
 class LocalEmbeddingProvider(EmbeddingProvider):
     """Local TF-IDF based embedding provider for fallback scenarios."""
     
+    # Tokenizer memo settings only affect speed
+    cache_identity_ignored_keys = EmbeddingProvider.cache_identity_ignored_keys | {
+        "tokenize_cache_size", "tokenize_cache_max_chars"
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self.vocabulary = set()
         self.document_frequency = Counter()
         self.total_documents = 0
         self.vector_dimension = config.get("dimension", 128) if config else 128
+        self.mode = config.get("mode", "vocabulary") if config else "vocabulary"
+        if self.mode not in ("vocabulary", "hashing"):
+            raise ValueError(f"Unknown LocalEmbeddingProvider mode '{self.mode}'. Available: ['vocabulary', 'hashing']")
+        
+        # Frozen IDF weights for hashing mode (None = plain term frequency)
+        self.idf_snapshot: Optional[Dict[str, float]] = None
+        self.idf_default = 1.0
+        self._idf_digest: Optional[str] = None
+        if config and config.get("idf_snapshot_path"):
+            self.load_idf_snapshot(config["idf_snapshot_path"])
+        
+        # First vector_dimension tokens of the sorted vocabulary, maintained incrementally
+        self._vocab_list: List[str] = []
+        
+        # Per-instance LRU of tokenized short texts (queries, statements); long documents are not kept
+        self.tokenize_cache_size = config.get("tokenize_cache_size", 4096) if config else 4096
+        self.tokenize_cache_max_chars = config.get("tokenize_cache_max_chars", 512) if config else 512
+        self._token_cache: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
         
     def embed_text(self, text: str) -> List[float]:
         """Generate TF-IDF based embedding for text."""
@@ -64,21 +113,81 @@ def get_dimension(self) -> int:
         """Get embedding dimension."""
         return self.vector_dimension
         
-    def _tokenize(self, text: str) -> List[str]:
-        """Simple tokenization."""
-        # Convert to lowercase and extract words
-        text = text.lower()
-        tokens = re.findall(r'\b\w+\b', text)
+    def get_provider_info(self) -> Dict[str, Any]:
+        """Get provider metadata including embedding mode."""
+        info = super().get_provider_info()
+        info["mode"] = self.mode
+        info["idf_frozen"] = self.idf_snapshot is not None
+        return info
+        
+    def get_cache_identity(self) -> Dict[str, Any]:
+        """Cache identity including the mode and the IDF state the vectors depend on."""
+        identity = super().get_cache_identity()
+        identity["mode"] = self.mode
+        if self.mode == "hashing":
+            identity["idf"] = self._idf_digest
+        else:
+            # Vocabulary and IDF move with every embedded text, so cached vectors never match again
+            identity["documents_seen"] = self.total_documents
+        return identity
+        
+    def is_cacheable(self) -> bool:
+        """Only hashing mode repeats its vectors; vocabulary mode drifts with every text."""
+        return self.mode == "hashing"
         
-        # Filter out common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'}
-        tokens = [token for token in tokens if token not in stop_words and len(token) > 2]
+    def freeze_idf(self) -> Dict[str, float]:
+        """Snapshot IDF weights from the documents seen so far; hashing-mode embeddings then stop drifting."""
+        self.idf_snapshot = {
+            token: math.log((self.total_documents + 1) / (df + 1)) + 1
+            for token, df in self.document_frequency.items()
+        }
+        self.idf_default = math.log(self.total_documents + 1) + 1  # Unseen token (df = 0)
+        self._update_idf_digest()
+        return self.idf_snapshot
         
-        return tokens
+    def save_idf_snapshot(self, path: str):
+        """Write the frozen IDF weights to JSON for reuse in other processes."""
+        if self.idf_snapshot is None:
+            self.freeze_idf()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"idf_default": self.idf_default, "idf": self.idf_snapshot}, f)
+            
+    def load_idf_snapshot(self, path: str):
+        """Load frozen IDF weights written by save_idf_snapshot."""
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        self.idf_snapshot = snapshot["idf"]
+        self.idf_default = snapshot["idf_default"]
+        self._update_idf_digest()
+        
+    def _update_idf_digest(self):
+        """Fingerprint of the frozen IDF weights for get_cache_identity()."""
+        snapshot = json.dumps({"idf_default": self.idf_default, "idf": self.idf_snapshot}, sort_keys=True)
+        self._idf_digest = hashlib.sha256(snapshot.encode("utf-8")).hexdigest()
+        
+    def _tokenize(self, text: str) -> List[str]:
+        """Simple tokenization, memoized for texts up to tokenize_cache_max_chars."""
+        if not self.tokenize_cache_size or len(text) > self.tokenize_cache_max_chars:
+            return list(_tokenize_text(text))
+            
+        tokens = self._token_cache.get(text)
+        if tokens is None:
+            tokens = _tokenize_text(text)
+            self._token_cache[text] = tokens
+            if len(self._token_cache) > self.tokenize_cache_size:
+                self._token_cache.popitem(last=False)
+        else:
+            self._token_cache.move_to_end(text)
+        return list(tokens)
         
     def _update_vocabulary(self, tokens: List[str], update_df: bool = True):
         """Update vocabulary and document frequency."""
-        self.vocabulary.update(tokens)
+        if self.mode == "vocabulary":
+            for token in set(tokens) - self.vocabulary:
+                if len(self._vocab_list) < self.vector_dimension or token < self._vocab_list[-1]:
+                    bisect.insort(self._vocab_list, token)
+                    del self._vocab_list[self.vector_dimension:]
+            self.vocabulary.update(tokens)
         
         if update_df:
             self.total_documents += 1
@@ -99,6 +208,15 @@ def _calculate_tfidf(self, tf_vector: Dict[str, float]) -> Dict[str, float]:
         """Calculate TF-IDF vector."""
         tfidf_vector = {}
         
+        if self.mode == "hashing":
+            # Frozen weights only, so the same text always maps to the same vector
+            if self.idf_snapshot is None:
+                return dict(tf_vector)
+            return {
+                token: tf * self.idf_snapshot.get(token, self.idf_default)
+                for token, tf in tf_vector.items()
+            }
+            
         for token, tf in tf_vector.items():
             # IDF calculation with smoothing
             df = self.document_frequency.get(token, 1)
@@ -109,12 +227,11 @@ def _calculate_tfidf(self, tf_vector: Dict[str, float]) -> Dict[str, float]:
         
     def _normalize_vector(self, tfidf_vector: Dict[str, float]) -> List[float]:
         """Convert to fixed-dimension normalized vector."""
-        # Create vocab list sorted for consistency
-        vocab_list = sorted(list(self.vocabulary))
-        
-        # Limit vocabulary size to dimension
-        if len(vocab_list) > self.vector_dimension:
-            vocab_list = vocab_list[:self.vector_dimension]
+        if self.mode == "hashing":
+            return self._hash_vector(tfidf_vector)
+            
+        # Sorted vocab prefix, limited to dimension (kept up to date by _update_vocabulary)
+        vocab_list = self._vocab_list
             
         # Create vector
         vector = []
@@ -132,4 +249,17 @@ def _normalize_vector(self, tfidf_vector: Dict[str, float]) -> List[float]:
         if magnitude > 0:
             vector = [x / magnitude for x in vector]
             
-        return vector
\ No newline at end of file
+        return vector
+        
+    def _hash_vector(self, tfidf_vector: Dict[str, float]) -> List[float]:
+        """Signed feature hashing of weighted tokens into vector_dimension buckets."""
+        vector = [0.0] * self.vector_dimension
+        for token, weight in tfidf_vector.items():
+            bucket, sign = _hash_token(token, self.vector_dimension)
+            vector[bucket] += sign * weight
+            
+        magnitude = math.sqrt(sum(x * x for x in vector))
+        if magnitude > 0:
+            vector = [x / magnitude for x in vector]
+            
+        return vector
@@ -15,6 +15,9 @@ def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.api_key = config.get("api_key") if config else None
         self.model = config.get("model", "text-embedding-ada-002") if config else "text-embedding-ada-002"
         self.dimension = config.get("dimension", 1536) if config else 1536  # ada-002 default
+        # Embeddings endpoint limits: 2048 inputs and ~300K tokens per request
+        self.max_batch_size = config.get("max_batch_size", 2048) if config else 2048
+        self.max_batch_tokens = config.get("max_batch_tokens", 300000) if config else 300000
         self._client = None
         
     def _get_client(self):
@@ -0,0 +1,353 @@
+"""
+Sharded Embedding Index - Multi-Process Scatter/Gather Vector Search
+
+Partitions embeddings across worker processes so a large top-k query uses
+several cores instead of one GIL-bound interpreter. Each shard's normalized
+float32 rows live in a multiprocessing.shared_memory block written by the
+coordinator (the ShardedIndex object); the shard's worker process maps the
+same block and scores queries against it without copying.
+"""
+
+from typing import List, Dict, Any, Optional, Tuple, Sequence
+import multiprocessing
+import os
+import threading
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .ann_index import AnnIndex
+from .embedding_matrix import normalize_vector, select_top_k
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without handing its lifetime to this process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the block, but workers share the
+        # coordinator's resource tracker, so the registration is a no-op there
+        return shared_memory.SharedMemory(name=name)
+
+
+def _shard_worker(conn):
+    """
+    Worker loop: score queries against one shard's shared-memory matrix.
+
+    Messages are (block_name, capacity, dimension, rows, query, k, threshold);
+    the reply is (row_indices, scores). None stops the worker.
+    """
+    block = None
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+
+        block_name, capacity, dimension, rows, query, k, threshold = message
+        try:
+            if block is None or block.name != block_name:
+                if block is not None:
+                    block.close()
+                block = _attach_shared_memory(block_name)
+            # No view of the block may outlive this statement, or close() on re-attach fails
+            scores = np.ndarray((capacity, dimension), dtype=np.float32, buffer=block.buf)[:rows] @ query
+            top = select_top_k(scores, k, threshold)
+            conn.send((top, scores[top]))
+        except Exception as e:
+            conn.send(e)
+
+    if block is not None:
+        block.close()
+    conn.close()
+
+
+class _Shard:
+    """Coordinator-side state of one shard: its shared block, row ids and worker."""
+
+    def __init__(self, dimension: int, capacity: int):
+        self.dimension = dimension
+        self.capacity = capacity
+        self.block = shared_memory.SharedMemory(create=True, size=max(1, capacity * dimension * 4))
+        self.ids: List[str] = []
+        self.process = None
+        self.conn = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return np.ndarray((self.capacity, self.dimension), dtype=np.float32, buffer=self.block.buf)
+
+    def grow(self, required_rows: int):
+        """Move rows into a larger block (the worker re-attaches on its next query)."""
+        capacity = max(required_rows, self.capacity * 2)
+        block = shared_memory.SharedMemory(create=True, size=capacity * self.dimension * 4)
+        grown = np.ndarray((capacity, self.dimension), dtype=np.float32, buffer=block.buf)
+        grown[:len(self.ids)] = self.matrix[:len(self.ids)]
+        del grown
+        self.release_block()
+        self.block, self.capacity = block, capacity
+
+    def release_block(self):
+        self.block.close()
+        self.block.unlink()
+
+    def stop_worker(self, timeout: float = 5.0):
+        """Stop the worker (if any); the next parallel query starts a fresh one."""
+        if self.conn is not None:
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self.conn.close()
+        if self.process is not None:
+            self.process.join(timeout=timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.process = self.conn = None
+
+
+def _shutdown_shards(shards: List[_Shard]):
+    """Stop workers and free shared memory (also run by the finalizer)."""
+    for shard in shards:
+        shard.stop_worker()
+        shard.release_block()
+    shards.clear()
+
+
+class ShardedIndex(AnnIndex):
+    """
+    Exact cosine index split into n_shards shared-memory partitions, one worker process each.
+
+    New ids go to the smallest shard; removals swap the shard's last row into
+    the freed slot and rebalance moves rows from the largest to the smallest
+    shard once sizes drift apart by more than rebalance_ratio. top_k scatters
+    the query to every non-empty shard and merges the per-shard top-k lists.
+    Indexes smaller than inline_threshold are scored in the coordinator, where
+    a single matrix-vector product beats the IPC round trip.
+
+    Workers are started on the first query; call close() (or use the index as
+    a context manager) to stop them and unlink the shared memory. A shard whose
+    worker dies is scored in the coordinator for that query and gets a new
+    worker on the next one.
+    """
+
+    thread_safe = True
+
+    def __init__(self, dimension: Optional[int] = None, n_shards: Optional[int] = None,
+                 initial_capacity: int = 1024, rebalance_ratio: float = 1.5,
+                 inline_threshold: int = 20_000, start_method: str = "spawn"):
+        self.dimension = dimension
+        self.n_shards = n_shards or os.cpu_count() or 1
+        self.initial_capacity = max(1, initial_capacity)
+        self.rebalance_ratio = rebalance_ratio
+        self.inline_threshold = inline_threshold
+        self.start_method = start_method
+        self.rebalanced_rows = 0
+        self.worker_restarts = 0
+
+        self._shards: List[_Shard] = []
+        self._locations: Dict[str, Tuple[int, int]] = {}  # id -> (shard, row)
+        self._lock = threading.RLock()
+        self._finalizer = weakref.finalize(self, _shutdown_shards, self._shards)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._locations
+
+    def __enter__(self) -> "ShardedIndex":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, item_id: str, embedding: Sequence[float]):
+        """Insert an embedding, or overwrite it in place if the id is already present."""
+        vector = normalize_vector(embedding)
+        with self._lock:
+            self._ensure_shards(vector.shape[0])
+            location = self._locations.get(item_id)
+            if location is not None:
+                shard_index, row = location
+                self._shards[shard_index].matrix[row] = vector
+                return
+
+            shard_index = min(range(len(self._shards)), key=lambda i: len(self._shards[i].ids))
+            self._append(shard_index, item_id, vector)
+
+    def remove(self, item_id: str) -> bool:
+        """Remove an id; returns False if it was not present."""
+        with self._lock:
+            location = self._locations.pop(item_id, None)
+            if location is None:
+                return False
+            self._remove_row(*location)
+            self.rebalance()
+            return True
+
+    def clear(self):
+        """Drop every stored embedding (shards and workers are kept)."""
+        with self._lock:
+            for shard in self._shards:
+                shard.ids.clear()
+            self._locations.clear()
+
+    def rebalance(self) -> int:
+        """Move rows from the largest to the smallest shard until sizes are within rebalance_ratio."""
+        moved = 0
+        with self._lock:
+            while self._shards:
+                sizes = [len(shard.ids) for shard in self._shards]
+                largest = max(range(len(sizes)), key=sizes.__getitem__)
+                smallest = min(range(len(sizes)), key=sizes.__getitem__)
+                if sizes[largest] - sizes[smallest] <= 1 or \
+                        sizes[largest] <= self.rebalance_ratio * max(sizes[smallest], 1):
+                    break
+
+                source = self._shards[largest]
+                item_id = source.ids[-1]
+                vector = source.matrix[len(source.ids) - 1].copy()
+                self._remove_row(largest, len(source.ids) - 1)
+                self._append(smallest, item_id, vector)
+                moved += 1
+        self.rebalanced_rows += moved
+        return moved
+
+    def top_k(self, query_embedding: Sequence[float], k: int,
+              threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Return up to k (id, cosine similarity) pairs, best first."""
+        with self._lock:
+            if not self._locations or k <= 0:
+                return []
+            query = normalize_vector(query_embedding)
+            if query.shape[0] != self.dimension:
+                raise ValueError(
+                    f"Query dimension {query.shape[0]} does not match index dimension {self.dimension}"
+                )
+
+            if len(self._locations) < self.inline_threshold:
+                partials = [self._score_inline(shard, query, k, threshold) for shard in self._shards]
+            else:
+                partials = self._score_parallel(query, k, threshold)
+
+        ids = [item_id for shard_ids, _ in partials for item_id in shard_ids]
+        if not ids:
+            return []
+        scores = np.concatenate([shard_scores for _, shard_scores in partials])
+        return [(ids[i], float(scores[i])) for i in select_top_k(scores, k)]
+
+    def get_vector(self, item_id: str) -> np.ndarray:
+        """Return a copy of the normalized row stored for an id."""
+        shard_index, row = self._locations[item_id]
+        return self._shards[shard_index].matrix[row].copy()
+
+    def get_shard_sizes(self) -> List[int]:
+        return [len(shard.ids) for shard in self._shards]
+
+    def get_index_info(self) -> Dict[str, Any]:
+        info = super().get_index_info()
+        info.update({
+            "n_shards": self.n_shards,
+            "shard_sizes": self.get_shard_sizes(),
+            "workers_running": sum(1 for shard in self._shards if shard.process is not None),
+            "rebalanced_rows": self.rebalanced_rows,
+            "worker_restarts": self.worker_restarts,
+        })
+        return info
+
+    def close(self):
+        """Stop worker processes and unlink shared memory."""
+        with self._lock:
+            self._locations.clear()
+            self._finalizer()
+
+    def _ensure_shards(self, dimension: int):
+        if self.dimension is None:
+            self.dimension = dimension
+        elif dimension != self.dimension:
+            raise ValueError(f"Embedding dimension {dimension} does not match index dimension {self.dimension}")
+        if not self._shards:
+            if not self._finalizer.alive:
+                raise RuntimeError("ShardedIndex is closed")
+            capacity = max(1, self.initial_capacity // self.n_shards)
+            self._shards.extend(_Shard(self.dimension, capacity) for _ in range(self.n_shards))
+
+    def _append(self, shard_index: int, item_id: str, vector: np.ndarray):
+        shard = self._shards[shard_index]
+        row = len(shard.ids)
+        if row >= shard.capacity:
+            shard.grow(row + 1)
+        shard.matrix[row] = vector
+        shard.ids.append(item_id)
+        self._locations[item_id] = (shard_index, row)
+
+    def _remove_row(self, shard_index: int, row: int):
+        shard = self._shards[shard_index]
+        last_row = len(shard.ids) - 1
+        if row != last_row:
+            moved_id = shard.ids[last_row]
+            shard.matrix[row] = shard.matrix[last_row]
+            shard.ids[row] = moved_id
+            self._locations[moved_id] = (shard_index, row)
+        shard.ids.pop()
+
+    def _score_inline(self, shard: _Shard, query: np.ndarray, k: int,
+                      threshold: Optional[float]) -> Tuple[List[str], np.ndarray]:
+        scores = shard.matrix[:len(shard.ids)] @ query
+        top = select_top_k(scores, k, threshold)
+        return [shard.ids[i] for i in top], scores[top]
+
+    def _score_parallel(self, query: np.ndarray, k: int,
+                        threshold: Optional[float]) -> List[Tuple[List[str], np.ndarray]]:
+        self._start_workers()
+        active = [shard for shard in self._shards if shard.ids]
+        sent, lost = [], set()
+        for shard in active:
+            try:
+                shard.conn.send((shard.block.name, shard.capacity, self.dimension, len(shard.ids),
+                                 query, k, threshold))
+                sent.append(shard)
+            except (BrokenPipeError, OSError):
+                lost.add(id(shard))
+
+        # Read every reply before raising, or the next query would receive this one's
+        replies, error = {}, None
+        for shard in sent:
+            try:
+                reply = shard.conn.recv()
+            except (EOFError, OSError):
+                lost.add(id(shard))
+                continue
+            if isinstance(reply, Exception):
+                error = error or reply
+            else:
+                replies[id(shard)] = reply
+        for shard in active:
+            if id(shard) in lost:
+                shard.stop_worker(timeout=0)
+                self.worker_restarts += 1
+        if error is not None:
+            raise error
+
+        partials = []
+        for shard in active:
+            if id(shard) in lost:
+                partials.append(self._score_inline(shard, query, k, threshold))
+            else:
+                rows, scores = replies[id(shard)]
+                partials.append(([shard.ids[i] for i in rows], scores))
+        return partials
+
+    def _start_workers(self):
+        context = multiprocessing.get_context(self.start_method)
+        for shard in self._shards:
+            if shard.process is None:
+                parent_conn, child_conn = context.Pipe()
+                process = context.Process(target=_shard_worker, args=(child_conn,), daemon=True)
+                try:
+                    process.start()
+                finally:
+                    child_conn.close()
+                shard.process, shard.conn = process, parent_conn
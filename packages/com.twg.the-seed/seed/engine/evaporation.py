@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import List, Dict, Any, Optional, Tuple
+import heapq
 import time
 import random
 import re
@@ -572,48 +573,84 @@ def _initialize_style_profiles(self) -> Dict[str, Dict[str, Any]]:
         }
 
 class CloudStore:
-    def __init__(self):
-        self.mist_lines = []
+    """Mist lines kept while they are active, with a maintained top-k index.
+
+    A mist line's activity score is 0.4 * recency + 0.3 * quality + 0.2 * mythic
+    weight + 0.1 * style confidence, where recency falls linearly from 1 to 0 over
+    horizon_s seconds. Inside the horizon the recency term is 0.4 - 0.4 * age / horizon_s,
+    so ranking by the static terms plus 0.4 * created_epoch / horizon_s gives the same
+    order at any time; a heap on that rank serves get_active_mist without rescoring.
+    Mist past the horizon is inactive, and is dropped with its created_epoch bucket.
+    """
+    def __init__(self, horizon_s: float = 3600.0, bucket_s: float = 60.0):
         self.humidity_index = 0.0
         self.generation_mode = "balanced"
+        self.horizon_s = horizon_s
+        self.bucket_s = bucket_s
+
+        self._live: Dict[int, Tuple[float, Dict[str, Any]]] = {}  # seq -> (created_epoch, mist)
+        self._buckets: Dict[int, List[int]] = {}
+        self._bucket_heap: List[int] = []
+        self._ranked: List[Tuple[float, int]] = []  # (-rank, seq)
+        self._next_seq = 0
+
+    @property
+    def mist_lines(self) -> List[Dict[str, Any]]:
+        """Retained mist lines in insertion order."""
+        return [mist for _, mist in self._live.values()]
 
     def add_mist_lines(self, mist_lines: List[Dict[str, Any]]):
-        self.mist_lines.extend(mist_lines)
+        now = time.time()
+        self._expire(now)
+        for mist in mist_lines:
+            created = mist.get("created_epoch", now)
+            if now - created > self.horizon_s:
+                continue
+            seq = self._next_seq
+            self._next_seq += 1
+            self._live[seq] = (created, mist)
+
+            bucket = int(created // self.bucket_s)
+            if bucket not in self._buckets:
+                self._buckets[bucket] = []
+                heapq.heappush(self._bucket_heap, bucket)
+            self._buckets[bucket].append(seq)
+
+            rank = (mist.get("distillation_quality", 0.5) * 0.3
+                    + mist.get("mythic_weight", 0.0) * 0.2
+                    + mist.get("style_confidence", 0.5) * 0.1
+                    + 0.4 * created / self.horizon_s)
+            heapq.heappush(self._ranked, (-rank, seq))
 
     def update_humidity(self, humidity: float):
         self.humidity_index = humidity
 
     def get_active_mist(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get active mist lines filtered by recency and activity."""
-        if not self.mist_lines:
-            return []
-
-        current_time = time.time()
-
-        # Score mist lines based on multiple factors
-        scored_mist = []
-        for mist in self.mist_lines:
-            score = 0.0
-
-            # Recency factor (newer is better)
-            age = current_time - mist.get("created_epoch", current_time)
-            recency_score = max(0, 1.0 - (age / 3600))  # Decay over 1 hour
-            score += recency_score * 0.4
-
-            # Quality factor
-            quality = mist.get("distillation_quality", 0.5)
-            score += quality * 0.3
-
-            # Mythic weight factor
-            mythic = mist.get("mythic_weight", 0.0)
-            score += mythic * 0.2
-
-            # Style confidence factor
-            style_confidence = mist.get("style_confidence", 0.5)
-            score += style_confidence * 0.1
-
-            scored_mist.append((mist, score))
-
-        # Sort by score and return top results
-        scored_mist.sort(key=lambda x: x[1], reverse=True)
-        return [mist for mist, _ in scored_mist[:limit]]
+        """Get the highest scoring mist lines created within the recency horizon."""
+        now = time.time()
+        self._expire(now)
+
+        taken = []
+        selected = []
+        while self._ranked and len(selected) < limit:
+            item = heapq.heappop(self._ranked)
+            entry = self._live.get(item[1])
+            if entry is None:
+                continue
+            created, mist = entry
+            taken.append(item)
+            # Older than the horizon but still in a live bucket: inactive, not ranked
+            if now - created <= self.horizon_s:
+                selected.append(mist)
+        for item in taken:
+            heapq.heappush(self._ranked, item)
+        return selected
+
+    def _expire(self, now: float):
+        """Drop every bucket wholly past the horizon; compact the rank heap."""
+        while self._bucket_heap and (self._bucket_heap[0] + 1) * self.bucket_s + self.horizon_s < now:
+            for seq in self._buckets.pop(heapq.heappop(self._bucket_heap)):
+                del self._live[seq]
+        if len(self._ranked) > 2 * len(self._live) + 1024:
+            self._ranked = [item for item in self._ranked if item[1] in self._live]
+            heapq.heapify(self._ranked)
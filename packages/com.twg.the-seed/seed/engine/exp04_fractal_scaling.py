@@ -35,6 +35,7 @@
     HORIZONS,
     ENTITY_TYPES,
     generate_random_bitchain,
+    compute_addresses,
 )
 
 
@@ -48,6 +49,7 @@ class ScaleTestConfig:
     scale: int                  # Number of bit-chains (1K, 10K, 100K, 1M)
     num_retrievals: int         # Number of random retrieval queries
     timeout_seconds: int        # Kill test if it takes too long
+    address_workers: Optional[int] = None  # Addressing pool size (None = all cores)
     
     def name(self) -> str:
         """Human-readable scale name."""
@@ -79,6 +81,11 @@ class ScaleTestResults:
     # System metrics
     total_time_seconds: float
     addresses_per_second: float
+    address_time_seconds: float = 0.0  # Addressing step alone (canonicalize + hash)
+    
+    @property
+    def addressing_per_second(self) -> float:
+        return self.num_addresses / self.address_time_seconds if self.address_time_seconds > 0 else 0.0
     
     def is_valid(self) -> bool:
         """Check if results meet success criteria."""
@@ -107,6 +114,8 @@ def to_dict(self) -> Dict[str, Any]:
             'performance': {
                 'total_time_seconds': round(self.total_time_seconds, 3),
                 'addresses_per_second': int(self.addresses_per_second),
+                'address_time_seconds': round(self.address_time_seconds, 3),
+                'addressing_per_second': int(self.addressing_per_second),
             },
             'valid': self.is_valid(),
         }
@@ -166,12 +175,12 @@ def run_scale_test(config: ScaleTestConfig) -> ScaleTestResults:
     
     # Step 2: Compute addresses and check for collisions (EXP-01)
     print(f"  Computing addresses (EXP-01)...", end='', flush=True)
-    address_map: Dict[str, int] = defaultdict(int)
-    addresses = []
+    address_start = time.perf_counter()
+    addresses = compute_addresses(bitchains, workers=config.address_workers)
+    address_time = time.perf_counter() - address_start
     
-    for bc in bitchains:
-        addr = bc.compute_address()
-        addresses.append(addr)
+    address_map: Dict[str, int] = defaultdict(int)
+    for addr in addresses:
         address_map[addr] += 1
     
     unique_addresses = len(address_map)
@@ -231,6 +240,7 @@ def run_scale_test(config: ScaleTestConfig) -> ScaleTestResults:
         retrieval_p99_ms=retrieval_p99,
         total_time_seconds=total_time,
         addresses_per_second=addresses_per_second,
+        address_time_seconds=address_time,
     )
 
 
@@ -326,6 +336,7 @@ def run_fractal_scaling_test(quick_mode: bool = True) -> FractalScalingResults:
             print(f"          Collisions: {result.collision_count} ({result.collision_rate*100:.2f}%)")
             print(f"          Retrieval: mean={result.retrieval_mean_ms:.6f}ms, p95={result.retrieval_p95_ms:.6f}ms")
             print(f"          Throughput: {result.addresses_per_second:,.0f} addr/sec")
+            print(f"          Addressing: {result.addressing_per_second:,.0f} addr/sec")
             print(f"          Valid: {'✓ YES' if result.is_valid() else '✗ NO'}")
             print()
             
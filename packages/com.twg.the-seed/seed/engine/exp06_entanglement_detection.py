@@ -18,11 +18,16 @@
 """
 
 import math
-from typing import Dict, List, Tuple, Set, Optional
+import random
+from collections import defaultdict
+from itertools import combinations
+from typing import Dict, List, Tuple, Set, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
 
+import numpy as np
+
 
 # ============================================================================
 # COMPONENT 1: POLARITY RESONANCE
@@ -387,6 +392,367 @@ def compute_entanglement_score(bc1: Dict, bc2: Dict) -> EntanglementScore:
     )
 
 
+# ============================================================================
+# VECTORIZED SCORING
+# ============================================================================
+
+@dataclass
+class BitChainFeatures:
+    """
+    Per-bit-chain inputs of the score function, extracted once as arrays.
+    
+    Adjacency is stored as CSR: the deduplicated neighbor codes of bit-chain i are
+    adjacency_indices[adjacency_indptr[i]:adjacency_indptr[i + 1]].
+    """
+    ids: List[str]
+    polarity: np.ndarray          # (n, 7) polarity vectors
+    polarity_norms: np.ndarray    # (n,) vector magnitudes
+    realm_codes: np.ndarray       # (n,) index into realm_affinity_table
+    realm_affinity_table: np.ndarray
+    density: np.ndarray
+    lineage: np.ndarray
+    adjacency_indptr: np.ndarray
+    adjacency_indices: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    @property
+    def adjacency_sizes(self) -> np.ndarray:
+        return np.diff(self.adjacency_indptr)
+
+
+def extract_features(bitchains: List[Dict]) -> BitChainFeatures:
+    """
+    Turn bit-chain dicts into the arrays score_pair_block() works on.
+    
+    Args:
+        bitchains: List of BitChain dictionaries
+        
+    Returns:
+        BitChainFeatures aligned with the input order
+    """
+    realm_names = list(REALM_ADJACENCY)
+    realm_lookup = {name: code for code, name in enumerate(realm_names)}
+    neighbor_lookup: Dict = {}
+    realm_codes, density, lineage = [], [], []
+    indptr, indices = [0], []
+    
+    for bc in bitchains:
+        coords = bc.get('coordinates', {})
+        realm = coords.get('realm', 'void')
+        if realm not in realm_lookup:
+            realm_lookup[realm] = len(realm_names)
+            realm_names.append(realm)
+        realm_codes.append(realm_lookup[realm])
+        density.append(coords.get('density', 0.5))
+        lineage.append(coords.get('lineage', 0))
+        for neighbor in set(coords.get('adjacency', [])):
+            indices.append(neighbor_lookup.setdefault(neighbor, len(neighbor_lookup)))
+        indptr.append(len(indices))
+    
+    table = np.array([
+        [realm_affinity({'coordinates': {'realm': r1}}, {'coordinates': {'realm': r2}})
+         for r2 in realm_names]
+        for r1 in realm_names
+    ], dtype=np.float64)
+    polarity = np.array([compute_polarity_vector(bc) for bc in bitchains],
+                        dtype=np.float64).reshape(len(bitchains), 7)
+    
+    return BitChainFeatures(
+        ids=[bc.get('id', 'unknown') for bc in bitchains],
+        polarity=polarity,
+        polarity_norms=np.sqrt(np.einsum('ij,ij->i', polarity, polarity)),
+        realm_codes=np.array(realm_codes, dtype=np.int64),
+        realm_affinity_table=table,
+        density=np.array(density, dtype=np.float64),
+        lineage=np.array(lineage, dtype=np.float64),
+        adjacency_indptr=np.array(indptr, dtype=np.int64),
+        adjacency_indices=np.array(indices, dtype=np.int64),
+    )
+
+
+@dataclass
+class ScoreBlock:
+    """Component and total scores for a block of pairs (left[k], right[k])."""
+    left: np.ndarray
+    right: np.ndarray
+    total: np.ndarray
+    polarity_resonance: np.ndarray
+    realm_affinity: np.ndarray
+    adjacency_overlap: np.ndarray
+    luminosity_proximity: np.ndarray
+    lineage_affinity: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.total)
+    
+    def entanglement_score(self, k: int, ids: List[str]) -> EntanglementScore:
+        """Materialize pair k as an EntanglementScore."""
+        return EntanglementScore(
+            bitchain1_id=ids[self.left[k]],
+            bitchain2_id=ids[self.right[k]],
+            total_score=float(self.total[k]),
+            polarity_resonance=float(self.polarity_resonance[k]),
+            realm_affinity=float(self.realm_affinity[k]),
+            adjacency_overlap=float(self.adjacency_overlap[k]),
+            luminosity_proximity=float(self.luminosity_proximity[k]),
+            lineage_affinity=float(self.lineage_affinity[k]),
+        )
+
+
+def _gather_neighbors(features: BitChainFeatures,
+                      rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Neighbor codes of each row, flattened, plus the block position they came from."""
+    sizes = features.adjacency_sizes[rows]
+    positions = np.repeat(np.arange(len(rows)), sizes)
+    offsets = np.arange(positions.size) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    starts = np.repeat(features.adjacency_indptr[rows], sizes)
+    return features.adjacency_indices[starts + offsets], positions
+
+
+def _adjacency_block(features: BitChainFeatures, left: np.ndarray,
+                     right: np.ndarray) -> np.ndarray:
+    """Jaccard overlap of CSR neighbor sets for every pair in the block."""
+    sizes = features.adjacency_sizes
+    union = sizes[left] + sizes[right]
+    intersection = np.zeros(len(left), dtype=np.int64)
+    
+    if len(features.adjacency_indices):
+        left_codes, left_pos = _gather_neighbors(features, left)
+        right_codes, right_pos = _gather_neighbors(features, right)
+        # Rows are deduplicated, so a key seen twice is a neighbor shared by the pair
+        stride = int(features.adjacency_indices.max()) + 1
+        keys = np.sort(np.concatenate([left_pos * stride + left_codes,
+                                       right_pos * stride + right_codes]))
+        shared = keys[1:][keys[1:] == keys[:-1]] // stride
+        intersection = np.bincount(shared, minlength=len(left))
+    
+    union = union - intersection
+    overlap = np.ones(len(left), dtype=np.float64)
+    nonempty = union > 0
+    overlap[nonempty] = intersection[nonempty] / union[nonempty]
+    return overlap
+
+
+def score_pair_block(features: BitChainFeatures, left: np.ndarray,
+                     right: np.ndarray) -> ScoreBlock:
+    """
+    Score a block of pairs with the same formula as compute_entanglement_score.
+    
+    Each component matches its scalar function to floating-point rounding.
+    
+    Args:
+        features: Output of extract_features()
+        left, right: Index arrays of equal length naming the pairs
+        
+    Returns:
+        ScoreBlock with per-pair totals and components
+    """
+    left = np.asarray(left, dtype=np.int64)
+    right = np.asarray(right, dtype=np.int64)
+    
+    # P: cosine shifted to [0, 1]; zero vectors score a cosine of 0
+    magnitudes = features.polarity_norms[left] * features.polarity_norms[right]
+    dots = np.einsum('ij,ij->i', features.polarity[left], features.polarity[right])
+    cosine = np.zeros(len(left), dtype=np.float64)
+    nonzero = magnitudes != 0.0
+    cosine[nonzero] = np.clip(dots[nonzero] / magnitudes[nonzero], -1.0, 1.0)
+    p_score = (cosine + 1.0) / 2.0
+    
+    r_score = features.realm_affinity_table[features.realm_codes[left],
+                                            features.realm_codes[right]]
+    a_score = _adjacency_block(features, left, right)
+    l_score = np.clip(1.0 - np.abs(features.density[left] - features.density[right]), 0.0, 1.0)
+    lineage_score = np.clip(0.9 ** np.abs(features.lineage[left] - features.lineage[right]),
+                            0.0, 1.0)
+    
+    total = (0.5 * p_score +
+             0.15 * r_score +
+             0.2 * a_score +
+             0.1 * l_score +
+             0.05 * lineage_score)
+    
+    return ScoreBlock(
+        left=left,
+        right=right,
+        total=np.clip(total, 0.0, 1.0),
+        polarity_resonance=p_score,
+        realm_affinity=r_score,
+        adjacency_overlap=a_score,
+        luminosity_proximity=l_score,
+        lineage_affinity=lineage_score,
+    )
+
+
+# ============================================================================
+# CANDIDATE GENERATION
+# ============================================================================
+
+# Slack applied to every upper-bound test so float rounding in the full score can
+# never lift a pruned pair over the threshold.
+_BOUND_SLACK = 1e-9
+
+
+def score_upper_bound(r_score: float, a_score: float) -> float:
+    """
+    Best total score a pair can reach once R and A are known.
+
+    P, L and ℓ are each at most 1.0, so E ≤ 0.5 + 0.15·R + 0.2·A + 0.1 + 0.05.
+    
+    Args:
+        r_score: Realm affinity of the pair
+        a_score: Adjacency overlap of the pair
+        
+    Returns:
+        Upper bound on compute_entanglement_score(...).total_score
+    """
+    return 0.65 + 0.15 * r_score + 0.2 * a_score
+
+
+def _polarity_signatures(bitchains: List[Dict], tables: int, bits: int,
+                         seed: int) -> List[List[int]]:
+    """Random-hyperplane LSH signatures of each polarity vector, one int per table."""
+    rng = random.Random(seed)
+    planes = [[[rng.gauss(0.0, 1.0) for _ in range(7)] for _ in range(bits)]
+              for _ in range(tables)]
+    signatures = []
+    for bc in bitchains:
+        vector = compute_polarity_vector(bc)
+        row = []
+        for table in planes:
+            signature = 0
+            for plane in table:
+                signature = (signature << 1) | (sum(a * b for a, b in zip(plane, vector)) >= 0.0)
+            row.append(signature)
+        signatures.append(row)
+    return signatures
+
+
+def _block_pairs(left: List[int], right: Optional[List[int]],
+                 signatures: Optional[List[List[int]]]) -> Set[Tuple[int, int]]:
+    """
+    Index pairs within one block (right is None) or across two blocks.
+
+    Without signatures every pair is returned; with them only pairs whose polarity
+    vectors share a bucket in at least one LSH table.
+    """
+    if signatures is None:
+        if right is None:
+            return set(combinations(left, 2))
+        return {(min(i, j), max(i, j)) for i in left for j in right}
+    
+    pairs: Set[Tuple[int, int]] = set()
+    for table in range(len(signatures[left[0]]) if left else 0):
+        buckets: Dict[int, List[int]] = defaultdict(list)
+        for i in left:
+            buckets[signatures[i][table]].append(i)
+        if right is None:
+            for members in buckets.values():
+                pairs.update(combinations(members, 2))
+            continue
+        for j in right:
+            for i in buckets.get(signatures[j][table], ()):
+                pairs.add((min(i, j), max(i, j)))
+    return pairs
+
+
+def generate_candidate_pairs(
+    bitchains: List[Dict],
+    threshold: float,
+    lsh_tables: int = 0,
+    lsh_bits: int = 6,
+    seed: int = 0,
+    stats: Optional[Dict] = None,
+) -> List[Tuple[int, int]]:
+    """
+    Find the index pairs (i < j) that can still reach ``threshold``.
+    
+    Stages:
+      1. Realm blocking — bit-chains are grouped by realm; block pairs whose best
+         score (A = 1) is below threshold are dropped whole.
+      2. Adjacency inverted index — pairs without a shared neighbor have A = 0, or
+         A = 1 when both are isolated. Only pairs that co-occur in a posting list and
+         pairs of isolated bit-chains are enumerated, unless the threshold is low
+         enough for A = 0 to pass, in which case the whole block pair is swept.
+      3. Bound check — R and A are exact for every candidate, so pairs whose bound
+         with P = L = ℓ = 1 is below threshold never reach the full score.
+    
+    Stages 1-3 are lossless. With ``lsh_tables > 0`` the pairs enumerated without a
+    shared neighbor are further restricted to those whose polarity vectors collide in
+    at least one random-hyperplane table, which is approximate.
+    
+    Args:
+        bitchains: List of BitChain dictionaries
+        threshold: Score threshold the pairs have to be able to reach
+        lsh_tables: Number of LSH tables over polarity vectors (0 disables LSH)
+        lsh_bits: Hyperplanes per LSH table
+        seed: Seed for the LSH hyperplanes
+        stats: Optional dict filled with candidate counts per stage
+        
+    Returns:
+        Sorted list of (i, j) index pairs to score
+    """
+    limit = threshold - _BOUND_SLACK
+    coords = [bc.get('coordinates', {}) for bc in bitchains]
+    realms = [c.get('realm', 'void') for c in coords]
+    adjacency = [set(c.get('adjacency', [])) for c in coords]
+    
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for i, realm in enumerate(realms):
+        blocks[realm].append(i)
+    
+    # Stage 1: realm blocking
+    affinity: Dict[Tuple[str, str], float] = {}
+    names = sorted(blocks)
+    for n, realm1 in enumerate(names):
+        for realm2 in names[n:]:
+            r_score = realm_affinity({'coordinates': {'realm': realm1}},
+                                     {'coordinates': {'realm': realm2}})
+            if score_upper_bound(r_score, 1.0) >= limit:
+                affinity[(realm1, realm2)] = affinity[(realm2, realm1)] = r_score
+    
+    # Stage 2: shared neighbors, isolated bit-chains and A = 0 sweeps
+    candidates: Set[Tuple[int, int]] = set()
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for i, neighbors in enumerate(adjacency):
+        for neighbor in neighbors:
+            postings[neighbor].append(i)
+    for members in postings.values():
+        for i, j in combinations(members, 2):
+            if (realms[i], realms[j]) in affinity:
+                candidates.add((i, j))
+    
+    signatures = None
+    if lsh_tables > 0:
+        signatures = _polarity_signatures(bitchains, lsh_tables, lsh_bits, seed)
+    for (realm1, realm2), r_score in affinity.items():
+        if realm1 > realm2:
+            continue
+        if score_upper_bound(r_score, 0.0) >= limit:
+            left, right = blocks[realm1], blocks[realm2]
+        else:
+            left = [i for i in blocks[realm1] if not adjacency[i]]
+            right = [i for i in blocks[realm2] if not adjacency[i]]
+        candidates |= _block_pairs(left, None if realm1 == realm2 else right, signatures)
+    
+    # Stage 3: exact R/A bound
+    kept = [
+        (i, j) for i, j in sorted(candidates)
+        if score_upper_bound(affinity[(realms[i], realms[j])],
+                             jaccard_similarity(adjacency[i], adjacency[j])) >= limit
+    ]
+    
+    if stats is not None:
+        n = len(bitchains)
+        stats.update({
+            'total_pairs': n * (n - 1) // 2,
+            'blocked_pairs': len(candidates),
+            'candidate_pairs': len(kept),
+        })
+    return kept
+
+
 # ============================================================================
 # ENTANGLEMENT DETECTION
 # ============================================================================
@@ -395,23 +761,148 @@ class EntanglementDetector:
     """
     Main detector class for finding entangled bit-chains.
     
+    Pairs are pruned by generate_candidate_pairs() before scoring, so detection no
+    longer touches all N² pairs. Surviving pairs are scored in blocks over
+    extract_features() arrays. Scores of the pairs that are scored are kept in
+    full, dropped, or reservoir-sampled depending on ``retain_scores``; the
+    score distribution therefore covers candidate pairs only unless
+    ``use_candidates=False``.
+    
     Usage:
         detector = EntanglementDetector(threshold=0.85)
         entangled = detector.detect(bitchains)
     """
     
-    def __init__(self, threshold: float = 0.85):
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        use_candidates: bool = True,
+        retain_scores: Union[bool, int] = True,
+        lsh_tables: int = 0,
+        lsh_bits: int = 6,
+        seed: int = 0,
+        vectorized: bool = True,
+        block_size: int = 65_536,
+    ):
         """
         Initialize detector with threshold.
         
         Args:
             threshold: Score threshold for declaring entanglement (default 0.85)
+            use_candidates: Prune pairs before scoring (False scores all pairs)
+            retain_scores: True keeps every score, False keeps none, an int keeps a
+                reservoir sample of that many
+            lsh_tables: LSH tables over polarity vectors for candidate generation
+                (0 keeps candidate generation exact)
+            lsh_bits: Hyperplanes per LSH table
+            seed: Seed for LSH hyperplanes and reservoir sampling
+            vectorized: Score pairs in NumPy blocks (False calls
+                compute_entanglement_score per pair)
+            block_size: Pairs per vectorized scoring block
         """
         if not 0.0 <= threshold <= 1.0:
             raise ValueError(f"Threshold must be in [0.0, 1.0], got {threshold}")
+        if not isinstance(retain_scores, bool) and retain_scores < 0:
+            raise ValueError(f"retain_scores must be a bool or >= 0, got {retain_scores}")
         
         self.threshold = threshold
+        self.use_candidates = use_candidates
+        self.retain_scores = retain_scores
+        self.lsh_tables = lsh_tables
+        self.lsh_bits = lsh_bits
+        self.seed = seed
+        self.vectorized = vectorized
+        self.block_size = block_size
         self.scores: List[EntanglementScore] = []
+        self.candidate_stats: Dict = {}
+        self._reset_running_stats()
+    
+    def _reset_running_stats(self):
+        self.scores = []
+        self.pairs_scored = 0
+        self._score_min = math.inf
+        self._score_max = -math.inf
+        self._score_mean = 0.0
+        self._score_m2 = 0.0
+        self._rng = random.Random(self.seed)
+    
+    def _record(self, score: EntanglementScore):
+        """Fold a score into the running stats and the retained scores."""
+        self.pairs_scored += 1
+        value = score.total_score
+        self._score_min = min(self._score_min, value)
+        self._score_max = max(self._score_max, value)
+        delta = value - self._score_mean
+        self._score_mean += delta / self.pairs_scored
+        self._score_m2 += delta * (value - self._score_mean)
+        
+        if self.retain_scores is True:
+            self.scores.append(score)
+            return
+        slot = self._reservoir_slot(self.pairs_scored)
+        if slot is not None:
+            self._retain(slot, score)
+    
+    def _record_block(self, block: ScoreBlock, ids: List[str]):
+        """Fold a vectorized score block into the running stats and retained scores."""
+        count = len(block)
+        if not count:
+            return
+        seen = self.pairs_scored
+        total = seen + count
+        
+        # Merge block mean/M2 into the running totals (Chan et al.)
+        block_mean = float(block.total.mean())
+        block_m2 = float(np.square(block.total - block_mean).sum())
+        delta = block_mean - self._score_mean
+        self._score_mean += delta * count / total
+        self._score_m2 += block_m2 + delta * delta * seen * count / total
+        self._score_min = min(self._score_min, float(block.total.min()))
+        self._score_max = max(self._score_max, float(block.total.max()))
+        self.pairs_scored = total
+        
+        if self.retain_scores is True:
+            self.scores.extend(block.entanglement_score(k, ids) for k in range(count))
+            return
+        for k in range(count):
+            slot = self._reservoir_slot(seen + k + 1)
+            if slot is not None:
+                self._retain(slot, block.entanglement_score(k, ids))
+    
+    def _reservoir_slot(self, seen: int) -> Optional[int]:
+        """Slot the seen-th score goes to under reservoir sampling (Algorithm R)."""
+        if self.retain_scores is False or self.retain_scores == 0:
+            return None
+        if seen <= self.retain_scores:
+            return seen - 1
+        slot = self._rng.randrange(seen)
+        return slot if slot < self.retain_scores else None
+    
+    def _retain(self, slot: int, score: EntanglementScore):
+        if slot == len(self.scores):
+            self.scores.append(score)
+        else:
+            self.scores[slot] = score
+    
+    def _pair_blocks(self, n: int, pairs: Optional[List[Tuple[int, int]]]):
+        """Yield (left, right) index arrays of at most block_size pairs, in pair order."""
+        if pairs is not None:
+            indices = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+            for start in range(0, len(indices), self.block_size):
+                chunk = indices[start:start + self.block_size]
+                yield chunk[:, 0], chunk[:, 1]
+            return
+        
+        # All pairs, row by row so the order matches combinations(range(n), 2)
+        i = 0
+        while i < n - 1:
+            lefts, rights, count = [], [], 0
+            while i < n - 1 and (not count or count + n - 1 - i <= self.block_size):
+                lefts.append(np.full(n - 1 - i, i, dtype=np.int64))
+                rights.append(np.arange(i + 1, n, dtype=np.int64))
+                count += n - 1 - i
+                i += 1
+            yield np.concatenate(lefts), np.concatenate(rights)
     
     def detect(self, bitchains: List[Dict]) -> List[Tuple[str, str, float]]:
         """
@@ -423,31 +914,87 @@ def detect(self, bitchains: List[Dict]) -> List[Tuple[str, str, float]]:
         Returns:
             List of (bitchain1_id, bitchain2_id, score) tuples where score >= threshold
         """
-        self.scores = []
+        self._reset_running_stats()
         entangled_pairs = []
         
-        # All-pairs comparison (O(N²))
-        for i in range(len(bitchains)):
-            for j in range(i + 1, len(bitchains)):
-                score = compute_entanglement_score(bitchains[i], bitchains[j])
-                self.scores.append(score)
-                
-                if score.total_score >= self.threshold:
+        n = len(bitchains)
+        if self.use_candidates:
+            self.candidate_stats = {}
+            pairs = generate_candidate_pairs(
+                bitchains, self.threshold,
+                lsh_tables=self.lsh_tables, lsh_bits=self.lsh_bits, seed=self.seed,
+                stats=self.candidate_stats,
+            )
+        else:
+            # All-pairs comparison (O(N²))
+            self.candidate_stats = {'total_pairs': n * (n - 1) // 2}
+            pairs = None
+        
+        if self.vectorized:
+            features = extract_features(bitchains)
+            for left, right in self._pair_blocks(n, pairs):
+                block = score_pair_block(features, left, right)
+                self._record_block(block, features.ids)
+                for k in np.flatnonzero(block.total >= self.threshold):
                     entangled_pairs.append((
-                        score.bitchain1_id,
-                        score.bitchain2_id,
-                        score.total_score
+                        features.ids[left[k]],
+                        features.ids[right[k]],
+                        float(block.total[k])
                     ))
+            self.candidate_stats['scored_pairs'] = self.pairs_scored
+            return entangled_pairs
         
+        for i, j in (pairs if pairs is not None else combinations(range(n), 2)):
+            score = compute_entanglement_score(bitchains[i], bitchains[j])
+            self._record(score)
+            
+            if score.total_score >= self.threshold:
+                entangled_pairs.append((
+                    score.bitchain1_id,
+                    score.bitchain2_id,
+                    score.total_score
+                ))
+        
+        self.candidate_stats['scored_pairs'] = self.pairs_scored
         return entangled_pairs
     
     def get_score_distribution(self) -> Dict:
         """
         Get statistics on score distribution.
         
+        Statistics cover the scored pairs, not pruned ones: with use_candidates
+        they describe candidate pairs only, which sit far above the all-pairs
+        distribution. 'scope' says which ('candidate_pairs' or 'all_pairs') and
+        'total_pairs' gives the all-pairs count; construct the detector with
+        use_candidates=False when a report needs the exhaustive distribution.
+        When scores are not all retained, count/min/max/mean/std dev come from
+        running totals and the median from the reservoir sample (omitted when
+        nothing is retained).
+        
         Returns:
-            Dictionary with min, max, mean, median, std dev
+            Dictionary with min, max, mean, median, std dev, scope, total_pairs
         """
+        scope = {
+            'scope': 'candidate_pairs' if self.use_candidates else 'all_pairs',
+            'total_pairs': self.candidate_stats.get('total_pairs', 0),
+        }
+        if self.retain_scores is not True:
+            if not self.pairs_scored:
+                return {}
+            distribution = {
+                'count': self.pairs_scored,
+                'min': round(self._score_min, 8),
+                'max': round(self._score_max, 8),
+                'mean': round(self._score_mean, 8),
+                'std_dev': round(math.sqrt(self._score_m2 / self.pairs_scored), 8),
+            }
+            if self.scores:
+                sample = sorted(s.total_score for s in self.scores)
+                distribution['median'] = round(sample[len(sample) // 2], 8)
+                distribution['sample_size'] = len(sample)
+            distribution.update(scope)
+            return distribution
+        
         if not self.scores:
             return {}
         
@@ -466,6 +1013,7 @@ def get_score_distribution(self) -> Dict:
             'mean': round(mean, 8),
             'median': round(median, 8),
             'std_dev': round(std_dev, 8),
+            **scope,
         }
     
     def get_all_scores(self) -> List[Dict]:
@@ -8,11 +8,12 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 import asyncio
 import logging
+import os
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 import json
 import time
 
@@ -29,9 +30,33 @@
     version="1.0.0"
 )
 
+# Executor modes for blocking work:
+# - "inline": run on the event loop (pre-offload behaviour, kept for load-test baselines)
+# - "thread": retrieval, Bob's re-queries and narrative analysis on a thread pool
+# - "process": retrieval on the thread pool (it needs the in-process RetrievalAPI),
+#   narrative analysis (a pure function) on a process pool
+EXECUTOR_MODES = ("inline", "thread", "process")
+
+
+def _create_executors(mode: str, workers: int) -> Tuple[Optional[Executor], Optional[Executor]]:
+    """Build the (retrieval, analysis) executors for a mode."""
+    if mode not in EXECUTOR_MODES:
+        raise ValueError(f"Unknown executor mode: {mode} (expected one of {EXECUTOR_MODES})")
+    if mode == "inline":
+        return None, None
+    threads = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="exp09-worker")
+    if mode == "process":
+        return threads, ProcessPoolExecutor(max_workers=workers)
+    return threads, threads
+
+
 # Global state
 _api_instance: Optional[RetrievalAPI] = None
-_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=20)
+_executor_config: Dict[str, Any] = {
+    "mode": os.environ.get("EXP09_EXECUTOR", "thread"),
+    "workers": int(os.environ.get("EXP09_EXECUTOR_WORKERS", "20")),
+}
+_executor, _analysis_executor = _create_executors(_executor_config["mode"], _executor_config["workers"])
 _metrics: Dict[str, Any] = {
     "total_queries": 0,
     "concurrent_queries": 0,
@@ -100,6 +125,29 @@ class HealthResponse(BaseModel):
     errors: int
 
 
+def configure_executor(mode: str = "thread", workers: int = 20):
+    """Swap the worker pools (e.g. for load-test comparisons); running work finishes on the old pools."""
+    global _executor, _analysis_executor
+    executor, analysis_executor = _create_executors(mode, workers)
+    for old in {_executor, _analysis_executor} - {None}:
+        old.shutdown(wait=False)
+    _executor, _analysis_executor = executor, analysis_executor
+    _executor_config.update(mode=mode, workers=workers)
+
+
+async def _run_blocking(fn: Callable, *args, executor: Optional[Executor] = None):
+    """Run a blocking call off the event loop so one slow query does not stall other clients."""
+    executor = executor or _executor
+    if executor is None:
+        return fn(*args)
+    return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+
+async def _run_analysis(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Narrative coherence analysis on the analysis pool."""
+    return await _run_blocking(_analyze_narrative_coherence, results, executor=_analysis_executor)
+
+
 def _init_api():
     """Initialize the RetrievalAPI instance"""
     global _api_instance
@@ -279,7 +327,7 @@ async def _stress_test_result(
                 max_results=query.max_results,
                 confidence_threshold=query.confidence_threshold
             )
-            semantic_assembly = api.retrieve_context(semantic_query)
+            semantic_assembly = await _run_blocking(api.retrieve_context, semantic_query)
             semantic_ids = set(r.content_id for r in semantic_assembly.results)
             semantic_overlap = len(original_ids & semantic_ids) / max(1, len(original_ids))
             
@@ -299,7 +347,7 @@ async def _stress_test_result(
                 max_results=query.max_results,
                 confidence_threshold=query.confidence_threshold
             )
-            stat7_assembly = api.retrieve_context(stat7_query)
+            stat7_assembly = await _run_blocking(api.retrieve_context, stat7_query)
             stat7_ids = set(r.content_id for r in stat7_assembly.results)
             stat7_overlap = len(original_ids & stat7_ids) / max(1, len(original_ids))
             
@@ -322,7 +370,7 @@ async def _stress_test_result(
                 stat7_hybrid=query.stat7_hybrid,
                 stat7_address=query.stat7_address
             )
-            high_conf_assembly = api.retrieve_context(high_conf_query)
+            high_conf_assembly = await _run_blocking(api.retrieve_context, high_conf_query)
             high_conf_ids = set(r.content_id for r in high_conf_assembly.results)
             high_conf_overlap = len(original_ids & high_conf_ids) / max(1, min(len(original_ids), len(high_conf_ids)))
             
@@ -417,7 +465,16 @@ async def _bob_skeptic_filter(
 async def startup_event():
     """Initialize API on startup"""
     _init_api()
-    logger.info("EXP-09 API Service started")
+    logger.info(f"EXP-09 API Service started (executor={_executor_config['mode']}, workers={_executor_config['workers']})")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release worker pools"""
+    for executor in {_executor, _analysis_executor} - {None}:
+        executor.shutdown(wait=False)
+    if _api_instance is not None:
+        _api_instance.close()
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -471,8 +528,8 @@ async def single_query(request: QueryRequest):
             weight_stat7=request.weight_stat7
         )
         
-        # Execute query
-        assembly = api.retrieve_context(query)
+        # Execute query off the event loop
+        assembly = await _run_blocking(api.retrieve_context, query)
         
         execution_time = (time.time() - start_time) * 1000  # Convert to ms
         
@@ -496,7 +553,7 @@ async def single_query(request: QueryRequest):
         ]
         
         # Analyze narrative coherence
-        narrative_analysis = _analyze_narrative_coherence(results_data)
+        narrative_analysis = await _run_analysis(results_data)
         
         # Bob the Skeptic: Verify suspiciously perfect results
         bob_status, bob_verification_log = await _bob_skeptic_filter(
@@ -561,7 +618,7 @@ async def execute_with_semaphore(query_req: QueryRequest):
         for result in successful_results:
             all_results_flat.extend(result.results)
         
-        batch_narrative_analysis = _analyze_narrative_coherence(all_results_flat)
+        batch_narrative_analysis = await _run_analysis(all_results_flat)
         
         return {
             "batch_id": f"batch_{int(time.time() * 1000)}",
@@ -594,29 +651,28 @@ async def ingest_documents(request: Dict[str, Any]):
     try:
         ingested = 0
         failed = []
+        batch = []
         
         for doc in documents:
             content_id = doc.get("content_id")
-            content = doc.get("content", "")
-            metadata = doc.get("metadata", {})
             
             if not content_id:
                 failed.append({"doc": doc, "error": "Missing content_id"})
                 continue
             
-            # Use the new add_document method
-            success = api.add_document(
-                doc_id=content_id,
-                content=content,
-                metadata=metadata
-            )
-            
+            batch.append({
+                "doc_id": content_id,
+                "content": doc.get("content", ""),
+                "metadata": doc.get("metadata", {})
+            })
+        
+        # Insert the whole request in one bulk call
+        for entry, success in zip(batch, await _run_blocking(api.add_documents, batch)):
             if success:
                 ingested += 1
-                logger.info(f"✓ Ingested: {content_id}")
             else:
-                failed.append({"doc_id": content_id, "error": "Document already exists"})
-                logger.warning(f"Document already exists: {content_id}")
+                failed.append({"doc_id": entry["doc_id"], "error": "Document already exists"})
+                logger.warning(f"Document already exists: {entry['doc_id']}")
         
         logger.info(f"Ingested {ingested}/{len(documents)} documents (context store now has {api.get_context_store_size()} total)")
         
@@ -645,7 +701,8 @@ async def get_metrics():
     """Get current metrics and performance data"""
     return {
         "timestamp": datetime.now().isoformat(),
-        **_metrics
+        **_metrics,
+        "executor": dict(_executor_config)
     }
 
 
@@ -14,12 +14,20 @@
 - No data corruption
 - Throughput: >100 queries/second
 - Narrative coherence preserved
+
+Load-test mode (--load-test) drives 100+ concurrent clients and reports p50/p99
+query latency plus /health latency under load. --compare runs the service
+in-process once per executor mode ("inline" = retrieval on the event loop, the
+pre-offload behaviour, vs "thread") to show the before/after difference.
 """
 
+import argparse
 import json
+import random
+import statistics
+import sys
 import time
 import asyncio
-import aiohttp
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
@@ -44,6 +52,129 @@ def __post_init__(self):
             self.results = {}
 
 
+def _latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    """p50/p99/mean/max of a latency sample, in ms."""
+    if not latencies_ms:
+        return {"count": 0, "p50_ms": 0.0, "p99_ms": 0.0, "mean_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(latencies_ms)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(ordered[len(ordered) // 2], 2),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+        "mean_ms": round(statistics.mean(ordered), 2),
+        "max_ms": round(ordered[-1], 2),
+    }
+
+
+def _load_test_query(client_id: int, request_id: int, vocabulary: List[str]) -> Dict[str, Any]:
+    rng = random.Random(client_id * 7919 + request_id)
+    return {
+        "query_id": f"load_{client_id}_{request_id}",
+        "semantic_query": " ".join(rng.sample(vocabulary, 3)),
+        "confidence_threshold": 0.0,
+    }
+
+
+LOAD_TEST_VOCABULARY = [f"term{i}" for i in range(2000)]
+
+
+def _synthetic_documents(count: int, seed: int = 9) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {"content_id": f"load_doc_{i}", "content": " ".join(rng.choices(LOAD_TEST_VOCABULARY, k=40)),
+         "metadata": {"pack": f"pack-{i % 5}"}}
+        for i in range(count)
+    ]
+
+
+async def _drive_load(send_query, send_health, clients: int, requests_per_client: int) -> Dict[str, Any]:
+    """
+    Run `clients` concurrent query loops plus a health probe; return latency summaries.
+
+    Latency is measured from the moment a request was due (load start for a
+    client's first query, the previous reply for the next one), so time spent
+    waiting for a blocked event loop counts against it.
+    """
+    query_latencies: List[float] = []
+    health_latencies: List[float] = []
+    errors = 0
+    done = asyncio.Event()
+    start = time.perf_counter()
+
+    async def client(client_id: int):
+        nonlocal errors
+        due = start
+        for request_id in range(requests_per_client):
+            status = await send_query(_load_test_query(client_id, request_id, LOAD_TEST_VOCABULARY))
+            finished = time.perf_counter()
+            query_latencies.append((finished - due) * 1000)
+            errors += status != 200
+            due = finished
+
+    async def health_probe():
+        due = start
+        while True:
+            await send_health()
+            finished = time.perf_counter()
+            health_latencies.append((finished - due) * 1000)
+            if done.is_set():
+                break
+            due = finished + 0.01
+            await asyncio.sleep(0.01)
+
+    probe = asyncio.create_task(health_probe())
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    total_s = time.perf_counter() - start
+    done.set()
+    await probe
+
+    return {
+        "clients": clients,
+        "requests": clients * requests_per_client,
+        "errors": errors,
+        "total_time_seconds": round(total_s, 2),
+        "throughput_queries_per_second": round(clients * requests_per_client / total_s, 1),
+        "query_latency": _latency_summary(query_latencies),
+        "health_latency_under_load": _latency_summary(health_latencies),
+    }
+
+
+def compare_executor_modes(clients: int = 100, requests_per_client: int = 5, documents: int = 20000,
+                           modes: tuple = ("inline", "thread"), workers: int = 20) -> Dict[str, Any]:
+    """
+    Load-test the service in-process (ASGI transport, no server) once per executor mode.
+
+    Each mode gets a fresh RetrievalAPI with the same synthetic corpus.
+    """
+    import httpx
+    sys.path.insert(0, str(Path(__file__).parent))
+    import exp09_api_service as service
+
+    corpus = _synthetic_documents(documents)
+    report = {}
+    for mode in modes:
+        service.configure_executor(mode, workers)
+        service._api_instance = None
+
+        async def run():
+            transport = httpx.ASGITransport(app=service.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://exp09", timeout=120) as client:
+                await client.post("/ingest", json={"documents": corpus})
+
+                async def send_query(payload):
+                    return (await client.post("/query", json=payload)).status_code
+
+                async def send_health():
+                    return (await client.get("/health")).status_code
+
+                return await _drive_load(send_query, send_health, clients, requests_per_client)
+
+        report[mode] = asyncio.run(run())
+
+    service.configure_executor("thread", workers)
+    return report
+
+
 class ConcurrencyTester:
     """Test system concurrency and thread safety."""
 
@@ -165,6 +296,35 @@ def test_concurrent_queries(self, num_queries: int = 20) -> Dict[str, Any]:
             "errors": [r["error"] for r in failed_queries if "error" in r]
         }
 
+    def run_load_test(self, clients: int = 100, requests_per_client: int = 5) -> Dict[str, Any]:
+        """Drive a running service with many concurrent clients and report p50/p99 latency."""
+        import requests
+
+        def blocking_post(payload):
+            return requests.post(f"{self.api_base_url}/query", json=payload, timeout=120).status_code
+
+        def blocking_health():
+            return requests.get(f"{self.api_base_url}/health", timeout=120).status_code
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=clients + 1))
+
+            async def send_query(payload):
+                return await loop.run_in_executor(None, blocking_post, payload)
+
+            async def send_health():
+                return await loop.run_in_executor(None, blocking_health)
+
+            return await _drive_load(send_query, send_health, clients, requests_per_client)
+
+        report = asyncio.run(run())
+        try:
+            report["server_executor"] = requests.get(f"{self.api_base_url}/metrics", timeout=5).json().get("executor")
+        except Exception:
+            report["server_executor"] = None
+        return report
+
     def test_data_consistency(self, query_results: List[Dict]) -> Dict[str, Any]:
         """Test for data consistency and race conditions."""
         # Check for duplicate query IDs (would indicate race conditions)
@@ -270,9 +430,43 @@ def save_results(self, output_file: str = None) -> str:
         return str(output_path)
 
 
-def main():
+def _print_load_report(label: str, report: Dict[str, Any]):
+    query, health = report["query_latency"], report["health_latency_under_load"]
+    print(f"   [{label}] {report['requests']} queries from {report['clients']} clients, "
+          f"{report['throughput_queries_per_second']} q/s, errors={report['errors']}")
+    print(f"      query  p50={query['p50_ms']}ms p99={query['p99_ms']}ms")
+    print(f"      health p50={health['p50_ms']}ms p99={health['p99_ms']}ms (under load)")
+
+
+def main(argv: Optional[List[str]] = None):
     """Run EXP-09 concurrency test."""
-    tester = ConcurrencyTester()
+    parser = argparse.ArgumentParser(description="EXP-09 concurrency test")
+    parser.add_argument("--url", default="http://localhost:8000", help="API service base URL")
+    parser.add_argument("--load-test", action="store_true", help="Load-test a running service")
+    parser.add_argument("--compare", action="store_true",
+                        help="Load-test the service in-process per executor mode (inline vs thread)")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=5, help="Queries per client")
+    parser.add_argument("--documents", type=int, default=20000, help="Corpus size for --compare")
+    parser.add_argument("--workers", type=int, default=20, help="Worker threads for --compare")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        print(f"🔄 EXP-09 load test: inline vs thread executor ({args.clients} clients)")
+        report = compare_executor_modes(args.clients, args.requests, args.documents, workers=args.workers)
+        for mode, mode_report in report.items():
+            _print_load_report(mode, mode_report)
+        return True
+
+    tester = ConcurrencyTester(args.url)
+
+    if args.load_test:
+        if not tester.check_api_health():
+            print("❌ API service not running - cannot proceed with load test")
+            return False
+        report = tester.run_load_test(args.clients, args.requests)
+        _print_load_report(str((report.get("server_executor") or {}).get("mode", "server")), report)
+        return report["errors"] == 0
 
     try:
         results = tester.run_comprehensive_test()
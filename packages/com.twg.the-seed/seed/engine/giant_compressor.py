@@ -1,14 +1,34 @@
 from __future__ import annotations
 from typing import List, Dict, Any, Optional, Tuple
 import time, hashlib, math
+import bisect
 import random
 from collections import defaultdict
+import numpy as np
 from embeddings.factory import EmbeddingProviderFactory
 
+try:
+    from .vector_clustering import (
+        unit_rows, density_clusters, minibatch_kmeans, average_linkage_clusters,
+        mean_pairwise_similarity, DEFAULT_BLOCK_ELEMENTS
+    )
+    from .sediment_segments import SedimentSegmentFile
+except ImportError:
+    # Loaded as a top-level module (seed/engine on sys.path)
+    from vector_clustering import (
+        unit_rows, density_clusters, minibatch_kmeans, average_linkage_clusters,
+        mean_pairwise_similarity, DEFAULT_BLOCK_ELEMENTS
+    )
+    from sediment_segments import SedimentSegmentFile
+
 class GiantCompressor:
     """The Giant: compacts raw fragments into clustered sediment strata.
 
     Enhanced with semantic clustering using embedding similarity and density-based clustering.
+
+    The "vectorized" clustering backend (default) runs each method over a NumPy
+    embedding matrix in blocks (see vector_clustering); the "reference" backend
+    keeps the original pure-Python methods.
     """
     def __init__(self, sediment_store: "SedimentStore", embed_provider=None, config: Optional[Dict[str, Any]] = None):
         self.sediment_store = sediment_store
@@ -25,6 +45,11 @@ def __init__(self, sediment_store: "SedimentStore", embed_provider=None, config:
         self.min_cluster_size = self.config.get("min_cluster_size", 3)
         self.max_cluster_distance = self.config.get("max_cluster_distance", 0.7)
         self.clustering_method = self.config.get("clustering_method", "density_based")  # density_based, kmeans, hierarchical
+        self.clustering_backend = self.config.get("clustering_backend", "vectorized")  # vectorized, reference
+        self.block_elements = self.config.get("cluster_block_elements", DEFAULT_BLOCK_ELEMENTS)
+        self.kmeans_batch_size = self.config.get("kmeans_batch_size", 1024)
+        self.kmeans_max_iter = self.config.get("kmeans_max_iter", 100)
+        self._rng = np.random.default_rng(self.config.get("random_seed"))
 
     def stomp(self, raw_fragments: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Compress fragments using semantic clustering."""
@@ -48,11 +73,14 @@ def stomp(self, raw_fragments: List[Dict[str, Any]]) -> Dict[str, Any]:
             "strata_updates": 1,
             "stratum_id": stratum_id,
             "clustering_method": self.clustering_method,
+            "clustering_backend": self.clustering_backend,
             "avg_cluster_size": sum(len(c["fragments"]) for c in clusters) / len(clusters) if clusters else 0,
         }
 
     def _semantic_cluster(self, fragments: List[Dict[str, Any]], embeddings: List[List[float]]) -> List[Dict[str, Any]]:
         """Perform semantic clustering based on embedding similarity."""
+        if self.clustering_backend == "vectorized" and self.clustering_method in ("density_based", "kmeans", "hierarchical"):
+            return self._vectorized_clustering(fragments, embeddings)
         if self.clustering_method == "density_based":
             return self._density_based_clustering(fragments, embeddings)
         elif self.clustering_method == "kmeans":
@@ -172,6 +200,37 @@ def _hierarchical_clustering(self, fragments: List[Dict[str, Any]], embeddings:
 
         return final_clusters
 
+    def _vectorized_clustering(self, fragments: List[Dict[str, Any]], embeddings: List[List[float]]) -> List[Dict[str, Any]]:
+        """Run the configured method on the blocked NumPy backend."""
+        if len(fragments) < self.min_cluster_size:
+            return self._create_single_cluster(fragments)
+
+        unit = unit_rows(embeddings)
+
+        def build(indices: List[int]) -> Dict[str, Any]:
+            return self._create_cluster([fragments[i] for i in indices], indices, unit[indices])
+
+        if self.clustering_method == "density_based":
+            groups, noise = density_clusters(unit, self.max_cluster_distance, self.min_cluster_size,
+                                             self.block_elements)
+            return [build(g) for g in groups] + [build([i]) for i in noise]
+
+        if self.clustering_method == "kmeans":
+            n_clusters = min(max(1, len(fragments) // 5), 10)
+            assignments = minibatch_kmeans(unit, n_clusters, self._rng, batch_size=self.kmeans_batch_size,
+                                           max_iter=self.kmeans_max_iter, block_elements=self.block_elements)
+            order = np.argsort(assignments, kind="stable")
+            boundaries = np.flatnonzero(np.diff(assignments[order])) + 1
+            return [build(g.tolist()) for g in np.split(order, boundaries) if len(g)]
+
+        clusters = []
+        for group in average_linkage_clusters(unit, self.max_cluster_distance, self.block_elements):
+            if len(group) >= self.min_cluster_size:
+                clusters.append(build(group))
+            else:
+                clusters.extend(build([i]) for i in group)
+        return clusters
+
     def _simple_clustering(self, fragments: List[Dict[str, Any]], embeddings: List[List[float]]) -> List[Dict[str, Any]]:
         """Simple similarity-based clustering as fallback."""
         if len(fragments) <= self.min_cluster_size:
@@ -327,14 +386,21 @@ def _cluster_distance(self, cluster1: List[int], cluster2: List[int], embeddings
 
         return total_distance / count if count > 0 else float('inf')
 
-    def _create_cluster(self, fragments: List[Dict[str, Any]], indices: List[int]) -> Dict[str, Any]:
-        """Create cluster metadata."""
+    def _create_cluster(self, fragments: List[Dict[str, Any]], indices: List[int],
+                        unit_vectors: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Create cluster metadata.
+
+        unit_vectors, when given, are the members' normalized embeddings; the average
+        similarity is then taken from them instead of re-embedding every fragment.
+        """
         # Generate cluster ID based on content hash
         concat = " ".join(f.get("text", "") for f in fragments)
         digest = hashlib.sha256(concat.encode()).hexdigest()[:10]
 
         # Calculate cluster quality metrics
-        if len(fragments) > 1:
+        if len(fragments) > 1 and unit_vectors is not None:
+            avg_similarity = mean_pairwise_similarity(unit_vectors)
+        elif len(fragments) > 1:
             embeddings = [self.embed_provider.embed_text(f.get("text", "")) for f in fragments]
             avg_similarity = sum(
                 self._cosine_similarity(embeddings[i], embeddings[j])
@@ -359,8 +425,33 @@ def _create_single_cluster(self, fragments: List[Dict[str, Any]]) -> List[Dict[s
         return [self._create_cluster(fragments, list(range(len(fragments))))]
 
 class SedimentStore:
-    def __init__(self):
-        self.strata = []  # list of dict
+    """Strata of compacted clusters, indexed by stratum id, fragment id and creation time.
+
+    With a path, each stratum is appended to a SedimentSegmentFile and the store
+    reloads from it on start. Only stratum headers are read back; cluster bodies
+    stay on disk until a stratum is requested.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self._strata: List[Dict[str, Any]] = []  # bodies ("clusters") present once loaded
+        self._bodies: Dict[int, Tuple[int, int]] = {}  # position -> (offset, length) on disk
+        self._positions: Dict[str, int] = {}
+        self._fragments: Dict[str, Tuple[int, int, int]] = {}  # fragment id -> (stratum, cluster, fragment)
+        self._cluster_ids: List[List[str]] = []
+        self._times: List[Tuple[float, int]] = []
+        self._cluster_count = 0
+        self._fragment_count = 0
+
+        self._segments = SedimentSegmentFile(path) if path else None
+        if self._segments:
+            for header, offset, length in self._segments.scan():
+                cluster_ids, fragment_ids = header.pop("cluster_ids"), header.pop("fragment_ids")
+                self._index(header, cluster_ids, fragment_ids)
+                self._bodies[len(self._strata) - 1] = (offset, length)
+
+    @property
+    def strata(self) -> List[Dict[str, Any]]:
+        """All strata in append order (loads any bodies still on disk)."""
+        return [self._load(position) for position in range(len(self._strata))]
 
     def append_cluster(self, cluster: Dict[str, Any]) -> str:
         """Legacy method for backward compatibility."""
@@ -377,7 +468,7 @@ def append_clusters(self, clusters: List[Dict[str, Any]]) -> str:
         compaction_ratio = total_fragments / len(clusters) if clusters else 1.0
 
         stratum = {
-            "stratum_id": f"stratum_{len(self.strata)+1}",
+            "stratum_id": f"stratum_{len(self._strata)+1}",
             "clusters": clusters,
             "total_fragments": total_fragments,
             "cluster_count": len(clusters),
@@ -386,24 +477,82 @@ def append_clusters(self, clusters: List[Dict[str, Any]]) -> str:
             "compaction_ratio": compaction_ratio,
             "created_at": time.time(),
         }
-        self.strata.append(stratum)
+        cluster_ids = [cluster.get("id") for cluster in clusters]
+        fragment_ids = [[f.get("id") if isinstance(f, dict) else None for f in cluster.get("fragments", [])]
+                        for cluster in clusters]
+
+        if self._segments:
+            header = {key: value for key, value in stratum.items() if key != "clusters"}
+            header["cluster_ids"] = cluster_ids
+            header["fragment_ids"] = fragment_ids
+            self._segments.append(header, clusters)
+
+        self._index(stratum, cluster_ids, fragment_ids)
         return stratum["stratum_id"]
 
     def get_stratum(self, stratum_id: str) -> Optional[Dict[str, Any]]:
         """Get stratum by ID."""
-        for stratum in self.strata:
-            if stratum["stratum_id"] == stratum_id:
-                return stratum
-        return None
+        position = self._positions.get(stratum_id)
+        return self._load(position) if position is not None else None
 
     def get_all_strata(self) -> List[Dict[str, Any]]:
         """Get all strata."""
-        return self.strata.copy()
+        return self.strata
+
+    def get_strata_between(self, start: float, end: float) -> List[Dict[str, Any]]:
+        """Strata with start <= created_at <= end, oldest first."""
+        low = bisect.bisect_left(self._times, (start, -1))
+        high = bisect.bisect_right(self._times, (end, len(self._strata)))
+        return [self._load(position) for _, position in self._times[low:high]]
+
+    def locate_fragment(self, fragment_id: str) -> Optional[Dict[str, str]]:
+        """Stratum and cluster holding a fragment, without loading any body."""
+        location = self._fragments.get(fragment_id)
+        if location is None:
+            return None
+        stratum, cluster, _ = location
+        return {
+            "stratum_id": self._strata[stratum]["stratum_id"],
+            "cluster_id": self._cluster_ids[stratum][cluster],
+        }
+
+    def get_fragment(self, fragment_id: str) -> Optional[Dict[str, Any]]:
+        """Get a stored fragment by its ID (the latest copy if stored more than once)."""
+        location = self._fragments.get(fragment_id)
+        if location is None:
+            return None
+        stratum, cluster, fragment = location
+        return self._load(stratum)["clusters"][cluster]["fragments"][fragment]
 
     def get_cluster_count(self) -> int:
         """Get total number of clusters across all strata."""
-        return sum(len(stratum["clusters"]) for stratum in self.strata)
+        return self._cluster_count
 
     def get_fragment_count(self) -> int:
         """Get total number of fragments across all strata."""
-        return sum(stratum["total_fragments"] for stratum in self.strata)
+        return self._fragment_count
+
+    def close(self):
+        """Close the segment file, if any."""
+        if self._segments:
+            self._segments.close()
+
+    def _index(self, stratum: Dict[str, Any], cluster_ids: List[str], fragment_ids: List[List[Optional[str]]]):
+        position = len(self._strata)
+        self._strata.append(stratum)
+        self._positions[stratum["stratum_id"]] = position
+        self._cluster_ids.append(cluster_ids)
+        bisect.insort(self._times, (stratum["created_at"], position))
+        for cluster, ids in enumerate(fragment_ids):
+            for fragment, fragment_id in enumerate(ids):
+                if fragment_id is not None:
+                    self._fragments[fragment_id] = (position, cluster, fragment)
+        self._cluster_count += stratum["cluster_count"]
+        self._fragment_count += stratum["total_fragments"]
+
+    def _load(self, position: int) -> Dict[str, Any]:
+        stratum = self._strata[position]
+        if "clusters" not in stratum:
+            offset, length = self._bodies.pop(position)
+            stratum["clusters"] = self._segments.read_body(offset, length)
+        return stratum
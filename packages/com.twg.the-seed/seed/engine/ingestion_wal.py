@@ -0,0 +1,233 @@
+"""
+Ingestion WAL - Durable Write-Ahead Log for StreamingIngestionPipeline
+
+Fragments are appended to segment files before they enter the in-memory
+queue, one record each:
+
+    u32 payload_length | u64 lsn | u32 crc32(payload) | payload JSON
+
+Segments are named after their first log sequence number (LSN) and rotate at
+segment_max_bytes. commit(lsn) makes a record durable with group commit: one
+fsync covers every record appended before it, so concurrent producers (or a
+whole ingest_batch) share a single flush.
+
+Consumers ack() LSNs once processing succeeds. The committed offset is the
+lowest LSN not yet acknowledged; it is persisted to consumer.offset and every
+segment wholly below it is deleted. On restart replay() yields the records
+from the committed offset on. Records that exhaust their retries go to a
+dead-letter segment with their original payload.
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_RECORD = struct.Struct('<IQI')
+_SEGMENT_PREFIX = 'wal-'
+_SEGMENT_SUFFIX = '.log'
+_OFFSET_FILE = 'consumer.offset'
+_DEAD_LETTER_FILE = 'dead-letter.log'
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _read_records(path: str) -> Iterator[Tuple[int, Dict[str, Any], int]]:
+    """Yield (lsn, payload, end_offset) for each intact record; stops at a torn or corrupt tail."""
+    with open(path, 'rb') as f:
+        end = 0
+        while True:
+            prefix = f.read(_RECORD.size)
+            if len(prefix) < _RECORD.size:
+                return
+            length, lsn, checksum = _RECORD.unpack(prefix)
+            body = f.read(length)
+            if len(body) < length or zlib.crc32(body) != checksum:
+                return
+            end += _RECORD.size + length
+            yield lsn, json.loads(body), end
+
+
+class WriteAheadLog:
+    """Segmented, append-only log with group-commit fsync and acknowledged consumer offsets."""
+
+    def __init__(self, directory: str, segment_max_bytes: int = 64 * 1024 * 1024, fsync: bool = True):
+        """
+        Open (or create) a WAL directory, recovering from a torn last record.
+
+        Args:
+            directory: Directory holding segments, the offset and the dead-letter segment
+            segment_max_bytes: Size at which the active segment rotates
+            fsync: False flushes to the OS on commit without forcing to disk
+        """
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+
+        self.stats = {"appended": 0, "fsyncs": 0, "acked": 0, "dead_lettered": 0, "segments_deleted": 0}
+        self._lock = threading.Lock()
+        self._acked = set()
+        self.committed_offset = self._load_offset()
+        self._segments: List[Tuple[int, str]] = sorted(
+            (int(name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)]), os.path.join(directory, name))
+            for name in os.listdir(directory)
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX)
+        )
+
+        self._next_lsn = self.committed_offset
+        if self._segments:
+            last_path = self._segments[-1][1]
+            end = 0
+            self._next_lsn = max(self._next_lsn, self._segments[-1][0])
+            for lsn, _, end in _read_records(last_path):
+                self._next_lsn = max(self._next_lsn, lsn + 1)
+            if end < os.path.getsize(last_path):
+                with open(last_path, 'r+b') as f:
+                    f.truncate(end)
+            self._writer = open(last_path, 'ab')
+        else:
+            self._writer = self._open_segment(self._next_lsn)
+        self._durable_lsn = self._next_lsn - 1
+        self._dead_letters = None
+        self._delete_consumed_segments()  # left behind by a crash between ack and delete
+
+    # ------------------------------------------------------------------ writes
+
+    def append(self, payload: Dict[str, Any]) -> int:
+        """Buffer one record and return its LSN; it is durable once commit() covers it."""
+        body = _encode(payload)
+        with self._lock:
+            if self._writer.tell() >= self.segment_max_bytes:
+                self._rotate()
+            lsn = self._next_lsn
+            self._next_lsn += 1
+            self._writer.write(_RECORD.pack(len(body), lsn, zlib.crc32(body)))
+            self._writer.write(body)
+            self.stats["appended"] += 1
+            return lsn
+
+    def commit(self, lsn: int):
+        """Block until the record at lsn (and every earlier one) is on disk."""
+        if self._durable_lsn >= lsn:
+            return
+        with self._lock:
+            if self._durable_lsn >= lsn:
+                return  # covered by another producer's fsync while we waited
+            self._sync()
+
+    def ack(self, lsns: Iterable[int]):
+        """Acknowledge processed records and advance the committed offset past contiguous acks."""
+        with self._lock:
+            fresh = [lsn for lsn in lsns if lsn >= self.committed_offset and lsn not in self._acked]
+            self._acked.update(fresh)
+            self.stats["acked"] += len(fresh)
+            offset = self.committed_offset
+            while offset in self._acked:
+                self._acked.discard(offset)
+                offset += 1
+            if offset == self.committed_offset:
+                return
+            self.committed_offset = offset
+            self._store_offset()
+            self._delete_consumed_segments()
+
+    def dead_letter(self, lsn: int, payload: Dict[str, Any]):
+        """Durably record a payload that exhausted its retries (the caller still acks its LSN)."""
+        body = _encode(payload)
+        with self._lock:
+            if self._dead_letters is None:
+                self._dead_letters = open(os.path.join(self.directory, _DEAD_LETTER_FILE), 'ab')
+            self._dead_letters.write(_RECORD.pack(len(body), lsn, zlib.crc32(body)))
+            self._dead_letters.write(body)
+            self._dead_letters.flush()
+            if self.fsync:
+                os.fsync(self._dead_letters.fileno())
+            self.stats["dead_lettered"] += 1
+
+    # ------------------------------------------------------------------- reads
+
+    def replay(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (lsn, payload) for every record at or past the committed offset, in LSN order.
+
+        Stops at the records logged when the call began; later appends were queued by their own ingest.
+        """
+        with self._lock:
+            self._writer.flush()
+            segments = list(self._segments)
+            start = self.committed_offset
+            end = self._next_lsn
+        for index, (first_lsn, path) in enumerate(segments):
+            if index + 1 < len(segments) and segments[index + 1][0] <= start:
+                continue  # wholly consumed
+            for lsn, payload, _ in _read_records(path):
+                if lsn >= end:
+                    return
+                if lsn >= start:
+                    yield lsn, payload
+
+    def read_dead_letters(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (lsn, payload) for every dead-lettered record."""
+        path = os.path.join(self.directory, _DEAD_LETTER_FILE)
+        if os.path.exists(path):
+            for lsn, payload, _ in _read_records(path):
+                yield lsn, payload
+
+    def pending_count(self) -> int:
+        """Records appended but not yet acknowledged."""
+        return self._next_lsn - self.committed_offset - len(self._acked)
+
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def close(self):
+        with self._lock:
+            self._sync()
+            self._writer.close()
+            if self._dead_letters is not None:
+                self._dead_letters.close()
+                self._dead_letters = None
+
+    # ---------------------------------------------------------------- internal
+
+    def _sync(self):
+        self._writer.flush()
+        if self.fsync:
+            os.fsync(self._writer.fileno())
+        self._durable_lsn = self._next_lsn - 1
+        self.stats["fsyncs"] += 1
+
+    def _rotate(self):
+        self._sync()
+        self._writer.close()
+        self._writer = self._open_segment(self._next_lsn)
+
+    def _open_segment(self, first_lsn: int):
+        path = os.path.join(self.directory, f"{_SEGMENT_PREFIX}{first_lsn:020d}{_SEGMENT_SUFFIX}")
+        self._segments.append((first_lsn, path))
+        return open(path, 'ab')
+
+    def _delete_consumed_segments(self):
+        # A segment is consumed once the next one starts at or below the committed offset
+        while len(self._segments) > 1 and self._segments[1][0] <= self.committed_offset:
+            _, path = self._segments.pop(0)
+            os.remove(path)
+            self.stats["segments_deleted"] += 1
+
+    def _load_offset(self) -> int:
+        try:
+            with open(os.path.join(self.directory, _OFFSET_FILE)) as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _store_offset(self):
+        # Not fsynced: a lost offset only replays already-processed records (at-least-once)
+        path = os.path.join(self.directory, _OFFSET_FILE)
+        with open(path + '.tmp', 'w') as f:
+            f.write(str(self.committed_offset))
+        os.replace(path + '.tmp', path)
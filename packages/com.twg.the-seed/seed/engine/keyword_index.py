@@ -0,0 +1,122 @@
+"""
+Keyword Index - Inverted Index with BM25 Scoring
+
+Backs RetrievalAPI's context-store keyword search (the path /query takes when
+no embedding provider is configured). Documents are tokenized once on insert;
+a query touches only the postings of its own terms.
+"""
+
+from typing import List, Dict, Any, Tuple
+import heapq
+import json
+import math
+import re
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens (shared by documents and queries)."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """
+    Incremental inverted index: term -> {doc_id: term frequency}.
+
+    search() returns the top-k documents by (matched query terms, BM25 score),
+    selected with a heap rather than a full sort.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
+
+    def add(self, doc_id: str, text: str):
+        """Index a document (ids are write-once, like the context store)."""
+        if doc_id in self.doc_lengths:
+            raise KeyError(f"Document already indexed: {doc_id}")
+
+        tokens = tokenize(text)
+        term_counts: Dict[str, int] = {}
+        for token in tokens:
+            term_counts[token] = term_counts.get(token, 0) + 1
+        for term, count in term_counts.items():
+            self.postings.setdefault(term, {})[doc_id] = count
+
+        self.doc_lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (non-negative variant)."""
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.doc_lengths) - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, k: int) -> List[Tuple[str, int, float]]:
+        """
+        Return up to k (doc_id, matched_terms, bm25_score), best first.
+
+        matched_terms counts query tokens (with repeats) present in the document.
+        """
+        query_terms = tokenize(query)
+        if not query_terms or not self.doc_lengths or k <= 0:
+            return []
+
+        avg_length = self.total_length / len(self.doc_lengths) or 1.0
+        matched: Dict[str, int] = {}
+        scores: Dict[str, float] = {}
+
+        for term in query_terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for doc_id, tf in postings.items():
+                length_norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + length_norm)
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+
+        top = heapq.nlargest(k, scores, key=lambda doc_id: (matched[doc_id], scores[doc_id]))
+        return [(doc_id, matched[doc_id], scores[doc_id]) for doc_id in top]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot."""
+        return {
+            "format_version": self.FORMAT_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "postings": self.postings,
+            "doc_lengths": self.doc_lengths,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BM25Index":
+        """Restore a snapshot produced by to_dict()."""
+        if data.get("format_version") != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported keyword index format: {data.get('format_version')}")
+        index = cls(k1=data["k1"], b=data["b"])
+        index.postings = data["postings"]
+        index.doc_lengths = data["doc_lengths"]
+        index.total_length = sum(index.doc_lengths.values())
+        return index
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
@@ -1,6 +1,12 @@
 from __future__ import annotations
-from typing import Dict, Any, List
-import time, hashlib
+from typing import Dict, Any, List, Optional, Tuple
+import heapq, math, os, tempfile, time, hashlib
+
+try:
+    from .sediment_segments import SedimentSegmentFile
+except ImportError:
+    # Loaded as a top-level module (seed/engine on sys.path)
+    from sediment_segments import SedimentSegmentFile
 
 class MeltLayer:
     """Melt Layer: retires clusters into molten glyphs.
@@ -41,13 +47,188 @@ def _prov_hash(self, fragments: List[Dict[str, Any]]) -> str:
         concat = "".join(f.get("text", "") for f in fragments)
         return "sha256:" + hashlib.sha256(concat.encode()).hexdigest()
 
+class _MagmaEntry:
+    __slots__ = ("order", "version", "key", "heat", "heated_at", "glyph", "location")
+
+    def __init__(self, order: int, heat: float, heated_at: float, half_life_s: float, glyph: Dict[str, Any]):
+        self.order = order
+        self.version = 0
+        self.glyph: Optional[Dict[str, Any]] = glyph
+        self.location: Optional[Tuple[int, int]] = None
+        self.set_heat(heat, heated_at, half_life_s)
+
+    def set_heat(self, heat: float, heated_at: float, half_life_s: float):
+        self.heat = heat
+        self.heated_at = heated_at
+        # log2 of the heat extrapolated to t = 0; decay shifts every glyph equally
+        self.key = math.log2(heat) + heated_at / half_life_s if heat > 0 else -math.inf
+
+    def heat_at(self, now: float, half_life_s: float) -> float:
+        return self.heat * 2.0 ** ((self.heated_at - now) / half_life_s)
+
+
 class MagmaStore:
-    def __init__(self):
-        self.glyphs = []
+    """Molten glyphs ordered by decayed heat.
+
+    A glyph's heat (its "heat" or "heat_seed", set at "created_epoch") halves every
+    half_life_s seconds. All glyphs decay at the same rate, so their order never
+    changes with time: it is fixed at insert by log2(heat) + heated_at / half_life_s.
+    Heaps on that key give select_hot in O(k log n), and the decayed "heat" is only
+    computed for the glyphs handed out.
+
+    With max_in_memory set, the coldest glyphs spill to an on-disk tier (a scratch
+    segment file at spill_path, or a temporary file) and are read back only when
+    selected.
+    """
+    def __init__(self, max_in_memory: Optional[int] = None, spill_path: Optional[str] = None,
+                 half_life_s: float = 86400.0):
+        if max_in_memory is not None and max_in_memory < 1:
+            raise ValueError("max_in_memory must be at least 1")
+        self.max_in_memory = max_in_memory
+        self.spill_path = spill_path
+        self.half_life_s = half_life_s
+
+        self._entries: Dict[int, _MagmaEntry] = {}
+        self._by_id: Dict[Any, int] = {}
+        self._hot: List[Tuple[float, int, int]] = []      # (-key, -order, version), resident
+        self._cold: List[Tuple[float, int, int]] = []     # (key, order, version), resident
+        self._spilled: List[Tuple[float, int, int]] = []  # (-key, -order, version), on disk
+        self._resident = 0
+        self._next_order = 0
+        self._segments: Optional[SedimentSegmentFile] = None
+        self._owns_spill_file = False
+
+    @property
+    def glyphs(self) -> List[Dict[str, Any]]:
+        """Every glyph in insertion order, spilled ones read back from disk."""
+        return [self._load(self._entries[order]) for order in sorted(self._entries)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resident_count(self) -> int:
+        return self._resident
+
+    def spilled_count(self) -> int:
+        return len(self._entries) - self._resident
 
     def add_glyph(self, glyph: Dict[str, Any]):
-        self.glyphs.append(glyph)
+        """Add a glyph; a repeated id is kept too, and the id resolves to the newest."""
+        now = time.time()
+        heat = glyph.get("heat", glyph.get("heat_seed", 0.0))
+        entry = _MagmaEntry(self._next_order, heat, glyph.get("created_epoch", now), self.half_life_s, glyph)
+        self._next_order += 1
+        self._entries[entry.order] = entry
+        if "id" in glyph:
+            self._by_id[glyph["id"]] = entry.order
+        self._resident += 1
+        self._push_resident(entry)
+        if self.max_in_memory is not None and self._resident > self.max_in_memory:
+            self._spill(self._resident - self.max_in_memory + self.max_in_memory // 10)
 
     def select_hot(self, limit: int) -> List[Dict[str, Any]]:
-        # TODO: sort by heat / recency
-        return self.glyphs[-limit:]
\ No newline at end of file
+        """The limit hottest glyphs, hottest first, as copies carrying the decayed "heat"."""
+        now = time.time()
+        taken: List[Tuple[List, Tuple[float, int, int]]] = []
+        while len(taken) < limit:
+            resident = self._peek(self._hot, resident=True)
+            spilled = self._peek(self._spilled, resident=False)
+            if resident is None and spilled is None:
+                break
+            heap = self._hot if spilled is None or (resident is not None and resident < spilled) else self._spilled
+            taken.append((heap, heapq.heappop(heap)))
+
+        selected = []
+        for heap, item in taken:
+            heapq.heappush(heap, item)
+            selected.append(self._decayed(self._entries[-item[1]], now))
+        return selected
+
+    def get_glyph(self, glyph_id: Any) -> Optional[Dict[str, Any]]:
+        """The newest glyph with this id, carrying its decayed "heat"."""
+        order = self._by_id.get(glyph_id)
+        return None if order is None else self._decayed(self._entries[order], time.time())
+
+    def reheat(self, glyph_id: Any, amount: float) -> Optional[float]:
+        """Add heat to a glyph now; returns its new heat, or None for an unknown id."""
+        order = self._by_id.get(glyph_id)
+        if order is None:
+            return None
+        entry = self._entries[order]
+        now = time.time()
+        entry.set_heat(entry.heat_at(now, self.half_life_s) + amount, now, self.half_life_s)
+        entry.version += 1
+        if entry.glyph is not None:
+            self._push_resident(entry)
+        else:
+            heapq.heappush(self._spilled, (-entry.key, -entry.order, entry.version))
+        self._compact()
+        return entry.heat
+
+    def close(self):
+        """Close the spill file; a temporary one is deleted."""
+        if self._segments is not None:
+            self._segments.close()
+            self._segments = None
+            if self._owns_spill_file:
+                os.remove(self.spill_path)
+
+    def _decayed(self, entry: _MagmaEntry, now: float) -> Dict[str, Any]:
+        glyph = dict(self._load(entry))
+        glyph["heat"] = entry.heat_at(now, self.half_life_s)
+        return glyph
+
+    def _load(self, entry: _MagmaEntry) -> Dict[str, Any]:
+        if entry.glyph is not None:
+            return entry.glyph
+        return self._segments.read_body(*entry.location)
+
+    def _push_resident(self, entry: _MagmaEntry):
+        heapq.heappush(self._hot, (-entry.key, -entry.order, entry.version))
+        heapq.heappush(self._cold, (entry.key, entry.order, entry.version))
+
+    def _peek(self, heap: List[Tuple[float, int, int]], resident: bool) -> Optional[Tuple[float, int, int]]:
+        """Top live item of a heap, discarding stale ones (superseded or moved tier)."""
+        while heap:
+            if self._live(heap[0], resident):
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def _spill(self, count: int):
+        """Move the count coldest resident glyphs to the disk tier."""
+        if self._segments is None:
+            if self.spill_path is None:
+                fd, self.spill_path = tempfile.mkstemp(prefix="magma_", suffix=".seg")
+                os.close(fd)
+                self._owns_spill_file = True
+            self._segments = SedimentSegmentFile(self.spill_path, truncate=True)
+
+        for _ in range(count):
+            item = self._peek(self._cold, resident=True)
+            if item is None:
+                break
+            heapq.heappop(self._cold)
+            entry = self._entries[item[1]]
+            entry.location = self._segments.append({"order": entry.order}, entry.glyph)
+            entry.glyph = None
+            self._resident -= 1
+            heapq.heappush(self._spilled, (-entry.key, -entry.order, entry.version))
+        self._compact()
+
+    def _compact(self):
+        """Rebuild heaps once stale items outnumber live ones."""
+        spilled = len(self._entries) - self._resident
+        if len(self._hot) > 2 * self._resident + 1024:
+            self._hot = [i for i in self._hot if self._live(i, True)]
+            heapq.heapify(self._hot)
+        if len(self._cold) > 2 * self._resident + 1024:
+            self._cold = [i for i in self._cold if self._live(i, True)]
+            heapq.heapify(self._cold)
+        if len(self._spilled) > 2 * spilled + 1024:
+            self._spilled = [i for i in self._spilled if self._live(i, False)]
+            heapq.heapify(self._spilled)
+
+    def _live(self, item: Tuple[float, int, int], resident: bool) -> bool:
+        entry = self._entries[abs(item[1])]
+        return entry.version == item[2] and (entry.glyph is not None) == resident
@@ -0,0 +1,1792 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmarks - Scalar Reference vs Optimized Engine Paths
+
+Each benchmark times the original pure-Python path of an engine component
+against its optimized replacement at increasing scales, and checks that both
+produce the same answers.
+
+Usage:
+    python performance_benchmarks.py                      # List benchmarks
+    python performance_benchmarks.py embedding_matrix     # Quick scales
+    python performance_benchmarks.py embedding_matrix --full
+    python performance_benchmarks.py ann_index --json
+"""
+
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+import numpy as np
+
+# Add engine and package root to path for imports (semantic_anchors uses relative imports)
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parents[2]))
+
+from embeddings.base_provider import EmbeddingProvider
+from embeddings.embedding_matrix import EmbeddingMatrix, batch_cosine_similarity
+from embeddings.ann_index import IVFFlatIndex, FaissIndex, FAISS_AVAILABLE
+from embeddings.sharded_index import ShardedIndex
+from embeddings.cached_provider import CachedEmbeddingProvider
+from embeddings.local_provider import LocalEmbeddingProvider
+from keyword_index import BM25Index
+from stat7_rag_bridge import (
+    Realm, RAGDocument, STAT7ColumnarStore, generate_random_stat7_address, retrieve,
+    _retrieve_scalar,
+)
+from stat7_experiments import generate_random_bitchain, compute_addresses, canonical_serialize
+from bitchain_binary import write_bitchains, BitChainFileReader
+from exp06_entanglement_detection import (
+    EntanglementDetector, compute_entanglement_score, extract_features, score_pair_block
+)
+from giant_compressor import GiantCompressor, SedimentStore
+from conflict_detector import ConflictDetector
+from castle_graph import CastleGraph
+from streaming_ingestion_pipeline import StreamingIngestionPipeline, AsyncStreamingIngestionPipeline, Fragment, BatchContext
+from batch_evaluation import BatchEvaluationEngine, ReplayMode
+from ingestion_wal import WriteAheadLog
+from summarization_ladder import SummarizationLadder, SegmentRungStore
+from melt_layer import MagmaStore
+import evaporation
+from evaporation import EvaporationEngine, CloudStore
+from seed.engine.semantic_anchors import SemanticAnchorGraph
+from seed.engine.retrieval_api import QueryResultCache, ContextAssembly, RetrievalQuery, RetrievalMode
+
+
+def _random_unit_vectors(count: int, dimension: int, rng: random.Random) -> List[List[float]]:
+    vectors = []
+    for _ in range(count):
+        vector = [rng.gauss(0.0, 1.0) for _ in range(dimension)]
+        norm = sum(x * x for x in vector) ** 0.5
+        vectors.append([x / norm for x in vector])
+    return vectors
+
+
+def _timed(fn: Callable[[], Any], repeats: int) -> Dict[str, Any]:
+    """Run fn repeats times; return latency stats in ms plus the last result."""
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "mean_ms": statistics.mean(timings),
+        "p50_ms": timings[len(timings) // 2],
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+        "result": result,
+    }
+
+
+# ============================================================================
+# Embedding matrix vs pairwise calculate_similarity (RetrievalAPI anchors)
+# ============================================================================
+
+def benchmark_embedding_matrix(scales: List[int], dimension: int = 128, k: int = 10,
+                               queries: int = 5, threshold: float = 0.0,
+                               seed: int = 42) -> List[Dict[str, Any]]:
+    """Top-k anchor search: per-pair Python cosine loop vs one matrix-vector product."""
+    rng = random.Random(seed)
+    calculate_similarity = EmbeddingProvider.calculate_similarity
+    results = []
+
+    for scale in scales:
+        embeddings = _random_unit_vectors(scale, dimension, rng)
+        ids = [f"anchor_{i}" for i in range(scale)]
+        query_vectors = _random_unit_vectors(queries, dimension, rng)
+
+        build_start = time.perf_counter()
+        matrix = EmbeddingMatrix(dimension, initial_capacity=scale)
+        matrix.extend(zip(ids, embeddings))
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        def scalar_search(query):
+            scored = []
+            for anchor_id, embedding in zip(ids, embeddings):
+                similarity = calculate_similarity(None, query, embedding)
+                if similarity >= threshold:
+                    scored.append((anchor_id, similarity))
+            scored.sort(key=lambda item: item[1], reverse=True)
+            return scored[:k]
+
+        scalar_runs = [_timed(lambda q=q: scalar_search(q), 1) for q in query_vectors]
+        vector_runs = [_timed(lambda q=q: matrix.top_k(q, k, threshold=threshold), 3)
+                       for q in query_vectors]
+
+        top_k_match = all(
+            [item_id for item_id, _ in s["result"]] == [item_id for item_id, _ in v["result"]]
+            for s, v in zip(scalar_runs, vector_runs)
+        )
+        scalar_ms = statistics.mean(r["mean_ms"] for r in scalar_runs)
+        vector_ms = statistics.mean(r["mean_ms"] for r in vector_runs)
+
+        results.append({
+            "scale": scale,
+            "dimension": dimension,
+            "build_ms": round(build_ms, 3),
+            "scalar_query_ms": round(scalar_ms, 3),
+            "matrix_query_ms": round(vector_ms, 3),
+            "speedup": round(scalar_ms / max(vector_ms, 1e-9), 1),
+            "matrix_memory_mb": round(matrix.get_memory_bytes() / (1024 * 1024), 2),
+            "top_k_match": top_k_match,
+        })
+
+    return results
+
+
+# ============================================================================
+# ANN index recall@k vs latency (SemanticAnchorGraph / RetrievalAPI backends)
+# ============================================================================
+
+def _clustered_unit_vectors(count: int, dimension: int, clusters: int,
+                            np_rng) -> "np.ndarray":
+    """Anchors in real corpora cluster by topic; uniform noise is the ANN worst case."""
+    centers = np_rng.standard_normal((clusters, dimension)).astype(np.float32)
+    labels = np_rng.integers(0, clusters, size=count)
+    vectors = centers[labels] + 0.5 * np_rng.standard_normal((count, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def benchmark_ann_index(scales: List[int], dimension: int = 128, k: int = 10,
+                        queries: int = 50, n_probes: Tuple[int, ...] = (1, 4, 8, 16),
+                        seed: int = 42) -> List[Dict[str, Any]]:
+    """Recall@k and query latency of each ANN backend against the exact matrix."""
+    np_rng = np.random.default_rng(seed)
+    results = []
+
+    for scale in scales:
+        vectors = _clustered_unit_vectors(scale, dimension, max(8, scale // 500), np_rng)
+        ids = [f"anchor_{i}" for i in range(scale)]
+        query_vectors = vectors[np_rng.choice(scale, size=queries, replace=False)]
+        query_vectors = query_vectors + 0.1 * np_rng.standard_normal(query_vectors.shape).astype(np.float32)
+
+        build_start = time.perf_counter()
+        exact = EmbeddingMatrix(dimension, initial_capacity=scale)
+        exact.extend(zip(ids, vectors))
+        exact_build_ms = (time.perf_counter() - build_start) * 1000
+        exact_runs = [_timed(lambda q=q: exact.top_k(q, k), 3) for q in query_vectors]
+        truth = [{item_id for item_id, _ in run["result"]} for run in exact_runs]
+
+        def measure(backend: str, index, build_ms: float, **extra) -> Dict[str, Any]:
+            runs = [_timed(lambda q=q: index.top_k(q, k), 3) for q in query_vectors]
+            recall = statistics.mean(
+                len(expected & {item_id for item_id, _ in run["result"]}) / k
+                for expected, run in zip(truth, runs)
+            )
+            query_ms = statistics.mean(run["mean_ms"] for run in runs)
+            row = {"scale": scale, "backend": backend}
+            row.update(extra)
+            row.update({
+                "build_ms": round(build_ms, 1),
+                "query_ms": round(query_ms, 3),
+                "p99_ms": round(max(run["p99_ms"] for run in runs), 3),
+                f"recall@{k}": round(recall, 4),
+            })
+            return row
+
+        results.append(measure("exact", exact, exact_build_ms))
+
+        build_start = time.perf_counter()
+        ivf = IVFFlatIndex(dimension, train_threshold=scale, seed=seed)
+        for item_id, vector in zip(ids, vectors):
+            ivf.add(item_id, vector)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        for n_probe in n_probes:
+            ivf.n_probe = n_probe
+            results.append(measure("ivf", ivf, build_ms, n_probe=n_probe))
+
+        if FAISS_AVAILABLE:
+            build_start = time.perf_counter()
+            flat = FaissIndex(dimension)
+            for item_id, vector in zip(ids, vectors):
+                flat.add(item_id, vector)
+            results.append(measure("faiss", flat, (time.perf_counter() - build_start) * 1000))
+
+    return results
+
+
+# ============================================================================
+# Batched vs per-item embedding ingest (SemanticAnchorGraph bulk path)
+# ============================================================================
+
+class _RemoteLikeProvider(EmbeddingProvider):
+    """Hashed bag-of-words provider that charges a fixed round-trip per request."""
+
+    max_batch_size = 256
+
+    def __init__(self, dimension: int = 128, request_latency_s: float = 0.002):
+        super().__init__({"dimension": dimension})
+        self.dimension = dimension
+        self.request_latency_s = request_latency_s
+        self.requests = 0
+
+    def embed_text(self, text: str) -> List[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self.requests += 1
+        time.sleep(self.request_latency_s)
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dimension
+            for token in text.split():
+                vector[hash(token) % self.dimension] += 1.0
+            vectors.append(vector)
+        return vectors
+
+    def get_dimension(self) -> int:
+        return self.dimension
+
+
+def benchmark_batched_ingest(scales: List[int], vocabulary: int = 5_000,
+                             words_per_item: int = 12, seed: int = 42) -> List[Dict[str, Any]]:
+    """Anchor ingest: create_or_update_anchor per item vs create_or_update_anchors_bulk."""
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocabulary)]
+    config = {"enable_privacy_hooks": False, "enable_memory_pooling": False,
+              "consolidation_threshold": 0.95}
+    results = []
+
+    for scale in scales:
+        items = [(" ".join(rng.choices(words, k=words_per_item)), f"u{i}", {})
+                 for i in range(scale)]
+
+        sequential_provider = _RemoteLikeProvider()
+        sequential = SemanticAnchorGraph(embedding_provider=sequential_provider, config=config)
+        start = time.perf_counter()
+        sequential_ids = [sequential.create_or_update_anchor(*item) for item in items]
+        sequential_s = time.perf_counter() - start
+
+        bulk_provider = _RemoteLikeProvider()
+        bulk = SemanticAnchorGraph(embedding_provider=bulk_provider, config=config)
+        start = time.perf_counter()
+        bulk_ids = bulk.create_or_update_anchors_bulk(items)
+        bulk_s = time.perf_counter() - start
+
+        results.append({
+            "scale": scale,
+            "sequential_s": round(sequential_s, 3),
+            "sequential_requests": sequential_provider.requests,
+            "bulk_s": round(bulk_s, 3),
+            "bulk_requests": bulk_provider.requests,
+            "speedup": round(sequential_s / max(bulk_s, 1e-9), 1),
+            "anchors_match": len(set(sequential_ids)) == len(set(bulk_ids)),
+        })
+
+    return results
+
+
+# ============================================================================
+# Embedding cache on a repeated query stream
+# ============================================================================
+
+def benchmark_embedding_cache(scales: List[int], distinct_texts: int = 500,
+                              max_entries: int = 250, seed: int = 42) -> List[Dict[str, Any]]:
+    """Zipf-distributed query texts: uncached provider vs CachedEmbeddingProvider."""
+    rng = random.Random(seed)
+    texts = [f"query {i} about castle memory strata" for i in range(distinct_texts)]
+    weights = [1.0 / (rank + 1) for rank in range(distinct_texts)]
+    results = []
+
+    for scale in scales:
+        stream = rng.choices(texts, weights=weights, k=scale)
+
+        uncached = _RemoteLikeProvider(request_latency_s=0.0005)
+        start = time.perf_counter()
+        uncached_vectors = [uncached.embed_text(text) for text in stream]
+        uncached_s = time.perf_counter() - start
+
+        cached = CachedEmbeddingProvider(_RemoteLikeProvider(request_latency_s=0.0005),
+                                         {"max_entries": max_entries})
+        start = time.perf_counter()
+        cached_vectors = [cached.embed_text(text) for text in stream]
+        cached_s = time.perf_counter() - start
+
+        stats = cached.get_cache_stats()
+        results.append({
+            "scale": scale,
+            "uncached_s": round(uncached_s, 3),
+            "cached_s": round(cached_s, 3),
+            "speedup": round(uncached_s / max(cached_s, 1e-9), 1),
+            "hit_rate": round(stats["hit_rate"], 4),
+            "evictions": stats["evictions"],
+            "provider_requests": cached.provider.requests,
+            "vectors_match": uncached_vectors == cached_vectors,
+        })
+
+    return results
+
+
+# ============================================================================
+# LocalEmbeddingProvider: sorted-vocabulary vs hashing mode
+# ============================================================================
+
+class _SortedVocabularyReference(LocalEmbeddingProvider):
+    """Original projection: re-sorts the full vocabulary on every embedding."""
+
+    def _normalize_vector(self, tfidf_vector: Dict[str, float]) -> List[float]:
+        vocab_list = sorted(list(self.vocabulary))[:self.vector_dimension]
+        vector = [tfidf_vector.get(token, 0.0) for token in vocab_list]
+        vector.extend([0.0] * (self.vector_dimension - len(vector)))
+        magnitude = sum(x * x for x in vector) ** 0.5
+        return [x / magnitude for x in vector] if magnitude > 0 else vector
+
+
+def benchmark_local_embedding(scales: List[int], vocabulary: int = 50_000,
+                              words_per_doc: int = 20, probes: int = 200,
+                              seed: int = 42) -> List[Dict[str, Any]]:
+    """embed_text cost after ingesting N documents, and probe-embedding stability."""
+    rng = random.Random(seed)
+    words = [f"token{i}" for i in range(vocabulary)]
+    results = []
+
+    for scale in scales:
+        corpus = [" ".join(rng.choices(words, k=words_per_doc)) for _ in range(scale)]
+        probe_texts = [" ".join(rng.choices(words, k=words_per_doc)) for _ in range(probes)]
+        providers = {
+            "sorted_reference": _SortedVocabularyReference(),
+            "vocabulary": LocalEmbeddingProvider(),
+            "hashing": LocalEmbeddingProvider({"mode": "hashing"}),
+        }
+
+        row: Dict[str, Any] = {"scale": scale}
+        for name, provider in providers.items():
+            start = time.perf_counter()
+            for text in corpus:
+                provider.embed_text(text)
+            ingest_s = time.perf_counter() - start
+            if name == "hashing":
+                provider.freeze_idf()
+
+            before = [provider.embed_text(text) for text in probe_texts]
+            start = time.perf_counter()
+            after = [provider.embed_text(text) for text in probe_texts]
+            probe_ms = (time.perf_counter() - start) * 1000 / probes
+
+            row[f"{name}_ingest_s"] = round(ingest_s, 3)
+            row[f"{name}_embed_ms"] = round(probe_ms, 4)
+            row[f"{name}_stable"] = before == after
+
+        row["vocabulary_matches_reference"] = (
+            providers["vocabulary"].embed_text(probe_texts[0]) ==
+            providers["sorted_reference"].embed_text(probe_texts[0])
+        )
+        results.append(row)
+
+    return results
+
+
+# ============================================================================
+# RetrievalAPI query result cache: scan-on-insert dict vs LRU/TTL cache
+# ============================================================================
+
+def benchmark_query_cache(scales: List[int], ttl_seconds: float = 300) -> List[Dict[str, Any]]:
+    """Insert N distinct query results, then look them all up."""
+    query = RetrievalQuery(query_id="bench", mode=RetrievalMode.SEMANTIC_SIMILARITY)
+    results = []
+
+    for scale in scales:
+        assemblies = [
+            ContextAssembly(assembly_id=f"a{i}", query=query, results=[], total_relevance=0.0,
+                            temporal_span_hours=0.0, anchor_coverage=[], assembly_quality=0.0,
+                            conflict_summary={}, retrieval_timestamp=time.time())
+            for i in range(scale)
+        ]
+        keys = [f"key_{i}" for i in range(scale)]
+
+        # Original _cache_result: store, then scan every entry for staleness
+        reference: Dict[str, ContextAssembly] = {}
+        start = time.perf_counter()
+        for key, assembly in zip(keys, assemblies):
+            reference[key] = assembly
+            now = time.time()
+            stale = [k for k, cached in reference.items()
+                     if now - cached.retrieval_timestamp > ttl_seconds]
+            for k in stale:
+                del reference[k]
+        reference_insert_s = time.perf_counter() - start
+
+        cache = QueryResultCache(max_entries=scale, ttl_seconds=ttl_seconds)
+        start = time.perf_counter()
+        for key, assembly in zip(keys, assemblies):
+            cache.put(key, assembly, 0)
+        cache_insert_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        hits = sum(1 for key in keys if cache.get(key, 0) is not None)
+        cache_lookup_s = time.perf_counter() - start
+
+        results.append({
+            "scale": scale,
+            "reference_insert_us": round(reference_insert_s * 1e6 / scale, 2),
+            "cache_insert_us": round(cache_insert_s * 1e6 / scale, 2),
+            "cache_lookup_us": round(cache_lookup_s * 1e6 / scale, 2),
+            "speedup": round(reference_insert_s / max(cache_insert_s, 1e-9), 1),
+            "hit_rate": hits / scale,
+            "cache_memory_kb": round(cache.memory_bytes / 1024, 1),
+        })
+
+    return results
+
+
+# ============================================================================
+# Context-store keyword search: substring scan vs BM25 inverted index
+# ============================================================================
+
+def benchmark_keyword_index(scales: List[int], vocabulary: int = 20_000,
+                            words_per_doc: int = 40, queries: int = 50, k: int = 10,
+                            seed: int = 42) -> List[Dict[str, Any]]:
+    """Query throughput of the original `term in content` scan vs BM25Index.search."""
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocabulary)]
+    weights = [1.0 / (rank + 1) for rank in range(vocabulary)]  # Zipf-like term frequencies
+    results = []
+
+    for scale in scales:
+        docs = {f"doc_{i}": " ".join(rng.choices(words, weights=weights, k=words_per_doc))
+                for i in range(scale)}
+        query_texts = [" ".join(rng.choices(words[100:2000], k=3)) for _ in range(queries)]
+
+        build_start = time.perf_counter()
+        index = BM25Index()
+        for doc_id, content in docs.items():
+            index.add(doc_id, content)
+        build_s = time.perf_counter() - build_start
+
+        def substring_scan(query_text):
+            terms = query_text.lower().split()
+            scored = []
+            for doc_id, content in docs.items():
+                content = content.lower()
+                matches = sum(1 for term in terms if term in content)
+                if matches:
+                    scored.append((doc_id, matches / len(terms)))
+            scored.sort(key=lambda item: item[1], reverse=True)
+            return scored[:k]
+
+        scan_runs = [_timed(lambda q=q: substring_scan(q), 1) for q in query_texts[:5]]
+        index_runs = [_timed(lambda q=q: index.search(q, k), 3) for q in query_texts]
+
+        snapshot = index.to_dict()
+        load_start = time.perf_counter()
+        BM25Index.from_dict(json.loads(json.dumps(snapshot)))
+        load_s = time.perf_counter() - load_start
+
+        scan_ms = statistics.mean(r["mean_ms"] for r in scan_runs)
+        index_ms = statistics.mean(r["mean_ms"] for r in index_runs)
+        results.append({
+            "scale": scale,
+            "build_s": round(build_s, 2),
+            "scan_query_ms": round(scan_ms, 2),
+            "index_query_ms": round(index_ms, 3),
+            "index_qps": round(1000 / max(index_ms, 1e-9), 1),
+            "speedup": round(scan_ms / max(index_ms, 1e-9), 1),
+            "snapshot_roundtrip_s": round(load_s, 2),
+        })
+
+    return results
+
+
+# ============================================================================
+# STAT7 hybrid retrieval: per-document hybrid_score vs columnar store
+# ============================================================================
+
+def benchmark_stat7_hybrid(scales: List[int], dimension: int = 128, k: int = 10,
+                           queries: int = 5, seed: int = 42) -> List[Dict[str, Any]]:
+    """Hybrid top-k: scalar loop vs public retrieve() (store built per call) vs a prebuilt store."""
+    rng = random.Random(seed)
+    random.seed(seed)
+    realms = [Realm("game", "arena"), Realm("faculty", "library"), Realm("data", "logs")]
+    results = []
+
+    for scale in scales:
+        vectors = _random_unit_vectors(scale, dimension, rng)
+        documents = [
+            RAGDocument(id=f"doc-{i}", text="", embedding=vectors[i],
+                        stat7=generate_random_stat7_address(realms[i % len(realms)]))
+            for i in range(scale)
+        ]
+        probes = [(vectors[rng.randrange(scale)], documents[rng.randrange(scale)].stat7)
+                  for _ in range(queries)]
+
+        build_start = time.perf_counter()
+        store = STAT7ColumnarStore.from_documents(documents)
+        store.resonance(probes[0][1])  # Materialize the columns
+        build_s = time.perf_counter() - build_start
+
+        scalar_runs = [_timed(lambda q=q, a=a: _retrieve_scalar(documents, q, a, k, 0.6, 0.4), 1)
+                       for q, a in probes]
+        retrieve_runs = [_timed(lambda q=q, a=a: retrieve(documents, q, a, k), 1) for q, a in probes]
+        columnar_runs = [_timed(lambda q=q, a=a: store.top_k(q, a, k), 3) for q, a in probes]
+
+        identical = all(s["result"] == r["result"] == c["result"]
+                        for s, r, c in zip(scalar_runs, retrieve_runs, columnar_runs))
+        scalar_ms = statistics.mean(r["mean_ms"] for r in scalar_runs)
+        retrieve_ms = statistics.mean(r["mean_ms"] for r in retrieve_runs)
+        columnar_ms = statistics.mean(r["mean_ms"] for r in columnar_runs)
+        results.append({
+            "scale": scale,
+            "build_s": round(build_s, 2),
+            "scalar_query_ms": round(scalar_ms, 2),
+            "retrieve_query_ms": round(retrieve_ms, 2),
+            "columnar_query_ms": round(columnar_ms, 2),
+            "retrieve_speedup": round(scalar_ms / max(retrieve_ms, 1e-9), 1),
+            "speedup": round(scalar_ms / max(columnar_ms, 1e-9), 1),
+            "identical_top_k": identical,
+        })
+
+    return results
+
+
+# ============================================================================
+# Sharded (multi-process) vs single-process exact search
+# ============================================================================
+
+def benchmark_sharded_retrieval(scales: List[int], dimension: int = 128, k: int = 10,
+                                queries: int = 20, max_workers: int = 0,
+                                seed: int = 42) -> List[Dict[str, Any]]:
+    """Top-k latency scaling from 1 to N shard workers against the in-process matrix."""
+    np_rng = np.random.default_rng(seed)
+    max_workers = max_workers or os.cpu_count() or 1
+    worker_counts = sorted({1, max_workers} | {2 ** i for i in range(1, max_workers.bit_length())
+                                               if 2 ** i < max_workers})
+    results = []
+
+    for scale in scales:
+        vectors = _clustered_unit_vectors(scale, dimension, max(8, scale // 500), np_rng)
+        ids = [f"doc_{i}" for i in range(scale)]
+        query_vectors = vectors[np_rng.choice(scale, size=queries, replace=False)]
+
+        exact = EmbeddingMatrix(dimension, initial_capacity=scale)
+        exact.extend(zip(ids, vectors))
+        exact_runs = [_timed(lambda q=q: exact.top_k(q, k), 3) for q in query_vectors]
+        exact_ms = statistics.mean(run["mean_ms"] for run in exact_runs)
+        results.append({"scale": scale, "workers": 0, "query_ms": round(exact_ms, 3),
+                        "speedup": 1.0, "identical_top_k": True})
+
+        for workers in worker_counts:
+            with ShardedIndex(dimension, n_shards=workers, initial_capacity=scale,
+                              inline_threshold=0) as index:
+                for item_id, vector in zip(ids, vectors):
+                    index.add(item_id, vector)
+                index.top_k(query_vectors[0], k)  # Start the workers outside the timing
+                runs = [_timed(lambda q=q: index.top_k(q, k), 3) for q in query_vectors]
+
+            query_ms = statistics.mean(run["mean_ms"] for run in runs)
+            results.append({
+                "scale": scale,
+                "workers": workers,
+                "query_ms": round(query_ms, 3),
+                "speedup": round(exact_ms / max(query_ms, 1e-9), 2),
+                "identical_top_k": all(
+                    [item_id for item_id, _ in e["result"]] == [item_id for item_id, _ in r["result"]]
+                    for e, r in zip(exact_runs, runs)
+                ),
+            })
+
+    return results
+
+
+# ============================================================================
+# Per-object compute_address() vs batch addressing (EXP-04)
+# ============================================================================
+
+def benchmark_bitchain_addressing(scales: List[int], workers: int = 0,
+                                  seed: int = 42) -> List[Dict[str, Any]]:
+    """Addresses/second: BitChain.compute_address() loop vs compute_addresses() serial and pooled."""
+    workers = workers or os.cpu_count() or 1
+    random.seed(seed)
+    results = []
+
+    for scale in scales:
+        bitchains = [generate_random_bitchain() for _ in range(scale)]
+
+        scalar = _timed(lambda: [bc.compute_address() for bc in bitchains], 1)
+        serial = _timed(lambda: compute_addresses(bitchains, workers=1), 1)
+        pooled = _timed(lambda: compute_addresses(bitchains, workers=workers), 1)
+
+        results.append({
+            "scale": scale,
+            "workers": workers,
+            "scalar_addr_per_s": int(scale / (scalar["mean_ms"] / 1000)),
+            "fast_serial_addr_per_s": int(scale / (serial["mean_ms"] / 1000)),
+            "fast_pool_addr_per_s": int(scale / (pooled["mean_ms"] / 1000)),
+            "identical": scalar["result"] == serial["result"] == pooled["result"],
+        })
+
+    return results
+
+
+# ============================================================================
+# JSON text vs binary BitChain records (storage size and scan rate)
+# ============================================================================
+
+def benchmark_bitchain_binary(scales: List[int], seed: int = 42) -> List[Dict[str, Any]]:
+    """Bytes/chain and chains/second for canonical JSON lines vs bitchain_binary records."""
+    random.seed(seed)
+    results = []
+
+    for scale in scales:
+        bitchains = [generate_random_bitchain() for _ in range(scale)]
+        expected = compute_addresses(bitchains, workers=1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = str(Path(directory) / "chains.jsonl")
+            binary_path = str(Path(directory) / "chains.bin")
+
+            def write_json():
+                with open(json_path, "w", encoding="utf-8") as f:
+                    for bc in bitchains:
+                        f.write(canonical_serialize(bc.to_canonical_dict()) + "\n")
+
+            def scan_json():
+                with open(json_path, "r", encoding="utf-8") as f:
+                    return [json.loads(line)["id"] for line in f]
+
+            def scan_binary():
+                with BitChainFileReader(binary_path) as reader:
+                    return [record.id for record in reader]
+
+            def address_binary():
+                with BitChainFileReader(binary_path) as reader:
+                    return [record.compute_address() for record in reader]
+
+            json_write = _timed(write_json, 1)
+            binary_write = _timed(lambda: write_bitchains(binary_path, bitchains), 1)
+            json_scan = _timed(scan_json, 1)
+            binary_scan = _timed(scan_binary, 1)
+            binary_address = _timed(address_binary, 1)
+            json_bytes = Path(json_path).stat().st_size
+            binary_bytes = Path(binary_path).stat().st_size
+
+        def rate(run):
+            return int(scale / (run["mean_ms"] / 1000))
+
+        results.append({
+            "scale": scale,
+            "json_bytes_per_chain": round(json_bytes / scale, 1),
+            "binary_bytes_per_chain": round(binary_bytes / scale, 1),
+            "json_write_per_s": rate(json_write),
+            "binary_write_per_s": rate(binary_write),
+            "json_scan_per_s": rate(json_scan),
+            "binary_scan_per_s": rate(binary_scan),
+            "binary_address_per_s": rate(binary_address),
+            "identical_addresses": binary_address["result"] == expected,
+        })
+
+    return results
+
+
+# ============================================================================
+# EXP-06 all-pairs entanglement detection vs candidate generation
+# ============================================================================
+
+def _entanglement_bitchains(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """EXP-06 style bit-chain dicts: mostly private neighbors, small entangled clusters."""
+    realms = ["data", "narrative", "system", "faculty", "event", "pattern", "void"]
+    bitchains = []
+    for i in range(count):
+        cluster = i // 4 if rng.random() < 0.2 else None
+        neighbors = [f"cluster-{cluster}-{n}" for n in range(3)] if cluster is not None else []
+        neighbors += [f"private-{i}-{n}" for n in range(rng.randint(1, 2))]
+        bitchains.append({
+            "id": f"bc-{i}",
+            "coordinates": {
+                "realm": rng.choice(realms),
+                "lineage": rng.randint(1, 10),
+                "adjacency": neighbors,
+                "horizon": rng.choice(["genesis", "emergence", "peak", "decay", "crystallization"]),
+                "resonance": rng.uniform(-1.0, 1.0),
+                "velocity": rng.uniform(-1.0, 1.0),
+                "density": rng.random(),
+            },
+        })
+    return bitchains
+
+
+def benchmark_entanglement_candidates(scales: List[int], threshold: float = 0.85,
+                                      exhaustive_limit: int = 2_000,
+                                      seed: int = 42) -> List[Dict[str, Any]]:
+    """Pairs scored and latency: exhaustive EntanglementDetector vs pruned candidates."""
+    rng = random.Random(seed)
+    results = []
+
+    for scale in scales:
+        bitchains = _entanglement_bitchains(scale, rng)
+        detector = EntanglementDetector(threshold, retain_scores=1_000)
+        pruned = _timed(lambda: detector.detect(bitchains), 1)
+
+        row = {
+            "scale": scale,
+            "total_pairs": detector.candidate_stats["total_pairs"],
+            "scored_pairs": detector.candidate_stats["scored_pairs"],
+            "pruned_ms": round(pruned["mean_ms"], 1),
+            "entangled": len(pruned["result"]),
+        }
+        if scale <= exhaustive_limit:
+            exhaustive = _timed(
+                lambda: EntanglementDetector(threshold, use_candidates=False,
+                                             retain_scores=False).detect(bitchains), 1)
+            row["exhaustive_ms"] = round(exhaustive["mean_ms"], 1)
+            row["speedup"] = round(exhaustive["mean_ms"] / pruned["mean_ms"], 1)
+            row["identical"] = exhaustive["result"] == pruned["result"]
+        results.append(row)
+
+    return results
+
+
+def benchmark_entanglement_scoring(scales: List[int], max_pairs: int = 200_000,
+                                   seed: int = 42) -> List[Dict[str, Any]]:
+    """Pairs/second: compute_entanglement_score() loop vs extract_features() + score_pair_block()."""
+    rng = random.Random(seed)
+    results = []
+
+    for scale in scales:
+        bitchains = _entanglement_bitchains(scale, rng)
+        pair_rng = np.random.default_rng(seed)
+        left = pair_rng.integers(0, scale, max_pairs)
+        right = (left + pair_rng.integers(1, scale, max_pairs)) % scale
+        pairs = list(zip(left.tolist(), right.tolist()))
+
+        scalar = _timed(lambda: [compute_entanglement_score(bitchains[i], bitchains[j]).total_score
+                                 for i, j in pairs], 1)
+        vectorized = _timed(lambda: score_pair_block(extract_features(bitchains), left, right).total, 3)
+
+        results.append({
+            "scale": scale,
+            "pairs": max_pairs,
+            "scalar_pairs_per_s": int(max_pairs / (scalar["mean_ms"] / 1000)),
+            "vectorized_pairs_per_s": int(max_pairs / (vectorized["mean_ms"] / 1000)),
+            "speedup": round(scalar["mean_ms"] / vectorized["mean_ms"], 1),
+            "max_abs_diff": float(np.max(np.abs(np.array(scalar["result"]) - vectorized["result"]))),
+        })
+
+    return results
+
+
+# ============================================================================
+# GiantCompressor reference clustering vs vector_clustering backend
+# ============================================================================
+
+class _LookupProvider(EmbeddingProvider):
+    """Returns precomputed embeddings for fragment texts."""
+
+    def __init__(self, table: Dict[str, List[float]]):
+        super().__init__({})
+        self.table = table
+
+    def embed_text(self, text: str) -> List[float]:
+        return self.table[text]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        return [self.table[text] for text in texts]
+
+    def get_dimension(self) -> int:
+        return len(next(iter(self.table.values())))
+
+
+def benchmark_giant_clustering(scales: List[int], dimension: int = 64, fragments_per_topic: int = 50,
+                               reference_sizes: Dict[str, int] = None,
+                               seed: int = 42) -> List[Dict[str, Any]]:
+    """Fragments/second per clustering method, with reference parity on a prefix of each corpus."""
+    reference_sizes = reference_sizes or {"density_based": 1_000, "kmeans": 1_000, "hierarchical": 200}
+    rng = np.random.default_rng(seed)
+    results = []
+
+    def cohesion(clusters):
+        return sum(c["avg_similarity"] * c["size"] for c in clusters) / sum(c["size"] for c in clusters)
+
+    for scale in scales:
+        topics = rng.standard_normal((max(1, scale // fragments_per_topic), dimension))
+        embeddings = topics[rng.integers(len(topics), size=scale)] + 0.8 * rng.standard_normal((scale, dimension))
+        fragments = [{"text": f"fragment {i}"} for i in range(scale)]
+        provider = _LookupProvider({f["text"]: e for f, e in zip(fragments, embeddings.tolist())})
+
+        for method, reference_size in reference_sizes.items():
+            def compressor(backend):
+                return GiantCompressor(SedimentStore(), provider, {
+                    "clustering_method": method, "clustering_backend": backend, "random_seed": seed})
+
+            vectorized = _timed(lambda: compressor("vectorized")._semantic_cluster(fragments, embeddings), 1)
+            prefix = min(scale, reference_size)
+            reference = _timed(lambda: compressor("reference")._semantic_cluster(
+                fragments[:prefix], embeddings[:prefix].tolist()), 1)
+            prefix_fast = compressor("vectorized")._semantic_cluster(fragments[:prefix], embeddings[:prefix])
+
+            row = {
+                "scale": scale,
+                "method": method,
+                "vectorized_frag_per_s": int(scale / (vectorized["mean_ms"] / 1000)),
+                "reference_frag_per_s": int(prefix / (reference["mean_ms"] / 1000)),
+                "parity_fragments": prefix,
+                "clusters": len(vectorized["result"]),
+            }
+            if method == "kmeans":
+                row["reference_cohesion"] = round(cohesion(reference["result"]), 4)
+                row["vectorized_cohesion"] = round(cohesion(prefix_fast), 4)
+            else:
+                row["identical"] = ([c["indices"] for c in reference["result"]] ==
+                                    [c["indices"] for c in prefix_fast])
+            results.append(row)
+
+    return results
+
+
+# ============================================================================
+# List-backed vs indexed, persistent SedimentStore
+# ============================================================================
+
+class _ListSedimentStore:
+    """The original list-backed SedimentStore lookups."""
+
+    def __init__(self, strata: List[Dict[str, Any]]):
+        self.strata = strata
+
+    def get_stratum(self, stratum_id: str) -> Optional[Dict[str, Any]]:
+        for stratum in self.strata:
+            if stratum["stratum_id"] == stratum_id:
+                return stratum
+        return None
+
+    def get_fragment_count(self) -> int:
+        return sum(stratum["total_fragments"] for stratum in self.strata)
+
+
+def benchmark_sediment_store(scales: List[int], fragments_per_cluster: int = 10,
+                             clusters_per_stratum: int = 100, lookups: int = 1_000,
+                             seed: int = 42) -> List[Dict[str, Any]]:
+    """Lookup latency and cold-start time of SedimentStore at a given fragment count."""
+    rng = random.Random(seed)
+    results = []
+
+    for scale in scales:
+        n_strata = max(1, scale // (fragments_per_cluster * clusters_per_stratum))
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "sediment.seg")
+            store = SedimentStore(path)
+
+            def build():
+                for s in range(n_strata):
+                    store.append_clusters([{
+                        "id": f"cluster_{s}_{c}",
+                        "size": fragments_per_cluster,
+                        "fragments": [{"id": f"frag_{s}_{c}_{f}", "text": f"fragment {s} {c} {f}"}
+                                      for f in range(fragments_per_cluster)],
+                        "avg_similarity": 0.5,
+                    } for c in range(clusters_per_stratum)])
+
+            append = _timed(build, 1)
+            reference = _ListSedimentStore(store.strata)
+            stratum_ids = [f"stratum_{rng.randint(1, n_strata)}" for _ in range(lookups)]
+            fragment_ids = [f"frag_{rng.randrange(n_strata)}_{rng.randrange(clusters_per_stratum)}_"
+                            f"{rng.randrange(fragments_per_cluster)}" for _ in range(lookups)]
+
+            def per_call_us(run, calls):
+                return round(run["mean_ms"] * 1000 / calls, 2)
+
+            scan = _timed(lambda: [reference.get_stratum(s) for s in stratum_ids[:100]], 1)
+            indexed = _timed(lambda: [store.get_stratum(s) for s in stratum_ids], 3)
+            resum = _timed(reference.get_fragment_count, 10)
+            counter = _timed(store.get_fragment_count, 10)
+            locate = _timed(lambda: [store.locate_fragment(f) for f in fragment_ids], 3)
+            store.close()
+
+            cold = _timed(lambda: SedimentStore(path).close(), 3)
+            reopened = SedimentStore(path)
+            first_body = _timed(lambda: reopened.get_fragment(fragment_ids[0]), 1)
+            window = _timed(lambda: reopened.get_strata_between(0.0, float("inf")), 1)
+            file_mb = Path(path).stat().st_size / 1e6
+            reopened.close()
+
+        results.append({
+            "fragments": n_strata * clusters_per_stratum * fragments_per_cluster,
+            "strata": n_strata,
+            "append_frag_per_s": int(scale / (append["mean_ms"] / 1000)),
+            "scan_get_stratum_us": per_call_us(scan, 100),
+            "indexed_get_stratum_us": per_call_us(indexed, lookups),
+            "resum_fragment_count_us": round(resum["mean_ms"] * 1000, 2),
+            "counter_fragment_count_us": round(counter["mean_ms"] * 1000, 2),
+            "locate_fragment_us": per_call_us(locate, lookups),
+            "cold_start_ms": round(cold["mean_ms"], 1),
+            "first_body_load_ms": round(first_body["mean_ms"], 2),
+            "full_range_load_ms": round(window["mean_ms"], 1),
+            "file_mb": round(file_mb, 1),
+        })
+
+    return results
+
+
+# ============================================================================
+# Sorted-list vs heap-ordered MagmaStore (evaporation)
+# ============================================================================
+
+class _SortedMagmaStore:
+    """A list-backed MagmaStore that sorts by decayed heat on every select_hot."""
+
+    def __init__(self, half_life_s: float = 86400.0):
+        self.glyphs: List[Dict[str, Any]] = []
+        self.half_life_s = half_life_s
+
+    def add_glyph(self, glyph: Dict[str, Any]):
+        self.glyphs.append(glyph)
+
+    def select_hot(self, limit: int) -> List[Dict[str, Any]]:
+        now = time.time()
+        decayed = [dict(g, heat=g["heat_seed"] * 2.0 ** ((g["created_epoch"] - now) / self.half_life_s))
+                   for g in self.glyphs]
+        return sorted(decayed, key=lambda g: -g["heat"])[:limit]
+
+
+def _magma_glyph(index: int, now: int, rng: random.Random) -> Dict[str, Any]:
+    return {
+        "id": f"mglyph_{index:08d}",
+        "compressed_summary": f"retired cluster {index} | fragment text {index % 997}",
+        "affect": {"awe": rng.random() * 0.3, "humor": rng.random() * 0.2, "tension": rng.random() * 0.2},
+        "heat_seed": rng.uniform(0.1, 1.0),
+        "created_epoch": now - rng.randrange(7 * 86400),
+    }
+
+
+def benchmark_evaporation_throughput(scales: List[int], max_in_memory: int = 100_000,
+                                     limit: int = 5, seed: int = 42) -> List[Dict[str, Any]]:
+    """Evaporations/second as the magma grows: per-call sort vs heap-ordered, spilling MagmaStore."""
+    rng = random.Random(seed)
+    now = int(time.time())
+    results = []
+
+    for scale in scales:
+        glyphs = [_magma_glyph(i, now, rng) for i in range(scale)]
+        reference = _SortedMagmaStore()
+        reference.glyphs = list(glyphs)
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = MagmaStore(max_in_memory=max_in_memory, spill_path=str(Path(directory) / "magma.seg"))
+            fill = _timed(lambda: [store.add_glyph(g) for g in glyphs], 1)
+
+            hot_reference = [g["id"] for g in reference.select_hot(limit * 6)]
+            hot_store = [g["id"] for g in store.select_hot(limit * 6)]
+
+            sorted_engine = EvaporationEngine(reference, CloudStore())
+            heap_engine = EvaporationEngine(store, CloudStore())
+            sorted_run = _timed(lambda: sorted_engine.evaporate(limit), 3 if scale <= 100_000 else 1)
+            heap_run = _timed(lambda: heap_engine.evaporate(limit), 50)
+            resident, spilled = store.resident_count(), store.spilled_count()
+            store.close()
+
+        results.append({
+            "glyphs": scale,
+            "resident": resident,
+            "spilled": spilled,
+            "add_glyph_per_s": int(scale / (fill["mean_ms"] / 1000)),
+            "sorted_evaporate_ms": round(sorted_run["mean_ms"], 2),
+            "heap_evaporate_ms": round(heap_run["mean_ms"], 3),
+            "sorted_evaporations_per_s": round(1000 / sorted_run["mean_ms"], 1),
+            "heap_evaporations_per_s": round(1000 / heap_run["mean_ms"], 1),
+            "speedup": round(sorted_run["mean_ms"] / heap_run["mean_ms"], 1),
+            "same_hot_set": hot_reference == hot_store,
+        })
+
+    return results
+
+
+# ============================================================================
+# Unbounded list vs expiring, top-k indexed CloudStore (soak)
+# ============================================================================
+
+class _ListCloudStore:
+    """The original CloudStore: an ever-growing list rescored and sorted per call."""
+
+    def __init__(self):
+        self.mist_lines: List[Dict[str, Any]] = []
+        self.humidity_index = 0.0
+        self.generation_mode = "balanced"
+
+    def add_mist_lines(self, mist_lines: List[Dict[str, Any]]):
+        self.mist_lines.extend(mist_lines)
+
+    def update_humidity(self, humidity: float):
+        self.humidity_index = humidity
+
+    def get_active_mist(self, limit: int = 10) -> List[Dict[str, Any]]:
+        current_time = evaporation.time.time()
+        scored = []
+        for mist in self.mist_lines:
+            age = current_time - mist.get("created_epoch", current_time)
+            score = (max(0, 1.0 - (age / 3600)) * 0.4 + mist.get("distillation_quality", 0.5) * 0.3
+                     + mist.get("mythic_weight", 0.0) * 0.2 + mist.get("style_confidence", 0.5) * 0.1)
+            scored.append((mist, score))
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return [mist for mist, _ in scored[:limit]]
+
+
+class _SimulatedClock:
+    """Stand-in for the time module inside evaporation."""
+
+    def __init__(self, start: float):
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+
+def benchmark_cloud_soak(scales: List[int], cycle_s: int = 10, limit: int = 10,
+                         glyphs: int = 2_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """get_active_mist latency per simulated hour of evaporate() cycles, list vs indexed CloudStore."""
+    results = []
+    real_time = evaporation.time
+
+    for hours in scales:
+        rng = random.Random(seed)
+        clock = _SimulatedClock(1_700_000_000.0)
+        magma = MagmaStore()
+        for i in range(glyphs):
+            magma.add_glyph(_magma_glyph(i, int(clock.now), rng))
+        reference, indexed = _ListCloudStore(), CloudStore()
+        engine = EvaporationEngine(magma, reference)
+        hourly = []
+
+        evaporation.time = clock
+        try:
+            cycles_per_hour = 3600 // cycle_s
+            for hour in range(hours):
+                reference_ms, indexed_ms = [], []
+                for _ in range(cycles_per_hour):
+                    clock.now += cycle_s
+                    mist = engine.evaporate(limit=5)
+                    indexed.add_mist_lines(mist)
+                    reference_ms.append(_timed(lambda: reference.get_active_mist(limit), 1)["mean_ms"])
+                    indexed_run = _timed(lambda: indexed.get_active_mist(limit), 1)
+                    indexed_ms.append(indexed_run["mean_ms"])
+                expected = [m for m in reference.get_active_mist(limit)
+                            if clock.now - m["created_epoch"] <= 3600]
+                hourly.append({
+                    "reference_ms": statistics.mean(reference_ms),
+                    "indexed_ms": statistics.mean(indexed_ms),
+                    "same_top_k": [id(m) for m in indexed.get_active_mist(limit)] == [id(m) for m in expected],
+                })
+        finally:
+            evaporation.time = real_time
+
+        results.append({
+            "simulated_hours": hours,
+            "cycles": hours * cycles_per_hour,
+            "reference_retained": len(reference.mist_lines),
+            "indexed_retained": len(indexed.mist_lines),
+            "reference_first_hour_ms": round(hourly[0]["reference_ms"], 3),
+            "reference_last_hour_ms": round(hourly[-1]["reference_ms"], 3),
+            "indexed_first_hour_ms": round(hourly[0]["indexed_ms"], 4),
+            "indexed_last_hour_ms": round(hourly[-1]["indexed_ms"], 4),
+            "indexed_max_hour_ms": round(max(h["indexed_ms"] for h in hourly), 4),
+            "same_top_k": all(h["same_top_k"] for h in hourly),
+        })
+
+    return results
+
+
+# ============================================================================
+# All-pairs vs indexed ConflictDetector
+# ============================================================================
+
+class _ScanConflictDetector(ConflictDetector):
+    """The original detector: every retained statement scored per new statement."""
+
+    def _calculate_similarities(self, new_fingerprint):
+        candidates = [fp for sid, fp in self.statement_fingerprints.items()
+                      if sid != new_fingerprint.statement_id and fp.embedding]
+        scores = batch_cosine_similarity(new_fingerprint.embedding, [fp.embedding for fp in candidates])
+        return {fp.statement_id: float(score) for fp, score in zip(candidates, scores)
+                if score > self.semantic_similarity_threshold}
+
+    def _cleanup_old_statements(self):
+        current_time = time.time()
+        max_age_seconds = self.max_statement_age_hours * 3600
+        for stmt_id in [sid for sid, fp in self.statement_fingerprints.items()
+                        if current_time - fp.creation_timestamp > max_age_seconds]:
+            del self.statement_fingerprints[stmt_id]
+
+
+_CONFLICT_CLAIMS = ["is stable", "is not stable", "always holds", "never holds",
+                    "runs before sync", "runs after sync", "is definitely proven", "is wrong"]
+
+
+def benchmark_conflict_detection(scales: List[int], dimension: int = 64, statements_per_topic: int = 25,
+                                 queries: int = 500, seed: int = 42) -> List[Dict[str, Any]]:
+    """Statements and conflicts per second against a retained set, all-pairs scan vs similarity index."""
+    rng = np.random.default_rng(seed)
+    results = []
+
+    for scale in scales:
+        n_topics = max(1, scale // statements_per_topic)
+        centers = rng.standard_normal((n_topics, dimension))
+        reference_queries = max(5, 200_000 // scale)
+        total = scale + reference_queries + queries
+        topics = rng.integers(n_topics, size=total)
+        vectors = centers[topics] + 0.25 * rng.standard_normal((total, dimension))
+        texts = [f"topic {t} statement {i} {_CONFLICT_CLAIMS[i % len(_CONFLICT_CLAIMS)]}"
+                 for i, t in enumerate(topics.tolist())]
+        provider = _LookupProvider(dict(zip(texts, vectors.tolist())))
+        statements = [{"id": f"stmt_{i}", "text": text} for i, text in enumerate(texts)]
+
+        detectors = {}
+        for name, cls in (("scan", _ScanConflictDetector), ("indexed", ConflictDetector)):
+            detector = cls(embedding_provider=provider,
+                           config={"opposition_threshold": 0.3, "min_confidence_score": 0.5})
+            for statement in statements[:scale]:
+                fingerprint = detector._create_statement_fingerprint(
+                    statement["id"], statement["text"], statement, provider.table[statement["text"]])
+                detector._statement_order[statement["id"]] = detector._next_statement_order
+                detector._next_statement_order += 1
+                detector.statement_fingerprints[statement["id"]] = fingerprint
+                if name == "indexed":
+                    detector._index_fingerprint(fingerprint)
+            detectors[name] = detector
+
+        probe = statements[scale:scale + reference_queries]
+        scan = _timed(lambda: detectors["scan"].process_statements(probe), 1)
+        indexed_probe = _timed(lambda: detectors["indexed"].process_statements(probe), 1)
+        same = ([(c["statement_a"], c["statement_b"]) for c in scan["result"]["new_conflicts"]] ==
+                [(c["statement_a"], c["statement_b"]) for c in indexed_probe["result"]["new_conflicts"]])
+
+        batch = statements[scale + reference_queries:]
+        indexed = _timed(lambda: detectors["indexed"].process_statements(batch), 1)
+        conflicts = len(indexed["result"]["new_conflicts"])
+
+        scan_per_s = len(probe) / (scan["mean_ms"] / 1000)
+        indexed_per_s = len(batch) / (indexed["mean_ms"] / 1000)
+        results.append({
+            "retained": scale,
+            "scan_statements_per_s": round(scan_per_s, 1),
+            "indexed_statements_per_s": round(indexed_per_s, 1),
+            "scan_conflicts_per_s": round(len(scan["result"]["new_conflicts"]) / (scan["mean_ms"] / 1000), 1),
+            "indexed_conflicts_per_s": round(conflicts / (indexed["mean_ms"] / 1000), 1),
+            "conflicts_per_statement": round(conflicts / len(batch), 2),
+            "speedup": round(indexed_per_s / scan_per_s, 1),
+            "same_conflicts": same,
+        })
+
+    return results
+
+
+# ============================================================================
+# Unbounded vs streaming, bounded SummarizationLadder
+# ============================================================================
+
+def _rss_mb() -> float:
+    """Current resident set size (Linux /proc), else peak RSS."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def _synthetic_fragments(count: int) -> Any:
+    for i in range(count):
+        yield {"id": f"frag_{i}", "text": f"synthetic fragment {i} about topic {i % 97}", "heat": (i % 10) / 10}
+
+
+class _RequestCostProvider(EmbeddingProvider):
+    """Cheap embeddings with a fixed per-request overhead, like a remote embedding API."""
+
+    def __init__(self, overhead_s: float = 1e-4, dimension: int = 32):
+        super().__init__({})
+        self.overhead_s = overhead_s
+        self.dimension = dimension
+        self.requests = 0
+
+    def embed_text(self, text: str) -> List[float]:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self.requests += 1
+        time.sleep(self.overhead_s)
+        return [[float((hash(text) >> k) & 0xFF) for k in range(self.dimension)] for text in texts]
+
+    def get_dimension(self) -> int:
+        return self.dimension
+
+
+def benchmark_summarization_stream(scales: List[int], retained_macros: int = 1_000,
+                                   unbounded_limit: int = 1_000_000, embedded_fragments: int = 20_000,
+                                   checkpoints: int = 10) -> List[Dict[str, Any]]:
+    """Fragments/second and RSS over a synthetic stream: unbounded ladder vs bounded stream with a rung store."""
+    results = []
+
+    for scale in scales:
+        row: Dict[str, Any] = {"fragments": scale}
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = SegmentRungStore(str(Path(directory) / "rungs.seg"))
+            ladder = SummarizationLadder({"max_macro_distillations": retained_macros}, rung_store=store)
+            baseline = _rss_mb()
+            rss = []
+            step = max(1, scale // checkpoints)
+            start = time.perf_counter()
+            for done in range(0, scale, step):
+                ladder.process_stream(_synthetic_fragments(min(step, scale - done)))
+                rss.append(_rss_mb() - baseline)
+            elapsed = time.perf_counter() - start
+            row.update({
+                "stream_frag_per_s": int(scale / elapsed),
+                "stream_rss_growth_mb_10pct": round(rss[0], 1),
+                "stream_rss_growth_mb_50pct": round(rss[len(rss) // 2], 1),
+                "stream_rss_growth_mb_end": round(rss[-1], 1),
+                "retained_macros": len(ladder.macro_distillations),
+                "archived_rungs": len(store),
+                "rung_store_mb": round(Path(store.path).stat().st_size / 1e6, 1),
+            })
+            ladder.close()
+
+        unbounded_scale = min(scale, unbounded_limit)
+        unbounded = SummarizationLadder()
+        baseline = _rss_mb()
+        start = time.perf_counter()
+        unbounded.process_stream(_synthetic_fragments(unbounded_scale))
+        row.update({
+            "unbounded_fragments": unbounded_scale,
+            "unbounded_frag_per_s": int(unbounded_scale / (time.perf_counter() - start)),
+            "unbounded_rss_growth_mb": round(_rss_mb() - baseline, 1),
+            "unbounded_macros": len(unbounded.macro_distillations),
+        })
+        del unbounded
+
+        # Per-text requests (chunk of 1) vs one request per chunk
+        for label, chunk_size in (("per_text", 1), ("batched", 1024)):
+            provider = _RequestCostProvider()
+            embedded = SummarizationLadder(embedding_provider=provider)
+            start = time.perf_counter()
+            embedded.process_stream(_synthetic_fragments(embedded_fragments), chunk_size=chunk_size)
+            row[f"{label}_embed_requests"] = provider.requests
+            row[f"{label}_embed_frag_per_s"] = int(embedded_fragments / (time.perf_counter() - start))
+
+        results.append(row)
+
+    return results
+
+
+# ============================================================================
+# Per-method vs shared, memoized CastleGraph extraction
+# ============================================================================
+
+class _PerMethodCastleGraph(CastleGraph):
+    """The original extraction: every method re-cleans the text, hybrid re-runs the others, nothing memoized."""
+
+    def _extract_candidates(self, proto_thought, mist, prefetched=None):
+        method_results = {}
+        for method_name, method_func in self.extraction_methods.items():
+            try:
+                result = method_func(proto_thought, mist)
+            except Exception:
+                continue
+            if result:
+                method_results[method_name] = result
+        if not method_results:
+            return None
+        best_result = self._select_best_extraction(method_results, mist)
+        return best_result, self._calculate_extraction_validation(best_result, method_results, proto_thought)
+
+
+_CASTLE_WORDS = ("system algorithm design pattern builder creating analyzed framework optimization mist glyph "
+                 "thought structure ancient wisdom data model memory_castle node_graph whisper lattice ember "
+                 "the of a to and with through beneath").split()
+
+
+def _castle_mist_lines(count: int, repeat_ratio: float, seed: int = 0) -> List[Dict[str, Any]]:
+    """Styled mist lines; repeat_ratio of them reuse an earlier proto-thought, as re-evaporated glyphs do."""
+    rng = random.Random(seed)
+    texts: List[str] = []
+    mist_lines = []
+    for i in range(count):
+        if texts and rng.random() < repeat_ratio:
+            text = rng.choice(texts)
+        else:
+            text = " ".join(rng.choice(_CASTLE_WORDS) for _ in range(rng.randrange(6, 18))) + f" Echo{i}"
+            texts.append(text)
+        mist_lines.append({
+            "id": f"mist_{i}",
+            "proto_thought": text,
+            "style": rng.choice(["technical", "poetic", "narrative", "mythic"]),
+            "affect_signature": {"curiosity": rng.random(), "awe": rng.random()},
+            "mythic_weight": rng.random(),
+            "technical_clarity": rng.random(),
+        })
+    return mist_lines
+
+
+def benchmark_castle_infusion(scales: List[int], repeat_ratio: float = 0.25,
+                              batch_size: int = 10_000) -> List[Dict[str, Any]]:
+    """Mist lines/second through CastleGraph.infuse: per-method extraction vs shared analysis, memo and pool."""
+    results = []
+    workers = os.cpu_count() or 1
+
+    def infuse_all(graph: CastleGraph, mist_lines: List[Dict[str, Any]]) -> float:
+        start = time.perf_counter()
+        for offset in range(0, len(mist_lines), batch_size):
+            graph.infuse(mist_lines[offset:offset + batch_size])
+        return time.perf_counter() - start
+
+    for scale in scales:
+        mist_lines = _castle_mist_lines(scale, repeat_ratio)
+
+        per_method = _PerMethodCastleGraph({"infusion_workers": 1, "max_extraction_history": None})
+        per_method_s = infuse_all(per_method, mist_lines)
+        shared = CastleGraph({"infusion_workers": 1})
+        shared_s = infuse_all(shared, mist_lines)
+        pooled = CastleGraph({"infusion_workers": workers})
+        pooled_s = infuse_all(pooled, mist_lines)
+
+        concepts = lambda graph: [r.concept_id for r in graph.extraction_history]
+        results.append({
+            "mist_lines": scale,
+            "repeat_ratio": repeat_ratio,
+            "per_method_lines_per_s": int(scale / per_method_s),
+            "shared_memo_lines_per_s": int(scale / shared_s),
+            f"pool_{workers}w_lines_per_s": int(scale / pooled_s),
+            "speedup": round(per_method_s / shared_s, 1),
+            "per_method_history": len(per_method.extraction_history),
+            "bounded_history": len(shared.extraction_history),
+            "same_concepts": (concepts(per_method)[-len(shared.extraction_history):] == concepts(shared)
+                              == concepts(pooled)
+                              and list(per_method.nodes) == list(shared.nodes) == list(pooled.nodes)),
+        })
+
+    return results
+
+
+# ============================================================================
+# Single polling worker vs multi-worker StreamingIngestionPipeline
+# ============================================================================
+
+_PIPELINE_WORK = 2_000
+
+
+def _cpu_bound_processor(fragments: List[Fragment]) -> bool:
+    """Pure-Python work per fragment; module-level so process workers can pickle it."""
+    for fragment in fragments:
+        acc = 0
+        for i in range(_PIPELINE_WORK):
+            acc += (i * len(fragment.content)) % 7
+    return True
+
+
+class _LatencyPipeline(StreamingIngestionPipeline):
+    """Records ingest-to-completion latency of every processed fragment."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies_ms: List[float] = []
+
+    def _update_metrics(self, batch: BatchContext):
+        done = time.time()
+        self.latencies_ms.extend((done - f.timestamp) * 1000 for f in batch.fragments)
+        super()._update_metrics(batch)
+
+
+class _PollingPipeline(_LatencyPipeline):
+    """The original collection: one get(timeout=0.1) per fragment, 0.1 s sleep when idle."""
+
+    def _collect_batch(self) -> BatchContext:
+        fragments: List[Fragment] = []
+        start_time = time.time()
+        while len(fragments) < self.current_batch_size:
+            got, _ = self.ingestion_queue.get_batch(1, timeout=0.1)
+            if not got:
+                break
+            fragments.extend(got)
+        if not fragments:
+            time.sleep(0.1)
+        return BatchContext(batch_id=f"batch_{int(start_time * 1000)}", fragments=fragments,
+                            batch_size=len(fragments), processing_start_time=start_time)
+
+
+def benchmark_pipeline_workers(scales: List[int], fragments: int = 4_000,
+                               trickle: int = 50) -> List[Dict[str, Any]]:
+    """Fragments/second and latency for a CPU-bound processor, 1..N thread and process workers."""
+    results = []
+
+    def run(pipeline: _LatencyPipeline, count: int, gap_s: float = 0.0) -> Tuple[float, List[float]]:
+        pipeline.start()
+        start = time.perf_counter()
+        for i in range(count):
+            pipeline.ingest_fragment(Fragment(f"frag_{i}", f"fragment {i}", {}, priority=1 + i % 5))
+            if gap_s:
+                time.sleep(gap_s)
+        while pipeline.metrics.total_fragments_processed < count and time.perf_counter() - start < 600:
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        pipeline.stop()
+        return elapsed, sorted(pipeline.latencies_ms)
+
+    def percentile(values: List[float], q: float) -> float:
+        return round(values[min(len(values) - 1, int(q * len(values)))], 1) if values else 0.0
+
+    # Idle latency: fragments trickling into an otherwise idle pipeline
+    for label, cls in (("polling", _PollingPipeline), ("woken", _LatencyPipeline)):
+        _, latencies = run(cls(_cpu_bound_processor, max_queue_size=fragments), trickle, gap_s=0.02)
+        results.append({"workers": 1, "mode": f"idle_{label}", "fragments": trickle,
+                        "p50_latency_ms": percentile(latencies, 0.5), "p99_latency_ms": percentile(latencies, 0.99)})
+
+    for workers in scales:
+        for mode in ("thread", "process"):
+            pipeline = _LatencyPipeline(_cpu_bound_processor, initial_batch_size=10, max_batch_size=100,
+                                        max_queue_size=fragments, num_workers=workers, worker_mode=mode)
+            elapsed, latencies = run(pipeline, fragments)
+            results.append({
+                "workers": workers,
+                "mode": mode,
+                "fragments": fragments,
+                "fragments_per_s": int(fragments / elapsed),
+                "p50_latency_ms": percentile(latencies, 0.5),
+                "p99_latency_ms": percentile(latencies, 0.99),
+                "batches": pipeline.metrics.total_batches_processed,
+            })
+
+    return results
+
+
+# ============================================================================
+# Durable ingestion: WriteAheadLog group commit in front of the pipeline
+# ============================================================================
+
+def benchmark_wal_ingest(scales: List[int], fragments: int = 5_000,
+                         batch_size: int = 100) -> List[Dict[str, Any]]:
+    """Sustained fragments/second with no WAL, a WAL without fsync and a fsynced WAL, per producer count."""
+    results = []
+    for producers in scales:
+        for durability in ("none", "wal_no_fsync", "wal_fsync"):
+            for api in ("ingest_fragment", "ingest_batch"):
+                with tempfile.TemporaryDirectory() as tmp:
+                    wal = None if durability == "none" else WriteAheadLog(tmp, fsync=durability == "wal_fsync")
+                    pipeline = StreamingIngestionPipeline(lambda batch: True, max_queue_size=fragments,
+                                                          max_batch_size=500, wal=wal)
+                    pipeline.start()
+                    per_producer = fragments // producers
+
+                    def produce(offset: int):
+                        chunk = [Fragment(f"frag_{offset + i}", f"fragment {offset + i}", {"n": i},
+                                          priority=1 + i % 5) for i in range(per_producer)]
+                        if api == "ingest_batch":
+                            for start in range(0, len(chunk), batch_size):
+                                pipeline.ingest_batch(chunk[start:start + batch_size])
+                        else:
+                            for fragment in chunk:
+                                pipeline.ingest_fragment(fragment)
+
+                    threads = [threading.Thread(target=produce, args=(p * per_producer,)) for p in range(producers)]
+                    start = time.perf_counter()
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+                    total = per_producer * producers
+                    while pipeline.metrics.total_fragments_processed < total and time.perf_counter() - start < 600:
+                        time.sleep(0.001)
+                    elapsed = time.perf_counter() - start
+                    pipeline.stop()
+                    results.append({
+                        "producers": producers,
+                        "durability": durability,
+                        "api": api,
+                        "fragments": total,
+                        "fragments_per_s": int(total / elapsed),
+                        "fsyncs": wal.stats["fsyncs"] if wal else 0,
+                        "pending_after": wal.pending_count() if wal else 0,
+                    })
+                    if wal:
+                        wal.close()
+
+    return results
+
+
+# ============================================================================
+# Async producers: threaded pipeline bridge vs AsyncStreamingIngestionPipeline
+# ============================================================================
+
+def benchmark_async_ingest(scales: List[int], fragments_per_producer: int = 5,
+                           max_queue_size: int = 1_000) -> List[Dict[str, Any]]:
+    """Fragments/second and ingest latency with N concurrent asyncio producers."""
+    def percentile(values: List[float], q: float) -> float:
+        values = sorted(values)
+        return round(values[min(len(values) - 1, int(q * len(values)))], 2) if values else 0.0
+
+    async def run(mode: str, producers: int) -> Dict[str, Any]:
+        latencies: List[float] = []
+        rejected = [0]
+        total = producers * fragments_per_producer
+
+        if mode == "async":
+            async def process(batch: List[Fragment]) -> bool:
+                await asyncio.sleep(0)
+                return True
+
+            pipeline = AsyncStreamingIngestionPipeline(process, max_batch_size=500, max_queue_size=max_queue_size)
+            await pipeline.start()
+
+            async def send(fragment: Fragment):
+                if not await pipeline.ingest(fragment):
+                    rejected[0] += 1
+        else:
+            pipeline = StreamingIngestionPipeline(lambda batch: True, max_batch_size=500,
+                                                  max_queue_size=max_queue_size)
+            pipeline.start()
+            loop = asyncio.get_running_loop()
+            bridge = ThreadPoolExecutor(max_workers=32)
+
+            async def send(fragment: Fragment):
+                if mode == "threaded_bridge":
+                    accepted = await loop.run_in_executor(bridge, pipeline.ingest_fragment, fragment)
+                else:
+                    accepted = pipeline.ingest_fragment(fragment, block=False)
+                    await asyncio.sleep(0)
+                if not accepted:
+                    rejected[0] += 1
+
+        async def producer(p: int):
+            for i in range(fragments_per_producer):
+                fragment = Fragment(f"frag_{p}_{i}", f"fragment {p} {i}", {}, priority=1 + (p + i) % 5)
+                sent = time.perf_counter()
+                await send(fragment)
+                latencies.append((time.perf_counter() - sent) * 1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(producer(p) for p in range(producers)))
+        accepted = total - rejected[0]
+        while pipeline.metrics.total_fragments_processed < accepted and time.perf_counter() - start < 600:
+            await asyncio.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        if mode == "async":
+            await pipeline.stop()
+        else:
+            pipeline.stop()
+            bridge.shutdown()
+
+        return {
+            "producers": producers,
+            "mode": mode,
+            "fragments": total,
+            "processed_per_s": int(accepted / elapsed),
+            "rejected": rejected[0],
+            "p50_ingest_ms": percentile(latencies, 0.5),
+            "p99_ingest_ms": percentile(latencies, 0.99),
+        }
+
+    results = []
+    for producers in scales:
+        for mode in ("threaded_nowait", "threaded_bridge", "async"):
+            results.append(asyncio.run(run(mode, producers)))
+    return results
+
+
+# ============================================================================
+# BatchEvaluationEngine: thread pool vs process pool over a mapped corpus
+# ============================================================================
+
+def _score_items(items: List[str]) -> List[int]:
+    """CPU-bound scoring; module-level so process workers can pickle it."""
+    scores = []
+    for text in items:
+        acc = 0
+        for _ in range(200):
+            for ch in text:
+                acc = (acc * 31 + ord(ch)) % 1_000_003
+        scores.append(acc)
+    return scores
+
+
+def benchmark_batch_replay(scales: List[int], corpus_size: int = 20_000,
+                           batch_size: int = 100) -> List[Dict[str, Any]]:
+    """Items/second replaying a corpus with 1..N thread (PARALLEL) and process (PROCESS) workers."""
+    corpus = [f"fragment {i} " + "x" * (i % 40) for i in range(corpus_size)]
+    results = []
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        for workers in scales:
+            for mode in (ReplayMode.PARALLEL, ReplayMode.PROCESS):
+                engine = BatchEvaluationEngine(max_workers=workers, checkpoint_interval=corpus_size,
+                                               checkpoint_dir=checkpoint_dir)
+                start = time.perf_counter()
+                outcome = engine.process_corpus(corpus, _score_items, operation_id=f"{mode.value}_{workers}",
+                                                mode=mode, batch_size=batch_size, resume_from_checkpoint=False)
+                elapsed = time.perf_counter() - start
+                results.append({
+                    "workers": workers,
+                    "mode": mode.value,
+                    "items": corpus_size,
+                    "items_per_s": int(len(outcome["results"]) / elapsed),
+                    "elapsed_s": round(elapsed, 2),
+                })
+    return results
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+BENCHMARKS: Dict[str, Dict[str, Any]] = {
+    "embedding_matrix": {
+        "fn": benchmark_embedding_matrix,
+        "quick_scales": [1_000, 10_000],
+        "full_scales": [1_000, 10_000, 100_000],
+    },
+    "ann_index": {
+        "fn": benchmark_ann_index,
+        "quick_scales": [10_000],
+        "full_scales": [10_000, 100_000],
+    },
+    "batched_ingest": {
+        "fn": benchmark_batched_ingest,
+        "quick_scales": [1_000],
+        "full_scales": [1_000, 10_000],
+    },
+    "embedding_cache": {
+        "fn": benchmark_embedding_cache,
+        "quick_scales": [10_000],
+        "full_scales": [10_000, 100_000],
+    },
+    "local_embedding": {
+        "fn": benchmark_local_embedding,
+        "quick_scales": [1_000, 2_000],
+        "full_scales": [1_000, 5_000, 10_000],
+    },
+    "query_cache": {
+        "fn": benchmark_query_cache,
+        "quick_scales": [1_000, 5_000],
+        "full_scales": [1_000, 5_000, 20_000],
+    },
+    "keyword_index": {
+        "fn": benchmark_keyword_index,
+        "quick_scales": [10_000],
+        "full_scales": [10_000, 100_000],
+    },
+    "stat7_hybrid": {
+        "fn": benchmark_stat7_hybrid,
+        "quick_scales": [1_000, 10_000],
+        "full_scales": [1_000, 10_000, 100_000],
+    },
+    "sharded_retrieval": {
+        "fn": benchmark_sharded_retrieval,
+        "quick_scales": [100_000],
+        "full_scales": [100_000, 1_000_000],
+    },
+    "bitchain_addressing": {
+        "fn": benchmark_bitchain_addressing,
+        "quick_scales": [10_000, 100_000],
+        "full_scales": [10_000, 100_000, 1_000_000],
+    },
+    "bitchain_binary": {
+        "fn": benchmark_bitchain_binary,
+        "quick_scales": [10_000, 100_000],
+        "full_scales": [10_000, 100_000, 1_000_000],
+    },
+    "entanglement_candidates": {
+        "fn": benchmark_entanglement_candidates,
+        "quick_scales": [1_000, 2_000],
+        "full_scales": [2_000, 20_000, 100_000],
+    },
+    "entanglement_scoring": {
+        "fn": benchmark_entanglement_scoring,
+        "quick_scales": [1_000, 5_000, 20_000],
+        "full_scales": [1_000, 5_000, 20_000],
+    },
+    "giant_clustering": {
+        "fn": benchmark_giant_clustering,
+        "quick_scales": [1_000, 10_000],
+        "full_scales": [1_000, 10_000, 50_000],
+    },
+    "sediment_store": {
+        "fn": benchmark_sediment_store,
+        "quick_scales": [100_000, 1_000_000],
+        "full_scales": [100_000, 1_000_000],
+    },
+    "evaporation_throughput": {
+        "fn": benchmark_evaporation_throughput,
+        "quick_scales": [10_000, 100_000],
+        "full_scales": [10_000, 100_000, 1_000_000],
+    },
+    "cloud_soak": {
+        "fn": benchmark_cloud_soak,
+        "quick_scales": [2],
+        "full_scales": [24],
+    },
+    "conflict_detection": {
+        "fn": benchmark_conflict_detection,
+        "quick_scales": [10_000, 100_000],
+        "full_scales": [10_000, 100_000],
+    },
+    "summarization_stream": {
+        "fn": benchmark_summarization_stream,
+        "quick_scales": [1_000_000],
+        "full_scales": [10_000_000],
+    },
+    "castle_infusion": {
+        "fn": benchmark_castle_infusion,
+        "quick_scales": [1_000, 100_000],
+        "full_scales": [1_000, 100_000],
+    },
+    "pipeline_workers": {
+        "fn": benchmark_pipeline_workers,
+        "quick_scales": [1, 2, 4],
+        "full_scales": [1, 2, 4, 8, 16],
+    },
+    "wal_ingest": {
+        "fn": benchmark_wal_ingest,
+        "quick_scales": [1, 8],
+        "full_scales": [1, 4, 8, 16],
+    },
+    "async_ingest": {
+        "fn": benchmark_async_ingest,
+        "quick_scales": [1_000, 10_000],
+        "full_scales": [1_000, 10_000, 50_000],
+    },
+    "batch_replay": {
+        "fn": benchmark_batch_replay,
+        "quick_scales": [1, 2, 4],
+        "full_scales": [1, 2, 4, 8, 16, 32],
+    },
+}
+
+
+def run_benchmark(name: str, full: bool = False) -> Dict[str, Any]:
+    """Run a registered benchmark at quick or full scales."""
+    spec = BENCHMARKS[name]
+    scales = spec["full_scales"] if full else spec["quick_scales"]
+
+    print("=" * 70)
+    print(f"BENCHMARK: {name} ({'Full' if full else 'Quick'} - {', '.join(f'{s:,}' for s in scales)})")
+    print("=" * 70)
+
+    start = time.time()
+    rows = spec["fn"](scales)
+    for row in rows:
+        print("  " + ", ".join(f"{key}={value}" for key, value in row.items()))
+
+    return {
+        "benchmark": name,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "duration_seconds": round(time.time() - start, 3),
+        "results": rows,
+    }
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if not args:
+        print("Available benchmarks:")
+        for benchmark_name in BENCHMARKS:
+            print(f"  - {benchmark_name}")
+        sys.exit(0)
+
+    report = run_benchmark(args[0], full="--full" in sys.argv)
+    if "--json" in sys.argv:
+        print(json.dumps(report, indent=2))
@@ -5,12 +5,25 @@
 for the Cognitive Geo-Thermal Lore Engine v0.3.
 """
 
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, Hashable
+from collections import OrderedDict
 import time
 import hashlib
+import threading
+import json
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    from .embeddings.embedding_matrix import batch_cosine_similarity
+    from .embeddings.ann_index import create_ann_index
+    from .keyword_index import BM25Index, tokenize
+except ImportError:
+    # Loaded as a top-level module (seed/engine on sys.path, e.g. exp09 service)
+    from embeddings.embedding_matrix import batch_cosine_similarity
+    from embeddings.ann_index import create_ann_index
+    from keyword_index import BM25Index, tokenize
+
 
 class RetrievalMode(Enum):
     """Types of retrieval operations."""
@@ -87,6 +100,110 @@ class ContextAssembly:
     retrieval_timestamp: float
 
 
+class QueryResultCache:
+    """
+    Bounded LRU cache of ContextAssembly results with TTL and generation checks.
+    
+    Each entry records the corpus generation it was computed against; a lookup
+    under a different generation is treated as a miss and the entry dropped.
+    Insert, lookup and eviction are all O(1) (expired entries are reaped from
+    the LRU end as new ones arrive). Safe to share between worker threads.
+    """
+    
+    # Rough per-object overheads for the memory estimate
+    ASSEMBLY_OVERHEAD_BYTES = 1024
+    RESULT_OVERHEAD_BYTES = 512
+    
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[ContextAssembly, Hashable, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_bytes = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str, generation: Hashable) -> Optional[ContextAssembly]:
+        """Return a fresh entry for key at this generation, else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+        
+            assembly, entry_generation, cached_at, _ = entry
+            if entry_generation != generation:
+                self._drop(key, "invalidations")
+            elif time.time() - cached_at >= self.ttl_seconds:
+                self._drop(key, "expirations")
+            else:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return assembly
+        
+            self.stats["misses"] += 1
+            return None
+    
+    def put(self, key: str, assembly: ContextAssembly, generation: Hashable):
+        """Insert or refresh an entry, evicting expired then least-recently-used entries."""
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+        
+            size = self._estimate_bytes(assembly)
+            self._entries[key] = (assembly, generation, time.time(), size)
+            self.memory_bytes += size
+        
+            # Reap expired entries sitting at the LRU end
+            now = time.time()
+            while self._entries:
+                oldest_key, (_, _, cached_at, _) = next(iter(self._entries.items()))
+                if now - cached_at < self.ttl_seconds:
+                    break
+                self._drop(oldest_key, "expirations")
+        
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)), "evictions")
+    
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.memory_bytes = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters, size and estimated memory footprint."""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "memory_bytes": self.memory_bytes,
+            }
+    
+    def _drop(self, key: str, reason: Optional[str] = None):
+        _, _, _, size = self._entries.pop(key)
+        self.memory_bytes -= size
+        if reason:
+            self.stats[reason] += 1
+    
+    def _estimate_bytes(self, assembly: ContextAssembly) -> int:
+        return self.ASSEMBLY_OVERHEAD_BYTES + sum(
+            self.RESULT_OVERHEAD_BYTES + len(result.content) + len(result.content_id)
+            for result in assembly.results
+        )
+
+
 class RetrievalAPI:
     """
     Anchor-grounded context retrieval system with optional STAT7 hybrid scoring.
@@ -122,15 +239,40 @@ def __init__(self, config: Optional[Dict[str, Any]] = None,
         self.default_weight_semantic = self.config.get("default_weight_semantic", 0.6)
         self.default_weight_stat7 = self.config.get("default_weight_stat7", 0.4)
         
+        # Vectorized semantic search: candidates pulled per query before ranking/decay
+        self.semantic_candidate_multiplier = self.config.get("semantic_candidate_multiplier", 5)
+        self.min_semantic_candidates = self.config.get("min_semantic_candidates", 50)
+        
         # Retrieval cache (for performance)
-        self.query_cache: Dict[str, ContextAssembly] = {}
         self.cache_ttl_seconds = self.config.get("cache_ttl_seconds", 300)  # 5 minutes
+        self.cache_max_entries = self.config.get("cache_max_entries", 1024)
+        self.query_cache = QueryResultCache(self.cache_max_entries, self.cache_ttl_seconds)
+        
+        # Bumped whenever the context store changes; cached results from older generations are dropped
+        self.corpus_generation = 0
         
         # Document STAT7 assignments cache (for rapid re-retrieval)
         self.document_stat7_cache: Dict[str, Dict[str, Any]] = {}
+        # content_id -> (address dict, parsed STAT7Address) for hybrid scoring
+        self._stat7_address_objects: Dict[str, Tuple[Dict[str, Any], Any]] = {}
         
-        # Simple in-memory document store for ingestion
+        # Simple in-memory document store for ingestion, with a BM25 keyword index over it
+        # (the lock keeps ingest from mutating the index under a query running on a worker thread)
         self._context_store: Dict[str, Dict[str, Any]] = {}
+        self._store_lock = threading.RLock()
+        self._keyword_index = BM25Index(
+            k1=self.config.get("bm25_k1", 1.2),
+            b=self.config.get("bm25_b", 0.75)
+        )
+        
+        # Optional vector index over context-store documents, searched in semantic mode.
+        # "sharded" partitions it across worker processes (document_index_config: n_shards, ...)
+        self.document_index = None
+        document_index_backend = self.config.get("document_index_backend")
+        if document_index_backend and self.embedding_provider is not None:
+            self.document_index = create_ann_index(
+                document_index_backend, config=self.config.get("document_index_config")
+            )
         
         # Metrics
         self.metrics = {
@@ -162,7 +304,7 @@ def retrieve_context(self, query: Union[RetrievalQuery, Dict[str, Any]]) -> Cont
         # Check cache first
         cache_key = self._generate_cache_key(query)
         cached_result = self._get_cached_result(cache_key)
-        if cached_result:
+        if cached_result is not None:
             self.metrics["cache_hits"] += 1
             return cached_result
         
@@ -278,15 +420,109 @@ def add_document(self, doc_id: str, content: str, metadata: Dict[str, Any] = Non
         """
         if doc_id in self._context_store:
             return False  # Document already exists
+        embedding = self._embed_documents([content])[0] if self.document_index is not None else None
         
-        self._context_store[doc_id] = {
-            "content": content,
-            "metadata": metadata or {},
-            "added_at": time.time(),
-            "length": len(content),
-            "content_hash": hashlib.sha256(content.encode()).hexdigest()
-        }
-        return True
+        with self._store_lock:
+            if doc_id in self._context_store:
+                return False
+            
+            self._context_store[doc_id] = {
+                "content": content,
+                "metadata": metadata or {},
+                "added_at": time.time(),
+                "length": len(content),
+                "content_hash": hashlib.sha256(content.encode()).hexdigest()
+            }
+            self._keyword_index.add(doc_id, content)
+            if embedding is not None:
+                self.document_index.add(doc_id, embedding)
+            self.corpus_generation += 1
+            return True
+    
+    def add_documents(self, documents: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Add many documents to the context store in one pass.
+        
+        Args:
+            documents: Dicts with 'doc_id', 'content' and optional 'metadata'
+            
+        Returns:
+            Per-document success flags, in input order (False for duplicates)
+        """
+        added_at = time.time()
+        added = []
+        
+        embeddings = {}
+        if self.document_index is not None:
+            new_documents = {}
+            for document in documents:
+                doc_id = document["doc_id"]
+                if doc_id not in self._context_store and doc_id not in new_documents:
+                    new_documents[doc_id] = document.get("content", "")  # first occurrence is the one stored
+            embeddings = dict(zip(new_documents, self._embed_documents(list(new_documents.values()))))
+        
+        with self._store_lock:
+            for document in documents:
+                doc_id = document["doc_id"]
+                content = document.get("content", "")
+                if doc_id in self._context_store:
+                    added.append(False)  # Document already exists
+                    continue
+                
+                self._context_store[doc_id] = {
+                    "content": content,
+                    "metadata": document.get("metadata") or {},
+                    "added_at": added_at,
+                    "length": len(content),
+                    "content_hash": hashlib.sha256(content.encode()).hexdigest()
+                }
+                self._keyword_index.add(doc_id, content)
+                if doc_id in embeddings:
+                    self.document_index.add(doc_id, embeddings[doc_id])
+                added.append(True)
+            
+            if any(added):
+                self.corpus_generation += 1
+        return added
+    
+    def save_context_store(self, path: str):
+        """Persist documents and their keyword index so a restart skips re-indexing."""
+        with self._store_lock, open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "documents": self._context_store,
+                "keyword_index": self._keyword_index.to_dict()
+            }, f)
+    
+    def load_context_store(self, path: str):
+        """Replace the context store with one written by save_context_store()."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        embeddings = {}
+        if self.document_index is not None:
+            documents = data["documents"]
+            embeddings = dict(zip(documents, self._embed_documents(
+                [document["content"] for document in documents.values()]
+            )))
+        
+        with self._store_lock:
+            if self.document_index is not None:
+                for doc_id in self._context_store:
+                    self.document_index.remove(doc_id)
+                for doc_id, embedding in embeddings.items():
+                    self.document_index.add(doc_id, embedding)
+            self._context_store = data["documents"]
+            self._keyword_index = BM25Index.from_dict(data["keyword_index"])
+            self.corpus_generation += 1
+    
+    def invalidate_cache(self):
+        """Invalidate every cached result (e.g. after external corpus changes)."""
+        self.corpus_generation += 1
+    
+    def close(self):
+        """Release the document index's worker processes and shared memory, if any."""
+        close = getattr(self.document_index, "close", None)
+        if close is not None:
+            close()
     
     def get_context_store_size(self) -> int:
         """Get number of documents in context store."""
@@ -294,14 +530,21 @@ def get_context_store_size(self) -> int:
     
     def get_retrieval_metrics(self) -> Dict[str, Any]:
         """Get retrieval performance and usage metrics."""
+        cache_stats = self.query_cache.get_stats()
         return {
             "retrieval_metrics": self.metrics.copy(),
             "cache_performance": {
                 "hit_rate": self._calculate_cache_hit_rate(),
                 "cache_size": len(self.query_cache),
-                "cache_efficiency": self._calculate_cache_efficiency()
+                "cache_efficiency": self._calculate_cache_efficiency(),
+                "max_entries": cache_stats["max_entries"],
+                "memory_bytes": cache_stats["memory_bytes"],
+                "evictions": cache_stats["evictions"],
+                "expirations": cache_stats["expirations"],
+                "invalidations": cache_stats["invalidations"],
             },
             "context_store_size": self.get_context_store_size(),
+            "document_index": self.document_index.get_index_info() if self.document_index is not None else None,
             "system_health": {
                 "components_available": self._check_component_availability(),
                 "average_quality": self._calculate_average_quality(),
@@ -341,6 +584,7 @@ def _retrieve_semantic_similarity(self, query: RetrievalQuery) -> List[Retrieval
         print(f"DEBUG: context_store size={len(self._context_store)}", file=sys.stderr)
         
         # If embedding provider available, use it
+        query_embedding = None
         if self.embedding_provider:
             # Get query embedding
             try:
@@ -349,62 +593,55 @@ def _retrieve_semantic_similarity(self, query: RetrievalQuery) -> List[Retrieval
                 return results
         
         # Search semantic anchors
-        if self.semantic_anchors:
-            for anchor_id, anchor in self.semantic_anchors.anchors.items():
-                if anchor.embedding:
-                    similarity = self.embedding_provider.calculate_similarity(
-                        query_embedding, anchor.embedding
-                    )
-                    
-                    if similarity >= query.confidence_threshold:
-                        result = RetrievalResult(
-                            result_id=f"anchor_{anchor_id}",
-                            content_type="anchor",
-                            content_id=anchor_id,
-                            content=anchor.concept_text,
-                            relevance_score=similarity,
-                            temporal_distance=self._calculate_temporal_distance(
-                                anchor.provenance.first_seen, query.query_timestamp
-                            ),
-                            anchor_connections=[anchor_id],
-                            provenance_depth=1,
-                            conflict_flags=[],
-                            metadata={
-                                "heat": anchor.heat,
-                                "updates": anchor.provenance.update_count,
-                                "semantic_drift": anchor.semantic_drift
-                            }
-                        )
-                        results.append(result)
+        if self.semantic_anchors and query_embedding is not None:
+            for anchor_id, similarity in self._score_anchors(query_embedding, query):
+                anchor = self.semantic_anchors.anchors[anchor_id]
+                result = RetrievalResult(
+                    result_id=f"anchor_{anchor_id}",
+                    content_type="anchor",
+                    content_id=anchor_id,
+                    content=anchor.concept_text,
+                    relevance_score=similarity,
+                    temporal_distance=self._calculate_temporal_distance(
+                        anchor.provenance.first_seen, query.query_timestamp
+                    ),
+                    anchor_connections=[anchor_id],
+                    provenance_depth=1,
+                    conflict_flags=[],
+                    metadata={
+                        "heat": anchor.heat,
+                        "updates": anchor.provenance.update_count,
+                        "semantic_drift": anchor.semantic_drift
+                    }
+                )
+                results.append(result)
         
         # Search micro-summaries if available
-        if self.summarization_ladder:
-            for micro in self.summarization_ladder.micro_summaries:
-                if micro.semantic_centroid:
-                    similarity = self.embedding_provider.calculate_similarity(
-                        query_embedding, micro.semantic_centroid
-                    )
-                    
-                    if similarity >= query.confidence_threshold:
-                        result = RetrievalResult(
-                            result_id=f"micro_{micro.summary_id}",
-                            content_type="micro_summary",
-                            content_id=micro.summary_id,
-                            content=micro.compressed_text,
-                            relevance_score=similarity,
-                            temporal_distance=self._calculate_temporal_distance(
-                                micro.creation_timestamp, query.query_timestamp
-                            ),
-                            anchor_connections=[],
-                            provenance_depth=2,
-                            conflict_flags=[],
-                            metadata={
-                                "window_size": micro.window_size,
-                                "heat_aggregate": micro.heat_aggregate,
-                                "fragments": micro.window_fragments
-                            }
-                        )
-                        results.append(result)
+        if self.summarization_ladder and query_embedding is not None:
+            for micro, similarity in self._score_micro_summaries(query_embedding, query):
+                result = RetrievalResult(
+                    result_id=f"micro_{micro.summary_id}",
+                    content_type="micro_summary",
+                    content_id=micro.summary_id,
+                    content=micro.compressed_text,
+                    relevance_score=similarity,
+                    temporal_distance=self._calculate_temporal_distance(
+                        micro.creation_timestamp, query.query_timestamp
+                    ),
+                    anchor_connections=[],
+                    provenance_depth=2,
+                    conflict_flags=[],
+                    metadata={
+                        "window_size": micro.window_size,
+                        "heat_aggregate": micro.heat_aggregate,
+                        "fragments": micro.window_fragments
+                    }
+                )
+                results.append(result)
+        
+        # Search context-store documents through their vector index
+        if self.document_index is not None and query_embedding is not None:
+            results.extend(self._score_documents(query_embedding, query))
         
         # Fallback: Search context store using keyword matching if no embeddings
         if not self.embedding_provider and not results:
@@ -412,36 +649,122 @@ def _retrieve_semantic_similarity(self, query: RetrievalQuery) -> List[Retrieval
         
         return results
     
+    def _score_anchors(self, query_embedding: List[float], query: RetrievalQuery) -> List[Tuple[str, float]]:
+        """
+        Score anchors against the query embedding.
+        
+        Uses the anchor graph's normalized embedding matrix (one matrix-vector
+        product plus argpartition) when it is in sync with the anchors; falls
+        back to pairwise calculate_similarity otherwise.
+        """
+        anchors = self.semantic_anchors.anchors
+        embedding_index = getattr(self.semantic_anchors, "embedding_index", None)
+        
+        if (embedding_index is not None and len(embedding_index) == len(anchors)
+                and embedding_index.dimension == len(query_embedding)):
+            candidate_pool = max(query.max_results * self.semantic_candidate_multiplier,
+                                 self.min_semantic_candidates)
+            return embedding_index.top_k(query_embedding, candidate_pool,
+                                         threshold=query.confidence_threshold)
+        
+        scored = []
+        for anchor_id, anchor in anchors.items():
+            if anchor.embedding:
+                similarity = self.embedding_provider.calculate_similarity(
+                    query_embedding, anchor.embedding
+                )
+                if similarity >= query.confidence_threshold:
+                    scored.append((anchor_id, similarity))
+        return scored
+    
+    def _score_documents(self, query_embedding: List[float], query: RetrievalQuery) -> List[RetrievalResult]:
+        """Top-k context-store documents from the document index (scattered across shards when sharded)."""
+        index = self.document_index
+        if not len(index) or index.dimension != len(query_embedding):
+            return []
+        if getattr(index, "thread_safe", False):
+            # The sharded index locks itself; holding the store lock over its
+            # scatter/gather would stall document writes for the whole query
+            matched = index.top_k(query_embedding, query.max_results, threshold=query.confidence_threshold)
+        else:
+            with self._store_lock:
+                matched = index.top_k(query_embedding, query.max_results, threshold=query.confidence_threshold)
+        with self._store_lock:
+            # Documents removed since the index was scored are skipped
+            matched = [(doc_id, similarity) for doc_id, similarity in matched if doc_id in self._context_store]
+            matched_docs = [self._context_store[doc_id] for doc_id, _ in matched]
+        
+        return [
+            RetrievalResult(
+                result_id=f"ctx_{doc_id}",
+                content_type="context_store",
+                content_id=doc_id,
+                content=doc_data.get("content", "")[:500],  # Truncate to 500 chars
+                relevance_score=similarity,
+                temporal_distance=self._calculate_temporal_distance(
+                    doc_data.get("added_at", query.query_timestamp), query.query_timestamp
+                ),
+                anchor_connections=[],
+                provenance_depth=1,
+                conflict_flags=[],
+                metadata=doc_data.get("metadata", {}),
+                semantic_similarity=similarity
+            )
+            for (doc_id, similarity), doc_data in zip(matched, matched_docs)
+        ]
+    
+    def _embed_documents(self, contents: List[str]) -> List[List[float]]:
+        """Embed document contents for the document index in provider-sized batches."""
+        if not contents:
+            return []
+        embed_in_batches = getattr(self.embedding_provider, "embed_in_batches", None)
+        if embed_in_batches is not None:
+            return embed_in_batches(contents)
+        return [self.embedding_provider.embed_text(content) for content in contents]
+    
+    def _score_micro_summaries(self, query_embedding: List[float], query: RetrievalQuery) -> List[Tuple[Any, float]]:
+        """Score micro-summary centroids against the query embedding in one batch."""
+        micros = [m for m in self.summarization_ladder.micro_summaries if m.semantic_centroid]
+        if not micros:
+            return []
+        
+        if all(len(m.semantic_centroid) == len(query_embedding) for m in micros):
+            similarities = batch_cosine_similarity(
+                query_embedding, [m.semantic_centroid for m in micros]
+            ).tolist()
+        else:
+            similarities = [
+                self.embedding_provider.calculate_similarity(query_embedding, m.semantic_centroid)
+                for m in micros
+            ]
+        
+        return [
+            (micro, similarity) for micro, similarity in zip(micros, similarities)
+            if similarity >= query.confidence_threshold
+        ]
+    
     def _search_context_store(self, query: RetrievalQuery) -> List[RetrievalResult]:
         """
-        Simple keyword-based search of context store.
+        BM25 keyword search of context store via its inverted index.
         Used as fallback when embedding provider is not available.
+        
+        Relevance is the fraction of query terms a document contains (so
+        confidence thresholds keep their meaning); BM25 orders documents
+        with equal coverage.
         """
         results = []
         
         if not query.semantic_query or not self._context_store:
             return results
         
-        # Lowercase query terms for case-insensitive matching
-        query_terms = query.semantic_query.lower().split()
-        
-        # Score each document by keyword matches
-        scored_docs = []
-        for doc_id, doc_data in self._context_store.items():
-            content = doc_data.get("content", "").lower()
-            
-            # Count keyword matches
-            matches = sum(1 for term in query_terms if term in content)
-            if matches > 0:
-                # Calculate relevance score based on match ratio
-                relevance_score = min(1.0, matches / len(query_terms))
-                scored_docs.append((doc_id, doc_data, relevance_score))
-        
-        # Sort by relevance score (descending)
-        scored_docs.sort(key=lambda x: x[2], reverse=True)
+        query_term_count = len(tokenize(query.semantic_query))
+        with self._store_lock:
+            matched = self._keyword_index.search(query.semantic_query, query.max_results)
+            matched_docs = [self._context_store[doc_id] for doc_id, _, _ in matched]
         
         # Create results
-        for doc_id, doc_data, relevance_score in scored_docs[:query.max_results]:
+        for (doc_id, matches, bm25_score), doc_data in zip(matched, matched_docs):
+            relevance_score = min(1.0, matches / query_term_count)
             if relevance_score >= query.confidence_threshold:
                 result = RetrievalResult(
                     result_id=f"ctx_{doc_id}",
@@ -786,42 +1109,40 @@ def _calculate_assembly_quality(self, results: List[RetrievalResult], query: Ret
         return quality
     
     def _generate_cache_key(self, query: RetrievalQuery) -> str:
-        """Generate cache key for query."""
+        """Generate cache key for query (every field that affects the result except ids/timestamps)."""
         key_parts = [
             query.mode.value,
             str(query.anchor_ids) if query.anchor_ids else "none",
             query.semantic_query or "none",
             str(query.temporal_range) if query.temporal_range else "none",
             str(query.max_results),
-            str(query.confidence_threshold)
+            str(query.confidence_threshold),
+            str(query.exclude_conflicts),
+            str(query.include_provenance),
+            str(query.stat7_hybrid),
+            str(query.weight_semantic),
+            str(query.weight_stat7),
+            json.dumps(query.stat7_address, sort_keys=True, default=str) if query.stat7_address else "none",
         ]
         key_string = "|".join(key_parts)
         return hashlib.md5(key_string.encode()).hexdigest()
     
+    def _cache_generation(self) -> Tuple[Any, ...]:
+        """Current corpus generation across the context store, anchor graph and summarization ladder."""
+        return (
+            self.corpus_generation,
+            getattr(self.semantic_anchors, "generation", None),
+            getattr(self.summarization_ladder, "micro_summaries_created", None),
+            getattr(self.summarization_ladder, "macro_distillations_created", None),
+        )
+    
     def _get_cached_result(self, cache_key: str) -> Optional[ContextAssembly]:
         """Get cached result if still valid."""
-        if cache_key in self.query_cache:
-            assembly = self.query_cache[cache_key]
-            age_seconds = time.time() - assembly.retrieval_timestamp
-            if age_seconds < self.cache_ttl_seconds:
-                return assembly
-            else:
-                # Remove stale cache entry
-                del self.query_cache[cache_key]
-        return None
+        return self.query_cache.get(cache_key, self._cache_generation())
     
     def _cache_result(self, cache_key: str, assembly: ContextAssembly):
         """Cache retrieval result."""
-        self.query_cache[cache_key] = assembly
-        
-        # Cleanup old cache entries
-        current_time = time.time()
-        stale_keys = [
-            key for key, cached_assembly in self.query_cache.items()
-            if current_time - cached_assembly.retrieval_timestamp > self.cache_ttl_seconds
-        ]
-        for key in stale_keys:
-            del self.query_cache[key]
+        self.query_cache.put(cache_key, assembly, self._cache_generation())
     
     def _update_metrics(self, assembly: ContextAssembly, elapsed_ms: float):
         """Update performance metrics."""
@@ -987,25 +1308,14 @@ def _apply_hybrid_scoring(self, results: List[RetrievalResult], query: Retrieval
             return results
         
         try:
-            q_stat7_dict = query.stat7_address
-            query_realm = Realm(
-                type=q_stat7_dict["realm"]["type"],
-                label=q_stat7_dict["realm"]["label"]
-            )
-            query_stat7 = STAT7Address(
-                realm=query_realm,
-                lineage=q_stat7_dict["lineage"],
-                adjacency=q_stat7_dict["adjacency"],
-                horizon=q_stat7_dict["horizon"],
-                luminosity=q_stat7_dict["luminosity"],
-                polarity=q_stat7_dict["polarity"],
-                dimensionality=q_stat7_dict["dimensionality"]
-            )
+            query_stat7 = self._parse_stat7_address(query.stat7_address, STAT7Address, Realm)
         except Exception:
             # Invalid STAT7 address, fall back to semantic
             return results
         
-        # Apply hybrid scoring to each result
+        # Resolve each result's STAT7 address (parsed objects are cached per content id)
+        scored_results = []
+        doc_stat7s = []
         for result in results:
             # Get or compute STAT7 address for this result's content
             if "stat7" not in result.metadata:
@@ -1020,26 +1330,27 @@ def _apply_hybrid_scoring(self, results: List[RetrievalResult], query: Retrieval
             if not doc_stat7_dict:
                 continue
             
-            try:
-                doc_realm = Realm(
-                    type=doc_stat7_dict["realm"]["type"],
-                    label=doc_stat7_dict["realm"]["label"]
-                )
-                doc_stat7 = STAT7Address(
-                    realm=doc_realm,
-                    lineage=doc_stat7_dict["lineage"],
-                    adjacency=doc_stat7_dict["adjacency"],
-                    horizon=doc_stat7_dict["horizon"],
-                    luminosity=doc_stat7_dict["luminosity"],
-                    polarity=doc_stat7_dict["polarity"],
-                    dimensionality=doc_stat7_dict["dimensionality"]
-                )
-            except Exception:
-                # Skip if document STAT7 invalid
-                continue
+            cached = self._stat7_address_objects.get(result.content_id)
+            if cached is not None and cached[0] == doc_stat7_dict:
+                doc_stat7 = cached[1]
+            else:
+                try:
+                    doc_stat7 = self._parse_stat7_address(doc_stat7_dict, STAT7Address, Realm)
+                except Exception:
+                    # Skip if document STAT7 invalid
+                    continue
+                self._stat7_address_objects[result.content_id] = (doc_stat7_dict, doc_stat7)
             
-            # Compute STAT7 resonance score
-            stat7_res = self.stat7_bridge.stat7_resonance(query_stat7, doc_stat7)
+            scored_results.append(result)
+            doc_stat7s.append(doc_stat7)
+        
+        # Compute STAT7 resonance scores (one vectorized pass when the bridge supports it)
+        if hasattr(self.stat7_bridge, "stat7_resonance_batch"):
+            resonances = self.stat7_bridge.stat7_resonance_batch(query_stat7, doc_stat7s)
+        else:
+            resonances = [self.stat7_bridge.stat7_resonance(query_stat7, doc_stat7) for doc_stat7 in doc_stat7s]
+        
+        for result, stat7_res in zip(scored_results, resonances):
             result.stat7_resonance = stat7_res
             
             # Compute semantic similarity (if available)
@@ -1052,6 +1363,21 @@ def _apply_hybrid_scoring(self, results: List[RetrievalResult], query: Retrieval
         
         return results
     
+    def _parse_stat7_address(self, stat7_dict: Dict[str, Any], address_cls, realm_cls):
+        """Build a STAT7Address from its dictionary form (raises on missing or invalid fields)."""
+        return address_cls(
+            realm=realm_cls(
+                type=stat7_dict["realm"]["type"],
+                label=stat7_dict["realm"]["label"]
+            ),
+            lineage=stat7_dict["lineage"],
+            adjacency=stat7_dict["adjacency"],
+            horizon=stat7_dict["horizon"],
+            luminosity=stat7_dict["luminosity"],
+            polarity=stat7_dict["polarity"],
+            dimensionality=stat7_dict["dimensionality"]
+        )
+    
     def _get_stat7_address_for_content(self, content_id: str, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Get or compute STAT7 address for content with caching.
@@ -23,8 +23,9 @@ def main():
     print(f"[✓] True pairs: {len(true_pairs)}")
     print(f"[✓] False pairs: {len(false_pairs)}")
 
-    # Initialize detector with high threshold
-    detector = EntanglementDetector(threshold=0.85)
+    # Initialize detector with high threshold; all pairs are scored so the
+    # score distribution below covers the whole matrix, not just candidates
+    detector = EntanglementDetector(threshold=0.85, use_candidates=False)
 
     # Run detection
     print("\nComputing entanglement matrix...")
@@ -67,7 +68,7 @@ def main():
     # Get score distribution
     dist = detector.get_score_distribution()
     if dist:
-        print(f"\nScore Distribution:")
+        print(f"\nScore Distribution ({dist['scope'].replace('_', ' ')}: {dist['count']} of {dist['total_pairs']}):")
         print(f"  Min: {dist['min']:.4f}")
         print(f"  Max: {dist['max']:.4f}")
         print(f"  Mean: {dist['mean']:.4f}")
@@ -0,0 +1,81 @@
+"""
+Sediment Segments - Append-Only On-Disk Format for SedimentStore
+
+Each stratum is written as one length-prefixed record:
+
+    u32 header_length | u64 body_length | header JSON | body JSON
+
+The header holds the stratum metrics plus, per cluster, its id, size and
+fragment ids, so a cold start rebuilds every index from headers alone and seeks
+past the bodies. A body (the stratum's cluster list with fragment payloads) is
+read back only when that stratum is requested.
+"""
+
+import json
+import os
+import struct
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+_PREFIX = struct.Struct('<IQ')
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+class SedimentSegmentFile:
+    """Append-only record file with random access to record bodies."""
+
+    def __init__(self, path: str, truncate: bool = False):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._writer = open(path, 'wb' if truncate else 'ab')
+        self._reader = None
+
+    def append(self, header: Dict[str, Any], body: Any) -> Tuple[int, int]:
+        """Append one record; returns (body_offset, body_length)."""
+        header_bytes, body_bytes = _encode(header), _encode(body)
+        offset = self._writer.tell()
+        self._writer.write(_PREFIX.pack(len(header_bytes), len(body_bytes)))
+        self._writer.write(header_bytes)
+        self._writer.write(body_bytes)
+        self._writer.flush()
+        return offset + _PREFIX.size + len(header_bytes), len(body_bytes)
+
+    def scan(self) -> Iterator[Tuple[Dict[str, Any], int, int]]:
+        """
+        Yield (header, body_offset, body_length) for every complete record.
+
+        A record cut short by a crash mid-append is dropped and truncated away,
+        so the next append starts on a record boundary.
+        """
+        end = 0
+        with open(self.path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            while end + _PREFIX.size <= size:
+                header_length, body_length = _PREFIX.unpack(f.read(_PREFIX.size))
+                body_offset = end + _PREFIX.size + header_length
+                if body_offset + body_length > size:
+                    break
+                header = json.loads(f.read(header_length))
+                f.seek(body_length, os.SEEK_CUR)
+                end = body_offset + body_length
+                yield header, body_offset, body_length
+
+        if end < size:
+            self._writer.truncate(end)
+            self._writer.seek(end)
+
+    def read_body(self, offset: int, length: int) -> Any:
+        """Read and decode one record body."""
+        if self._reader is None:
+            self._reader = open(self.path, 'rb')
+        self._reader.seek(offset)
+        return json.loads(self._reader.read(length))
+
+    def close(self):
+        self._writer.close()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
@@ -7,7 +7,7 @@
 import hashlib
 import json
 from dataclasses import dataclass, asdict
-from .embeddings import EmbeddingProvider, EmbeddingProviderFactory
+from .embeddings import EmbeddingProvider, EmbeddingProviderFactory, create_ann_index
 from .anchor_memory_pool import AnchorMemoryPool, get_global_anchor_pool
 from .anchor_data_classes import SemanticAnchor, AnchorProvenance
 
@@ -44,6 +44,13 @@ def __init__(self, embedding_provider: Optional[EmbeddingProvider] = None,
         self.anchors: Dict[str, SemanticAnchor] = {}
         self.clusters: Dict[str, List[str]] = {}  # cluster_id -> anchor_ids
         
+        # Vector index kept in sync with self.anchors for vectorized search
+        # ("exact" brute-force matrix by default; "ivf"/"faiss"/"auto" for ANN)
+        self.embedding_index = create_ann_index(
+            self.config.get("ann_backend", "exact"),
+            config=self.config.get("ann_config")
+        )
+        
         # Lifecycle configuration
         self.max_age_days = self.config.get("max_age_days", 30)
         self.consolidation_threshold = self.config.get("consolidation_threshold", 0.8)
@@ -52,6 +59,9 @@ def __init__(self, embedding_provider: Optional[EmbeddingProvider] = None,
         # Performance configuration
         self.enable_memory_pooling = self.config.get("enable_memory_pooling", True)
         
+        # Bumped on every anchor change so readers (e.g. RetrievalAPI's cache) can detect staleness
+        self.generation = 0
+        
         # Metrics
         self.metrics = {
             "total_anchors_created": 0,
@@ -62,6 +72,41 @@ def __init__(self, embedding_provider: Optional[EmbeddingProvider] = None,
         
     def create_or_update_anchor(self, concept_text: str, utterance_id: str, context: Dict[str, Any]) -> str:
         """Create new anchor or update existing one with PII scrubbing applied."""
+        concept_text, context = self._scrub_concept(concept_text, utterance_id, context)
+        
+        # Generate embedding from scrubbed content
+        embedding = self.embedding_provider.embed_text(concept_text)
+        
+        return self._upsert_anchor(concept_text, embedding, utterance_id, context)
+        
+    def create_or_update_anchors_bulk(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[str]:
+        """
+        Create or update many anchors with a single batched embedding pass.
+        
+        Args:
+            items: (concept_text, utterance_id, context) tuples, applied in order
+            
+        Returns:
+            Anchor id for each item, in input order
+        """
+        scrubbed = [
+            self._scrub_concept(concept_text, utterance_id, context)
+            for concept_text, utterance_id, context in items
+        ]
+        
+        # Embed each distinct scrubbed text once, in provider-sized batches
+        unique_texts = list(dict.fromkeys(concept_text for concept_text, _ in scrubbed))
+        embeddings = dict(zip(unique_texts, self.embedding_provider.embed_in_batches(unique_texts)))
+        
+        # Consolidation stays sequential so later items can merge into anchors created earlier in the batch
+        return [
+            self._upsert_anchor(concept_text, embeddings[concept_text], utterance_id, context)
+            for (concept_text, context), (_, utterance_id, _) in zip(scrubbed, items)
+        ]
+        
+    def _scrub_concept(self, concept_text: str, utterance_id: str,
+                       context: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Apply privacy hooks to concept text; returns scrubbed text and annotated context."""
         
         # 🔐 PRIVACY HOOK: Apply PII scrubbing before anchor injection
         original_concept_text = concept_text
@@ -86,9 +131,12 @@ def create_or_update_anchor(self, concept_text: str, utterance_id: str, context:
                 context["privacy_violations"] = violations
                 # Log the violation but continue with scrubbed content
                 print(f"⚠️ Privacy violations detected for anchor injection: {violations}")
+                
+        return concept_text, context
         
-        # Generate embedding from scrubbed content
-        embedding = self.embedding_provider.embed_text(concept_text)
+    def _upsert_anchor(self, concept_text: str, embedding: List[float],
+                       utterance_id: str, context: Dict[str, Any]) -> str:
+        """Consolidate an embedded concept into its nearest anchor, or create a new one."""
         
         # Check for existing similar anchor
         existing_anchor_id = self._find_similar_anchor(embedding)
@@ -105,6 +153,9 @@ def create_or_update_anchor(self, concept_text: str, utterance_id: str, context:
                 for old, new in zip(anchor.embedding, embedding)
             ]
             
+            self.embedding_index.add(existing_anchor_id, anchor.embedding)
+            self.generation += 1
+            
             # Calculate semantic drift
             anchor.semantic_drift = self._calculate_drift(old_embedding, anchor.embedding)
             
@@ -153,6 +204,8 @@ def create_or_update_anchor(self, concept_text: str, utterance_id: str, context:
                 )
             
             self.anchors[anchor_id] = anchor
+            self.embedding_index.add(anchor_id, anchor.embedding)
+            self.generation += 1
             self.metrics["total_anchors_created"] += 1
             
             return anchor_id
@@ -263,6 +316,7 @@ def apply_lifecycle_policies(self) -> Dict[str, Any]:
         # Evict old/cold anchors and return to memory pool
         for anchor_id in anchors_to_evict:
             evicted_anchor = self.anchors.pop(anchor_id)
+            self.embedding_index.remove(anchor_id)
             
             # Return to memory pool if enabled
             if self.enable_memory_pooling:
@@ -277,6 +331,8 @@ def apply_lifecycle_policies(self) -> Dict[str, Any]:
             })
             
         self.metrics["total_evictions"] += actions["evicted"]
+        if actions["aged"] or actions["evicted"]:
+            self.generation += 1  # Heat decay and evictions both change retrieval results
         
         # Trigger memory pool cleanup periodically
         if self.enable_memory_pooling and actions["evicted"] > 0:
@@ -329,6 +385,14 @@ def get_stability_metrics(self) -> Dict[str, Any]:
         
     def _find_similar_anchor(self, embedding: List[float]) -> Optional[str]:
         """Find existing anchor with similar embedding."""
+        index = self.embedding_index
+        if (index is not None and self.anchors and len(index) == len(self.anchors)
+                and index.dimension == len(embedding)):
+            matches = index.top_k(embedding, 1, threshold=self.consolidation_threshold)
+            if matches and matches[0][1] > self.consolidation_threshold:
+                return matches[0][0]
+            return None
+
         best_similarity = 0
         best_anchor_id = None
         
@@ -10,8 +10,11 @@
 
 import json
 import hashlib
+import os
 import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from json.encoder import encode_basestring_ascii
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_HALF_EVEN
 from typing import Dict, List, Tuple, Any, Optional
@@ -237,6 +240,158 @@ def get_stat7_uri(self) -> str:
         return uri
 
 
+# ============================================================================
+# BATCH ADDRESSING (fast canonical path + process pool)
+# ============================================================================
+
+# Same encoder settings as canonical_serialize (json.dumps builds an identical one)
+_CANONICAL_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=True, sort_keys=False)
+
+_BITCHAIN_TEMPLATE = (
+    '{"created_at":%s,"entity_type":%s,"id":%s,"realm":%s,'
+    '"stat7_coordinates":{"adjacency":[%s],"density":%s,"horizon":%s,"lineage":%s,'
+    '"realm":%s,"resonance":%s,"velocity":%s},"state":%s}'
+)
+
+
+def _normalized_float_repr(value: Any) -> str:
+    """
+    JSON text of float(normalize_float(value)) without the Decimal round trip.
+    
+    When repr(value) needs 10+ fractional digits, no 8-place rounding tie lies
+    within half an ulp of value (a tie would round-trip with fewer digits and
+    repr would have picked it), so round(value, 8) rounds the same way as
+    Decimal(str(value)).quantize and yields the same double. Everything else
+    (short reprs, exponents, ints, NaN/Inf) takes the reference path.
+    """
+    if type(value) is float:
+        text = repr(value)
+        point = text.find('.')
+        if point > 0 and len(text) - point > 10 and 'e' not in text:
+            return repr(round(value, 8))
+    return repr(float(normalize_float(value)))
+
+
+def canonical_json(value: Any) -> str:
+    """canonical_serialize() for any JSON value, with one shared encoder for hot paths."""
+    return _CANONICAL_ENCODER.encode(sort_json_keys(value))
+
+
+def format_canonical_bitchain(created_at: str, entity_type: str, bitchain_id: str, realm: str,
+                              adjacency: str, density: Any, horizon: str, lineage: Any,
+                              coordinate_realm: str, resonance: Any, velocity: Any, state: str) -> bytes:
+    """
+    Canonical bytes of a bit-chain assembled from its parts.
+    
+    Text parts are JSON already (adjacency is the sorted element list without
+    brackets, lineage its JSON or an int); density, resonance and velocity are
+    raw numbers normalized as canonical_serialize would. Shared by
+    canonical_bitchain_bytes() and readers of encoded bit-chains.
+    """
+    return (_BITCHAIN_TEMPLATE % (
+        created_at,
+        entity_type,
+        bitchain_id,
+        realm,
+        adjacency,
+        _normalized_float_repr(density),
+        horizon,
+        lineage,
+        coordinate_realm,
+        _normalized_float_repr(resonance),
+        _normalized_float_repr(velocity),
+        state,
+    )).encode('ascii')
+
+
+def _json_text(value: Any) -> str:
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+    return canonical_json(value)
+
+
+def _state_text(state: Any) -> str:
+    """Flat str-keyed dicts of str/int values (the usual state) skip the generic encoder."""
+    if type(state) is dict and all(type(key) is str for key in state):
+        parts = []
+        for key in sorted(state):
+            value = state[key]
+            if type(value) is int:
+                parts.append(encode_basestring_ascii(key) + ':' + repr(value))
+            elif type(value) is str:
+                parts.append(encode_basestring_ascii(key) + ':' + encode_basestring_ascii(value))
+            else:
+                return _json_text(state)
+        return '{' + ','.join(parts) + '}'
+    return _json_text(state)
+
+
+def canonical_bitchain_bytes(bitchain: 'BitChain') -> bytes:
+    """
+    Canonical bytes of bitchain.to_canonical_dict() without building the dicts.
+    
+    Writes the fixed key layout straight into one format template; byte-for-byte
+    identical to canonical_serialize(bitchain.to_canonical_dict()).encode('utf-8').
+    """
+    coords = bitchain.coordinates
+    adjacency = sorted(coords.adjacency)
+    if all(type(neighbor) is str for neighbor in adjacency):
+        adjacency_text = ','.join(map(encode_basestring_ascii, adjacency))
+    else:
+        adjacency_text = canonical_json(adjacency)[1:-1]
+    lineage = coords.lineage
+    
+    return format_canonical_bitchain(
+        _json_text(bitchain.created_at),
+        _json_text(bitchain.entity_type),
+        _json_text(bitchain.id),
+        _json_text(bitchain.realm),
+        adjacency_text,
+        coords.density,
+        _json_text(coords.horizon),
+        repr(lineage) if type(lineage) is int else _CANONICAL_ENCODER.encode(lineage),
+        _json_text(coords.realm),
+        coords.resonance,
+        coords.velocity,
+        _state_text(bitchain.state),
+    )
+
+
+def _address_chunk(bitchains: List['BitChain']) -> List[str]:
+    sha256 = hashlib.sha256
+    return [sha256(canonical_bitchain_bytes(bc)).hexdigest() for bc in bitchains]
+
+
+def compute_addresses(bitchains: List['BitChain'], workers: Optional[int] = None,
+                      chunk_size: int = 20_000,
+                      executor: Optional[ProcessPoolExecutor] = None) -> List[str]:
+    """
+    STAT7 addresses for many bit-chains, in input order.
+    
+    Same result as [bc.compute_address() for bc in bitchains]. Inputs larger
+    than one chunk are split into chunk_size pieces and hashed on a process
+    pool (workers defaults to os.cpu_count(); pass an executor to reuse one).
+    
+    Args:
+        bitchains: Bit-chains to address
+        workers: Pool size; 1 hashes in this process
+        chunk_size: Bit-chains per pool task
+        executor: Existing process pool to use instead of creating one
+    
+    Returns:
+        Hex-encoded SHA-256 addresses
+    """
+    workers = workers or os.cpu_count() or 1
+    if executor is None and (workers <= 1 or len(bitchains) <= chunk_size):
+        return _address_chunk(bitchains)
+    
+    chunks = [bitchains[start:start + chunk_size] for start in range(0, len(bitchains), chunk_size)]
+    if executor is not None:
+        return [address for chunk in executor.map(_address_chunk, chunks) for address in chunk]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return [address for chunk in pool.map(_address_chunk, chunks) for address in chunk]
+
+
 # ============================================================================
 # RANDOM BIT-CHAIN GENERATION
 # ============================================================================
@@ -16,6 +16,9 @@
 from typing import Dict, Any, List, Tuple, Optional
 import math
 import random
+import sys
+
+import numpy as np
 
 
 # ============================================================================
@@ -127,9 +130,8 @@ def stat7_resonance(query_stat7: STAT7Address, doc_stat7: STAT7Address) -> float
     realm_score = min(realm_score, 1.0)  # Cap at 1.0
     
     # Horizon alignment: scale by distance
-    horizon_levels = {"logline": 1, "outline": 2, "scene": 3, "panel": 4}
-    h_query = horizon_levels.get(query_stat7.horizon, 3)
-    h_doc = horizon_levels.get(doc_stat7.horizon, 3)
+    h_query = HORIZON_LEVELS.get(query_stat7.horizon, DEFAULT_HORIZON_LEVEL)
+    h_doc = HORIZON_LEVELS.get(doc_stat7.horizon, DEFAULT_HORIZON_LEVEL)
     h_distance = abs(h_query - h_doc)
     
     if h_distance == 0:
@@ -189,6 +191,241 @@ def hybrid_score(
     return max(0.0, min(hybrid, 1.0))  # Clamp to [0,1]
 
 
+# ============================================================================
+# Columnar Store: Vectorized Hybrid Scoring
+# ============================================================================
+
+HORIZON_LEVELS = {"logline": 1, "outline": 2, "scene": 3, "panel": 4}
+DEFAULT_HORIZON_LEVEL = 3
+
+# Horizon score indexed by level distance (0, 1, 2, 3)
+_HORIZON_SCORES = np.array([1.0, 0.9, 0.7, 0.7])
+
+
+class STAT7ColumnarStore:
+    """
+    Column-oriented STAT7 document store for one-pass hybrid scoring.
+
+    Realm type/label and horizon are kept as small integer codes, the numeric
+    dimensions as NumPy arrays and embeddings as a column-major float64 matrix.
+    resonance() and hybrid_scores() evaluate every document at once and
+    reproduce stat7_resonance()/hybrid_score() operation for operation, so the
+    scores are bit-identical to the scalar path.
+
+    The cosine dot product is accumulated one embedding column at a time with
+    the same rounding as the builtin sum() used by cosine_similarity().
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.dimension: Optional[int] = None
+        self._realm_type_codes: Dict[str, int] = {}
+        self._realm_label_codes: Dict[str, int] = {}
+        self._rows: Dict[str, List[Any]] = {
+            "realm_type": [], "realm_label": [], "horizon": [], "lineage": [],
+            "adjacency": [], "luminosity": [], "polarity": [], "dimensionality": [],
+            "norm": [],
+        }
+        self._embeddings: List[List[float]] = []
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+        self._matrix: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_documents(cls, documents: List[RAGDocument]) -> "STAT7ColumnarStore":
+        """
+        Build a store from documents in one pass.
+
+        Same result as add() per document, but the embedding matrix is filled
+        in one conversion and the norms are summed column by column, so a
+        build costs less than one scalar scoring pass over the documents.
+        """
+        store = cls()
+        if not documents:
+            return store
+        dimension = len(documents[0].embedding)
+        for doc in documents:
+            if len(doc.embedding) != dimension:
+                raise ValueError(
+                    f"Embedding dimension {len(doc.embedding)} of {doc.id} does not match {dimension}"
+                )
+        store._extend_stat7([doc.stat7 for doc in documents])
+        store.ids = [doc.id for doc in documents]
+
+        matrix = np.asfortranarray(np.asarray([doc.embedding for doc in documents], dtype=np.float64))
+        norms = np.sqrt(_column_sum((matrix[:, d] * matrix[:, d] for d in range(dimension)), len(documents)))
+        store.dimension = dimension
+        store._rows["norm"] = norms.tolist()
+        store._matrix = matrix  # _embeddings stays empty until add() needs the rows
+        return store
+
+    def add(self, doc_id: str, stat7: STAT7Address, embedding: Optional[List[float]] = None):
+        """
+        Append a document.
+
+        Embeddings must share one dimension; a store built without embeddings
+        only supports resonance().
+        """
+        if embedding is not None:
+            embedding = [float(x) for x in embedding]
+            if self.dimension is None and self.ids:
+                raise ValueError("Store was started without embeddings")
+            if self.dimension is None:
+                self.dimension = len(embedding)
+            elif len(embedding) != self.dimension:
+                raise ValueError(
+                    f"Embedding dimension {len(embedding)} does not match store dimension {self.dimension}"
+                )
+        elif self.dimension is not None:
+            raise ValueError(f"Embedding required for {doc_id}")
+
+        self._extend_stat7([stat7])
+        if embedding is not None:
+            if len(self._embeddings) < len(self.ids):
+                self._embeddings = self._matrix.tolist()
+            self._rows["norm"].append(math.sqrt(sum(x * x for x in embedding)))
+            self._embeddings.append(embedding)
+        self.ids.append(doc_id)
+        self._columns = None
+        self._matrix = None
+
+    def _extend_stat7(self, stat7s: List[STAT7Address]):
+        rows = self._rows
+        type_codes, label_codes = self._realm_type_codes, self._realm_label_codes
+        rows["realm_type"] += [type_codes.setdefault(a.realm.type, len(type_codes)) for a in stat7s]
+        rows["realm_label"] += [label_codes.setdefault(a.realm.label, len(label_codes)) for a in stat7s]
+        rows["horizon"] += [HORIZON_LEVELS.get(a.horizon, DEFAULT_HORIZON_LEVEL) for a in stat7s]
+        rows["lineage"] += [a.lineage for a in stat7s]
+        rows["adjacency"] += [a.adjacency for a in stat7s]
+        rows["luminosity"] += [a.luminosity for a in stat7s]
+        rows["polarity"] += [a.polarity for a in stat7s]
+        rows["dimensionality"] += [a.dimensionality for a in stat7s]
+
+    def resonance(self, query_stat7: STAT7Address) -> np.ndarray:
+        """stat7_resonance(query_stat7, doc.stat7) for every document, in insertion order."""
+        columns = self._get_columns()
+        if not self.ids:
+            return np.zeros(0)
+
+        type_code = self._realm_type_codes.get(query_stat7.realm.type, -1)
+        label_code = self._realm_label_codes.get(query_stat7.realm.label, -1)
+        realm_score = np.where(columns["realm_type"] == type_code, 1.0, 0.85)
+        realm_score = realm_score + np.where(columns["realm_label"] == label_code, 0.1, 0.0)
+        realm_score = np.minimum(realm_score, 1.0)
+
+        h_query = HORIZON_LEVELS.get(query_stat7.horizon, DEFAULT_HORIZON_LEVEL)
+        horizon_score = _HORIZON_SCORES[np.abs(columns["horizon"] - h_query)]
+
+        lineage_distance = np.abs(columns["lineage"] - query_stat7.lineage)
+        lineage_score = np.maximum(0.7, 1.0 - 0.05 * lineage_distance)
+
+        luminosity_diff = np.abs(query_stat7.luminosity - columns["luminosity"])
+        polarity_diff = np.abs(query_stat7.polarity - columns["polarity"])
+        signal_score = np.maximum(0.0, 1.0 - 0.5 * (luminosity_diff + polarity_diff))
+
+        dim_bonus = np.minimum(1.0, columns["dimensionality"] / 7.0)
+        adj_dim_score = 0.5 * columns["adjacency"] + 0.5 * dim_bonus
+
+        resonance = realm_score * horizon_score * lineage_score * signal_score
+        resonance *= (0.8 + 0.2 * adj_dim_score)
+        return np.clip(resonance, 0.0, 1.0)
+
+    def semantic_scores(self, query_embedding: List[float]) -> np.ndarray:
+        """cosine_similarity(query_embedding, doc.embedding) for every document."""
+        columns = self._get_columns()
+        if not self.ids:
+            return np.zeros(0)
+        if self._matrix is None:
+            raise ValueError("Store holds no embeddings")
+        if not query_embedding:
+            return np.zeros(len(self.ids))
+
+        query = [float(x) for x in query_embedding]
+        # zip() in the scalar path stops at the shorter vector
+        products = (self._matrix[:, d] * query[d] for d in range(min(len(query), self.dimension)))
+        dot = _column_sum(products, len(self.ids))
+
+        query_norm = math.sqrt(sum(x * x for x in query))
+        return dot / (query_norm * columns["norm"] + 1e-12)
+
+    def hybrid_scores(
+        self,
+        query_embedding: List[float],
+        query_stat7: STAT7Address,
+        weight_semantic: float = 0.6,
+        weight_stat7: float = 0.4,
+    ) -> np.ndarray:
+        """hybrid_score() for every document, in insertion order."""
+        assert weight_semantic + weight_stat7 == 1.0, "Weights must sum to 1.0"
+
+        semantic_sim = self.semantic_scores(query_embedding)
+        stat7_res = self.resonance(query_stat7)
+        return np.clip((weight_semantic * semantic_sim) + (weight_stat7 * stat7_res), 0.0, 1.0)
+
+    def top_k(
+        self,
+        query_embedding: List[float],
+        query_stat7: STAT7Address,
+        k: int = 10,
+        weight_semantic: float = 0.6,
+        weight_stat7: float = 0.4,
+    ) -> List[Tuple[str, float]]:
+        """Top-k (doc_id, hybrid_score), ties kept in insertion order like retrieve()."""
+        scores = self.hybrid_scores(query_embedding, query_stat7, weight_semantic, weight_stat7)
+        return [(self.ids[i], float(scores[i])) for i in _stable_top_k(scores, k)]
+
+    def _get_columns(self) -> Dict[str, np.ndarray]:
+        if self._columns is None:
+            rows = self._rows
+            self._columns = {
+                "realm_type": np.asarray(rows["realm_type"], dtype=np.int32),
+                "realm_label": np.asarray(rows["realm_label"], dtype=np.int32),
+                "horizon": np.asarray(rows["horizon"], dtype=np.int8),
+                "lineage": np.asarray(rows["lineage"], dtype=np.int64),
+                "adjacency": np.asarray(rows["adjacency"], dtype=np.float64),
+                "luminosity": np.asarray(rows["luminosity"], dtype=np.float64),
+                "polarity": np.asarray(rows["polarity"], dtype=np.float64),
+                "dimensionality": np.asarray(rows["dimensionality"], dtype=np.int64),
+                "norm": np.asarray(rows["norm"], dtype=np.float64),
+            }
+            if self._embeddings and self._matrix is None:
+                self._matrix = np.asfortranarray(np.asarray(self._embeddings, dtype=np.float64))
+        return self._columns
+
+
+def _column_sum(columns, size: int) -> np.ndarray:
+    """Element-wise sum of column vectors, rounded exactly as the builtin sum() rounds."""
+    total = np.zeros(size)
+    if sys.version_info < (3, 12):
+        for column in columns:
+            total = total + column
+        return total
+
+    # Python 3.12+ sum() of floats uses Neumaier compensated summation
+    compensation = np.zeros(size)
+    for column in columns:
+        step = total + column
+        compensation += np.where(np.abs(total) >= np.abs(column),
+                                 (total - step) + column, (column - step) + total)
+        total = step
+    apply = (compensation != 0) & np.isfinite(compensation)
+    return np.where(apply, total + compensation, total)
+
+
+def _stable_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k best scores, descending, equal scores in index order."""
+    if k <= 0 or scores.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    if scores.size > k:
+        kth = np.partition(scores, scores.size - k)[scores.size - k]
+        candidates = np.flatnonzero(scores >= kth)
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.argsort(-scores[candidates], kind="stable")][:k]
+
+
 # ============================================================================
 # Retrieval: Hybrid RAG Search
 # ============================================================================
@@ -214,6 +451,23 @@ def retrieve(
     
     Returns: List of (doc_id, hybrid_score) tuples, sorted by score (descending)
     """
+    try:
+        store = STAT7ColumnarStore.from_documents(documents)
+    except ValueError:
+        # Mixed embedding sizes: score document by document
+        return _retrieve_scalar(documents, query_embedding, query_stat7, k, weight_semantic, weight_stat7)
+    return store.top_k(query_embedding, query_stat7, k, weight_semantic, weight_stat7)
+
+
+def _retrieve_scalar(
+    documents: List[RAGDocument],
+    query_embedding: List[float],
+    query_stat7: STAT7Address,
+    k: int,
+    weight_semantic: float,
+    weight_stat7: float,
+) -> List[Tuple[str, float]]:
+    """Reference implementation of retrieve(): one hybrid_score() call per document."""
     scores = []
     for doc in documents:
         score = hybrid_score(query_embedding, doc, query_stat7, weight_semantic, weight_stat7)
@@ -408,8 +662,16 @@ class STAT7RAGBridge:
     
     This allows RetrievalAPI to work with STAT7 coordinates seamlessly through
     dependency injection.
+    
+    retrieve() scores exactly the documents it is given. For repeated queries
+    over one corpus, index_documents()/add_documents() keep a columnar store
+    and search() queries it; the index changes only through those calls.
     """
     
+    def __init__(self):
+        self._store: Optional[STAT7ColumnarStore] = None
+        self.index_version = 0
+    
     def stat7_resonance(self, query_stat7: STAT7Address, doc_stat7: STAT7Address) -> float:
         """
         Compute STAT7 resonance between query and document addresses.
@@ -422,6 +684,21 @@ def stat7_resonance(self, query_stat7: STAT7Address, doc_stat7: STAT7Address) ->
         """
         return stat7_resonance(query_stat7, doc_stat7)
     
+    def stat7_resonance_batch(self, query_stat7: STAT7Address, doc_stat7s: List[STAT7Address]) -> List[float]:
+        """
+        Compute STAT7 resonance of one query address against many documents in one pass.
+        
+        Args:
+            query_stat7: Query STAT7 address
+            doc_stat7s: Document STAT7 addresses
+        
+        Returns: Resonance scores in the order of doc_stat7s
+        """
+        store = STAT7ColumnarStore()
+        for i, doc_stat7 in enumerate(doc_stat7s):
+            store.add(str(i), doc_stat7)
+        return store.resonance(query_stat7).tolist()
+    
     def hybrid_score(
         self,
         query_embedding: List[float],
@@ -466,4 +743,39 @@ def retrieve(
         
         Returns: List of (doc_id, hybrid_score) tuples, sorted by score (descending)
         """
-        return retrieve(documents, query_embedding, query_stat7, k, weight_semantic, weight_stat7)
\ No newline at end of file
+        return retrieve(documents, query_embedding, query_stat7, k, weight_semantic, weight_stat7)
+    
+    def index_documents(self, documents: List[RAGDocument]):
+        """
+        Replace the search() index with the given documents.
+        
+        Call again after documents are replaced or edited in place; the index
+        holds a copy of their scores and does not watch the list.
+        """
+        self._store = STAT7ColumnarStore.from_documents(documents)
+        self.index_version += 1
+    
+    def add_documents(self, documents: List[RAGDocument]):
+        """Append documents to the search() index."""
+        if self._store is None:
+            self._store = STAT7ColumnarStore()
+        for doc in documents:
+            self._store.add(doc.id, doc.stat7, doc.embedding)
+        self.index_version += 1
+    
+    def search(
+        self,
+        query_embedding: List[float],
+        query_stat7: STAT7Address,
+        k: int = 10,
+        weight_semantic: float = 0.6,
+        weight_stat7: float = 0.4,
+    ) -> List[Tuple[str, float]]:
+        """
+        Retrieve top-k indexed documents using hybrid scoring.
+        
+        Returns: List of (doc_id, hybrid_score) tuples, same order as retrieve()
+        """
+        if self._store is None:
+            return []
+        return self._store.top_k(query_embedding, query_stat7, k, weight_semantic, weight_stat7)
\ No newline at end of file
@@ -9,15 +9,25 @@
     the pipeline must adapt its flow to the castle's capacity." - Bootstrap Sentinel
 """
 
-from typing import List, Dict, Any, Optional, Callable, Deque
+from typing import List, Dict, Any, Optional, Callable, Deque, Set, Tuple, Union, Awaitable
 import time
 import asyncio
+import inspect
+import heapq
+import itertools
 import threading
 from collections import deque
-from dataclasses import dataclass
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, field
 from enum import Enum
 import queue
 
+try:
+    from .ingestion_wal import WriteAheadLog
+except ImportError:
+    # Loaded as a top-level module (seed/engine on sys.path)
+    from ingestion_wal import WriteAheadLog
+
 
 class PipelineState(Enum):
     """Pipeline operational states."""
@@ -38,6 +48,12 @@ class BackpressureLevel(Enum):
     CRITICAL = "critical"
 
 
+class OrderingMode(Enum):
+    """Ordering guarantee for one priority class across processing workers."""
+    UNORDERED = "unordered"  # batches of the class may be processed concurrently
+    ORDERED = "ordered"      # one batch of the class in flight at a time, in queue order
+
+
 @dataclass
 class Fragment:
     """Data fragment for ingestion."""
@@ -47,10 +63,22 @@ class Fragment:
     priority: int = 1  # 1=low, 5=high
     timestamp: float = 0.0
     retry_count: int = 0
+    wal_offset: Optional[int] = field(default=None, repr=False, compare=False)  # LSN when logged
     
     def __post_init__(self):
         if self.timestamp == 0.0:
             self.timestamp = time.time()
+            
+    def to_record(self) -> Dict[str, Any]:
+        """Serializable form written to the write-ahead log."""
+        return {
+            "fragment_id": self.fragment_id,
+            "content": self.content,
+            "metadata": self.metadata,
+            "priority": self.priority,
+            "timestamp": self.timestamp,
+            "retry_count": self.retry_count,
+        }
 
 
 @dataclass
@@ -61,6 +89,7 @@ class BatchContext:
     batch_size: int
     processing_start_time: float
     estimated_completion_time: float = 0.0
+    claimed_classes: Tuple[int, ...] = ()  # ordered priority classes held until the batch finishes
     
     def get_processing_duration(self) -> float:
         """Get current processing duration in seconds."""
@@ -76,6 +105,10 @@ class PipelineMetrics:
     average_batch_size: float = 0.0
     backpressure_events: int = 0
     failed_fragments: int = 0
+    timed_out_batches: int = 0
+    dead_lettered_fragments: int = 0
+    dropped_retries: int = 0  # retries that no longer fit in the queue
+    replayed_fragments: int = 0
     throughput_fragments_per_sec: float = 0.0
     queue_depth_max: int = 0
     queue_depth_current: int = 0
@@ -87,15 +120,362 @@ def update_throughput(self, window_size_sec: float = 60.0):
             self.throughput_fragments_per_sec = self.total_fragments_processed / processing_time_sec
 
 
-class StreamingIngestionPipeline:
+class PriorityBatchQueue:
+    """
+    Bounded priority queue drained a batch at a time.
+
+    Fragments are kept per priority class and by timestamp within a class,
+    the order of the (-priority, timestamp) keys of a PriorityQueue.
+    get_batch takes up to max_items fragments, highest class first, under a
+    single lock acquisition instead of one get() per fragment. An ORDERED
+    class is claimed by the batch that takes it and is skipped by other
+    consumers until release(); requeue() puts that batch's retries back at
+    the head of the class first.
+    """
+
+    def __init__(self, maxsize: int = 0, ordering: Optional[Dict[int, OrderingMode]] = None):
+        self.maxsize = maxsize
+        self.ordered_classes: Set[int] = {
+            priority for priority, mode in (ordering or {}).items() if mode == OrderingMode.ORDERED
+        }
+        self._classes: Dict[int, List[Tuple[float, int, Fragment]]] = {}
+        self._claimed: Set[int] = set()
+        self._size = 0
+        self._sequence = itertools.count()
+        self._front_sequence = itertools.count(-(1 << 62))  # sorts before every put()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def put(self, fragment: Fragment, block: bool = True, timeout: Optional[float] = None):
+        """Enqueue a fragment; raises queue.Full like queue.Queue.put."""
+        with self._not_full:
+            if self.maxsize > 0 and self._size >= self.maxsize:
+                if not block:
+                    raise queue.Full
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while self._size >= self.maxsize:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Full
+                    self._not_full.wait(remaining)
+
+            entry = (fragment.timestamp, next(self._sequence), fragment)
+            heapq.heappush(self._classes.setdefault(fragment.priority, []), entry)
+            self._size += 1
+            self._not_empty.notify()
+
+    def get_batch(self, max_items: int, timeout: Optional[float] = None) -> Tuple[List[Fragment], Tuple[int, ...]]:
+        """
+        Dequeue up to max_items fragments, waiting up to timeout for the first.
+
+        Returns (fragments, claimed ordered classes); pass the latter to release().
+        """
+        with self._not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                available = sorted(
+                    (priority for priority, entries in self._classes.items()
+                     if entries and priority not in self._claimed),
+                    reverse=True,
+                )
+                if available:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return [], ()
+                self._not_empty.wait(remaining)
+
+            fragments: List[Fragment] = []
+            claimed = []
+            for priority in available:
+                entries = self._classes[priority]
+                take = min(len(entries), max_items - len(fragments))
+                fragments.extend(heapq.heappop(entries)[2] for _ in range(take))
+                if priority in self.ordered_classes:
+                    self._claimed.add(priority)
+                    claimed.append(priority)
+                if len(fragments) >= max_items:
+                    break
+
+            self._size -= len(fragments)
+            self._not_full.notify(len(fragments))
+            return fragments, tuple(claimed)
+
+    def requeue(self, fragment: Fragment):
+        """
+        Return a fragment of a claimed class ahead of the fragments put() since.
+
+        Call before release() so no other consumer overtakes it. The fragment
+        was admitted once already, so maxsize is not enforced; the overshoot
+        is at most one batch per claimed class.
+        """
+        with self._lock:
+            entry = (fragment.timestamp, next(self._front_sequence), fragment)
+            heapq.heappush(self._classes.setdefault(fragment.priority, []), entry)
+            self._size += 1
+            self._not_empty.notify()
+
+    def release(self, claimed: Tuple[int, ...]):
+        """Hand ordered classes claimed by get_batch back to other consumers."""
+        if not claimed:
+            return
+        with self._lock:
+            self._claimed.difference_update(claimed)
+            self._not_empty.notify_all()
+
+    def wake_all(self):
+        """Wake every consumer blocked in get_batch (used on stop)."""
+        with self._lock:
+            self._not_empty.notify_all()
+
+
+class _AdaptivePipelineBase:
+    """
+    Adaptive batch sizing, backpressure levels and metrics shared by the
+    threaded and asyncio pipelines; subclasses supply the queue and workers.
+    """
+
+    def __init__(self,
+                 initial_batch_size: int,
+                 max_batch_size: int,
+                 max_queue_size: int,
+                 backpressure_threshold: float,
+                 processing_timeout_sec: float,
+                 num_workers: int,
+                 max_retries: int):
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+
+        self.initial_batch_size = initial_batch_size
+        self.max_batch_size = max_batch_size
+        self.max_queue_size = max_queue_size
+        self.backpressure_threshold = backpressure_threshold
+        self.processing_timeout_sec = processing_timeout_sec
+        self.num_workers = num_workers
+        self.max_retries = max_retries
+        
+        # Pipeline state
+        self.state = PipelineState.STOPPED
+        self.backpressure_level = BackpressureLevel.NONE
+        self._metrics_lock = threading.Lock()
+        self._batch_sequence = itertools.count()
+        
+        # Adaptive configuration
+        self.current_batch_size = initial_batch_size
+        self.adaptive_enabled = True
+        
+        # Performance tracking
+        self.metrics = PipelineMetrics()
+        self.processing_history: Deque[float] = deque(maxlen=100)  # Last 100 processing times
+        
+        # Callbacks
+        self.backpressure_callback: Optional[Callable[[BackpressureLevel], None]] = None
+        self.metrics_callback: Optional[Callable[[PipelineMetrics], None]] = None
+        
+    def _new_batch(self, fragments: List[Fragment], claimed: Tuple[int, ...] = ()) -> BatchContext:
+        start_time = time.time()
+        return BatchContext(
+            batch_id=f"batch_{int(start_time * 1000)}_{next(self._batch_sequence)}",
+            fragments=fragments,
+            batch_size=len(fragments),
+            processing_start_time=start_time,
+            claimed_classes=claimed
+        )
+        
+    def _update_queue_depth(self, depth: int):
+        """Record the current queue depth and re-evaluate backpressure."""
+        self.metrics.queue_depth_current = depth
+        self.metrics.queue_depth_max = max(self.metrics.queue_depth_max, depth)
+        self._check_backpressure()
+        
+    def _record_rejection(self):
+        """Queue is full - backpressure event."""
+        self.metrics.backpressure_events += 1
+        if self.backpressure_callback:
+            self.backpressure_callback(BackpressureLevel.CRITICAL)
+            
+    def _update_metrics(self, batch: BatchContext):
+        """Update performance metrics after successful batch processing."""
+        processing_duration = batch.get_processing_duration()
+        processing_time_ms = processing_duration * 1000
+        
+        with self._metrics_lock:
+            # Update counters
+            self.metrics.total_fragments_processed += len(batch.fragments)
+            self.metrics.total_batches_processed += 1
+            self.metrics.total_processing_time_ms += processing_time_ms
+            
+            # Update averages
+            self.metrics.average_batch_size = (
+                self.metrics.total_fragments_processed / self.metrics.total_batches_processed
+            )
+            
+            # Track processing time history
+            self.processing_history.append(processing_time_ms)
+            
+            # Update throughput
+            self.metrics.update_throughput()
+        
+        # Trigger metrics callback
+        if self.metrics_callback:
+            self.metrics_callback(self.metrics)
+            
+    def _retry_failed(self, batch: BatchContext, requeue: Callable[[Fragment], bool]) -> List[Fragment]:
+        """
+        Requeue the fragments of a failed batch at _retry_priority().
+
+        Ids are kept so downstream dedupe still works. Returns the fragments
+        that were not requeued: those that reached max_retries (dead-lettered)
+        and those that no longer fit in the queue (dropped retries).
+        """
+        with self._metrics_lock:
+            self.metrics.failed_fragments += len(batch.fragments)
+        
+        exhausted, dropped = [], []
+        for fragment in batch.fragments:
+            fragment.retry_count += 1
+            
+            if fragment.retry_count < self.max_retries:
+                fragment.priority = self._retry_priority(fragment)
+                if not requeue(fragment):
+                    dropped.append(fragment)
+            else:
+                exhausted.append(fragment)
+                
+        with self._metrics_lock:
+            self.metrics.dead_lettered_fragments += len(exhausted)
+            self.metrics.dropped_retries += len(dropped)
+        if dropped:
+            self._record_rejection()
+        return exhausted + dropped
+        
+    def _retry_priority(self, fragment: Fragment) -> int:
+        """Priority a retried fragment is requeued at: one class lower."""
+        return max(1, fragment.priority - 1)
+        
+    def _adapt_batch_size(self, batch: BatchContext):
+        """Adapt batch size based on processing performance."""
+        if not self.adaptive_enabled or len(self.processing_history) < 5:
+            return
+            
+        # Calculate recent average processing time
+        with self._metrics_lock:
+            recent_times = list(self.processing_history)[-5:]
+        avg_processing_time = sum(recent_times) / len(recent_times)
+        
+        # Target processing time (aiming for ~100ms per batch)
+        target_time_ms = 100.0
+        
+        if avg_processing_time < target_time_ms * 0.7:
+            # Processing is fast, can increase batch size
+            self.current_batch_size = min(
+                self.current_batch_size + 2,
+                self.max_batch_size
+            )
+        elif avg_processing_time > target_time_ms * 1.5:
+            # Processing is slow, should decrease batch size
+            self.current_batch_size = max(
+                self.current_batch_size - 1,
+                1
+            )
+            
+    def _check_backpressure(self):
+        """Check and update backpressure level."""
+        queue_utilization = self.metrics.queue_depth_current / self.max_queue_size
+        
+        # Determine backpressure level
+        if queue_utilization >= 0.95:
+            level = BackpressureLevel.CRITICAL
+        elif queue_utilization >= 0.85:
+            level = BackpressureLevel.HIGH
+        elif queue_utilization >= 0.70:
+            level = BackpressureLevel.MEDIUM
+        elif queue_utilization >= 0.50:
+            level = BackpressureLevel.LOW
+        else:
+            level = BackpressureLevel.NONE
+            
+        # Update state if backpressure level changed
+        if level != self.backpressure_level:
+            self.backpressure_level = level
+            
+            # Update pipeline state
+            if level in [BackpressureLevel.HIGH, BackpressureLevel.CRITICAL]:
+                self.state = PipelineState.BACKPRESSURE
+            elif self.state == PipelineState.BACKPRESSURE:
+                self.state = PipelineState.RUNNING
+                
+            # Trigger callback
+            if self.backpressure_callback:
+                self.backpressure_callback(level)
+                
+    def get_status(self) -> Dict[str, Any]:
+        """Get comprehensive pipeline status."""
+        return {
+            "state": self.state.value,
+            "backpressure_level": self.backpressure_level.value,
+            "current_batch_size": self.current_batch_size,
+            "queue_depth": self.metrics.queue_depth_current,
+            "queue_utilization_pct": (self.metrics.queue_depth_current / self.max_queue_size) * 100,
+            "metrics": {
+                "total_processed": self.metrics.total_fragments_processed,
+                "total_batches": self.metrics.total_batches_processed,
+                "throughput_fps": self.metrics.throughput_fragments_per_sec,
+                "avg_batch_size": self.metrics.average_batch_size,
+                "backpressure_events": self.metrics.backpressure_events,
+                "failed_fragments": self.metrics.failed_fragments,
+                "timed_out_batches": self.metrics.timed_out_batches,
+                "dead_lettered_fragments": self.metrics.dead_lettered_fragments,
+                "dropped_retries": self.metrics.dropped_retries,
+                "replayed_fragments": self.metrics.replayed_fragments
+            },
+            "performance": {
+                "avg_processing_time_ms": (
+                    sum(self.processing_history) / len(self.processing_history)
+                    if self.processing_history else 0.0
+                ),
+                "recent_processing_times": list(self.processing_history)[-10:],
+                "adaptive_enabled": self.adaptive_enabled
+            }
+        }
+        
+    def configure_adaptive_mode(self, enabled: bool, target_time_ms: float = 100.0):
+        """Configure adaptive batch sizing."""
+        self.adaptive_enabled = enabled
+        self.target_processing_time = target_time_ms
+        
+    def set_backpressure_callback(self, callback: Callable[[BackpressureLevel], None]):
+        """Set callback for backpressure events."""
+        self.backpressure_callback = callback
+        
+    def set_metrics_callback(self, callback: Callable[[PipelineMetrics], None]):
+        """Set callback for metrics updates."""
+        self.metrics_callback = callback
+        
+    def reset_metrics(self):
+        """Reset performance metrics."""
+        self.metrics = PipelineMetrics()
+        self.processing_history.clear()
+
+
+class StreamingIngestionPipeline(_AdaptivePipelineBase):
     """
     High-performance streaming ingestion pipeline with adaptive backpressure.
     
     Features:
     - Adaptive batch sizing based on processing capacity
     - Backpressure detection and automatic throttling
-    - Priority-based fragment ordering
-    - Concurrent processing with thread safety
+    - Priority-based fragment ordering, optionally strict per priority class
+    - Concurrent processing on a pool of thread or process workers
+    - Per-batch processing timeouts
+    - Optional write-ahead log: durable ingest, replay after a crash, dead letters
     - Comprehensive performance metrics
     """
     
@@ -105,7 +485,12 @@ def __init__(self,
                  max_batch_size: int = 100,
                  max_queue_size: int = 1000,
                  backpressure_threshold: float = 0.8,
-                 processing_timeout_sec: float = 30.0):
+                 processing_timeout_sec: float = 30.0,
+                 num_workers: int = 1,
+                 worker_mode: str = "thread",
+                 ordering: Optional[Dict[int, OrderingMode]] = None,
+                 wal: Optional[WriteAheadLog] = None,
+                 max_retries: int = 3):
         """
         Initialize streaming pipeline.
         
@@ -115,36 +500,39 @@ def __init__(self,
             max_batch_size: Maximum allowed batch size
             max_queue_size: Maximum fragments in queue before backpressure
             backpressure_threshold: Queue utilization threshold for backpressure
-            processing_timeout_sec: Timeout for batch processing
+            processing_timeout_sec: Timeout for batch processing. The call itself
+                cannot be interrupted: a batch that exceeds it is counted as timed
+                out and its worker moves on, but the batch is only acknowledged or
+                retried (and its ordered class released) once the call returns
+            num_workers: Batches processed concurrently
+            worker_mode: 'thread', or 'process' for CPU-bound processor_func
+                (which must then be picklable, e.g. a module-level function)
+            ordering: OrderingMode per priority class (default UNORDERED)
+            wal: Write-ahead log in front of the queue. Ingested fragments are
+                durable before ingest returns, acknowledged once processor_func
+                succeeds, and replayed by the first start() after a restart.
+                A failed fragment that cannot be retried (max_retries reached,
+                or no room left in the queue) is dead-lettered, then acknowledged
+            max_retries: Processing attempts before a fragment is dead-lettered
         """
+        if worker_mode not in ("thread", "process"):
+            raise ValueError(f"Unknown worker_mode: {worker_mode}")
+        super().__init__(initial_batch_size, max_batch_size, max_queue_size, backpressure_threshold,
+                         processing_timeout_sec, num_workers, max_retries)
+
         self.processor_func = processor_func
-        self.initial_batch_size = initial_batch_size
-        self.max_batch_size = max_batch_size
-        self.max_queue_size = max_queue_size
-        self.backpressure_threshold = backpressure_threshold
-        self.processing_timeout_sec = processing_timeout_sec
-        
-        # Pipeline state
-        self.state = PipelineState.STOPPED
-        self.backpressure_level = BackpressureLevel.NONE
+        self.worker_mode = worker_mode
+        self.wal = wal
+        self._wal_replayed = False
         
         # Queues and threading
-        self.ingestion_queue: queue.PriorityQueue = queue.PriorityQueue(maxsize=max_queue_size)
-        self.processing_thread: Optional[threading.Thread] = None
+        self.ingestion_queue = PriorityBatchQueue(maxsize=max_queue_size, ordering=ordering)
+        self.processing_threads: List[threading.Thread] = []
+        self.executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        self._timed_out_calls: Set[Future] = set()  # still running after their timeout
         self.stop_event = threading.Event()
         
-        # Adaptive configuration
-        self.current_batch_size = initial_batch_size
-        self.adaptive_enabled = True
-        
-        # Performance tracking
-        self.metrics = PipelineMetrics()
-        self.processing_history: Deque[float] = deque(maxlen=100)  # Last 100 processing times
-        
-        # Callbacks
-        self.backpressure_callback: Optional[Callable[[BackpressureLevel], None]] = None
-        self.metrics_callback: Optional[Callable[[PipelineMetrics], None]] = None
-        
     def start(self):
         """Start the streaming pipeline."""
         if self.state != PipelineState.STOPPED:
@@ -153,12 +541,33 @@ def start(self):
         self.state = PipelineState.STARTING
         self.stop_event.clear()
         
-        # Start processing thread
-        self.processing_thread = threading.Thread(target=self._processing_loop, daemon=True)
-        self.processing_thread.start()
+        # Processor calls run on the executor so timeouts can be enforced
+        self.executor = self._new_executor()
+        
+        # Start one batch-collecting thread per worker
+        self.processing_threads = [
+            threading.Thread(target=self._processing_loop, name=f"ingest-worker-{i}", daemon=True)
+            for i in range(self.num_workers)
+        ]
+        for thread in self.processing_threads:
+            thread.start()
         
         self.state = PipelineState.RUNNING
         
+        # Re-queue whatever was logged but never acknowledged before the last shutdown
+        if self.wal is not None and not self._wal_replayed:
+            self._wal_replayed = True
+            for lsn, record in self.wal.replay():
+                fragment = Fragment(**record)
+                fragment.wal_offset = lsn
+                self.ingestion_queue.put(fragment)  # blocks while the workers drain
+                self.metrics.replayed_fragments += 1
+        
+    def _new_executor(self) -> Executor:
+        if self.worker_mode == "process":
+            return ProcessPoolExecutor(max_workers=self.num_workers)
+        return ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="ingest-processor")
+        
     def stop(self, timeout_sec: float = 10.0):
         """Stop the streaming pipeline gracefully."""
         if self.state == PipelineState.STOPPED:
@@ -166,9 +575,17 @@ def stop(self, timeout_sec: float = 10.0):
             
         self.state = PipelineState.DRAINING
         self.stop_event.set()
+        self.ingestion_queue.wake_all()
+        
+        deadline = time.monotonic() + timeout_sec
+        for thread in self.processing_threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        self.processing_threads = []
         
-        if self.processing_thread:
-            self.processing_thread.join(timeout=timeout_sec)
+        with self._executor_lock:
+            if self.executor:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
             
         self.state = PipelineState.STOPPED
         
@@ -187,66 +604,85 @@ def ingest_fragment(self, fragment: Fragment, block: bool = True, timeout: float
         if self.state not in [PipelineState.RUNNING, PipelineState.BACKPRESSURE]:
             return False
             
-        try:
-            # Priority queue uses negative priority for max-heap behavior
-            priority_key = (-fragment.priority, fragment.timestamp)
-            self.ingestion_queue.put((priority_key, fragment), block=block, timeout=timeout)
-            
-            # Update queue metrics
-            self.metrics.queue_depth_current = self.ingestion_queue.qsize()
-            self.metrics.queue_depth_max = max(
-                self.metrics.queue_depth_max, 
-                self.metrics.queue_depth_current
-            )
-            
-            # Check for backpressure
-            self._check_backpressure()
+        if self.wal is not None:
+            if not block and self.ingestion_queue.qsize() >= self.max_queue_size:
+                self._record_rejection()  # rejected without touching the log
+                return False
+            fragment.wal_offset = self.wal.append(fragment.to_record())
+            self.wal.commit(fragment.wal_offset)
             
+        return self._enqueue(fragment, block=block, timeout=timeout)
+        
+    def _enqueue(self, fragment: Fragment, block: bool = True, timeout: float = None) -> bool:
+        """Put an (already logged) fragment on the in-memory queue."""
+        try:
+            self.ingestion_queue.put(fragment, block=block, timeout=timeout)
+            self._update_queue_depth(self.ingestion_queue.qsize())
             return True
             
         except queue.Full:
-            # Queue is full - backpressure event
-            self.metrics.backpressure_events += 1
-            if self.backpressure_callback:
-                self.backpressure_callback(BackpressureLevel.CRITICAL)
+            # A rejected fragment is not replayed
+            if fragment.wal_offset is not None:
+                self.wal.ack([fragment.wal_offset])
+                fragment.wal_offset = None
+            self._record_rejection()
             return False
             
     def ingest_batch(self, fragments: List[Fragment]) -> int:
         """
         Ingest multiple fragments efficiently.
         
+        With a write-ahead log the fragments that fit in the queue are logged
+        and made durable with a single commit.
+        
         Returns:
             Number of fragments successfully ingested
         """
+        if self.state not in [PipelineState.RUNNING, PipelineState.BACKPRESSURE]:
+            return 0
+            
+        candidates = fragments
+        if self.wal is not None:
+            # Log only what currently fits, made durable by one commit
+            candidates = fragments[:max(0, self.max_queue_size - self.ingestion_queue.qsize())]
+            for fragment in candidates:
+                fragment.wal_offset = self.wal.append(fragment.to_record())
+            if candidates:
+                self.wal.commit(candidates[-1].wal_offset)
+            
         ingested_count = 0
         
-        for fragment in fragments:
-            if self.ingest_fragment(fragment, block=False):
+        for fragment in candidates:
+            if self._enqueue(fragment, block=False):
                 ingested_count += 1
             else:
                 break  # Stop on first failure to avoid overwhelming
                 
+        if self.wal is not None:
+            # Logged but never queued (_enqueue acked the rejected one): not replayed either
+            unqueued = candidates[ingested_count + 1:]
+            self._acknowledge(unqueued)
+            for fragment in unqueued:
+                fragment.wal_offset = None
+            if ingested_count == len(candidates) < len(fragments):
+                self._record_rejection()  # the rest did not fit
+                
         return ingested_count
         
     def _processing_loop(self):
-        """Main processing loop running in separate thread."""
+        """Processing loop run by each worker thread."""
         while not self.stop_event.is_set():
             try:
-                # Collect batch of fragments
+                # Collect batch of fragments (blocks until work arrives or stop wakes it)
                 batch = self._collect_batch()
                 
                 if not batch.fragments:
-                    time.sleep(0.1)  # Brief pause if no work
                     continue
                     
-                # Process the batch
+                # Process the batch; None means it timed out and is settled when the call returns
                 success = self._process_batch(batch)
-                
-                if success:
-                    self._update_metrics(batch)
-                    self._adapt_batch_size(batch)
-                else:
-                    self._handle_processing_failure(batch)
+                if success is not None:
+                    self._complete_batch(batch, success)
                     
             except Exception as e:
                 self.state = PipelineState.ERROR
@@ -254,37 +690,28 @@ def _processing_loop(self):
                 break
                 
     def _collect_batch(self) -> BatchContext:
-        """Collect fragments into a batch for processing."""
-        fragments = []
-        batch_id = f"batch_{int(time.time() * 1000)}"
-        start_time = time.time()
-        
-        # Collect up to current_batch_size fragments
-        while len(fragments) < self.current_batch_size:
-            try:
-                # Non-blocking get with short timeout
-                priority_key, fragment = self.ingestion_queue.get(timeout=0.1)
-                fragments.append(fragment)
-                self.ingestion_queue.task_done()
-                
-            except queue.Empty:
-                break  # No more fragments available
-                
-        return BatchContext(
-            batch_id=batch_id,
-            fragments=fragments,
-            batch_size=len(fragments),
-            processing_start_time=start_time
-        )
+        """Collect up to current_batch_size fragments in one bulk dequeue."""
+        # The timeout only bounds how long stop() can go unnoticed; new work wakes the wait
+        fragments, claimed = self.ingestion_queue.get_batch(self.current_batch_size, timeout=0.5)
+        return self._new_batch(fragments, claimed)
         
-    def _process_batch(self, batch: BatchContext) -> bool:
-        """Process a batch of fragments."""
+    def _process_batch(self, batch: BatchContext) -> Optional[bool]:
+        """Process a batch of fragments; None if the call is still running after the timeout."""
         if not batch.fragments:
             return True
             
         try:
             # Call the processor function with timeout
-            success = self.processor_func(batch.fragments)
+            with self._executor_lock:
+                future = self.executor.submit(self.processor_func, batch.fragments)
+            try:
+                success = future.result(timeout=self.processing_timeout_sec)
+            except FuturesTimeoutError:
+                with self._metrics_lock:
+                    self.metrics.timed_out_batches += 1
+                print(f"Batch processing timed out after {self.processing_timeout_sec}s: {batch.batch_id}")
+                self._defer_timed_out(batch, future)
+                return None
             
             # Update queue depth after processing
             self.metrics.queue_depth_current = self.ingestion_queue.qsize()
@@ -295,158 +722,311 @@ def _process_batch(self, batch: BatchContext) -> bool:
             print(f"Batch processing error: {e}")
             return False
             
-    def _update_metrics(self, batch: BatchContext):
-        """Update performance metrics after successful batch processing."""
-        processing_duration = batch.get_processing_duration()
-        processing_time_ms = processing_duration * 1000
+    def _complete_batch(self, batch: BatchContext, success: bool):
+        """Acknowledge or retry a finished batch, then release its ordered classes."""
+        try:
+            if success:
+                self._acknowledge(batch.fragments)
+                self._update_metrics(batch)
+                self._adapt_batch_size(batch)
+            else:
+                self._handle_processing_failure(batch)
+        finally:
+            self.ingestion_queue.release(batch.claimed_classes)
+            
+    def _defer_timed_out(self, batch: BatchContext, future: Future):
+        """
+        Settle a timed-out batch once its call actually returns.
+
+        Retrying now would run the fragments a second time while the first call
+        is still going, and release an ORDERED class with a batch still in
+        flight. The stuck call also keeps its executor slot, so the executor is
+        replaced; the old one finishes its running calls and shuts down.
+        """
+        with self._executor_lock:
+            self._timed_out_calls.add(future)
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+                self.executor = self._new_executor()
+        future.add_done_callback(lambda done: self._settle_timed_out(batch, done))
         
-        # Update counters
-        self.metrics.total_fragments_processed += len(batch.fragments)
-        self.metrics.total_batches_processed += 1
-        self.metrics.total_processing_time_ms += processing_time_ms
+    def _settle_timed_out(self, batch: BatchContext, future: Future):
+        with self._executor_lock:
+            self._timed_out_calls.discard(future)
+        success = not future.cancelled() and future.exception() is None and bool(future.result())
+        self._complete_batch(batch, success)
         
-        # Update averages
-        self.metrics.average_batch_size = (
-            self.metrics.total_fragments_processed / self.metrics.total_batches_processed
-        )
+    def _handle_processing_failure(self, batch: BatchContext):
+        """Handle batch processing failure."""
+        # Logged fragments that are not retried go to the dead-letter log and are acknowledged,
+        # so the committed offset keeps advancing
+        unretried = self._retry_failed(batch, self._requeue)
+        if unretried and self.wal is not None:
+            for fragment in unretried:
+                if fragment.wal_offset is not None:
+                    self.wal.dead_letter(fragment.wal_offset, fragment.to_record())
+            self._acknowledge(unretried)
+            
+    def _retry_priority(self, fragment: Fragment) -> int:
+        # An ORDERED fragment stays in its class, or later fragments would overtake it
+        if fragment.priority in self.ingestion_queue.ordered_classes:
+            return fragment.priority
+        return super()._retry_priority(fragment)
+        
+    def _requeue(self, fragment: Fragment) -> bool:
+        if fragment.priority in self.ingestion_queue.ordered_classes:
+            # The class is still claimed by the failed batch (released after this)
+            self.ingestion_queue.requeue(fragment)
+            return True
+        try:
+            self.ingestion_queue.put(fragment, block=False)
+            return True
+        except queue.Full:
+            return False
+            
+    def _acknowledge(self, fragments: List[Fragment]):
+        """Advance the write-ahead log past fragments that are done with."""
+        if self.wal is not None:
+            self.wal.ack([f.wal_offset for f in fragments if f.wal_offset is not None])
+            
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get comprehensive pipeline status."""
+        status = super().get_status()
+        status["workers"] = {
+            "num_workers": self.num_workers,
+            "worker_mode": self.worker_mode,
+            "ordered_classes": sorted(self.ingestion_queue.ordered_classes),
+            "timed_out_running": len(self._timed_out_calls)
+        }
+        status["wal"] = {
+            "committed_offset": self.wal.committed_offset,
+            "pending": self.wal.pending_count(),
+            "segments": self.wal.segment_count(),
+            **self.wal.stats
+        } if self.wal is not None else None
+        return status
+
+
+class AsyncStreamingIngestionPipeline(_AdaptivePipelineBase):
+    """
+    asyncio-native streaming ingestion pipeline.
+    
+    Fragments wait on an asyncio.PriorityQueue in (-priority, timestamp) order
+    and are drained by num_workers batch tasks on the running event loop, so
+    async sources ingest without a thread hop per fragment. `await ingest()`
+    suspends the producer while the queue is full instead of rejecting it.
+    Batch sizing, backpressure levels, retries and PipelineMetrics are those
+    of StreamingIngestionPipeline. A pipeline belongs to the event loop it
+    was started on.
+    """
+    
+    def __init__(self,
+                 processor_func: Callable[[List[Fragment]], Union[bool, Awaitable[bool]]],
+                 initial_batch_size: int = 10,
+                 max_batch_size: int = 100,
+                 max_queue_size: int = 1000,
+                 backpressure_threshold: float = 0.8,
+                 processing_timeout_sec: float = 30.0,
+                 num_workers: int = 1,
+                 max_retries: int = 3):
+        """
+        Initialize async streaming pipeline.
         
-        # Track processing time history
-        self.processing_history.append(processing_time_ms)
+        Args:
+            processor_func: Coroutine function processing a batch of fragments;
+                a plain function is called directly and blocks the loop while it runs
+            initial_batch_size: Starting batch size
+            max_batch_size: Maximum allowed batch size
+            max_queue_size: Maximum fragments in queue before ingest suspends
+            backpressure_threshold: Queue utilization threshold for backpressure
+            processing_timeout_sec: Timeout for batch processing; an async batch
+                that exceeds it is cancelled, failed and retried
+            num_workers: Batches processed concurrently (tasks, not threads)
+            max_retries: Processing attempts before a fragment is dead-lettered
+        """
+        super().__init__(initial_batch_size, max_batch_size, max_queue_size, backpressure_threshold,
+                         processing_timeout_sec, num_workers, max_retries)
         
-        # Update throughput
-        self.metrics.update_throughput()
+        self.processor_func = processor_func
+        self.ingestion_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(maxsize=max_queue_size)
+        self._sequence = itertools.count()
+        self._workers: List[asyncio.Task] = []
+        self._idle_workers: Set[asyncio.Task] = set()
+        self._stopping = False
         
-        # Trigger metrics callback
-        if self.metrics_callback:
-            self.metrics_callback(self.metrics)
+    async def start(self):
+        """Start the batch workers on the running event loop."""
+        if self.state != PipelineState.STOPPED:
+            raise RuntimeError(f"Pipeline already running: {self.state}")
             
-    def _adapt_batch_size(self, batch: BatchContext):
-        """Adapt batch size based on processing performance."""
-        if not self.adaptive_enabled or len(self.processing_history) < 5:
+        self.state = PipelineState.STARTING
+        self._stopping = False
+        self._workers = [
+            asyncio.create_task(self._processing_loop(), name=f"ingest-worker-{i}")
+            for i in range(self.num_workers)
+        ]
+        self.state = PipelineState.RUNNING
+        
+    async def stop(self, timeout_sec: float = 10.0):
+        """Stop the pipeline, letting in-flight batches finish within timeout_sec."""
+        if self.state == PipelineState.STOPPED:
             return
             
-        # Calculate recent average processing time
-        recent_times = list(self.processing_history)[-5:]
-        avg_processing_time = sum(recent_times) / len(recent_times)
+        self.state = PipelineState.DRAINING
+        self._stopping = True
+        for worker in self._idle_workers:
+            worker.cancel()  # waiting for work; nothing is lost
+            
+        if self._workers:
+            _, pending = await asyncio.wait(self._workers, timeout=timeout_sec)
+            for worker in pending:
+                worker.cancel()
+        self._workers = []
         
-        # Target processing time (aiming for ~100ms per batch)
-        target_time_ms = 100.0
+        self.state = PipelineState.STOPPED
         
-        if avg_processing_time < target_time_ms * 0.7:
-            # Processing is fast, can increase batch size
-            self.current_batch_size = min(
-                self.current_batch_size + 2,
-                self.max_batch_size
-            )
-        elif avg_processing_time > target_time_ms * 1.5:
-            # Processing is slow, should decrease batch size
-            self.current_batch_size = max(
-                self.current_batch_size - 1,
-                1
-            )
-            
-    def _handle_processing_failure(self, batch: BatchContext):
-        """Handle batch processing failure."""
-        self.metrics.failed_fragments += len(batch.fragments)
+    async def join(self):
+        """Wait until every queued fragment has been processed, retried out or dropped."""
+        await self.ingestion_queue.join()
         
-        # Retry logic for individual fragments
-        for fragment in batch.fragments:
-            fragment.retry_count += 1
-            
-            if fragment.retry_count < 3:  # Max 3 retries
-                # Put back in queue with lower priority
-                retry_fragment = Fragment(
-                    fragment_id=f"{fragment.fragment_id}_retry_{fragment.retry_count}",
-                    content=fragment.content,
-                    metadata=fragment.metadata,
-                    priority=max(1, fragment.priority - 1),  # Lower priority
-                    retry_count=fragment.retry_count
-                )
-                self.ingest_fragment(retry_fragment, block=False)
-                
-    def _check_backpressure(self):
-        """Check and update backpressure level."""
-        queue_utilization = self.metrics.queue_depth_current / self.max_queue_size
+    async def ingest(self, fragment: Fragment, timeout: Optional[float] = None) -> bool:
+        """
+        Ingest a fragment, suspending while the queue is full.
         
-        # Determine backpressure level
-        if queue_utilization >= 0.95:
-            level = BackpressureLevel.CRITICAL
-        elif queue_utilization >= 0.85:
-            level = BackpressureLevel.HIGH
-        elif queue_utilization >= 0.70:
-            level = BackpressureLevel.MEDIUM
-        elif queue_utilization >= 0.50:
-            level = BackpressureLevel.LOW
+        Args:
+            fragment: Fragment to ingest
+            timeout: Longest to wait for queue space; None waits indefinitely
+            
+        Returns:
+            True if the fragment was queued, False if the pipeline is not
+            running or the timeout expired
+        """
+        if self.state not in [PipelineState.RUNNING, PipelineState.BACKPRESSURE]:
+            return False
+            
+        entry = (-fragment.priority, fragment.timestamp, next(self._sequence), fragment)
+        if self.ingestion_queue.full():
+            try:
+                await asyncio.wait_for(self.ingestion_queue.put(entry), timeout)
+            except asyncio.TimeoutError:
+                self._record_rejection()
+                return False
         else:
-            level = BackpressureLevel.NONE
+            self.ingestion_queue.put_nowait(entry)  # no suspension on the common path
             
-        # Update state if backpressure level changed
-        if level != self.backpressure_level:
-            self.backpressure_level = level
+        self._update_queue_depth(self.ingestion_queue.qsize())
+        return True
+        
+    def ingest_nowait(self, fragment: Fragment) -> bool:
+        """Ingest from synchronous code on the loop; False if the queue is full."""
+        if self.state not in [PipelineState.RUNNING, PipelineState.BACKPRESSURE]:
+            return False
             
-            # Update pipeline state
-            if level in [BackpressureLevel.HIGH, BackpressureLevel.CRITICAL]:
-                self.state = PipelineState.BACKPRESSURE
-            elif self.state == PipelineState.BACKPRESSURE and level <= BackpressureLevel.MEDIUM:
-                self.state = PipelineState.RUNNING
+        try:
+            self.ingestion_queue.put_nowait((-fragment.priority, fragment.timestamp, next(self._sequence), fragment))
+        except asyncio.QueueFull:
+            self._record_rejection()
+            return False
+            
+        self._update_queue_depth(self.ingestion_queue.qsize())
+        return True
+        
+    async def ingest_batch(self, fragments: List[Fragment], timeout: Optional[float] = None) -> int:
+        """
+        Ingest multiple fragments in order, suspending for queue space as needed.
+        
+        Returns:
+            Number of fragments ingested; stops at the first that times out
+        """
+        ingested_count = 0
+        for fragment in fragments:
+            if not await self.ingest(fragment, timeout=timeout):
+                break
+            ingested_count += 1
+        return ingested_count
+        
+    async def _processing_loop(self):
+        """Processing loop run by each worker task."""
+        worker = asyncio.current_task()
+        while not self._stopping:
+            self._idle_workers.add(worker)
+            try:
+                first = await self.ingestion_queue.get()
+            finally:
+                self._idle_workers.discard(worker)
                 
-            # Trigger callback
-            if self.backpressure_callback:
-                self.backpressure_callback(level)
+            batch = self._collect_batch(first[-1])
+            try:
+                success = await self._process_batch(batch)
+                
+                if success:
+                    self._update_metrics(batch)
+                    self._adapt_batch_size(batch)
+                else:
+                    self._retry_failed(batch, self._requeue)
+                    
+            except Exception as e:
+                self.state = PipelineState.ERROR
+                print(f"Pipeline error: {e}")
+                break
+            finally:
+                for _ in batch.fragments:
+                    self.ingestion_queue.task_done()
+                self._update_queue_depth(self.ingestion_queue.qsize())
                 
+    def _collect_batch(self, first: Fragment) -> BatchContext:
+        """Take whatever else is queued, up to current_batch_size, without suspending."""
+        fragments = [first]
+        while len(fragments) < self.current_batch_size and not self.ingestion_queue.empty():
+            fragments.append(self.ingestion_queue.get_nowait()[-1])
+        return self._new_batch(fragments)
+        
+    async def _process_batch(self, batch: BatchContext) -> bool:
+        """Process a batch of fragments."""
+        try:
+            result = self.processor_func(batch.fragments)
+            if inspect.isawaitable(result):
+                result = await asyncio.wait_for(result, self.processing_timeout_sec)
+            return result
+            
+        except asyncio.TimeoutError:
+            with self._metrics_lock:
+                self.metrics.timed_out_batches += 1
+            print(f"Batch processing timed out after {self.processing_timeout_sec}s: {batch.batch_id}")
+            return False
+            
+        except Exception as e:
+            print(f"Batch processing error: {e}")
+            return False
+            
+    def _requeue(self, fragment: Fragment) -> bool:
+        try:
+            self.ingestion_queue.put_nowait((-fragment.priority, fragment.timestamp, next(self._sequence), fragment))
+            return True
+        except asyncio.QueueFull:
+            return False
+            
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive pipeline status."""
-        return {
-            "state": self.state.value,
-            "backpressure_level": self.backpressure_level.value,
-            "current_batch_size": self.current_batch_size,
-            "queue_depth": self.metrics.queue_depth_current,
-            "queue_utilization_pct": (self.metrics.queue_depth_current / self.max_queue_size) * 100,
-            "metrics": {
-                "total_processed": self.metrics.total_fragments_processed,
-                "total_batches": self.metrics.total_batches_processed,
-                "throughput_fps": self.metrics.throughput_fragments_per_sec,
-                "avg_batch_size": self.metrics.average_batch_size,
-                "backpressure_events": self.metrics.backpressure_events,
-                "failed_fragments": self.metrics.failed_fragments
-            },
-            "performance": {
-                "avg_processing_time_ms": (
-                    sum(self.processing_history) / len(self.processing_history)
-                    if self.processing_history else 0.0
-                ),
-                "recent_processing_times": list(self.processing_history)[-10:],
-                "adaptive_enabled": self.adaptive_enabled
-            }
+        status = super().get_status()
+        status["workers"] = {
+            "num_workers": self.num_workers,
+            "worker_mode": "asyncio"
         }
-        
-    def configure_adaptive_mode(self, enabled: bool, target_time_ms: float = 100.0):
-        """Configure adaptive batch sizing."""
-        self.adaptive_enabled = enabled
-        self.target_processing_time = target_time_ms
-        
-    def set_backpressure_callback(self, callback: Callable[[BackpressureLevel], None]):
-        """Set callback for backpressure events."""
-        self.backpressure_callback = callback
-        
-    def set_metrics_callback(self, callback: Callable[[PipelineMetrics], None]):
-        """Set callback for metrics updates."""
-        self.metrics_callback = callback
-        
-    def reset_metrics(self):
-        """Reset performance metrics."""
-        self.metrics = PipelineMetrics()
-        self.processing_history.clear()
+        return status
 
 
 def create_default_pipeline(processor_func: Callable[[List[Fragment]], bool],
-                          performance_profile: str = "balanced") -> StreamingIngestionPipeline:
+                          performance_profile: str = "balanced",
+                          **overrides: Any) -> StreamingIngestionPipeline:
     """
     Create pipeline with predefined performance profiles.
     
     Args:
         processor_func: Function to process fragment batches
         performance_profile: 'dev', 'balanced', 'performance', 'experiment'
+        **overrides: Constructor arguments replacing the profile's (e.g. num_workers)
     """
     profiles = {
         "dev": {
@@ -475,7 +1055,7 @@ def create_default_pipeline(processor_func: Callable[[List[Fragment]], bool],
         }
     }
     
-    config = profiles.get(performance_profile, profiles["balanced"])
+    config = dict(profiles.get(performance_profile, profiles["balanced"]), **overrides)
     
     return StreamingIngestionPipeline(
         processor_func=processor_func,
@@ -3,14 +3,28 @@
 
 Implements rolling N-window micro-summaries and pipeline macro distillation
 for the Cognitive Geo-Thermal Lore Engine v0.3.
+
+stream_fragments() consumes an iterator of fragments and yields rungs as they
+form, keeping only a bounded retention window in memory; rungs evicted from it
+go to a pluggable RungStore.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, Callable, Union
 import time
 import hashlib
 from dataclasses import dataclass, asdict
 from collections import deque
 
+import numpy as np
+
+try:
+    from .sediment_segments import SedimentSegmentFile
+except ImportError:
+    # Loaded as a top-level module (seed/engine on sys.path)
+    from sediment_segments import SedimentSegmentFile
+
 
 @dataclass
 class MicroSummary:
@@ -38,7 +52,56 @@ class MacroDistillation:
     provenance_chain: List[Dict[str, Any]]
     creation_timestamp: float
     anchor_reinforcements: List[str]  # Anchor IDs that were reinforced
-    
+
+
+Rung = Union[MicroSummary, MacroDistillation]
+
+
+class RungStore(ABC):
+    """Destination for rungs evicted from the ladder's in-memory retention window."""
+
+    @abstractmethod
+    def put(self, kind: str, record: Dict[str, Any]):
+        """Store one evicted rung ("micro" or "macro") as a plain dict."""
+        pass
+
+    @abstractmethod
+    def scan(self, kind: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield stored rungs in eviction order, optionally of one kind."""
+        pass
+
+    def close(self):
+        pass
+
+
+class SegmentRungStore(RungStore):
+    """
+    Evicted rungs appended to a length-prefixed segment file.
+
+    Nothing is indexed in memory, so the store's footprint stays constant however
+    long the stream runs; scan() reads the file back sequentially.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._segments = SedimentSegmentFile(path)
+        self.count = sum(1 for _ in self._segments.scan())
+
+    def __len__(self) -> int:
+        return self.count
+
+    def put(self, kind: str, record: Dict[str, Any]):
+        self._segments.append({"kind": kind}, record)
+        self.count += 1
+
+    def scan(self, kind: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        for header, offset, length in self._segments.scan():
+            if kind is None or header["kind"] == kind:
+                yield self._segments.read_body(offset, length)
+
+    def close(self):
+        self._segments.close()
+
 
 class SummarizationLadder:
     """
@@ -48,21 +111,31 @@ class SummarizationLadder:
     - Micro-summaries: Rolling N-window summaries of recent fragments
     - Macro distillation: Pipeline processing after N micro-summaries accumulated
     - Recovery distillation: Anchor reinforcement during distillation process
+    
+    Macro distillations beyond max_macro_distillations (unbounded by default), and
+    micro-summaries pushed out of the max_micro_summaries window, are handed to
+    rung_store when one is given and otherwise dropped.
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None, embedding_provider=None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, embedding_provider=None,
+                 rung_store: Optional[RungStore] = None):
         self.config = config or {}
         self.embedding_provider = embedding_provider
+        self.rung_store = rung_store
         
         # Configuration parameters
         self.micro_window_size = self.config.get("micro_window_size", 5)
         self.macro_trigger_count = self.config.get("macro_trigger_count", 3)
         self.max_micro_summaries = self.config.get("max_micro_summaries", 20)
+        self.max_macro_distillations = self.config.get("max_macro_distillations")
+        self.stream_chunk_size = self.config.get("stream_chunk_size", 1024)
         
         # Storage
         self.micro_summaries: deque = deque(maxlen=self.max_micro_summaries)
-        self.macro_distillations: List[MacroDistillation] = []
+        self.macro_distillations: deque = deque()
         self.fragment_buffer: deque = deque(maxlen=self.micro_window_size)
+        self._embedding_buffer: deque = deque(maxlen=self.micro_window_size)
+        self.rungs_evicted = 0
         
         # State tracking
         self.total_fragments_processed = 0
@@ -93,53 +166,130 @@ def process_fragments(self, fragments: List[Dict[str, Any]]) -> Dict[str, Any]:
             "new_macro_distillations": []
         }
         
-        for fragment in fragments:
-            self.fragment_buffer.append(fragment)
-            self.total_fragments_processed += 1
-            
-            # Check if we should create a micro-summary
-            if len(self.fragment_buffer) >= self.micro_window_size:
-                micro_summary = self._create_micro_summary()
-                if micro_summary:
-                    self.micro_summaries.append(micro_summary)
-                    processing_report["micro_summaries_created"] += 1
-                    processing_report["new_micro_summaries"].append({
-                        "summary_id": micro_summary.summary_id,
-                        "compressed_text": micro_summary.compressed_text[:100] + "...",
-                        "window_size": micro_summary.window_size,
-                        "heat_aggregate": micro_summary.heat_aggregate
-                    })
-                    
-                    # Check if we should trigger macro distillation
-                    if len(self.micro_summaries) >= self.macro_trigger_count:
-                        macro_distillation = self._create_macro_distillation()
-                        if macro_distillation:
-                            self.macro_distillations.append(macro_distillation)
-                            processing_report["macro_distillations_created"] += 1
-                            processing_report["new_macro_distillations"].append({
-                                "distillation_id": macro_distillation.distillation_id,
-                                "distilled_essence": macro_distillation.distilled_essence[:100] + "...",
-                                "consolidation_ratio": macro_distillation.consolidation_ratio,
-                                "source_count": len(macro_distillation.source_micro_summaries)
-                            })
-        
-        # Update metrics
-        elapsed_ms = (time.time() - start_time) * 1000
+        for rung in self.stream_fragments(fragments, chunk_size=max(len(fragments), 1)):
+            if isinstance(rung, MicroSummary):
+                processing_report["micro_summaries_created"] += 1
+                processing_report["new_micro_summaries"].append({
+                    "summary_id": rung.summary_id,
+                    "compressed_text": rung.compressed_text[:100] + "...",
+                    "window_size": rung.window_size,
+                    "heat_aggregate": rung.heat_aggregate
+                })
+            else:
+                processing_report["macro_distillations_created"] += 1
+                processing_report["new_macro_distillations"].append({
+                    "distillation_id": rung.distillation_id,
+                    "distilled_essence": rung.distilled_essence[:100] + "...",
+                    "consolidation_ratio": rung.consolidation_ratio,
+                    "source_count": len(rung.source_micro_summaries)
+                })
+        
+        processing_report["elapsed_ms"] = (time.time() - start_time) * 1000
+        processing_report["total_micro_summaries"] = len(self.micro_summaries)
+        processing_report["total_macro_distillations"] = len(self.macro_distillations)
+        
+        return processing_report
+    
+    def stream_fragments(self, fragments: Iterable[Dict[str, Any]],
+                         chunk_size: Optional[int] = None) -> Iterator[Rung]:
+        """
+        Feed fragments through the ladder, yielding each micro-summary and macro
+        distillation as it forms.
+        
+        Fragments are pulled chunk_size (config stream_chunk_size) at a time and each
+        chunk's texts are embedded in one batched provider pass.
+        """
+        chunk_size = chunk_size or self.stream_chunk_size
+        iterator = iter(fragments)
+        start_time = time.time()
+        try:
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                embeddings = self._embed_texts([f.get("text", "") for f in chunk])
+                for fragment, embedding in zip(chunk, embeddings):
+                    yield from self._advance(fragment, embedding)
+        finally:
+            self._update_metrics((time.time() - start_time) * 1000)
+    
+    def process_stream(self, fragments: Iterable[Dict[str, Any]],
+                       on_micro: Optional[Callable[[MicroSummary], None]] = None,
+                       on_macro: Optional[Callable[[MacroDistillation], None]] = None,
+                       chunk_size: Optional[int] = None) -> Dict[str, Any]:
+        """Drive stream_fragments to exhaustion, passing each rung to its callback."""
+        counts = {"micro_summaries_created": 0, "macro_distillations_created": 0}
+        for rung in self.stream_fragments(fragments, chunk_size):
+            if isinstance(rung, MicroSummary):
+                counts["micro_summaries_created"] += 1
+                if on_micro:
+                    on_micro(rung)
+            else:
+                counts["macro_distillations_created"] += 1
+                if on_macro:
+                    on_macro(rung)
+        counts["total_fragments"] = self.total_fragments_processed
+        counts["rungs_evicted"] = self.rungs_evicted
+        return counts
+    
+    def close(self):
+        """Close the rung store, if any."""
+        if self.rung_store is not None:
+            self.rung_store.close()
+    
+    def _advance(self, fragment: Dict[str, Any], embedding: Optional[List[float]]) -> Iterator[Rung]:
+        """Add one fragment; yield the micro-summary (and macro distillation) it completes."""
+        self.fragment_buffer.append(fragment)
+        self._embedding_buffer.append(embedding)
+        self.total_fragments_processed += 1
+        
+        # Check if we should create a micro-summary
+        if len(self.fragment_buffer) < self.micro_window_size:
+            return
+        micro_summary = self._create_micro_summary()
+        if not micro_summary:
+            return
+        if len(self.micro_summaries) == self.micro_summaries.maxlen:
+            self._evict("micro", self.micro_summaries[0])
+        self.micro_summaries.append(micro_summary)
+        yield micro_summary
+        
+        # Check if we should trigger macro distillation
+        if len(self.micro_summaries) >= self.macro_trigger_count:
+            macro_distillation = self._create_macro_distillation()
+            if macro_distillation:
+                self.macro_distillations.append(macro_distillation)
+                if (self.max_macro_distillations is not None
+                        and len(self.macro_distillations) > self.max_macro_distillations):
+                    self._evict("macro", self.macro_distillations.popleft())
+                yield macro_distillation
+    
+    def _evict(self, kind: str, rung: Rung):
+        self.rungs_evicted += 1
+        if self.rung_store is not None:
+            # Fields hold only plain lists and dicts, so a shallow copy suffices
+            self.rung_store.put(kind, dict(vars(rung)))
+    
+    def _embed_texts(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed texts in one batched provider pass (None per text without a provider or on failure)."""
+        if self.embedding_provider and texts:
+            try:
+                return self.embedding_provider.embed_in_batches(texts)
+            except Exception:
+                # Fallback to no centroids if embedding fails
+                pass
+        return [None] * len(texts)
+    
+    def _update_metrics(self, elapsed_ms: float):
         self.metrics["total_fragments"] = self.total_fragments_processed
         self.metrics["micro_summaries_created"] = self.micro_summaries_created
         self.metrics["macro_distillations_created"] = self.macro_distillations_created
         self.metrics["processing_time_ms"] += elapsed_ms
         
-        # Calculate compression ratio
+        # Calculate compression ratio (evicted distillations still count)
         if self.total_fragments_processed > 0:
-            compressed_units = len(self.micro_summaries) + len(self.macro_distillations)
+            compressed_units = len(self.micro_summaries) + self.macro_distillations_created
             self.metrics["compression_ratio"] = self.total_fragments_processed / max(compressed_units, 1)
-        
-        processing_report["elapsed_ms"] = elapsed_ms
-        processing_report["total_micro_summaries"] = len(self.micro_summaries)
-        processing_report["total_macro_distillations"] = len(self.macro_distillations)
-        
-        return processing_report
     
     def get_recovery_context(self, anchor_id: str, context_size: int = 3) -> Dict[str, Any]:
         """
@@ -167,7 +317,7 @@ def get_recovery_context(self, anchor_id: str, context_size: int = 3) -> Dict[st
             })
             
         # Find relevant macro distillations
-        recent_macros = self.macro_distillations[-context_size:] if self.macro_distillations else []
+        recent_macros = list(self.macro_distillations)[-context_size:] if self.macro_distillations else []
         for macro in recent_macros:
             if anchor_id in macro.anchor_reinforcements:
                 recovery_context["related_macro_distillations"].append({
@@ -226,20 +376,14 @@ def _create_micro_summary(self) -> Optional[MicroSummary]:
         # Calculate aggregate heat
         heat_aggregate = sum(f.get("heat", 0.1) for f in fragments) / len(fragments)
         
-        # Generate semantic centroid if embedding provider available
+        # Semantic centroid of the window's embeddings, computed when they were batched in
         semantic_centroid = None
-        if self.embedding_provider and fragment_texts:
+        embeddings = list(self._embedding_buffer)
+        if len(embeddings) == len(fragments) and all(e is not None for e in embeddings):
             try:
-                embeddings = [self.embedding_provider.embed_text(text) for text in fragment_texts]
-                if embeddings:
-                    # Calculate centroid
-                    dim = len(embeddings[0])
-                    semantic_centroid = [
-                        sum(emb[i] for emb in embeddings) / len(embeddings)
-                        for i in range(dim)
-                    ]
-            except Exception:
-                # Fallback to None if embedding fails
+                semantic_centroid = np.mean(np.asarray(embeddings, dtype=np.float64), axis=0).tolist()
+            except ValueError:
+                # Ragged embeddings: no centroid
                 pass
         
         # Create micro-summary
@@ -260,6 +404,8 @@ def _create_micro_summary(self) -> Optional[MicroSummary]:
         overlap_size = max(1, self.micro_window_size // 3)
         for _ in range(len(self.fragment_buffer) - overlap_size):
             self.fragment_buffer.popleft()
+        while len(self._embedding_buffer) > len(self.fragment_buffer):
+            self._embedding_buffer.popleft()
             
         return micro_summary
     
@@ -0,0 +1,294 @@
+"""
+Vector Clustering - Blocked NumPy Backend for GiantCompressor
+
+Cosine clustering over an (n, d) embedding matrix that never materializes the
+n×n distance matrix: similarities are produced one block of rows at a time.
+Density-based and hierarchical clustering reproduce GiantCompressor's reference
+methods; k-means is mini-batch with k-means++ seeding.
+"""
+
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Similarity entries per block (32 MB of float64)
+DEFAULT_BLOCK_ELEMENTS = 1 << 22
+
+
+def unit_rows(embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+    """L2-normalized float64 copy of the embeddings (zero rows stay zero)."""
+    matrix = np.array(embeddings, dtype=np.float64)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(embeddings), -1)
+    norms = np.linalg.norm(matrix, axis=1)
+    nonzero = norms > 0
+    matrix[nonzero] /= norms[nonzero, None]
+    return matrix
+
+
+def rows_per_block(n: int, block_elements: int = DEFAULT_BLOCK_ELEMENTS) -> int:
+    """Rows of an n-column similarity block that fit in block_elements."""
+    return max(1, block_elements // max(n, 1))
+
+
+def within_distance_blocks(unit: np.ndarray, max_distance: float,
+                           rows: Optional[np.ndarray] = None,
+                           block_elements: int = DEFAULT_BLOCK_ELEMENTS
+                           ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Yield (row_indices, mask) where mask[k, j] is True when row_indices[k] and j are
+    distinct and 1 - cos <= max_distance.
+    """
+    n = unit.shape[0]
+    rows = np.arange(n) if rows is None else np.asarray(rows, dtype=np.int64)
+    step = rows_per_block(n, block_elements)
+    for start in range(0, len(rows), step):
+        block = rows[start:start + step]
+        similarities = unit[block] @ unit.T
+        similarities[np.arange(len(block)), block] = -np.inf
+        yield block, (1.0 - similarities) <= max_distance
+
+
+def mean_pairwise_similarity(unit: np.ndarray) -> float:
+    """Mean cosine over all pairs of rows, from the row sum instead of every pair."""
+    m = unit.shape[0]
+    if m < 2:
+        return 1.0
+    total = unit.sum(axis=0)
+    pair_sum = (float(total @ total) - float(np.einsum('ij,ij->', unit, unit))) / 2.0
+    return pair_sum / (m * (m - 1) / 2)
+
+
+# ============================================================================
+# Density-based (neighbour graph)
+# ============================================================================
+
+def density_clusters(unit: np.ndarray, max_distance: float, min_cluster_size: int,
+                     block_elements: int = DEFAULT_BLOCK_ELEMENTS
+                     ) -> Tuple[List[List[int]], List[int]]:
+    """
+    Core points and one-hop expansion, as GiantCompressor._density_based_clustering.
+
+    A point is core when it has at least min_cluster_size - 1 neighbours within
+    max_distance. Cores are expanded in index order; each claims itself plus its
+    unvisited neighbours, and the claim is kept when it reaches min_cluster_size.
+    Neighbour rows are computed lazily for the cores still unvisited.
+
+    Returns:
+        (clusters, noise) — cluster member lists in reference order, and the
+        indices never claimed by any core
+    """
+    n = unit.shape[0]
+    counts = np.zeros(n, dtype=np.int64)
+    for block, mask in within_distance_blocks(unit, max_distance, block_elements=block_elements):
+        counts[block] = mask.sum(axis=1)
+    cores = np.flatnonzero(counts >= min_cluster_size - 1)
+
+    visited = np.zeros(n, dtype=bool)
+    clusters: List[List[int]] = []
+    step = rows_per_block(n, block_elements)
+    for start in range(0, len(cores), step):
+        pending = cores[start:start + step]
+        pending = pending[~visited[pending]]
+        if not len(pending):
+            continue
+        for block, mask in within_distance_blocks(unit, max_distance, rows=pending,
+                                                  block_elements=block_elements):
+            for core, row in zip(block.tolist(), mask):
+                if visited[core]:
+                    continue
+                neighbours = np.flatnonzero(row)
+                fresh = neighbours[~visited[neighbours]]
+                visited[core] = True
+                visited[fresh] = True
+                if len(fresh) + 1 >= min_cluster_size:
+                    clusters.append([core] + fresh.tolist())
+
+    return clusters, np.flatnonzero(~visited).tolist()
+
+
+# ============================================================================
+# Mini-batch k-means
+# ============================================================================
+
+def nearest_centroids(unit: np.ndarray, centroids: np.ndarray,
+                      block_elements: int = DEFAULT_BLOCK_ELEMENTS) -> np.ndarray:
+    """Index of the most cosine-similar centroid for every row (first on ties)."""
+    centers = unit_rows(centroids)
+    assignments = np.empty(unit.shape[0], dtype=np.int64)
+    step = max(1, block_elements // max(len(centers), 1))
+    for start in range(0, unit.shape[0], step):
+        assignments[start:start + step] = np.argmax(unit[start:start + step] @ centers.T, axis=1)
+    return assignments
+
+
+def kmeans_plus_plus(unit: np.ndarray, n_clusters: int, rng: np.random.Generator) -> np.ndarray:
+    """Seed indices chosen with probability proportional to squared cosine distance."""
+    n = unit.shape[0]
+    chosen = [int(rng.integers(n))]
+    nearest = 1.0 - unit @ unit[chosen[0]]
+    for _ in range(1, min(n_clusters, n)):
+        weights = np.square(nearest)
+        total = weights.sum()
+        if total <= 0:
+            break
+        chosen.append(int(rng.choice(n, p=weights / total)))
+        nearest = np.minimum(nearest, 1.0 - unit @ unit[chosen[-1]])
+    return np.array(chosen, dtype=np.int64)
+
+
+def minibatch_kmeans(unit: np.ndarray, n_clusters: int, rng: np.random.Generator,
+                     batch_size: int = 1024, max_iter: int = 100, tol: float = 0.001,
+                     block_elements: int = DEFAULT_BLOCK_ELEMENTS) -> np.ndarray:
+    """
+    Spherical mini-batch k-means (Sculley 2010) with k-means++ seeding.
+
+    Each step assigns a random batch to its nearest centroid and moves every
+    centroid toward its batch mean with a per-centroid learning rate of
+    batch_count / total_count. Stops when no centroid moves more than tol in
+    cosine distance, the convergence test of the reference implementation.
+
+    Returns:
+        Cluster assignment per row
+    """
+    n = unit.shape[0]
+    centroids = unit[kmeans_plus_plus(unit, n_clusters, rng)].copy()
+    k = len(centroids)
+    counts = np.zeros(k, dtype=np.float64)
+    batch_size = min(batch_size, n)
+
+    for _ in range(max_iter):
+        batch = unit[rng.choice(n, size=batch_size, replace=False)]
+        labels = nearest_centroids(batch, centroids, block_elements)
+        batch_counts = np.bincount(labels, minlength=k).astype(np.float64)
+        batch_sums = np.zeros_like(centroids)
+        np.add.at(batch_sums, labels, batch)
+
+        previous = centroids.copy()
+        counts += batch_counts
+        moved = batch_counts > 0
+        centroids[moved] += (batch_sums[moved] - batch_counts[moved, None] * centroids[moved]) / counts[moved, None]
+
+        shift = 1.0 - np.einsum('ij,ij->i', unit_rows(previous), unit_rows(centroids))
+        if np.all(shift <= tol):
+            break
+
+    return nearest_centroids(unit, centroids, block_elements)
+
+
+# ============================================================================
+# Average-linkage agglomerative (nearest-neighbour chain)
+# ============================================================================
+
+def _components(unit: np.ndarray, max_distance: float, block_elements: int) -> np.ndarray:
+    """Connected-component label per row of the max_distance neighbour graph."""
+    n = unit.shape[0]
+    left, right = [], []
+    for block, mask in within_distance_blocks(unit, max_distance, block_elements=block_elements):
+        rows, cols = np.nonzero(mask)
+        keep = cols > block[rows]
+        left.append(block[rows[keep]])
+        right.append(cols[keep])
+    labels = np.arange(n)
+    if not left:
+        return labels
+    left, right = np.concatenate(left), np.concatenate(right)
+
+    # Min-label propagation with pointer jumping
+    while True:
+        updated = labels.copy()
+        np.minimum.at(updated, left, labels[right])
+        np.minimum.at(updated, right, labels[left])
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def _nn_chain(unit: np.ndarray, members: List[List[int]], max_distance: float) -> List[List[int]]:
+    """
+    Merge one component with the nearest-neighbour chain algorithm.
+
+    Average cosine linkage is 1 - (S_a · S_b) / (|a| |b|) for row sums S, so each
+    cluster is a running sum and a nearest-neighbour query is one matrix-vector
+    product over the live clusters. Average linkage is reducible: a cluster with
+    no neighbour within max_distance never gets one, so it is retired from the
+    search. Dead rows are compacted away once they make up half the matrix.
+    """
+    sums = unit.copy()
+    sizes = np.ones(len(members), dtype=np.float64)
+    slots = np.arange(len(members))      # matrix row -> cluster id
+    row_of = np.arange(len(members))     # cluster id -> matrix row
+    live = np.ones(len(members), dtype=bool)
+    live_count = len(members)
+    final: List[List[int]] = []
+    chain: List[int] = []
+
+    def retire(cluster: int):
+        nonlocal live_count
+        live[row_of[cluster]] = False
+        live_count -= 1
+
+    while live_count:
+        if live_count * 2 < len(slots):
+            sums, sizes, slots = sums[live], sizes[live], slots[live]
+            row_of[slots] = np.arange(len(slots))
+            live = np.ones(len(slots), dtype=bool)
+
+        if not chain:
+            chain.append(int(slots[np.flatnonzero(live)[0]]))
+        a = chain[-1]
+        row = row_of[a]
+        distances = 1.0 - (sums @ sums[row]) / (sizes * sizes[row])
+        distances[~live] = np.inf
+        distances[row] = np.inf
+        b = int(slots[np.argmin(distances)])
+        if len(chain) > 1 and distances[row_of[chain[-2]]] <= distances[row_of[b]]:
+            b = chain[-2]
+
+        if distances[row_of[b]] > max_distance:
+            retire(a)
+            final.append(members[a])
+            chain.pop()
+            continue
+        if len(chain) > 1 and b == chain[-2]:
+            chain.pop()
+            chain.pop()
+            # The reference appends the later cluster to the earlier one
+            first, second = (a, b) if members[a][0] < members[b][0] else (b, a)
+            members[first] = members[first] + members[second]
+            sums[row_of[first]] += sums[row_of[second]]
+            sizes[row_of[first]] += sizes[row_of[second]]
+            retire(second)
+            continue
+        chain.append(b)
+
+    return final
+
+
+def average_linkage_clusters(unit: np.ndarray, max_distance: float,
+                             block_elements: int = DEFAULT_BLOCK_ELEMENTS) -> List[List[int]]:
+    """
+    Clusters of GiantCompressor._hierarchical_clustering before size filtering.
+
+    Merges never cross components of the max_distance neighbour graph (every
+    cross pair is farther than max_distance, and so is their average), so each
+    component runs its own nearest-neighbour chain.
+
+    Returns:
+        Member lists ordered by their first (smallest) index, members in merge order
+    """
+    labels = _components(unit, max_distance, block_elements)
+    order = np.argsort(labels, kind='stable')
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+
+    clusters: List[List[int]] = []
+    for component in np.split(order, boundaries):
+        if len(component) == 1:
+            clusters.append([int(component[0])])
+            continue
+        local = _nn_chain(unit[component], [[k] for k in range(len(component))], max_distance)
+        clusters.extend([int(component[k]) for k in cluster] for cluster in local)
+
+    clusters.sort(key=lambda cluster: cluster[0])
+    return clusters